@@ -0,0 +1,35 @@
+"""chat_messages keyset index on (chat_id, created_at, id)
+
+Revision ID: b7e2f4a91c03
+Revises: cd784ebc62bd
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e2f4a91c03'
+down_revision: Union[str, Sequence[str], None] = 'cd784ebc62bd'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Replace (chat_id, created_at) with (chat_id, created_at, id) for keyset pagination."""
+    op.create_index(
+        "ix_chat_messages_chat_created_id",
+        "chat_messages",
+        ["chat_id", "created_at", "id"],
+    )
+    op.drop_index("ix_chat_messages_chat_created", table_name="chat_messages")
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_chat_messages_chat_created",
+        "chat_messages",
+        ["chat_id", "created_at"],
+    )
+    op.drop_index("ix_chat_messages_chat_created_id", table_name="chat_messages")
@@ -0,0 +1,94 @@
+"""compact_chunk_block_meta
+
+Revision ID: c2d5e8f1a3b9
+Revises: f4a8b2c6d1e7
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+import json
+from typing import Any, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'c2d5e8f1a3b9'
+down_revision: Union[str, Sequence[str], None] = 'f4a8b2c6d1e7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_BATCH = 500
+_COMPACT_KEYS = ("kind", "head", "xml_id", "targets", "synthetic_kind")
+
+# chunks.meta->'blocks' entries were {"text", "meta"}; compact ones never have "text"
+_SELECT = sa.text(
+    """
+    SELECT id, text, meta FROM chunks
+    WHERE id > CAST(:after AS uuid)
+      AND jsonb_typeof(meta->'blocks') = 'array'
+      AND jsonb_array_length(meta->'blocks') > 0
+      AND (meta->'blocks'->0 ? 'text') = :legacy
+    ORDER BY id
+    LIMIT :limit
+    """
+)
+_UPDATE = sa.text("UPDATE chunks SET meta = CAST(:meta AS jsonb) WHERE id = CAST(:id AS uuid)")
+
+
+def _compact(chunk_text: str, blocks: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    # frozen copy of infrastructure.indexing.mappers._chunk_meta_with_blocks
+    out: list[dict[str, Any]] = []
+    cursor = 0
+    for b in blocks:
+        text = (b.get("text") or "").strip()
+        meta = b.get("meta") or {}
+        block: dict[str, Any] = {}
+        start = chunk_text.find(text, cursor) if text else -1
+        if start >= 0:
+            cursor = start + len(text)
+            block["start"], block["end"] = start, cursor
+        for key in _COMPACT_KEYS:
+            value = meta.get(key)
+            if value not in (None, "", []):
+                block[key] = value
+        out.append(block)
+    return out
+
+
+def _expand(chunk_text: str, blocks: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    out: list[dict[str, Any]] = []
+    for b in blocks:
+        start, end = b.get("start"), b.get("end")
+        text = chunk_text[start:end] if start is not None and end is not None else ""
+        out.append({"text": text, "meta": {k: b[k] for k in _COMPACT_KEYS if k in b}})
+    return out
+
+
+def _rewrite(*, legacy: bool, convert) -> None:
+    conn = op.get_bind()
+    after = "00000000-0000-0000-0000-000000000000"
+    while True:
+        rows = conn.execute(_SELECT, {"after": after, "legacy": legacy, "limit": _BATCH}).all()
+        if not rows:
+            return
+        updates = []
+        for row in rows:
+            meta = dict(row.meta)
+            meta["blocks"] = convert(row.text, meta["blocks"])
+            updates.append({"id": str(row.id), "meta": json.dumps(meta)})
+        conn.execute(_UPDATE, updates)
+        after = str(rows[-1].id)
+
+
+def upgrade() -> None:
+    """
+    Replace per-block text/meta copies in chunks.meta with offsets into chunks.text
+    plus kind/head/ids. Space is reusable after autovacuum; run VACUUM FULL (or
+    pg_repack) to return it to the OS.
+    """
+    _rewrite(legacy=True, convert=_compact)
+
+
+def downgrade() -> None:
+    """Rebuild {"text", "meta"} blocks from the offsets (block meta keeps only the compact keys)."""
+    _rewrite(legacy=False, convert=_expand)
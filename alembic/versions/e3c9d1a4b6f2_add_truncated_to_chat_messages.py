@@ -0,0 +1,30 @@
+"""add_truncated_to_chat_messages
+
+Revision ID: e3c9d1a4b6f2
+Revises: b7e2f4a91c03
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'e3c9d1a4b6f2'
+down_revision: Union[str, Sequence[str], None] = 'b7e2f4a91c03'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add truncated flag (reply stream abandoned by the client) to chat_messages."""
+    op.add_column(
+        'chat_messages',
+        sa.Column('truncated', sa.Boolean(), nullable=False, server_default=sa.false()),
+    )
+
+
+def downgrade() -> None:
+    """Remove truncated flag from chat_messages."""
+    op.drop_column('chat_messages', 'truncated')
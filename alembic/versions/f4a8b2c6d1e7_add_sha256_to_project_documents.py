@@ -0,0 +1,30 @@
+"""add_sha256_to_project_documents
+
+Revision ID: f4a8b2c6d1e7
+Revises: e3c9d1a4b6f2
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'f4a8b2c6d1e7'
+down_revision: Union[str, Sequence[str], None] = 'e3c9d1a4b6f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add sha256 (hex digest computed while streaming the upload) to project_documents."""
+    op.add_column(
+        'project_documents',
+        sa.Column('sha256', sa.String(length=64), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Remove sha256 from project_documents."""
+    op.drop_column('project_documents', 'sha256')
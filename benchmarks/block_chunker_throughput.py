@@ -0,0 +1,131 @@
+"""
+Throughput benchmark for DefaultBlockChunker on synthetic GROBID TEI.
+
+    python benchmarks/block_chunker_throughput.py --pages 1000 --docs 3
+    python benchmarks/block_chunker_throughput.py --pages 5000 --workers 4
+
+Builds deterministic TEI documents (sections, long paragraphs, equations,
+figures, tables, lists, footnotes and a bibliography), extracts blocks once
+with GrobidTeiBlockExtractor, then times chunking alone and reports blocks/s
+and chunks/s. With --workers > 1 the ParallelBlockChunker is timed instead
+(process start-up included, as in an indexing job).
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import time
+from xml.sax.saxutils import escape
+
+from talk_to_pdf.backend.app.application.indexing.interfaces import BlockChunker
+from talk_to_pdf.backend.app.infrastructure.indexing.chunkers.block_chunker import DefaultBlockChunker
+from talk_to_pdf.backend.app.infrastructure.indexing.chunkers.parallel_chunker import ParallelBlockChunker
+from talk_to_pdf.backend.app.infrastructure.indexing.extractors.grobid_tei_block_extractor import (
+    GrobidTeiBlockExtractor,
+)
+
+_WORDS = (
+    "model data result method analysis system approach value error sample "
+    "training network layer feature signal gradient loss parameter kernel "
+    "matrix vector estimate bound proof theorem lemma baseline dataset"
+).split()
+
+
+def _sentence(rng: random.Random) -> str:
+    words = rng.choices(_WORDS, k=rng.randint(6, 28))
+    return " ".join(words).capitalize() + rng.choice((".", ".", ".", "?", "!"))
+
+
+def _paragraph(rng: random.Random, sentences: int) -> str:
+    return " ".join(_sentence(rng) for _ in range(sentences))
+
+
+def synthetic_tei(*, pages: int, seed: int = 0) -> str:
+    """
+    A TEI body of roughly `pages` pages (~3,000 characters each): a new div
+    every ~2 pages, mostly paragraphs, with occasional oversize paragraphs,
+    equations, figures, tables, lists and footnotes, plus references.
+    """
+    rng = random.Random(seed)
+    divs: list[str] = []
+    page_chars = 0
+    div_parts: list[str] = ["<head>Section 1</head>"]
+    page = 0
+    while page < pages:
+        roll = rng.random()
+        if roll < 0.70:
+            # ~1 in 20 paragraphs is long enough to be split
+            n = rng.randint(25, 60) if rng.random() < 0.05 else rng.randint(2, 8)
+            text = _paragraph(rng, n)
+            div_parts.append(f'<p>{escape(text)} <ref target="#b{rng.randint(0, 49)}">[{rng.randint(1, 50)}]</ref>.</p>')
+        elif roll < 0.78:
+            text = " + ".join(f"x_{i}^{rng.randint(1, 3)}" for i in range(rng.randint(2, 12)))
+            div_parts.append(f'<formula><label>{len(divs) + 1}.{len(div_parts)}</label>{escape(text)}</formula>')
+        elif roll < 0.84:
+            div_parts.append(f"<figure><figDesc>{escape(_paragraph(rng, rng.randint(1, 3)))}</figDesc></figure>")
+        elif roll < 0.88:
+            rows = rng.randint(3, 80)  # large tables are unsplittable
+            cells = " ".join(f"{rng.random():.4f}" for _ in range(rows * 4))
+            div_parts.append(f"<table>{cells}</table>")
+        elif roll < 0.95:
+            items = "".join(f"<item>{escape(_sentence(rng))}</item>" for _ in range(rng.randint(2, 6)))
+            div_parts.append(f"<list>{items}</list>")
+        else:
+            div_parts.append(f'<note place="foot">{escape(_sentence(rng))}</note>')
+
+        page_chars += len(div_parts[-1])
+        if page_chars >= 3000:
+            page_chars = 0
+            page += 1
+            if page % 2 == 0 and page < pages:
+                divs.append("<div>" + "".join(div_parts) + "</div>")
+                div_parts = [f"<head>Section {len(divs) + 1}</head>"]
+
+    divs.append("<div>" + "".join(div_parts) + "</div>")
+    bibl = "".join(f'<bibl xml:id="b{i}">{escape(_sentence(rng))}</bibl>' for i in range(50))
+    divs.append(f'<div type="references"><head>References</head><listBibl>{bibl}</listBibl></div>')
+    return (
+        '<TEI xmlns="http://www.tei-c.org/ns/1.0"><text><body>'
+        + "".join(divs)
+        + "</body></text></TEI>"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--pages", type=int, default=1000)
+    parser.add_argument("--docs", type=int, default=3, help="distinct synthetic documents")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per document")
+    parser.add_argument("--max-chars", type=int, default=1200)
+    parser.add_argument("--overlap-chars", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=0, help="processes for ParallelBlockChunker (0/1 = sequential)")
+    args = parser.parse_args()
+
+    extractor = GrobidTeiBlockExtractor()
+    chunker: BlockChunker = DefaultBlockChunker(max_chars=args.max_chars, overlap_chars=args.overlap_chars)
+    if args.workers > 1:
+        chunker = ParallelBlockChunker(inner=chunker, max_workers=args.workers, min_blocks=0)
+
+    blocks_per_s: list[float] = []
+    chunks_per_s: list[float] = []
+    for seed in range(args.docs):
+        blocks = extractor.extract(xml=synthetic_tei(pages=args.pages, seed=seed))
+        for _ in range(args.repeat):
+            t0 = time.perf_counter()
+            chunks = chunker.chunk(blocks=blocks)
+            elapsed = time.perf_counter() - t0
+            blocks_per_s.append(len(blocks) / elapsed)
+            chunks_per_s.append(len(chunks) / elapsed)
+        print(f"doc seed={seed}: {len(blocks)} blocks -> {len(chunks)} chunks")
+
+    print(
+        f"{args.pages} pages, max_chars={args.max_chars}, overlap_chars={args.overlap_chars}, "
+        f"workers={max(1, args.workers)}: "
+        f"median {statistics.median(blocks_per_s):,.0f} blocks/s, "
+        f"{statistics.median(chunks_per_s):,.0f} chunks/s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import Depends, Query, WebSocket, WebSocketException, status
+
+from talk_to_pdf.backend.app.api.v1.users.deps import DEV_USER, get_current_user_use_case
+from talk_to_pdf.backend.app.api.v1.users.mappers import token_claims_to_current_user
+from talk_to_pdf.backend.app.application.users import CurrentUserDTO
+from talk_to_pdf.backend.app.application.users.use_cases.get_current_user import GetCurrentUserUseCase
+from talk_to_pdf.backend.app.core.config import settings
+from talk_to_pdf.backend.app.core.security import decode_access_token
+from talk_to_pdf.backend.app.domain.users import UserNotFoundError
+
+
+def _bearer_token(websocket: WebSocket) -> str | None:
+    auth = websocket.headers.get("authorization", "")
+    scheme, _, token = auth.partition(" ")
+    return token if scheme.lower() == "bearer" and token else None
+
+
+async def get_ws_user(
+        websocket: WebSocket,
+        use_case: Annotated[GetCurrentUserUseCase, Depends(get_current_user_use_case)],
+        token: Annotated[str | None, Query()] = None,
+) -> CurrentUserDTO:
+    """
+    WebSocket flavour of get_logged_in_user. Browsers cannot set headers on a
+    WebSocket handshake, so the access token may also come as ?token=.
+    """
+    if settings.SKIP_AUTH:
+        return DEV_USER
+
+    policy_violation = WebSocketException(code=status.WS_1008_POLICY_VIOLATION)
+    token = token or _bearer_token(websocket)
+    if not token:
+        raise policy_violation
+    try:
+        payload = decode_access_token(token)
+        user_id = UUID(payload["sub"])
+    except Exception:
+        raise policy_violation
+
+    claimed = token_claims_to_current_user(payload) if settings.AUTH_TRUST_TOKEN_CLAIMS else None
+    try:
+        user = claimed or await use_case.execute(user_id, issued_at=payload.get("iat"))
+    except UserNotFoundError:
+        raise policy_violation
+    if not user.is_active:
+        raise policy_violation
+    return user
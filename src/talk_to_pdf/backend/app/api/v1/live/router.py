@@ -0,0 +1,77 @@
+from typing import Annotated, AsyncIterator
+from uuid import UUID
+
+import anyio
+
+from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect, status
+
+from talk_to_pdf.backend.app.api.v1.live.deps import get_ws_user
+from talk_to_pdf.backend.app.application.common.progress import ProgressEvent
+from talk_to_pdf.backend.app.application.indexing.interfaces import IndexStatusFeed
+from talk_to_pdf.backend.app.application.users import CurrentUserDTO
+from talk_to_pdf.backend.app.core.deps import get_index_status_feed
+
+router = APIRouter(prefix="/live", tags=["live"])
+
+ws_user_dep = Annotated[CurrentUserDTO, Depends(get_ws_user)]
+index_status_feed_dep = Annotated[IndexStatusFeed, Depends(get_index_status_feed)]
+
+
+async def _forward(
+        websocket: WebSocket,
+        events: AsyncIterator[ProgressEvent],
+        *,
+        project_id: UUID | None,
+) -> bool:
+    """Relay events until the feed ends (True) or the client is gone (False)."""
+    async for event in events:
+        if project_id is not None and event.payload.get("project_id") != str(project_id):
+            continue
+        try:
+            await websocket.send_json({"type": event.name, "data": event.payload})
+        except (WebSocketDisconnect, RuntimeError):
+            return False
+    return True
+
+
+async def _until_disconnect(websocket: WebSocket) -> None:
+    # client frames carry nothing we need; reading them is how a close is noticed
+    try:
+        while True:
+            await websocket.receive_text()
+    except WebSocketDisconnect:
+        return
+
+
+@router.websocket("/ws")
+async def live_updates(
+        websocket: WebSocket,
+        user: ws_user_dep,
+        feed: index_status_feed_dep,
+        project_id: UUID | None = None,
+) -> None:
+    """
+    Push channel for index status changes (replaces polling /indexing/.../latest).
+    Messages: {"type": "index_status", "data": {index_id, project_id, status, progress, ...}}.
+    """
+    feed_ended = False
+
+    # subscribe before accepting so nothing published after the handshake is missed
+    async with feed.subscribe(owner_id=user.id) as events:
+        await websocket.accept()
+        async with anyio.create_task_group() as tg:
+            async def forward() -> None:
+                nonlocal feed_ended
+                feed_ended = await _forward(websocket, events, project_id=project_id)
+                tg.cancel_scope.cancel()
+
+            async def watch_disconnect() -> None:
+                await _until_disconnect(websocket)
+                tg.cancel_scope.cancel()
+
+            tg.start_soon(forward)
+            tg.start_soon(watch_disconnect)
+
+    if feed_ended:
+        # the feed ended (listener lost): ask the client to reconnect
+        await websocket.close(code=status.WS_1012_SERVICE_RESTART)
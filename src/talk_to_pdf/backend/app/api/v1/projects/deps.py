@@ -5,6 +5,7 @@ from fastapi import Depends
 from talk_to_pdf.backend.app.application.projects.use_cases import CreateProjectUseCase, ListUserProjectsUseCase, \
     DeleteProjectUseCase, RenameProjectUseCase
 from talk_to_pdf.backend.app.application.projects.use_cases.get_project import GetProjectUseCase
+from talk_to_pdf.backend.app.core.config import settings
 from talk_to_pdf.backend.app.core.deps import get_uow, get_file_storage
 from talk_to_pdf.backend.app.domain.files.interfaces import FileStorage
 from talk_to_pdf.backend.app.domain.common.uow import UnitOfWork
@@ -14,7 +15,7 @@ async def get_create_project_use_case(
         uow: Annotated[UnitOfWork, Depends(get_uow)],
         storage: Annotated[FileStorage, Depends(get_file_storage)]
 ) -> CreateProjectUseCase:
-    return CreateProjectUseCase(uow,storage)
+    return CreateProjectUseCase(uow, storage, max_upload_bytes=settings.MAX_UPLOAD_BYTES)
 
 async def get_get_project_use_case(
         uow: Annotated[UnitOfWork, Depends(get_uow)],
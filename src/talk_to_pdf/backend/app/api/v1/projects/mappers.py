@@ -1,3 +1,4 @@
+from typing import AsyncIterator
 from uuid import UUID
 from fastapi import UploadFile
 
@@ -10,16 +11,21 @@ def get_create_project_input_dto(
         user_id: UUID,
         project_name:str,
         file: UploadFile,
-        file_bytes: bytes
+        chunk_size: int,
 ) -> CreateProjectInputDTO:
     return CreateProjectInputDTO(
         owner_id=user_id,
         name=project_name,
-        file_bytes=file_bytes,
+        content=iter_upload_chunks(file, chunk_size),
         filename=file.filename or "uploaded.pdf",
         content_type=file.content_type or "application/octet-stream",
     )
 
+async def iter_upload_chunks(file: UploadFile, chunk_size: int) -> AsyncIterator[bytes]:
+    # Starlette has already spooled the part to a temp file; hand it on piecewise
+    while chunk := await file.read(chunk_size):
+        yield chunk
+
 def get_get_project_input_dto(
     user_id: UUID,
         project_id:UUID
@@ -13,6 +13,8 @@ from talk_to_pdf.backend.app.application.projects.use_cases import CreateProject
     DeleteProjectUseCase, RenameProjectUseCase
 from talk_to_pdf.backend.app.application.projects.use_cases.get_project import GetProjectUseCase
 from talk_to_pdf.backend.app.application.users import CurrentUserDTO
+from talk_to_pdf.backend.app.core.config import settings
+from talk_to_pdf.backend.app.domain.files import FileTooLarge
 
 router = APIRouter(prefix="/projects", tags=["projects"])
 
@@ -31,8 +33,9 @@ async def create_project(
         name: Annotated[str, Form(min_length=1, max_length=100)],  # user typed name
         file: UploadFile = File(...),  # user uploaded file
 ):
-    file_bytes = await file.read()
-    dto = get_create_project_input_dto(user.id, name, file, file_bytes)
+    if file.size is not None and file.size > settings.MAX_UPLOAD_BYTES:
+        raise FileTooLarge(settings.MAX_UPLOAD_BYTES)
+    dto = get_create_project_input_dto(user.id, name, file, settings.UPLOAD_CHUNK_BYTES)
     project_dto = await use_case.execute(dto)
     return ProjectResponse.model_validate(project_dto)
 
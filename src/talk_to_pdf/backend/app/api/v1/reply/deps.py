@@ -1,9 +1,11 @@
 from functools import lru_cache
-from typing import Annotated, Callable
+from typing import Annotated, AsyncIterator, Callable
 
+import httpx
 from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from talk_to_pdf.backend.app.application.common.interfaces import ContextBuilder
+from talk_to_pdf.backend.app.application.common.interfaces import ContextBuilder, EmbedderFactory
 from talk_to_pdf.backend.app.application.reply.use_cases.create_message import CreateChatMessageUseCase
 from talk_to_pdf.backend.app.application.reply.use_cases.stream_reply import StreamReplyUseCase
 from talk_to_pdf.backend.app.application.reply.use_cases.create_chat import CreateChatUseCase
@@ -11,15 +13,25 @@ from talk_to_pdf.backend.app.application.reply.use_cases.get_chat import GetChat
 from talk_to_pdf.backend.app.application.reply.use_cases.list_chats import ListChatsUseCase
 from talk_to_pdf.backend.app.application.reply.use_cases.delete_chat import DeleteChatUseCase
 from talk_to_pdf.backend.app.application.reply.use_cases.get_chat_messages import GetChatMessagesUseCase
+from talk_to_pdf.backend.app.application.reply.use_cases.get_cited_chunks import GetCitedChunksUseCase
+from talk_to_pdf.backend.app.application.reply.interfaces import AnswerCache
+from talk_to_pdf.backend.app.application.retrieval.interfaces import RetrievalCache
 from talk_to_pdf.backend.app.application.retrieval.use_cases.build_index_context import BuildIndexContextUseCase
+from talk_to_pdf.backend.app.infrastructure.retrieval.cache import LruRetrievalCache, RedisRetrievalCacheBackend
 from talk_to_pdf.backend.app.infrastructure.retrieval.merger.mergers import DeterministicRetrievalResultMerger
 from talk_to_pdf.backend.app.core.config import settings
+from talk_to_pdf.backend.app.api.v1.users.deps import get_logged_in_user
+from talk_to_pdf.backend.app.application.users import CurrentUserDTO
 from talk_to_pdf.backend.app.core.deps import get_uow_factory, get_reply_generation_config, get_query_rewrite_config, \
-    get_reranker_config
+    get_reranker_config, get_read_uow_factory, get_read_session_router
+from talk_to_pdf.backend.app.infrastructure.db.read_routing import ReadSessionRouter
+from talk_to_pdf.backend.app.infrastructure.db.uow import SqlAlchemyUnitOfWork
 from talk_to_pdf.backend.app.domain.common.uow import UnitOfWork
 from talk_to_pdf.backend.app.domain.common.value_objects import ReplyGenerationConfig, QueryRewriteConfig, \
     RerankerConfig
+from talk_to_pdf.backend.app.infrastructure.common.embedders.coalescing import CoalescingEmbedderFactory
 from talk_to_pdf.backend.app.infrastructure.common.embedders.factory_openai_langchain import OpenAIEmbedderFactory
+from talk_to_pdf.backend.app.infrastructure.reply.answer_cache import InMemorySemanticAnswerCache
 from talk_to_pdf.backend.app.infrastructure.reply.query_rewriter.factory_openai_rewriter import \
     OpenAILlmQueryRewriterFactory
 from talk_to_pdf.backend.app.infrastructure.reply.query_rewriter.openai_query_rewriter import OpenAIQueryRewriter
@@ -30,11 +42,59 @@ from talk_to_pdf.backend.app.infrastructure.retrieval.rerankers.factory_openai_r
 from talk_to_pdf.backend.app.infrastructure.retrieval.rerankers.openai_reranker import OpenaiReranker
 
 
+# coalescing folds concurrent turns into few requests, so a small pool suffices
+_QUERY_EMBED_MAX_CONNECTIONS = 16
+
+
+@lru_cache(maxsize=1)
+def get_query_embed_http_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=_QUERY_EMBED_MAX_CONNECTIONS,
+            max_keepalive_connections=_QUERY_EMBED_MAX_CONNECTIONS,
+        ),
+        timeout=httpx.Timeout(60.0, connect=10.0),
+    )
+
+
 @lru_cache(maxsize=1)
-def get_open_ai_embedding_factory() -> OpenAIEmbedderFactory:
+def get_open_ai_embedding_factory() -> EmbedderFactory:
     if settings.OPENAI_API_KEY is None:
         raise RuntimeError("OPENAI_API_KEY must be set")
-    return OpenAIEmbedderFactory(api_key=settings.OPENAI_API_KEY)
+    if settings.QUERY_EMBED_LINGER_MS <= 0:
+        return OpenAIEmbedderFactory(api_key=settings.OPENAI_API_KEY)
+    # concurrent chat turns share one client and, within the linger window, one request
+    return CoalescingEmbedderFactory(
+        inner=OpenAIEmbedderFactory(api_key=settings.OPENAI_API_KEY, http_async_client=get_query_embed_http_client()),
+        linger_s=settings.QUERY_EMBED_LINGER_MS / 1000,
+        max_items=settings.QUERY_EMBED_MAX_ITEMS,
+        max_chars=settings.QUERY_EMBED_MAX_CHARS,
+    )
+
+@lru_cache(maxsize=1)
+def get_retrieval_cache() -> RetrievalCache | None:
+    if settings.RETRIEVAL_CACHE_MAX_ENTRIES <= 0:
+        return None
+    shared = None
+    if settings.RETRIEVAL_CACHE_REDIS_URL:
+        import redis.asyncio as redis
+
+        shared = RedisRetrievalCacheBackend(redis.from_url(settings.RETRIEVAL_CACHE_REDIS_URL))
+    return LruRetrievalCache(
+        max_entries=settings.RETRIEVAL_CACHE_MAX_ENTRIES,
+        shared=shared,
+        shared_ttl_s=settings.RETRIEVAL_CACHE_SHARED_TTL_S,
+    )
+
+@lru_cache(maxsize=1)
+def get_answer_cache() -> AnswerCache | None:
+    if not settings.ANSWER_CACHE_ENABLED:
+        return None
+    return InMemorySemanticAnswerCache(
+        min_similarity=settings.ANSWER_CACHE_MIN_SIMILARITY,
+        max_indexes=settings.ANSWER_CACHE_MAX_INDEXES,
+        max_entries_per_index=settings.ANSWER_CACHE_MAX_ENTRIES_PER_INDEX,
+    )
 
 @lru_cache(maxsize=1)
 def get_openai_reranker(conf: Annotated[RerankerConfig,Depends(get_reranker_config)]) -> OpenaiReranker:
@@ -59,27 +119,53 @@ def get_open_ai_query_rewriter(
         raise RuntimeError("OPENAI_API_KEY must be set")
     return OpenAILlmQueryRewriterFactory(api_key=settings.OPENAI_API_KEY).create(config)
 
+async def get_history_session(
+        user: Annotated[CurrentUserDTO, Depends(get_logged_in_user)],
+        router: Annotated[ReadSessionRouter, Depends(get_read_session_router)],
+) -> AsyncIterator[AsyncSession]:
+    # replica, unless this user just posted (read-your-writes, see query_project)
+    async with router.session(key=user.id) as session:
+        yield session
+
+
+def get_history_uow_factory(
+        session: Annotated[AsyncSession, Depends(get_history_session)]
+) -> Callable[[], UnitOfWork]:
+    def _factory() -> UnitOfWork:
+        return SqlAlchemyUnitOfWork(session)
+    return _factory
+
+
 def get_build_index_context_use_case(
         uow_factory: Annotated[Callable[[], UnitOfWork], Depends(get_uow_factory)],
-        embedding_factory: Annotated[OpenAIEmbedderFactory, Depends(get_open_ai_embedding_factory)],
+        read_uow_factory: Annotated[Callable[[], UnitOfWork], Depends(get_read_uow_factory)],
+        embedding_factory: Annotated[EmbedderFactory, Depends(get_open_ai_embedding_factory)],
         query_rewriter: Annotated[OpenAIQueryRewriter, Depends(get_open_ai_query_rewriter)],
-        reranker: Annotated[OpenaiReranker, Depends(get_openai_reranker)]
+        reranker: Annotated[OpenaiReranker, Depends(get_openai_reranker)],
+        retrieval_cache: Annotated[RetrievalCache | None, Depends(get_retrieval_cache)],
 ) -> BuildIndexContextUseCase:
     return BuildIndexContextUseCase(
         uow_factory=uow_factory,
+        read_uow_factory=read_uow_factory,
         embedder_factory=embedding_factory,
         reranker=reranker,
         max_top_k=settings.MAX_TOP_K,
         max_top_n=settings.MAX_TOP_N,
         query_rewriter=query_rewriter,
         retrieval_merger=DeterministicRetrievalResultMerger(w_vec=settings.RETRIEVAL_MERGER_WEIGHT_VEC,w_fts=settings.RETRIEVAL_MERGER_WEIGHT_FTS),
+        retrieval_cache=retrieval_cache,
     )
 
 def get_get_chat_messages_use_case(
-    uow_factory: Annotated[Callable[[], UnitOfWork], Depends(get_uow_factory)]
+    uow_factory: Annotated[Callable[[], UnitOfWork], Depends(get_history_uow_factory)]
 ) -> GetChatMessagesUseCase:
     return GetChatMessagesUseCase(uow_factory=uow_factory)
 
+def get_get_cited_chunks_use_case(
+    uow_factory: Annotated[Callable[[], UnitOfWork], Depends(get_history_uow_factory)]
+) -> GetCitedChunksUseCase:
+    return GetCitedChunksUseCase(uow_factory=uow_factory)
+
 def get_create_chat_message_use_case(uow_factory: Annotated[Callable[[], UnitOfWork], Depends(get_uow_factory)]) -> CreateChatMessageUseCase:
     return CreateChatMessageUseCase(uow_factory=uow_factory)
 
@@ -88,15 +174,21 @@ def get_stream_reply_use_case(
         uow_factory: Annotated[Callable[[], UnitOfWork], Depends(get_uow_factory)],
         context_builder: Annotated[ContextBuilder, Depends(get_build_index_context_use_case)],
         create_chat_message_uc: Annotated[CreateChatMessageUseCase, Depends(get_create_chat_message_use_case)],
-        get_chat_messages_uc: Annotated[GetChatMessagesUseCase, Depends(get_get_chat_messages_use_case)],
-        reply_generator: Annotated[OpenAIReplyGenerator, Depends(get_open_ai_reply_generator)]
+        reply_generator: Annotated[OpenAIReplyGenerator, Depends(get_open_ai_reply_generator)],
+        answer_cache: Annotated[AnswerCache | None, Depends(get_answer_cache)],
+        embedding_factory: Annotated[EmbedderFactory, Depends(get_open_ai_embedding_factory)],
 ) -> StreamReplyUseCase:
     return StreamReplyUseCase(
         uow_factory=uow_factory,
         ctx_builder_uc=context_builder,
         create_msg_uc=create_chat_message_uc,
-        get_chat_messages_uc=get_chat_messages_uc,
         reply_generator=reply_generator,
+        history_max_turns=settings.QUERY_REWRITER_MAX_TURN,
+        # stable_prefix: move the history window start in whole windows, not one turn at a time
+        history_align_turns=settings.QUERY_REWRITER_MAX_TURN if settings.REPLY_PROMPT_LAYOUT == "stable_prefix" else 1,
+        context_max_tokens=settings.REPLY_MAX_CONTEXT_TOKENS,
+        answer_cache=answer_cache,
+        embedder_factory=embedding_factory if answer_cache is not None else None,
     )
 
 
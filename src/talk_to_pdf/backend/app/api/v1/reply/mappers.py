@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import base64
+import binascii
+from datetime import datetime
 from uuid import UUID
 
 from talk_to_pdf.backend.app.api.v1.reply.schemas import (
@@ -12,6 +15,9 @@ from talk_to_pdf.backend.app.api.v1.reply.schemas import (
     ListChatsResponse,
     MessageResponse,
     ListMessagesResponse,
+    CitedChunksRequest,
+    CitedChunkContentResponse,
+    CitedChunksResponse,
 )
 from talk_to_pdf.backend.app.application.reply.dto import (
     ReplyOutputDTO,
@@ -23,7 +29,12 @@ from talk_to_pdf.backend.app.application.reply.dto import (
     DeleteChatInputDTO,
     MessageDTO,
     GetChatMessagesInputDTO,
+    MessagePageDTO,
+    GetCitedChunksInputDTO,
+    CitedChunkContentDTO,
 )
+from talk_to_pdf.backend.app.domain.reply.errors import InvalidMessageCursor
+from talk_to_pdf.backend.app.domain.reply.value_objects import MessageCursor
 
 
 def to_search_project_context_input(dto: QueryRequest, *, owner_id) -> ReplyInputDTO:
@@ -126,11 +137,36 @@ def list_chats_dto_to_response(dtos: list[ChatDTO]) -> ListChatsResponse:
 # -------------------------
 # Message mappers
 # -------------------------
-def to_get_chat_messages_input_dto(chat_id: UUID, *, owner_id: UUID, limit: int = 50) -> GetChatMessagesInputDTO:
+def encode_message_cursor(created_at: datetime, message_id: UUID) -> str:
+    raw = f"{created_at.isoformat()}|{message_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_message_cursor(cursor: str) -> MessageCursor:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, message_id = base64.urlsafe_b64decode(padded).decode().split("|", 1)
+        return MessageCursor(created_at=datetime.fromisoformat(created_at), id=UUID(message_id))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise InvalidMessageCursor() from e
+
+
+def to_get_chat_messages_input_dto(
+    chat_id: UUID,
+    *,
+    owner_id: UUID,
+    limit: int = 50,
+    before: str | None = None,
+    after: str | None = None,
+    include_citation_content: bool = True,
+) -> GetChatMessagesInputDTO:
     return GetChatMessagesInputDTO(
         owner_id=owner_id,
         chat_id=chat_id,
         limit=limit,
+        before=decode_message_cursor(before) if before else None,
+        after=decode_message_cursor(after) if after else None,
+        include_citation_content=include_citation_content,
     )
 
 
@@ -143,10 +179,29 @@ def message_dto_to_response(dto: MessageDTO) -> MessageResponse:
         created_at=dto.created_at.isoformat(),
         citations=dto.citations,
         metrics=dto.metrics,
+        truncated=dto.truncated,
     )
 
 
-def list_messages_dto_to_response(dtos: list[MessageDTO]) -> ListMessagesResponse:
+def list_messages_dto_to_response(page: MessagePageDTO) -> ListMessagesResponse:
+    items = page.items
     return ListMessagesResponse(
-        items=[message_dto_to_response(dto) for dto in dtos]
+        items=[message_dto_to_response(dto) for dto in items],
+        has_more=page.has_more,
+        before_cursor=encode_message_cursor(items[0].created_at, items[0].id) if items else None,
+        after_cursor=encode_message_cursor(items[-1].created_at, items[-1].id) if items else None,
+    )
+
+
+def to_get_cited_chunks_input_dto(index_id: UUID, req: CitedChunksRequest, *, owner_id: UUID) -> GetCitedChunksInputDTO:
+    return GetCitedChunksInputDTO(
+        owner_id=owner_id,
+        index_id=index_id,
+        chunk_ids=list(req.chunk_ids),
+    )
+
+
+def cited_chunks_dto_to_response(dtos: list[CitedChunkContentDTO]) -> CitedChunksResponse:
+    return CitedChunksResponse(
+        items=[CitedChunkContentResponse(chunk_id=dto.chunk_id, content=dto.content) for dto in dtos]
     )
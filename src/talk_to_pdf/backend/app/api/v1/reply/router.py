@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from typing import Annotated
+import logging
+from typing import Annotated, Literal
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status, Query
+from fastapi import APIRouter, Depends, Request, status, Query
 from fastapi.responses import StreamingResponse
 
 from talk_to_pdf.backend.app.api.v1.reply.deps import (
@@ -13,6 +14,7 @@ from talk_to_pdf.backend.app.api.v1.reply.deps import (
     get_list_chats_use_case,
     get_delete_chat_use_case,
     get_get_chat_messages_use_case,
+    get_get_cited_chunks_use_case,
 )
 from talk_to_pdf.backend.app.api.v1.reply.mappers import (
     to_search_project_context_input,
@@ -25,6 +27,8 @@ from talk_to_pdf.backend.app.api.v1.reply.mappers import (
     list_chats_dto_to_response,
     to_get_chat_messages_input_dto,
     list_messages_dto_to_response,
+    to_get_cited_chunks_input_dto,
+    cited_chunks_dto_to_response,
 )
 from talk_to_pdf.backend.app.api.v1.reply.schemas import (
     QueryRequest,
@@ -33,6 +37,15 @@ from talk_to_pdf.backend.app.api.v1.reply.schemas import (
     ChatResponse,
     ListChatsResponse,
     ListMessagesResponse,
+    CitedChunksRequest,
+    CitedChunksResponse,
+)
+from talk_to_pdf.backend.app.api.v1.reply.streaming import (
+    with_heartbeats,
+    stop_on_disconnect,
+    encode_sse,
+    encode_ndjson,
+    error_event,
 )
 from talk_to_pdf.backend.app.api.v1.users.deps import get_logged_in_user
 from talk_to_pdf.backend.app.application.reply.use_cases.stream_reply import StreamReplyUseCase
@@ -41,8 +54,14 @@ from talk_to_pdf.backend.app.application.reply.use_cases.get_chat import GetChat
 from talk_to_pdf.backend.app.application.reply.use_cases.list_chats import ListChatsUseCase
 from talk_to_pdf.backend.app.application.reply.use_cases.delete_chat import DeleteChatUseCase
 from talk_to_pdf.backend.app.application.reply.use_cases.get_chat_messages import GetChatMessagesUseCase
+from talk_to_pdf.backend.app.application.reply.use_cases.get_cited_chunks import GetCitedChunksUseCase
 from talk_to_pdf.backend.app.application.users import CurrentUserDTO
+from talk_to_pdf.backend.app.core.config import settings
+from talk_to_pdf.backend.app.core.deps import get_read_session_router
+from talk_to_pdf.backend.app.infrastructure.db.read_routing import ReadSessionRouter
+
 
+logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["reply"])
 
@@ -53,6 +72,8 @@ get_chat_dep = Annotated[GetChatUseCase, Depends(get_get_chat_use_case)]
 list_chats_dep = Annotated[ListChatsUseCase, Depends(get_list_chats_use_case)]
 delete_chat_dep = Annotated[DeleteChatUseCase, Depends(get_delete_chat_use_case)]
 get_chat_messages_dep = Annotated[GetChatMessagesUseCase, Depends(get_get_chat_messages_use_case)]
+get_cited_chunks_dep = Annotated[GetCitedChunksUseCase, Depends(get_get_cited_chunks_use_case)]
+read_router_dep = Annotated[ReadSessionRouter, Depends(get_read_session_router)]
 
 
 # -------------------------
@@ -64,18 +85,48 @@ get_chat_messages_dep = Annotated[GetChatMessagesUseCase, Depends(get_get_chat_m
 )
 async def query_project(
     body: QueryRequest,
+    request: Request,
     user: logged_in_user_dep,
     uc: stream_reply_dep,
+    read_router: read_router_dep,
+    stream_format: Literal["text", "sse", "ndjson"] = Query(default="text"),
 ) -> StreamingResponse:
     app_dto = to_search_project_context_input(body, owner_id=user.id)
-
-    async def stream_generator():
-        async for chunk in uc.execute(app_dto):
-            yield chunk
+    # this request writes the user's chat messages: keep their history reads on
+    # the primary until the replica has surely caught up (pinned again at the end)
+    read_router.pin_primary(user.id)
+
+    if stream_format == "text":
+        async def stream_generator():
+            try:
+                async for chunk in stop_on_disconnect(uc.execute(app_dto), request.is_disconnected):
+                    yield chunk
+            finally:
+                read_router.pin_primary(user.id)
+
+        return StreamingResponse(
+            stream_generator(),
+            media_type="text/plain",
+        )
+
+    encode = encode_sse if stream_format == "sse" else encode_ndjson
+
+    async def event_generator():
+        events = with_heartbeats(uc.execute_events(app_dto), interval_s=settings.REPLY_STREAM_HEARTBEAT_S)
+        try:
+            async for event in stop_on_disconnect(events, request.is_disconnected):
+                yield encode(event)
+        except Exception as e:
+            # headers are already sent; report failures in-band
+            logger.exception("Reply stream failed", exc_info=e)
+            yield encode(error_event(e))
+        finally:
+            read_router.pin_primary(user.id)
 
     return StreamingResponse(
-        stream_generator(),
-        media_type="text/plain",
+        event_generator(),
+        media_type="text/event-stream" if stream_format == "sse" else "application/x-ndjson",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
 
 
@@ -156,8 +207,34 @@ async def get_chat_messages(
     user: logged_in_user_dep,
     uc: get_chat_messages_dep,
     limit: int = Query(default=50, ge=1, le=100),
+    before: str | None = Query(default=None),
+    after: str | None = Query(default=None),
+    include_citation_content: bool = Query(default=True),
 ) -> ListMessagesResponse:
-    dto = to_get_chat_messages_input_dto(chat_id, owner_id=user.id, limit=limit)
-    messages = await uc.execute(dto)
-    return list_messages_dto_to_response(messages)
+    dto = to_get_chat_messages_input_dto(
+        chat_id,
+        owner_id=user.id,
+        limit=limit,
+        before=before,
+        after=after,
+        include_citation_content=include_citation_content,
+    )
+    page = await uc.execute(dto)
+    return list_messages_dto_to_response(page)
+
+
+@router.post(
+    "/indexes/{index_id}/chunks/batch",
+    response_model=CitedChunksResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def get_cited_chunks(
+    index_id: UUID,
+    body: CitedChunksRequest,
+    user: logged_in_user_dep,
+    uc: get_cited_chunks_dep,
+) -> CitedChunksResponse:
+    dto = to_get_cited_chunks_input_dto(index_id, body, owner_id=user.id)
+    chunks = await uc.execute(dto)
+    return cited_chunks_dto_to_response(chunks)
 
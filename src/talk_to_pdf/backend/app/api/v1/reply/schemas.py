@@ -79,7 +79,25 @@ class MessageResponse(BaseModel):
     created_at: str
     citations: dict[str, Any] | None = None
     metrics: dict[str, Any] | None = None
+    truncated: bool = False
 
 
 class ListMessagesResponse(BaseModel):
     items: list[MessageResponse]
+    has_more: bool = False
+    # pass as ?before= to load older messages, ?after= to load newer ones
+    before_cursor: str | None = None
+    after_cursor: str | None = None
+
+
+class CitedChunksRequest(BaseModel):
+    chunk_ids: list[UUID] = Field(min_length=1, max_length=100)
+
+
+class CitedChunkContentResponse(BaseModel):
+    chunk_id: UUID
+    content: str
+
+
+class CitedChunksResponse(BaseModel):
+    items: list[CitedChunkContentResponse]
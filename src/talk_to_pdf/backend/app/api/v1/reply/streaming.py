@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from contextlib import aclosing
+from typing import AsyncGenerator, Awaitable, Callable, TypeVar
+
+from talk_to_pdf.backend.app.application.common.progress import ProgressEvent
+
+HEARTBEAT = ProgressEvent(name="heartbeat", payload={})
+
+T = TypeVar("T")
+
+_DONE = object()
+_DOMAIN_PKG = "talk_to_pdf.backend.app.domain."
+
+
+async def with_heartbeats(
+    events: AsyncGenerator[ProgressEvent, None],
+    *,
+    interval_s: float,
+) -> AsyncGenerator[ProgressEvent, None]:
+    """
+    Interleave HEARTBEAT whenever `events` is idle for `interval_s`.
+
+    The source is consumed by a single pump task, so it never hops between tasks
+    (anyio cancel scopes inside retrieval/LLM calls stay valid). Closing this
+    generator cancels the pump, which cancels whatever the source awaits upstream.
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=64)
+
+    async def pump() -> None:
+        try:
+            async with aclosing(events) as it:
+                async for ev in it:
+                    await queue.put(ev)
+        except Exception as e:  # surfaced to the consumer below
+            await queue.put(e)
+        else:
+            await queue.put(_DONE)
+
+    task = asyncio.create_task(pump())
+    try:
+        while True:
+            try:
+                item = await asyncio.wait_for(queue.get(), timeout=interval_s)
+            except asyncio.TimeoutError:
+                yield HEARTBEAT
+                continue
+            if item is _DONE:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        if not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+
+async def stop_on_disconnect(
+    events: AsyncGenerator[T, None],
+    is_disconnected: Callable[[], Awaitable[bool]],
+) -> AsyncGenerator[T, None]:
+    """Stop (and close the source) as soon as the client is gone."""
+    async with aclosing(events) as it:
+        async for ev in it:
+            if await is_disconnected():
+                return
+            yield ev
+
+
+def encode_sse(event: ProgressEvent) -> str:
+    if event.name == HEARTBEAT.name:
+        # SSE comment frame: keeps proxies from timing out, ignored by EventSource
+        return ": heartbeat\n\n"
+    data = json.dumps(event.payload, ensure_ascii=False, default=str)
+    return f"event: {event.name}\ndata: {data}\n\n"
+
+
+def encode_ndjson(event: ProgressEvent) -> str:
+    return json.dumps({"event": event.name, "data": event.payload}, ensure_ascii=False, default=str) + "\n"
+
+
+def error_event(exc: Exception) -> ProgressEvent:
+    # domain errors are user-facing; anything else stays opaque (as in exception_handlers)
+    if type(exc).__module__.startswith(_DOMAIN_PKG):
+        return ProgressEvent(name="error", payload={"type": type(exc).__name__, "detail": str(exc)})
+    return ProgressEvent(name="error", payload={"type": "InternalError", "detail": "Internal server error"})
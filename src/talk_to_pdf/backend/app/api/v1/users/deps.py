@@ -1,10 +1,13 @@
 import uuid
+from functools import lru_cache
 from typing import Annotated
 from uuid import UUID
 from fastapi import HTTPException, status
 from fastapi.params import Depends
 from fastapi.security import OAuth2PasswordBearer
+from talk_to_pdf.backend.app.api.v1.users.mappers import token_claims_to_current_user
 from talk_to_pdf.backend.app.application.users import CurrentUserDTO
+from talk_to_pdf.backend.app.application.users.interfaces import CurrentUserCache
 from talk_to_pdf.backend.app.application.users.use_cases import RegisterUserUseCase, LoginUserUseCase
 from talk_to_pdf.backend.app.application.users.use_cases.get_current_user import GetCurrentUserUseCase
 from talk_to_pdf.backend.app.core.security import BcryptPasswordHasher, decode_access_token
@@ -12,6 +15,7 @@ from talk_to_pdf.backend.app.core.deps import get_uow
 from talk_to_pdf.backend.app.domain.users import UserNotFoundError, User, UserEmail
 from talk_to_pdf.backend.app.domain.common.uow import UnitOfWork
 from talk_to_pdf.backend.app.core.config import settings
+from talk_to_pdf.backend.app.infrastructure.users.current_user_cache import TTLCurrentUserCache
 
 oauth2_scheme = OAuth2PasswordBearer(
     tokenUrl="/api/v1/auth/token",
@@ -19,7 +23,9 @@ oauth2_scheme = OAuth2PasswordBearer(
 )
 
 
+@lru_cache
 def get_password_hasher() -> BcryptPasswordHasher:
+    # one pool + admission limit per process
     return BcryptPasswordHasher()
 
 
@@ -37,10 +43,19 @@ async def get_login_user_use_case(
     return LoginUserUseCase(uow, hasher)
 
 
+@lru_cache
+def get_current_user_cache() -> CurrentUserCache:
+    return TTLCurrentUserCache(
+        ttl_s=settings.AUTH_USER_CACHE_TTL_S,
+        max_entries=settings.AUTH_USER_CACHE_MAX_ENTRIES,
+    )
+
+
 async def get_current_user_use_case(
-        uow: Annotated[UnitOfWork, Depends(get_uow)]
+        uow: Annotated[UnitOfWork, Depends(get_uow)],
+        cache: Annotated[CurrentUserCache, Depends(get_current_user_cache)],
 ) -> GetCurrentUserUseCase:
-    return GetCurrentUserUseCase(uow)
+    return GetCurrentUserUseCase(uow, cache)
 
 DEV_USER = CurrentUserDTO(id=UUID('79376ad0-f4ea-42a7-ac46-5bbbbbe45f46'), email="dev@example.com", name="devmod", is_active=True)
 
@@ -64,6 +79,15 @@ async def get_logged_in_user(
 ) -> CurrentUserDTO:
     if settings.SKIP_AUTH:
         return DEV_USER
+    if settings.AUTH_TRUST_TOKEN_CLAIMS:
+        claimed = token_claims_to_current_user(payload)
+        if claimed is not None:
+            if not claimed.is_active:
+                raise HTTPException(
+                    status_code=status.HTTP_403_FORBIDDEN,
+                    detail="Inactive user",
+                )
+            return claimed
     sub = payload.get("sub")
     if sub is None:
         raise HTTPException(
@@ -80,7 +104,7 @@ async def get_logged_in_user(
         )
 
     try:
-        user = await use_case.execute(user_id)
+        user = await use_case.execute(user_id, issued_at=payload.get("iat"))
     except UserNotFoundError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -1,7 +1,10 @@
 from __future__ import annotations
+from typing import Any
+from uuid import UUID
 from pydantic import EmailStr, TypeAdapter
 from talk_to_pdf.backend.app.api.v1.users import RegisterUserRequest, UserResponse, LoginRequest
-from talk_to_pdf.backend.app.application.users import RegisterUserInput, RegisterUserOutput, LoginUserInputDTO
+from talk_to_pdf.backend.app.application.users import RegisterUserInput, RegisterUserOutput, LoginUserInputDTO, \
+    LoginUserOutputDTO, CurrentUserDTO
 
 
 def request_to_input_dto(user_request:RegisterUserRequest)->RegisterUserInput:
@@ -24,4 +27,20 @@ def login_request_to_input_dto(data: LoginRequest) -> LoginUserInputDTO:
     return LoginUserInputDTO(
         email=str(data.email),
         password=data.password,
-    )
\ No newline at end of file
+    )
+
+def login_output_to_token_claims(user: LoginUserOutputDTO) -> dict[str, Any]:
+    return {"email": user.email, "name": user.name, "active": user.is_active}
+
+
+def token_claims_to_current_user(payload: dict) -> CurrentUserDTO | None:
+    """None when the token predates user claims (caller falls back to the DB)."""
+    try:
+        return CurrentUserDTO(
+            id=UUID(payload["sub"]),
+            email=payload["email"],
+            name=payload["name"],
+            is_active=bool(payload["active"]),
+        )
+    except (KeyError, TypeError, ValueError):
+        return None
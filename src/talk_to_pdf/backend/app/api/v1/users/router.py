@@ -6,7 +6,7 @@ from talk_to_pdf.backend.app.api.v1.users import UserResponse, RegisterUserReque
 from talk_to_pdf.backend.app.api.v1.users.deps import get_register_user_use_case, get_login_user_use_case, \
     get_logged_in_user
 from talk_to_pdf.backend.app.api.v1.users.mappers import request_to_input_dto, output_dto_to_response, \
-    login_request_to_input_dto
+    login_request_to_input_dto, login_output_to_token_claims
 from talk_to_pdf.backend.app.application.users import RegisterUserOutput, CurrentUserDTO
 from talk_to_pdf.backend.app.application.users.use_cases import RegisterUserUseCase, LoginUserUseCase
 from talk_to_pdf.backend.app.core.security import create_access_token
@@ -40,7 +40,7 @@ async def login(
 ) -> TokenResponse:
     input_dto = login_request_to_input_dto(payload)
     result = await use_case.execute(input_dto)
-    access_token = create_access_token(subject=str(result.id))
+    access_token = create_access_token(subject=str(result.id), claims=login_output_to_token_claims(result))
     return TokenResponse(access_token=access_token)
 
 @router.get("/me")
@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import Protocol
 
 from talk_to_pdf.backend.app.application.common.dto import SearchInputDTO, ContextPackDTO
+from talk_to_pdf.backend.app.application.common.progress import ProgressSink
 from talk_to_pdf.backend.app.domain.common.value_objects import EmbedConfig
 
 
@@ -15,4 +16,4 @@ class EmbedderFactory(Protocol):
 
 
 class ContextBuilder(Protocol):
-    async def execute(self, dto: SearchInputDTO) -> ContextPackDTO: ...
+    async def execute(self, dto: SearchInputDTO, *, progress: ProgressSink | None = None) -> ContextPackDTO: ...
@@ -1,7 +1,9 @@
 # app/application/common/progress.py
 from __future__ import annotations
+
+import asyncio
 from dataclasses import dataclass
-from typing import Protocol, Any
+from typing import Protocol, Any, AsyncIterator
 
 
 @dataclass(frozen=True, slots=True)
@@ -12,3 +14,31 @@ class ProgressEvent:
 
 class ProgressSink(Protocol):
     async def emit(self, event: ProgressEvent) -> None: ...
+
+
+class QueueProgressSink:
+    """
+    Buffers events so a caller can forward them (e.g. onto a stream) while the
+    producing coroutine is still running in its own task.
+    """
+
+    def __init__(self) -> None:
+        self._queue: asyncio.Queue[ProgressEvent] = asyncio.Queue()
+
+    async def emit(self, event: ProgressEvent) -> None:
+        self._queue.put_nowait(event)
+
+    async def drain_while(self, task: asyncio.Future) -> AsyncIterator[ProgressEvent]:
+        """Yield events as they arrive until `task` finishes, then flush the rest."""
+        while not task.done():
+            getter = asyncio.ensure_future(self._queue.get())
+            try:
+                await asyncio.wait({task, getter}, return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                if not getter.done():
+                    getter.cancel()
+            if getter.done() and not getter.cancelled():
+                yield getter.result()
+
+        while not self._queue.empty():
+            yield self._queue.get_nowait()
@@ -1,3 +1,6 @@
+import time
+from typing import Callable
+
 from talk_to_pdf.backend.app.domain.indexing.enums import IndexStatus, IndexStep, STEP_PROGRESS
 
 
@@ -30,3 +33,48 @@ async def report(
         error=error,
         meta=meta,
     )
+
+
+class ProgressThrottle:
+    """
+    Decides which progress updates are worth a DB write: the first one, then
+    whenever `min_interval_s` has passed or progress moved by `min_delta` points.
+    """
+
+    def __init__(
+        self,
+        *,
+        min_interval_s: float,
+        min_delta: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._min_interval_s = min_interval_s
+        self._min_delta = min_delta
+        self._clock = clock
+        self._last_at: float | None = None
+        self._last_progress = 0
+
+    def should_write(self, progress: int) -> bool:
+        now = self._clock()
+        if (
+            self._last_at is not None
+            and now - self._last_at < self._min_interval_s
+            and progress - self._last_progress < self._min_delta
+        ):
+            return False
+        self._last_at = now
+        self._last_progress = progress
+        return True
+
+
+class CancelFlag:
+    """In-memory cancel signal for one index; kept current by a CancelWatcher."""
+
+    def __init__(self) -> None:
+        self._set = False
+
+    def set(self) -> None:
+        self._set = True
+
+    def is_set(self) -> bool:
+        return self._set
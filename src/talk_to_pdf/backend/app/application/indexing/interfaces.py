@@ -1,8 +1,12 @@
 from __future__ import annotations
 
-from typing import Protocol
+from contextlib import AbstractAsyncContextManager
+from typing import AsyncIterator, Awaitable, Callable, Protocol
 from uuid import UUID
 
+from talk_to_pdf.backend.app.application.common.progress import ProgressEvent
+from talk_to_pdf.backend.app.application.indexing.indexing_progress import CancelFlag
+
 from talk_to_pdf.backend.app.domain.indexing.value_objects import Block, ChunkDraft
 
 
@@ -26,3 +30,25 @@ class BlockExtractor(Protocol):
 class BlockChunker(Protocol):
     def chunk(self, *, blocks: list[Block]) -> list[ChunkDraft]: ...
 
+
+
+class IndexStatusFeed(Protocol):
+    def subscribe(self, *, owner_id: UUID) -> AbstractAsyncContextManager[AsyncIterator[ProgressEvent]]:
+        """Live `index_status` events for every index owned by owner_id."""
+        ...
+
+    async def aclose(self) -> None: ...
+
+
+class CancelWatcher(Protocol):
+    def watch(
+        self,
+        *,
+        index_id: UUID,
+        is_cancel_requested: Callable[[], Awaitable[bool]],
+    ) -> AbstractAsyncContextManager[CancelFlag]:
+        """
+        Yield a CancelFlag that flips once cancellation of index_id is requested.
+        `is_cancel_requested` is the authoritative (DB) check the watcher may poll.
+        """
+        ...
@@ -1,7 +1,7 @@
 from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import AsyncIterable, Optional
 from uuid import UUID
 
 
@@ -11,7 +11,7 @@ from uuid import UUID
 class CreateProjectInputDTO:
     owner_id: UUID
     name: str
-    file_bytes: bytes
+    content: AsyncIterable[bytes]
     filename: str
     content_type: str
 
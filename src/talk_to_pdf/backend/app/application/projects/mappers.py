@@ -47,6 +47,7 @@ def build_project_with_main_document(
         storage_path=stored.storage_path,
         content_type=stored.content_type,
         size_bytes=stored.size_bytes,
+        sha256=stored.sha256,
     )
     project = project.attach_main_document(document)
     return project
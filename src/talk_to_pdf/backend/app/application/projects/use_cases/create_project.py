@@ -6,30 +6,34 @@ from talk_to_pdf.backend.app.application.projects.mappers import (
     project_domain_to_output_dto,
     project_input_dto_to_domain,
 )
-from talk_to_pdf.backend.app.domain.files.errors import FailedToSaveFile
+from talk_to_pdf.backend.app.domain.files.errors import FailedToSaveFile, FileTooLarge
 from talk_to_pdf.backend.app.domain.files.interfaces import FileStorage
 from talk_to_pdf.backend.app.domain.projects.errors import FailedToCreateProject
 from talk_to_pdf.backend.app.domain.common.uow import UnitOfWork
 
 
 class CreateProjectUseCase:
-    def __init__(self, uow: UnitOfWork, file_storage: FileStorage) -> None:
+    def __init__(self, uow: UnitOfWork, file_storage: FileStorage, *, max_upload_bytes: int | None = None) -> None:
         self._uow = uow
         self._file_storage = file_storage
+        self._max_upload_bytes = max_upload_bytes
 
     async def execute(self, dto: CreateProjectInputDTO) -> ProjectDTO:
         async with self._uow:
             project = project_input_dto_to_domain(dto)
 
-            # 1) Save the file first
+            # 1) Stream the file to storage first
             try:
                 stored = await self._file_storage.save(
                     owner_id=dto.owner_id,
                     project_id=project.id,
                     filename=dto.filename,
-                    content=dto.file_bytes,
+                    content=dto.content,
                     content_type=dto.content_type,
+                    max_bytes=self._max_upload_bytes,
                 )
+            except FileTooLarge:
+                raise
             except Exception as e:
                 # file save failed, nothing to clean up
                 raise FailedToSaveFile("Could not save uploaded file") from e
@@ -43,7 +47,7 @@ class CreateProjectUseCase:
             except Exception:
                 # DB failed -> cleanup the file, then re-raise original DB error
                 try:
-                    await self._file_storage.delete(stored.storage_path)
+                    await self._file_storage.delete(storage_path=stored.storage_path)
                 except Exception:
                     pass
                 raise FailedToCreateProject(project.name.value)
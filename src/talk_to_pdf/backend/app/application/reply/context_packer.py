@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+from uuid import UUID
+
+from talk_to_pdf.backend.app.application.common.dto import ContextChunkDTO
+from talk_to_pdf.backend.app.infrastructure.common.token_counter import encode_text, truncate_to_tokens
+
+_SEP = "\n\n"  # DefaultBlockChunker joins blocks with this, so carried overlap ends on it
+
+
+@dataclass(frozen=True, slots=True)
+class PackedContext:
+    text: str
+    tokens: int
+    chunk_ids: list[UUID]  # included chunks, in rendered order
+    dropped: int  # chunks that did not fit the budget
+    overlap_chars_removed: int
+
+
+@dataclass(slots=True)
+class _Candidate:
+    rank: int
+    chunk: ContextChunkDTO
+    full_text: str
+    full_tokens: int
+    # text/tokens without the overlap prefix, used when the previous chunk is also packed
+    tail_text: str
+    tail_tokens: int
+
+
+def _has_overlap_prefix(meta: dict[str, Any] | None) -> bool:
+    if not meta:
+        return False
+    if meta.get("has_overlap_prefix"):
+        return True
+    for b in meta.get("blocks") or []:
+        if not isinstance(b, dict):
+            continue
+        # compact blocks carry synthetic_kind directly; rows written before the migration nest it in "meta"
+        kind = b.get("synthetic_kind") or (b.get("meta") or {}).get("synthetic_kind")
+        if kind == "overlap_block":
+            return True
+    return False
+
+
+def _overlap_prefix_len(prev_text: str, text: str) -> int:
+    # the carried prefix is a run of whole blocks copied from the end of the previous chunk
+    best = 0
+    start = text.find(_SEP)
+    while 0 < start <= len(prev_text):
+        if prev_text.endswith(text[:start]):
+            best = start
+        start = text.find(_SEP, start + 1)
+    return best
+
+
+def _clean(text: str) -> str:
+    return (text or "").strip().replace("\u0000", "")
+
+
+def _groups(selected: list[_Candidate]) -> list[list[_Candidate]]:
+    """Runs of consecutive chunk_index, ordered by their best-ranked chunk."""
+    by_index = sorted(selected, key=lambda c: c.chunk.chunk_index)
+    runs: list[list[_Candidate]] = []
+    for c in by_index:
+        if runs and runs[-1][-1].chunk.chunk_index + 1 == c.chunk.chunk_index:
+            runs[-1].append(c)
+        else:
+            runs.append([c])
+    runs.sort(key=lambda run: min(c.rank for c in run))
+    return runs
+
+
+def _estimate(selected: list[_Candidate], sep_tokens: int) -> int:
+    total = 0
+    for run in _groups(selected):
+        total += 4  # "[n] " plus the separator before the next source
+        for i, c in enumerate(run):
+            total += c.full_tokens if i == 0 else c.tail_tokens + sep_tokens
+    return total
+
+
+def _render(selected: list[_Candidate]) -> tuple[str, list[UUID], int]:
+    parts: list[str] = []
+    ids: list[UUID] = []
+    removed = 0
+    for n, run in enumerate(_groups(selected), start=1):
+        texts: list[str] = []
+        for i, c in enumerate(run):
+            texts.append(c.full_text if i == 0 else c.tail_text)
+            if i:
+                removed += len(c.full_text) - len(c.tail_text)
+            ids.append(c.chunk.chunk_id)
+        parts.append(f"[{n}] " + _SEP.join(t for t in texts if t))
+    return _SEP.join(parts), ids, removed
+
+
+def pack_context(chunks: list[ContextChunkDTO], *, model: str, max_tokens: int) -> PackedContext:
+    """
+    Render retrieved chunks as numbered sources within `max_tokens` (exact, by the
+    reply model's tokenizer).
+
+    - Chunks with consecutive chunk_index are merged into one source, and a
+      chunk's carried overlap prefix (overlap_block) is dropped when the chunk
+      it was copied from is in the same source.
+    - The best-ranked chunk always goes in (truncated if it alone is over
+      budget); the rest are added by score per token while they fit.
+    - Sources are ordered by their best-ranked chunk.
+
+    CPU-bound (tiktoken): run it off the event loop.
+    """
+    cleaned = [c for c in chunks if _clean(c.text)]
+    if not cleaned or max_tokens <= 0:
+        return PackedContext(text="", tokens=0, chunk_ids=[], dropped=len(chunks), overlap_chars_removed=0)
+
+    text_by_index = {c.chunk_index: _clean(c.text) for c in cleaned}
+    candidates: list[_Candidate] = []
+    for rank, chunk in enumerate(cleaned):
+        full = _clean(chunk.text)
+        tail = full
+        prev = text_by_index.get(chunk.chunk_index - 1)
+        if prev is not None and _has_overlap_prefix(chunk.meta):
+            cut = _overlap_prefix_len(prev, full)
+            if cut:
+                tail = full[cut:].strip()
+        full_tokens = len(encode_text(full, model=model))
+        tail_tokens = full_tokens if tail == full else len(encode_text(tail, model=model))
+        candidates.append(_Candidate(rank, chunk, full, full_tokens, tail, tail_tokens))
+
+    sep_tokens = len(encode_text(_SEP, model=model))
+    seed, rest = candidates[0], candidates[1:]
+    rest.sort(key=lambda c: (-(max(c.chunk.score, 0.0) / max(1, c.full_tokens)), c.rank))
+
+    selected = [seed]
+    for c in rest:
+        if _estimate(selected + [c], sep_tokens) <= max_tokens:
+            selected.append(c)
+
+    # the estimate ignores merges across boundaries; confirm on the rendered text
+    while True:
+        text, ids, removed = _render(selected)
+        tokens = len(encode_text(text, model=model))
+        if tokens <= max_tokens or len(selected) == 1:
+            break
+        selected.pop()  # last added has the lowest density
+
+    if tokens > max_tokens:
+        text = truncate_to_tokens(text, max_tokens, model=model)
+        tokens = len(encode_text(text, model=model))
+
+    return PackedContext(
+        text=text,
+        tokens=tokens,
+        chunk_ids=ids,
+        dropped=len(chunks) - len(ids),
+        overlap_chars_removed=removed,
+    )
@@ -7,6 +7,7 @@ from uuid import UUID
 from talk_to_pdf.backend.app.application.common.dto import ContextPackDTO
 from talk_to_pdf.backend.app.domain.common.enums import ChatRole
 from talk_to_pdf.backend.app.domain.reply.metrics import ReplyMetrics
+from talk_to_pdf.backend.app.domain.reply.value_objects import MessageCursor
 
 
 # -------------------------
@@ -58,6 +59,7 @@ class MessageDTO:
     created_at: datetime
     citations: dict | None = None
     metrics: dict | None = None
+    truncated: bool = False
 
 @dataclass(frozen=True, slots=True)
 class CreateMessageInputDTO:
@@ -71,6 +73,7 @@ class CreateMessageInputDTO:
     prompt_version: str | None = None
     model: str | None = None
     metrics: ReplyMetrics | None = None
+    truncated: bool = False
 
 
 @dataclass(frozen=True, slots=True)
@@ -78,6 +81,29 @@ class GetChatMessagesInputDTO:
     owner_id: UUID
     chat_id: UUID
     limit: int = 50
+    before: MessageCursor | None = None
+    after: MessageCursor | None = None
+    include_citation_content: bool = True
+
+
+@dataclass(frozen=True, slots=True)
+class MessagePageDTO:
+    items: list[MessageDTO]
+    # more messages exist past this page in the paging direction
+    has_more: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class GetCitedChunksInputDTO:
+    owner_id: UUID
+    index_id: UUID
+    chunk_ids: list[UUID]
+
+
+@dataclass(frozen=True, slots=True)
+class CitedChunkContentDTO:
+    chunk_id: UUID
+    content: str
 
 
 # -------------------------
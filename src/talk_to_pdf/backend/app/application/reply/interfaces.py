@@ -1,8 +1,75 @@
-from typing import Protocol, AsyncIterator
+from dataclasses import dataclass
+from typing import Protocol, AsyncGenerator
+from uuid import UUID
 
 from talk_to_pdf.backend.app.domain.reply.value_objects import GenerateReplyInput
 
 
+@dataclass
+class PromptTokenBreakdown:
+    """Breakdown of tokens in the prompt."""
+    system: int
+    context: int
+    history: int
+    question: int
+
+
+@dataclass
+class StreamMetrics:
+    """Metrics collected during streaming."""
+    prompt_breakdown: PromptTokenBreakdown
+    completion_tokens: int = 0
+    # provider-reported prompt total (None when the provider sent no usage)
+    prompt_tokens: int | None = None
+    # prompt tokens the provider served from its prompt cache (None when not reported)
+    cached_prompt_tokens: int | None = None
+
+
+class ReplyStream(Protocol):
+    """
+    Handle for a single stream_answer call: iterate it for text chunks,
+    then read `metrics` (None until the stream has been fully consumed).
+    Closing the iterator early must cancel the upstream request.
+    """
+    def __aiter__(self) -> AsyncGenerator[str, None]:...
+
+    @property
+    def metrics(self) -> StreamMetrics | None:...
+
+
 class ReplyGenerator(Protocol):
     llm_model:str
-    async def stream_answer(self, inp: GenerateReplyInput) -> AsyncIterator[str]:...
+    def stream_answer(self, inp: GenerateReplyInput) -> ReplyStream:...
+
+
+@dataclass(frozen=True, slots=True)
+class CachedAnswer:
+    """A stored answer whose question is close enough to the new one."""
+    answer: str
+    similarity: float
+
+
+class AnswerCache(Protocol):
+    """
+    Semantic answer cache, scoped per index. An entry only matches when the new
+    question's embedding is within the cache's cosine threshold AND the new
+    question retrieved exactly the same context chunks (same order).
+    """
+    async def lookup(
+            self,
+            *,
+            index_id: UUID,
+            scope: str,
+            query_vector: list[float],
+            chunk_ids: tuple[UUID, ...],
+    ) -> CachedAnswer | None:...
+
+    async def store(
+            self,
+            *,
+            index_id: UUID,
+            scope: str,
+            query_vector: list[float],
+            chunk_ids: tuple[UUID, ...],
+            answer: str,
+    ) -> None:...
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from dataclasses import replace
 from uuid import UUID
 
 from talk_to_pdf.backend.app.application.common.dto import SearchInputDTO, ContextPackDTO
@@ -59,9 +60,41 @@ def create_chat_message_domain(create_dto: CreateMessageInputDTO) -> ChatMessage
         content=create_dto.content,
         citations=citations,
         metrics=create_dto.metrics,
+        truncated=create_dto.truncated,
     )
 
-def message_to_dto(msg: ChatMessage) -> MessageDTO:
+def collect_cited_chunk_ids(msgs: list[ChatMessage]) -> dict[UUID, list[UUID]]:
+    """Group every cited chunk id across messages by the index it belongs to."""
+    ids_by_index: dict[UUID, list[UUID]] = {}
+    for msg in msgs:
+        if not msg.citations or not msg.citations.chunks:
+            continue
+        ids = ids_by_index.setdefault(msg.citations.index_id, [])
+        ids.extend(chunk.chunk_id for chunk in msg.citations.chunks)
+    return ids_by_index
+
+
+def hydrate_message_citations(msg: ChatMessage, chunk_texts: dict[UUID, str]) -> ChatMessage:
+    """Return a copy of the message with cited chunk contents filled from chunk_texts."""
+    if not msg.citations or not msg.citations.chunks:
+        return msg
+    chunks = [replace(c, content=chunk_texts.get(c.chunk_id)) for c in msg.citations.chunks]
+    return replace(msg, citations=replace(msg.citations, chunks=chunks))
+
+
+def _cited_chunk_to_dict(chunk: CitedChunk, *, include_content: bool) -> dict:
+    out = {
+        "chunk_id": str(chunk.chunk_id),
+        "score": chunk.score,
+        "citation": chunk.citation,
+        "matched_by": chunk.matched_by,
+    }
+    if include_content:
+        out["content"] = chunk.content
+    return out
+
+
+def message_to_dto(msg: ChatMessage, *, include_citation_content: bool = True) -> MessageDTO:
     citations_dict = None
     if msg.citations:
         citations_dict = {
@@ -69,13 +102,7 @@ def message_to_dto(msg: ChatMessage) -> MessageDTO:
             "embed_signature": msg.citations.embed_signature,
             "metric": msg.citations.metric if isinstance(msg.citations.metric, str) else msg.citations.metric.value,
             "chunks": [
-                {
-                    "chunk_id": str(chunk.chunk_id),
-                    "score": chunk.score,
-                    "citation": chunk.citation,
-                    "content": chunk.content,
-                    "matched_by": chunk.matched_by,
-                }
+                _cited_chunk_to_dict(chunk, include_content=include_citation_content)
                 for chunk in msg.citations.chunks
             ],
             "top_k": msg.citations.top_k,
@@ -101,6 +128,7 @@ def message_to_dto(msg: ChatMessage) -> MessageDTO:
         created_at=msg.created_at,
         citations=citations_dict,
         metrics=metrics_dict,
+        truncated=msg.truncated,
     )
 
 
@@ -121,6 +149,25 @@ def create_reply_output_dto(dto: ReplyInputDTO, answer_text: str, context: Conte
         )
 
 
+def context_to_citation_stubs(context: ContextPackDTO) -> dict:
+    """Citation payload for streaming clients: chunk ids/scores/locations, no chunk text."""
+    return {
+        "index_id": str(context.index_id),
+        "rewritten_query": context.rewritten_query,
+        "rewritten_queries": context.rewritten_queries,
+        "chunks": [
+            {
+                "chunk_id": str(chunk.chunk_id),
+                "chunk_index": chunk.chunk_index,
+                "score": chunk.score,
+                "citation": chunk.citation,
+                "matched_by": chunk.matched_by,
+            }
+            for chunk in context.chunks
+        ],
+    }
+
+
 def create_citations_from_context(
     context: ContextPackDTO,
     top_k: int,
@@ -155,21 +202,14 @@ def create_citations_from_context(
 
 
 
-def render_context(pack: ContextPackDTO, *, max_chars: int = 12_000) -> str:
-    # render chunks as numbered sources
-    parts: list[str] = []
-    for i, ch in enumerate(pack.chunks, start=1):
-        parts.append(f"[{i}] {ch.text}")  # adjust field name
-    txt = "\n\n".join(parts)
-    return txt[:max_chars]
-
 def map_history(msgs: list[MessageDTO]) -> list[ChatTurn]:
     return [ChatTurn(role=m.role, content=m.content) for m in msgs]
 
-def create_generate_answer_input(query:str,context_pack_dto:ContextPackDTO,message_history:list[ChatTurn],system_prompt:str | None = None) -> GenerateReplyInput:
+def create_generate_answer_input(query:str,context:str,message_history:list[ChatTurn],system_prompt:str | None = None) -> GenerateReplyInput:
+    # context: the packed sources (see context_packer.pack_context)
     return GenerateReplyInput(
         query=query,
-        context=render_context(context_pack_dto),
+        context=context,
         history=message_history,
         system_prompt=system_prompt,
     )
@@ -1,20 +1,25 @@
 from __future__ import annotations
 
 from typing import Callable
-from uuid import UUID
 
-from talk_to_pdf.backend.app.application.reply.dto import GetChatMessagesInputDTO, MessageDTO
-from talk_to_pdf.backend.app.application.reply.mappers import message_to_dto
+from talk_to_pdf.backend.app.application.reply.dto import GetChatMessagesInputDTO, MessagePageDTO
+from talk_to_pdf.backend.app.application.reply.mappers import (
+    message_to_dto,
+    collect_cited_chunk_ids,
+    hydrate_message_citations,
+)
 from talk_to_pdf.backend.app.domain.common.uow import UnitOfWork
 from talk_to_pdf.backend.app.domain.reply.errors import ChatNotFoundOrForbidden
-from talk_to_pdf.backend.app.domain.reply.value_objects import CitedChunk
 
 
 class GetChatMessagesUseCase:
     def __init__(self, uow_factory: Callable[[], UnitOfWork]):
         self._uow_factory = uow_factory
 
-    async def execute(self, dto: GetChatMessagesInputDTO) -> list[MessageDTO]:
+    async def execute(self, dto: GetChatMessagesInputDTO) -> MessagePageDTO:
+        limit = int(dto.limit)
+        forward = dto.after is not None and dto.before is None
+
         uow = self._uow_factory()
         async with uow:
             # enforce ownership (avoid leaking whether the chat exists)
@@ -25,63 +30,32 @@ class GetChatMessagesUseCase:
             if not chat:
                 raise ChatNotFoundOrForbidden()
 
-            msgs = await uow.chat_message_repo.list_recent_by_owner_and_chat(
+            # one extra row tells us whether another page exists
+            msgs = await uow.chat_message_repo.list_page_by_owner_and_chat(
                 owner_id=dto.owner_id,
                 chat_id=dto.chat_id,
-                limit=int(dto.limit),
+                limit=limit + 1,
+                before=dto.before,
+                after=dto.after,
             )
-
-            # Populate chunk content for messages with citations
-            updated_msgs = []
-            for msg in msgs:
-                if msg.citations and msg.citations.chunks:
-                    chunk_ids = [chunk.chunk_id for chunk in msg.citations.chunks]
-                    chunks = await uow.chunk_repo.get_many_by_ids_for_index(
-                        index_id=msg.citations.index_id,
-                        ids=chunk_ids,
-                    )
-
-                    # Create a mapping of chunk_id to chunk text
-                    chunk_map = {chunk.id: chunk.text for chunk in chunks}
-
-                    # Update citations with chunk content
-                    updated_chunks = [
-                        CitedChunk(
-                            chunk_id=cited_chunk.chunk_id,
-                            score=cited_chunk.score,
-                            citation=cited_chunk.citation,
-                            content=chunk_map.get(cited_chunk.chunk_id),
-                        )
-                        for cited_chunk in msg.citations.chunks
-                    ]
-
-                    # Create new citations with updated chunks
-                    from talk_to_pdf.backend.app.domain.reply.value_objects import ChatMessageCitations
-                    from talk_to_pdf.backend.app.domain.reply.entities import ChatMessage
-                    updated_citations = ChatMessageCitations(
-                        index_id=msg.citations.index_id,
-                        embed_signature=msg.citations.embed_signature,
-                        metric=msg.citations.metric,
-                        chunks=updated_chunks,
-                        top_k=msg.citations.top_k,
-                        rerank_signature=msg.citations.rerank_signature,
-                        prompt_version=msg.citations.prompt_version,
-                        model=msg.citations.model,
-                        rewritten_query=msg.citations.rewritten_queries,
-                    )
-
-                    # Create new message with updated citations (dataclass is frozen)
-                    updated_msg = ChatMessage(
-                        id=msg.id,
-                        chat_id=msg.chat_id,
-                        role=msg.role,
-                        content=msg.content,
-                        created_at=msg.created_at,
-                        citations=updated_citations,
-                        metrics=msg.metrics,
-                    )
-                    updated_msgs.append(updated_msg)
-                else:
-                    updated_msgs.append(msg)
-
-        return [message_to_dto(m) for m in updated_msgs]
+            has_more = len(msgs) > limit
+            if has_more:
+                msgs = msgs[:limit] if forward else msgs[1:]
+
+            # Populate chunk content for all cited chunks in one batched query
+            chunk_texts: dict = {}
+            if dto.include_citation_content:
+                ids_by_index = collect_cited_chunk_ids(msgs)
+                if ids_by_index:
+                    chunk_texts = await uow.chunk_repo.get_texts_by_index_and_ids(ids_by_index=ids_by_index)
+
+        if dto.include_citation_content:
+            msgs = [hydrate_message_citations(m, chunk_texts) for m in msgs]
+
+        return MessagePageDTO(
+            items=[
+                message_to_dto(m, include_citation_content=dto.include_citation_content)
+                for m in msgs
+            ],
+            has_more=has_more,
+        )
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from typing import Callable
+
+from talk_to_pdf.backend.app.application.reply.dto import GetCitedChunksInputDTO, CitedChunkContentDTO
+from talk_to_pdf.backend.app.domain.common.uow import UnitOfWork
+from talk_to_pdf.backend.app.domain.retrieval.errors import IndexNotFoundOrForbidden
+
+
+class GetCitedChunksUseCase:
+    """
+    On-demand chunk text lookup for citation stubs (messages loaded without content).
+    """
+
+    def __init__(self, uow_factory: Callable[[], UnitOfWork]):
+        self._uow_factory = uow_factory
+
+    async def execute(self, dto: GetCitedChunksInputDTO) -> list[CitedChunkContentDTO]:
+        uow = self._uow_factory()
+        async with uow:
+            idx = await uow.index_repo.get_by_owner_and_id(
+                owner_id=dto.owner_id,
+                index_id=dto.index_id,
+            )
+            if not idx:
+                raise IndexNotFoundOrForbidden()
+
+            if not dto.chunk_ids:
+                return []
+
+            texts = await uow.chunk_repo.get_texts_by_index_and_ids(
+                ids_by_index={dto.index_id: list(dto.chunk_ids)},
+            )
+
+        # keep request order, skip unknown ids
+        return [
+            CitedChunkContentDTO(chunk_id=cid, content=texts[cid])
+            for cid in dict.fromkeys(dto.chunk_ids)
+            if cid in texts
+        ]
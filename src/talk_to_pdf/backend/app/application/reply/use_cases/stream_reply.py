@@ -1,21 +1,30 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
 import time
-from typing import Callable, AsyncIterator
+from contextlib import aclosing
+from dataclasses import replace
+from typing import Callable, AsyncGenerator
 
-from talk_to_pdf.backend.app.application.common.interfaces import ContextBuilder
-from talk_to_pdf.backend.app.application.reply.dto import ReplyInputDTO, ReplyOutputDTO, CreateMessageInputDTO, \
-    GetChatMessagesInputDTO, MessageDTO
-from talk_to_pdf.backend.app.application.reply.interfaces import ReplyGenerator
+from talk_to_pdf.backend.app.application.common.interfaces import ContextBuilder, EmbedderFactory
+from talk_to_pdf.backend.app.application.common.progress import ProgressEvent, QueueProgressSink
+from talk_to_pdf.backend.app.application.common.dto import ContextPackDTO
+from talk_to_pdf.backend.app.application.reply.dto import ReplyInputDTO, CreateMessageInputDTO, MessageDTO
+from talk_to_pdf.backend.app.application.reply.context_packer import pack_context
+from talk_to_pdf.backend.app.application.reply.interfaces import ReplyGenerator, AnswerCache, CachedAnswer
 from talk_to_pdf.backend.app.application.reply.mappers import (
     build_search_input_dto,
     create_reply_output_dto,
-    create_generate_answer_input, map_history,
+    create_generate_answer_input,
+    create_chat_message_domain,
+    context_to_citation_stubs,
 )
 from talk_to_pdf.backend.app.application.reply.use_cases.create_message import CreateChatMessageUseCase
-from talk_to_pdf.backend.app.application.reply.use_cases.get_chat_messages import GetChatMessagesUseCase
 
 from talk_to_pdf.backend.app.domain.common.uow import UnitOfWork
+from talk_to_pdf.backend.app.domain.common.value_objects import ChatTurn, EmbedConfig
 from talk_to_pdf.backend.app.domain.retrieval.errors import IndexNotFoundOrForbidden
 from talk_to_pdf.backend.app.domain.reply.errors import ChatNotFoundOrForbidden
 from talk_to_pdf.backend.app.domain.common.enums import ChatRole
@@ -23,29 +32,105 @@ from talk_to_pdf.backend.app.domain.reply.metrics import ReplyMetrics, TokenMetr
 from talk_to_pdf.backend.app.infrastructure.common.token_counter import count_tokens
 
 
+async def _replay(answer: str) -> AsyncGenerator[str, None]:
+    yield answer
+
+
 class StreamReplyUseCase:
     def __init__(
             self,
             uow_factory: Callable[[], UnitOfWork],
             ctx_builder_uc: ContextBuilder,
             create_msg_uc: CreateChatMessageUseCase,
-            get_chat_messages_uc: GetChatMessagesUseCase,
-            reply_generator:ReplyGenerator
+            reply_generator:ReplyGenerator,
+            history_max_turns: int = 6,
+            history_align_turns: int = 1,
+            context_max_tokens: int = 4000,
+            answer_cache: AnswerCache | None = None,
+            embedder_factory: EmbedderFactory | None = None,
     ):
         self._uow_factory = uow_factory
         self._ctx_builder_uc = ctx_builder_uc
         self._create_msg_uc = create_msg_uc
-        self._get_chat_messages_uc = get_chat_messages_uc
         self._reply_generator = reply_generator
+        self._history_max_turns = history_max_turns
+        # >1 keeps the older part of the reply history stable across turns (prompt caching)
+        self._history_align_turns = history_align_turns
+        self._context_max_tokens = context_max_tokens
+        # opt-in semantic answer cache; needs the embedder to embed the raw question
+        self._answer_cache = answer_cache if embedder_factory is not None else None
+        self._embedder_factory = embedder_factory
+
+    async def _embed_question(self, embed_cfg: EmbedConfig, query: str) -> list[float] | None:
+        # fail-open: a failed embedding only means no cache lookup/store
+        if self._embedder_factory is None:
+            return None
+        try:
+            vectors = await self._embedder_factory.create(embed_cfg).aembed_documents([query])
+        except Exception:
+            return None
+        return vectors[0] if vectors and vectors[0] else None
+
+    def _answer_cache_scope(self, context: ContextPackDTO, history: list[ChatTurn]) -> str:
+        # vectors are only comparable under one embed config; answers depend on the reply
+        # model and on the earlier turns in the reply prompt (the last turn is the question)
+        prior = [[t.role.value, t.content] for t in history[:-1]]
+        raw = json.dumps(prior, separators=(",", ":"), ensure_ascii=False)
+        history_digest = hashlib.sha256(raw.encode("utf-8")).hexdigest()
+        return f"{context.embed_signature}:{self._reply_generator.llm_model}:{history_digest}"
 
-    async def execute(self, dto: ReplyInputDTO) -> AsyncIterator[str]:
+    async def _save_assistant_message(
+            self,
+            dto: ReplyInputDTO,
+            *,
+            content: str,
+            context: ContextPackDTO,
+            metrics: ReplyMetrics | None,
+            truncated: bool = False,
+    ) -> MessageDTO:
+        return await self._create_msg_uc.execute(
+            CreateMessageInputDTO(
+                owner_id=dto.owner_id,
+                chat_id=dto.chat_id,
+                role=ChatRole.ASSISTANT,
+                content=content,
+                context=context,
+                top_k=dto.top_k,
+                rerank_signature=None,
+                prompt_version='0.1.0',
+                model=self._reply_generator.llm_model,
+                metrics=metrics,
+                truncated=truncated,
+            )
+        )
+
+    async def execute(self, dto: ReplyInputDTO) -> AsyncGenerator[str, None]:
+        """Plain-text mode: only the answer deltas."""
+        async with aclosing(self.execute_events(dto)) as events:
+            async for event in events:
+                if event.name == "token":
+                    yield event.payload["text"]
+
+    async def execute_events(self, dto: ReplyInputDTO) -> AsyncGenerator[ProgressEvent, None]:
+        """
+        Typed reply stream:
+        - "rewrite_done": rewritten queries (forwarded from the context builder)
+        - "retrieval_done": citation stubs (no chunk text) + retrieval latency
+        - "token": {"text": delta}
+        - "done": persisted assistant message id + metrics
+
+        With an answer cache, a question close to a cached one that retrieved the
+        same context after the same earlier turns replays the cached answer as "token" events instead of
+        calling the reply generator (flagged in the metrics).
+        """
         # Track latencies
         query_rewrite_latency: float | None = None
         retrieval_latency: float | None = None
         reply_generation_latency: float | None = None
         rewritten_question_tokens = 0
 
-        # 1) Validate index + chat (ownership + same project)
+        # 1) Validate index + chat (ownership + same project), persist the user message
+        #    and load the slim (role, content) history window in one transaction
         uow = self._uow_factory()
         async with uow:
             idx = await uow.index_repo.get_latest_ready_by_project_and_owner(
@@ -62,61 +147,152 @@ class StreamReplyUseCase:
             if not chat or chat.project_id != dto.project_id:
                 raise ChatNotFoundOrForbidden()
 
-        # 2) Persist user message (through use case)
-        await self._create_msg_uc.execute(
-            CreateMessageInputDTO(
-                owner_id=dto.owner_id,
-                chat_id=dto.chat_id,
-                role=ChatRole.USER,
-                content=dto.query,
+            # 2) Persist user message (ownership already checked above)
+            await uow.chat_message_repo.add(
+                create_chat_message_domain(
+                    CreateMessageInputDTO(
+                        owner_id=dto.owner_id,
+                        chat_id=dto.chat_id,
+                        role=ChatRole.USER,
+                        content=dto.query,
+                    )
+                )
             )
-        )
 
-        # 4) Get chat history
-        chat_messages_dto = await self._get_chat_messages_uc.execute(
-            GetChatMessagesInputDTO(
-                owner_id=dto.owner_id,
+            # 3) Chat history (includes the message just added). Same primary transaction
+            #    as the insert, so it is never routed to a lagging replica.
+            chat_messages = await uow.chat_message_repo.list_recent_turns(
                 chat_id=dto.chat_id,
+                limit=self._history_max_turns,
+                align=self._history_align_turns,
             )
-        )
-
-        chat_messages=map_history(chat_messages_dto)
 
-        # 3) Build RAG context (includes query rewriting + retrieval)
+        # 4) Build RAG context (includes query rewriting + retrieval)
         retrieval_start = time.time()
-        search_input = build_search_input_dto(dto=dto, index_id=idx.id,chat_messages=chat_messages)
-        context = await self._ctx_builder_uc.execute(search_input)
+        # the rewriter keeps its fixed-size window; only the reply prompt uses the aligned one
+        search_input = build_search_input_dto(
+            dto=dto, index_id=idx.id, chat_messages=chat_messages[-self._history_max_turns:]
+        )
+        sink = QueueProgressSink()
+        # the question embedding for the answer cache runs alongside retrieval
+        answer_cache = self._answer_cache
+        question_task = (
+            asyncio.ensure_future(self._embed_question(idx.embed_config, dto.query))
+            if answer_cache is not None
+            else None
+        )
+        ctx_task = asyncio.ensure_future(self._ctx_builder_uc.execute(search_input, progress=sink))
+        try:
+            async for event in sink.drain_while(ctx_task):
+                if event.name == "multi_rewrite_done":
+                    yield ProgressEvent(name="rewrite_done", payload=event.payload)
+        finally:
+            # consumer went away mid-retrieval: don't leave retrieval running
+            if not ctx_task.done():
+                ctx_task.cancel()
+                if question_task is not None:
+                    question_task.cancel()
+        try:
+            context = ctx_task.result()
+        except BaseException:
+            if question_task is not None:
+                question_task.cancel()
+            raise
         retrieval_latency = time.time() - retrieval_start
 
+        yield ProgressEvent(
+            name="retrieval_done",
+            payload={"latency": retrieval_latency, "citations": context_to_citation_stubs(context)},
+        )
+
         # Get query rewriter metrics from context
         # Sum of prompt + completion tokens (as requested by user)
         rewritten_question_tokens = context.rewrite_prompt_tokens + context.rewrite_completion_tokens
         query_rewrite_latency = context.rewrite_latency
 
-        # 5) Build GenerateReplyInput
-        generate_input = create_generate_answer_input(
-            query=dto.query,
-            context_pack_dto=context,
-            message_history=chat_messages,
-            system_prompt=None,
-        )
+        # 5) Semantic answer cache: same context + near-identical question
+        question_vector: list[float] | None = None
+        chunk_ids = tuple(c.chunk_id for c in context.chunks)
+        cached: CachedAnswer | None = None
+        answer_cache_scope = ""
+        if question_task is not None and answer_cache is not None:
+            question_vector = await question_task
+            answer_cache_scope = self._answer_cache_scope(context, chat_messages)
+            if question_vector is not None and chunk_ids:
+                cached = await answer_cache.lookup(
+                    index_id=context.index_id,
+                    scope=answer_cache_scope,
+                    query_vector=question_vector,
+                    chunk_ids=chunk_ids,
+                )
 
+        # token-budgeted, overlap-aware sources (tiktoken: off the event loop).
+        # Packed on a cache hit too: the message cites only what the prompt carried.
+        packed = await asyncio.to_thread(
+            pack_context,
+            context.chunks,
+            model=self._reply_generator.llm_model,
+            max_tokens=self._context_max_tokens,
+        )
+        packed_ids = set(packed.chunk_ids)
+        cited_context = replace(context, chunks=[c for c in context.chunks if c.chunk_id in packed_ids])
 
         # Accumulate the full answer as we stream
         answer_chunks: list[str] = []
 
-        # 6) Stream reply with latency tracking
+        # 6) Stream reply with latency tracking (a cache hit replays the stored answer)
         reply_start = time.time()
-        async for chunk in self._reply_generator.stream_answer(generate_input):
-            answer_chunks.append(chunk)
-            yield chunk
+        reply_stream = None
+        source: AsyncGenerator[str, None]
+        if cached is not None:
+            source = _replay(cached.answer)
+        else:
+            generate_input = create_generate_answer_input(
+                query=dto.query,
+                context=packed.text,
+                message_history=chat_messages,
+                system_prompt=None,
+            )
+            reply_stream = self._reply_generator.stream_answer(generate_input)
+            source = aiter(reply_stream)
+        try:
+            # aclosing: leaving early closes the provider stream instead of draining it
+            async with aclosing(source) as chunks:
+                async for chunk in chunks:
+                    answer_chunks.append(chunk)
+                    yield ProgressEvent(name="token", payload={"text": chunk})
+        except (GeneratorExit, asyncio.CancelledError):
+            # client disconnected: keep what was generated, flagged as truncated.
+            # shield so a repeated cancel can't abort the write halfway.
+            await asyncio.shield(
+                self._save_assistant_message(
+                    dto,
+                    content="".join(answer_chunks),
+                    context=cited_context,
+                    metrics=None,
+                    truncated=True,
+                )
+            )
+            raise
         reply_generation_latency = time.time() - reply_start
 
-        # 7) Collect metrics
-        stream_metrics = self._reply_generator.get_last_metrics()
+        # 7) Collect metrics (per-call handle, safe under concurrent streams)
+        stream_metrics = reply_stream.metrics if reply_stream is not None else None
 
         metrics = None
-        if stream_metrics:
+        if cached is not None:
+            metrics = ReplyMetrics(
+                prompt_tokens=TokenMetrics(rewritten_question=rewritten_question_tokens),
+                completion_tokens=0,
+                latency=LatencyMetrics(
+                    query_rewriting=query_rewrite_latency,
+                    retrieval=retrieval_latency,
+                    reply_generation=reply_generation_latency,
+                ),
+                answer_cache_hit=True,
+                answer_cache_similarity=cached.similarity,
+            )
+        elif stream_metrics:
             token_metrics = TokenMetrics(
                 system=stream_metrics.prompt_breakdown.system,
                 history=stream_metrics.prompt_breakdown.history,
@@ -134,22 +310,33 @@ class StreamReplyUseCase:
             metrics = ReplyMetrics(
                 prompt_tokens=token_metrics,
                 completion_tokens=stream_metrics.completion_tokens,
+                cached_prompt_tokens=stream_metrics.cached_prompt_tokens,
                 latency=latency_metrics,
             )
 
         # 8) Persist assistant message with citations after streaming completes
-        answer_text = "".join(answer_chunks)
-        await self._create_msg_uc.execute(
-            CreateMessageInputDTO(
-                owner_id=dto.owner_id,
-                chat_id=dto.chat_id,
-                role=ChatRole.ASSISTANT,
-                content=answer_text,
-                context=context,
-                top_k=dto.top_k,
-                rerank_signature=None,
-                prompt_version='0.1.0',
-                model=self._reply_generator.llm_model,
-                metrics=metrics,
+        answer = "".join(answer_chunks)
+        message = await self._save_assistant_message(
+            dto,
+            content=answer,
+            context=cited_context,
+            metrics=metrics,
+        )
+
+        # only complete, freshly generated answers are cached
+        if answer_cache is not None and cached is None and stream_metrics and question_vector is not None and chunk_ids:
+            await answer_cache.store(
+                index_id=context.index_id,
+                scope=answer_cache_scope,
+                query_vector=question_vector,
+                chunk_ids=chunk_ids,
+                answer=answer,
             )
+
+        yield ProgressEvent(
+            name="done",
+            payload={
+                "message_id": str(message.id),
+                "metrics": metrics.to_dict() if metrics else None,
+            },
         )
@@ -1,6 +1,7 @@
-from typing import Protocol
+from typing import Awaitable, Callable, Protocol
 
-from talk_to_pdf.backend.app.application.retrieval.value_objects import MultiQueryRewriteResult, MergeResult
+from talk_to_pdf.backend.app.application.retrieval.value_objects import MultiQueryRewriteResult, MergeResult, \
+    RetrievalCacheKey, RetrievalCacheStatus
 from talk_to_pdf.backend.app.domain.common.value_objects import Chunk, ChatTurn
 from talk_to_pdf.backend.app.domain.retrieval.value_objects import ChunkMatch, RerankContext
 
@@ -40,3 +41,11 @@ class RetrievalResultMerger(Protocol):
         top_k: int,
         original_query: str,
     ) -> MergeResult: ...
+
+
+class RetrievalCache(Protocol):
+    async def get_or_compute(
+        self,
+        key: RetrievalCacheKey,
+        compute: Callable[[], Awaitable[MergeResult]],
+    ) -> tuple[MergeResult, RetrievalCacheStatus]: ...
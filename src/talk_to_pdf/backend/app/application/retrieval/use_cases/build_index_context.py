@@ -11,8 +11,10 @@ import anyio
 from talk_to_pdf.backend.app.application.common.dto import SearchInputDTO, ContextPackDTO, ContextChunkDTO
 from talk_to_pdf.backend.app.application.common.progress import ProgressEvent, ProgressSink
 from talk_to_pdf.backend.app.application.common.interfaces import EmbedderFactory
-from talk_to_pdf.backend.app.application.retrieval.interfaces import Reranker, QueryRewriter, RetrievalResultMerger
+from talk_to_pdf.backend.app.application.retrieval.interfaces import Reranker, QueryRewriter, RetrievalResultMerger, \
+    RetrievalCache
 from talk_to_pdf.backend.app.application.retrieval.mappers import create_context_pack_dto
+from talk_to_pdf.backend.app.application.retrieval.value_objects import MergeResult, RetrievalCacheKey
 from talk_to_pdf.backend.app.domain.common.uow import UnitOfWork
 from talk_to_pdf.backend.app.domain.common.value_objects import Vector, Chunk, EmbedConfig
 from talk_to_pdf.backend.app.domain.indexing.enums import IndexStatus
@@ -57,27 +59,35 @@ class BuildIndexContextUseCase:
         self,
         uow_factory: Callable[[], UnitOfWork],
         *,
+        read_uow_factory: Callable[[], UnitOfWork] | None = None,
         embedder_factory: EmbedderFactory,
         reranker: Reranker | None = None,
         progress: ProgressSink | None = None,
         metric: VectorMetric = VectorMetric.COSINE,
         query_rewriter: QueryRewriter,
         retrieval_merger: RetrievalResultMerger,
+        retrieval_cache: RetrievalCache | None = None,
         # guardrails to avoid abuse / accidental huge loads
         max_top_k: int,
         max_top_n: int,
     ) -> None:
         self._uow_factory = uow_factory
+        # read-only work (index lookup, searches, chunk loads) may go to a replica
+        self._read_uow_factory = read_uow_factory
         self._embedder_factory = embedder_factory
         self._reranker = reranker
         self._progress: ProgressSink = progress or NullProgressSink()
         self._metric = metric
         self._query_rewriter = query_rewriter
         self._retrieval_merger = retrieval_merger
+        self._retrieval_cache = retrieval_cache
         self._max_top_k = max_top_k
         self._max_top_n = max_top_n
 
-    async def execute(self, dto: SearchInputDTO) -> ContextPackDTO:
+    async def execute(self, dto: SearchInputDTO, *, progress: ProgressSink | None = None) -> ContextPackDTO:
+        # per-call sink (e.g. a streaming request) overrides the one given at construction
+        progress = progress or self._progress
+
         if _is_blank(dto.query):
             raise InvalidQuery("Query must not be blank")
 
@@ -90,24 +100,36 @@ class BuildIndexContextUseCase:
         # -----------------------------------
         # 1) Authz + ready index (single query)
         # -----------------------------------
-        uow = self._uow_factory()
+        uow = (self._read_uow_factory or self._uow_factory)()
         async with uow:
             idx = await uow.index_repo.get_by_owner_project_and_id(
                 owner_id=dto.owner_id,
                 project_id=dto.project_id,
                 index_id=dto.index_id,
             )
-            if not idx:
-                raise IndexNotFoundOrForbidden()
+        if self._read_uow_factory is not None and (not idx or idx.status != IndexStatus.READY):
+            # the replica may lag behind an index that just became ready: confirm on
+            # the primary and stay there. A replica that sees READY already has the
+            # chunks and embeddings, which were committed before the status.
+            uow = self._uow_factory()
+            async with uow:
+                idx = await uow.index_repo.get_by_owner_project_and_id(
+                    owner_id=dto.owner_id,
+                    project_id=dto.project_id,
+                    index_id=dto.index_id,
+                )
+
+        if not idx:
+            raise IndexNotFoundOrForbidden()
 
-            if idx.status != IndexStatus.READY:
-                raise IndexNotReady(index_id=str(dto.index_id))
-            # Must be the SAME config used for chunk embeddings.
-            embed_cfg: EmbedConfig = idx.embed_config
-            embed_sig = embed_cfg.signature()
+        if idx.status != IndexStatus.READY:
+            raise IndexNotReady(index_id=str(dto.index_id))
+        # Must be the SAME config used for chunk embeddings.
+        embed_cfg: EmbedConfig = idx.embed_config
+        embed_sig = embed_cfg.signature()
 
         # ----------------
-        # 2) Rewrite query into multiple sub-queries and embed
+        # 2) Rewrite query into multiple sub-queries
         # ----------------
         rewrite_start = time.time()
         rewrite_result = await self._query_rewriter.rewrite_queries_with_metrics(
@@ -132,7 +154,7 @@ class BuildIndexContextUseCase:
             for a in acros:
                 if a not in rewritten_queries:
                     rewritten_queries.append(a)
-        await self._progress.emit(
+        await progress.emit(
             ProgressEvent(
                 name="multi_rewrite_done",
                 payload={
@@ -144,97 +166,120 @@ class BuildIndexContextUseCase:
             )
         )
 
-        embedder = self._embedder_factory.create(embed_cfg)
-        await self._progress.emit(
-            ProgressEvent(
-                name="embed_queries_start",
-                payload={"index_id": str(dto.index_id), "queries": len(rewritten_queries)},
+        metric_name = self._metric.value if hasattr(self._metric, "value") else str(self._metric)
+
+        # ----------------
+        # 3) Embed, search and merge: deterministic for a READY index, so cacheable
+        # ----------------
+        async def _search_and_merge() -> MergeResult:
+            embedder = self._embedder_factory.create(embed_cfg)
+            await progress.emit(
+                ProgressEvent(
+                    name="embed_queries_start",
+                    payload={"index_id": str(dto.index_id), "queries": len(rewritten_queries)},
+                )
             )
-        )
 
-        vectors = await embedder.aembed_documents(rewritten_queries)
-        if not vectors or len(vectors) != len(rewritten_queries):
-            raise InvalidRetrieval("Embedding provider returned empty vectors")
+            vectors = await embedder.aembed_documents(rewritten_queries)
+            if not vectors or len(vectors) != len(rewritten_queries):
+                raise InvalidRetrieval("Embedding provider returned empty vectors")
 
-        query_vectors: list[Vector] = []
-        for i, vec in enumerate(vectors):
-            if not vec:
-                raise InvalidRetrieval(f"Embedding provider returned empty vector for query #{i}")
-            query_vectors.append(Vector.from_list(vec))
+            query_vectors: list[Vector] = []
+            for i, vec in enumerate(vectors):
+                if not vec:
+                    raise InvalidRetrieval(f"Embedding provider returned empty vector for query #{i}")
+                query_vectors.append(Vector.from_list(vec))
 
-        await self._progress.emit(
-            ProgressEvent(
-                name="embed_queries_done",
-                payload={"dim": query_vectors[0].dim if query_vectors else None, "count": len(query_vectors)},
+            await progress.emit(
+                ProgressEvent(
+                    name="embed_queries_done",
+                    payload={"dim": query_vectors[0].dim if query_vectors else None, "count": len(query_vectors)},
+                )
             )
-        )
 
-        # ---------------------------------------------
-        # 3) Vector similarity search (scoped properly)
-        # ---------------------------------------------
-        await self._progress.emit(
-            ProgressEvent(
-                name="vector_search_start",
-                payload={
-                    "index_id": str(dto.index_id),
-                    "top_k": top_k,
-                    "queries": len(query_vectors),
-                    "embed_signature": embed_sig,
-                    "metric": self._metric.value if hasattr(self._metric, "value") else str(self._metric),
-                },
+            # vector similarity + FTS search (scoped properly)
+            await progress.emit(
+                ProgressEvent(
+                    name="vector_search_start",
+                    payload={
+                        "index_id": str(dto.index_id),
+                        "top_k": top_k,
+                        "queries": len(query_vectors),
+                        "embed_signature": embed_sig,
+                        "metric": metric_name,
+                    },
+                )
             )
-        )
 
-        per_query_vec_matches: list[list[ChunkMatch]] = []
-        per_query_fts_matches: list[list[ChunkMatch]] = []
+            per_query_vec_matches: list[list[ChunkMatch]] = []
+            per_query_fts_matches: list[list[ChunkMatch]] = []
+
+            async def _search_one(q_idx: int, qvec: Vector) -> tuple[list[ChunkMatch], list[ChunkMatch]]:
+                q_text = rewritten_queries[q_idx]
+
+                vec_matches = await uow.chunk_search_repo.similarity_search(
+                    query=qvec,
+                    top_k=top_k,
+                    embed_signature=embed_sig,
+                    index_id=dto.index_id,
+                    metric=self._metric,
+                )
 
-        async def _search_one(q_idx: int, qvec: Vector) -> tuple[list[ChunkMatch], list[ChunkMatch]]:
-            q_text = rewritten_queries[q_idx]
+                fts_matches = await uow.chunk_search_repo.fts_search(
+                    query=q_text,
+                    top_k=top_k,
+                    index_id=dto.index_id,
+                    config="english",
+                )
 
-            vec_matches = await uow.chunk_search_repo.similarity_search(
-                query=qvec,
+                return vec_matches, fts_matches
+
+            async with uow:
+                for q_idx, qvec in enumerate(query_vectors):
+                    vec_matches, fts_matches = await _search_one(q_idx, qvec)
+                    per_query_vec_matches.append(vec_matches)
+                    per_query_fts_matches.append(fts_matches)
+
+                    await progress.emit(
+                        ProgressEvent(
+                            name="hybrid_search_done",
+                            payload={
+                                "query_index": q_idx,
+                                "top_k": top_k,
+                                "vec_returned": len(vec_matches),
+                                "fts_returned": len(fts_matches),
+                                "returned": len(vec_matches) + len(fts_matches),
+                            },
+                        )
+                    )
+            return await self._retrieval_merger.merge(
+                query_texts=rewritten_queries,
+                per_query_vec_matches=per_query_vec_matches,
+                per_query_fts_matches=per_query_fts_matches,
                 top_k=top_k,
-                embed_signature=embed_sig,
-                index_id=dto.index_id,
-                metric=self._metric,
+                original_query=dto.query,
             )
 
-            fts_matches = await uow.chunk_search_repo.fts_search(
-                query=q_text,
-                top_k=top_k,
+        if self._retrieval_cache is None:
+            merge_result = await _search_and_merge()
+        else:
+            cache_key = RetrievalCacheKey.build(
                 index_id=dto.index_id,
-                config="english",
+                embed_signature=embed_sig,
+                queries=rewritten_queries,
+                top_k=top_k,
+                metric=metric_name,
+                merger=f"{self._retrieval_merger.w_vec}:{self._retrieval_merger.w_fts}",
             )
-
-            return vec_matches, fts_matches
-
-        async with uow:
-            for q_idx, qvec in enumerate(query_vectors):
-                vec_matches, fts_matches = await _search_one(q_idx, qvec)
-                per_query_vec_matches.append(vec_matches)
-                per_query_fts_matches.append(fts_matches)
-
-                await self._progress.emit(
-                    ProgressEvent(
-                        name="hybrid_search_done",
-                        payload={
-                            "query_index": q_idx,
-                            "top_k": top_k,
-                            "vec_returned": len(vec_matches),
-                            "fts_returned": len(fts_matches),
-                            "returned": len(vec_matches) + len(fts_matches),
-                        },
-                    )
+            merge_result, cache_status = await self._retrieval_cache.get_or_compute(cache_key, _search_and_merge)
+            await progress.emit(
+                ProgressEvent(
+                    name="retrieval_cache",
+                    payload={"status": cache_status.value, "key": cache_key.digest()},
                 )
-        merge_result = await self._retrieval_merger.merge(
-            query_texts=rewritten_queries,
-            per_query_vec_matches=per_query_vec_matches,
-            per_query_fts_matches=per_query_fts_matches,
-            top_k=top_k,
-            original_query=dto.query,
-        )
+            )
 
-        await self._progress.emit(
+        await progress.emit(
             ProgressEvent(
                 name="merge_done",
                 payload={
@@ -266,7 +311,7 @@ class BuildIndexContextUseCase:
         match_ids: list[UUID] = [m.chunk_id for m in merge_result.matches]
         score_by_id: dict[UUID, float] = merge_result.score_by_id
 
-        await self._progress.emit(
+        await progress.emit(
             ProgressEvent(
                 name="load_chunks_start",
                 payload={"count": len(match_ids)},
@@ -283,7 +328,7 @@ class BuildIndexContextUseCase:
         chunk_by_id = {c.id: c for c in chunks}
         ordered_chunks: list[Chunk] = [chunk_by_id[cid] for cid in match_ids if cid in chunk_by_id]
 
-        await self._progress.emit(
+        await progress.emit(
             ProgressEvent(
                 name="load_chunks_done",
                 payload={"loaded": len(ordered_chunks)},
@@ -313,7 +358,7 @@ class BuildIndexContextUseCase:
                 and rerank_top_n > 0
                 and timeout_s > 0.0
         ):
-            await self._progress.emit(
+            await progress.emit(
                 ProgressEvent(
                     name="rerank_start",
                     payload={
@@ -374,7 +419,7 @@ class BuildIndexContextUseCase:
                 rerank_error = f"{type(e).__name__}: {e}"
                 final_chunks = ordered_chunks  # fail-open
 
-            await self._progress.emit(
+            await progress.emit(
                 ProgressEvent(
                     name="rerank_done",
                     payload={
@@ -388,7 +433,7 @@ class BuildIndexContextUseCase:
             )
         else:
             # If reranker is disabled or timeout is 0, emit a lightweight event if you want observability.
-            await self._progress.emit(
+            await progress.emit(
                 ProgressEvent(
                     name="rerank_done",
                     payload={
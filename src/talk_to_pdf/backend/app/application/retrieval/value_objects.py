@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import hashlib
+import json
 from dataclasses import dataclass
+from enum import StrEnum
 from uuid import UUID
 
 from talk_to_pdf.backend.app.domain.retrieval.value_objects import ChunkMatch
@@ -36,3 +39,59 @@ class MergeResult:
     matched_by: dict[UUID, list[int]]
     total_candidates: int
     unique_candidates: int
+
+
+@dataclass(frozen=True, slots=True)
+class RetrievalCacheKey:
+    """
+    Everything the merged retrieval of a READY index depends on.
+
+    Queries are whitespace-normalized but keep their order: MergeResult.matched_by
+    refers to them by position.
+    """
+
+    index_id: UUID
+    embed_signature: str
+    queries: tuple[str, ...]
+    top_k: int
+    metric: str
+    merger: str  # merger weights; they change the scores and the selection
+
+    @classmethod
+    def build(
+        cls,
+        *,
+        index_id: UUID,
+        embed_signature: str,
+        queries: list[str],
+        top_k: int,
+        metric: str,
+        merger: str,
+    ) -> "RetrievalCacheKey":
+        return cls(
+            index_id=index_id,
+            embed_signature=embed_signature,
+            queries=tuple(" ".join(q.split()) for q in queries),
+            top_k=top_k,
+            metric=metric,
+            merger=merger,
+        )
+
+    def digest(self) -> str:
+        payload = {
+            "index_id": str(self.index_id),
+            "embed_signature": self.embed_signature,
+            "queries": list(self.queries),
+            "top_k": self.top_k,
+            "metric": self.metric,
+            "merger": self.merger,
+        }
+        raw = json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class RetrievalCacheStatus(StrEnum):
+    MISS = "miss"  # computed here
+    HIT = "hit"  # in-process entry
+    SHARED = "shared"  # loaded from the shared backend
+    JOINED = "joined"  # waited for an identical in-flight computation
@@ -29,6 +29,7 @@ class LoginUserOutputDTO:
     id: UUID
     email: str
     is_active: bool
+    name: str = ""
 
 
 @dataclass
@@ -1,8 +1,21 @@
 from typing import Protocol
+from uuid import UUID
+
+from talk_to_pdf.backend.app.application.users.dto import CurrentUserDTO
 
 
 class PasswordHasher(Protocol):
-    def hash(self, raw_password: str) -> str:
+    async def hash(self, raw_password: str) -> str:
+        ...
+    async def verify(self, plain: str, hashed: str) -> bool:  # pragma: no cover - interface
+        ...
+
+
+class CurrentUserCache(Protocol):
+    def get(self, user_id: UUID, issued_at: int) -> CurrentUserDTO | None: ...
+
+    def put(self, user_id: UUID, issued_at: int, user: CurrentUserDTO) -> None: ...
+
+    def invalidate(self, user_id: UUID) -> None:
+        """Drop every cached lookup for user_id (call after changing the user)."""
         ...
-    def verify(self, plain: str, hashed: str) -> bool:  # pragma: no cover - interface
-        ...
\ No newline at end of file
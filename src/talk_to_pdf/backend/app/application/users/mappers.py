@@ -24,7 +24,8 @@ def login_domain_to_output_dto(user:User)->LoginUserOutputDTO:
     return LoginUserOutputDTO(
         id=user.id,
         email=str(user.email),
-        is_active=user.is_active
+        is_active=user.is_active,
+        name=user.name,
     )
 
 def current_domain_to_output_dto(user:User)->CurrentUserDTO:
@@ -1,18 +1,31 @@
 from __future__ import annotations
 from uuid import UUID
 from talk_to_pdf.backend.app.application.users import CurrentUserDTO
+from talk_to_pdf.backend.app.application.users.interfaces import CurrentUserCache
 from talk_to_pdf.backend.app.application.users.mappers import current_domain_to_output_dto
 from talk_to_pdf.backend.app.domain.users import UserNotFoundError
 from talk_to_pdf.backend.app.domain.common.uow import UnitOfWork
 
 
 class GetCurrentUserUseCase:
-    def __init__(self, uow: UnitOfWork) -> None:
+    def __init__(self, uow: UnitOfWork, cache: CurrentUserCache | None = None) -> None:
         self._uow = uow
+        self._cache = cache
+
+    async def execute(self, user_id: UUID, *, issued_at: int | None = None) -> CurrentUserDTO:
+        # issued_at (token iat) scopes the cached lookup to one token
+        cache = self._cache
+        if cache is not None and issued_at is not None:
+            cached = cache.get(user_id, issued_at)
+            if cached is not None:
+                return cached
 
-    async def execute(self, user_id: UUID) -> CurrentUserDTO:
         async with self._uow:
             user = await self._uow.user_repo.get_by_id(user_id)
             if user is None:
                 raise UserNotFoundError()
-            return current_domain_to_output_dto(user)
\ No newline at end of file
+            dto = current_domain_to_output_dto(user)
+
+        if cache is not None and issued_at is not None:
+            cache.put(user_id, issued_at, dto)
+        return dto
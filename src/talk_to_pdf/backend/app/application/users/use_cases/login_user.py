@@ -23,7 +23,7 @@ class LoginUserUseCase:
                 raise InvalidCredentialsError()
 
             # 2) check password
-            if not self._password_hasher.verify(dto.password, user.hashed_password):
+            if not await self._password_hasher.verify(dto.password, user.hashed_password):
                 raise InvalidCredentialsError()
 
             # 3) check an active flag
@@ -25,7 +25,7 @@ class RegisterUserUseCase:
             if existing is not None:
                 raise RegistrationError(f"Email {data.email} is already in use")
 
-            hashed = self._password_hasher.hash(data.password)
+            hashed = await self._password_hasher.hash(data.password)
             user = register_input_dto_to_domain(data, hashed)
 
             saved = await self._uow.user_repo.add(user)
@@ -7,20 +7,63 @@ from pydantic import Field, ValidationError, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from talk_to_pdf.backend.app.core.const import (
+    DEFAULT_AUTH_TRUST_TOKEN_CLAIMS,
+    DEFAULT_AUTH_USER_CACHE_MAX_ENTRIES,
+    DEFAULT_AUTH_USER_CACHE_TTL_S,
+    DEFAULT_PASSWORD_HASH_MAX_PENDING,
+    DEFAULT_PASSWORD_HASH_WORKERS,
     DEFAULT_CHUNKER_KIND,
     DEFAULT_CHUNKER_MAX_CHARS,
     DEFAULT_CHUNKER_OVERLAP,
+    DEFAULT_CHUNKER_PARALLEL_MIN_BLOCKS,
+    DEFAULT_CHUNKER_PARALLEL_WORKERS,
+    DEFAULT_EMBED_BATCH_MAX_ITEMS,
+    DEFAULT_EMBED_BATCH_MAX_TOKENS,
     DEFAULT_EMBED_BATCH_SIZE,
+    DEFAULT_EMBED_COALESCE_LINGER_MS,
+    DEFAULT_EMBED_COALESCE_MAX_CHARS,
+    DEFAULT_EMBED_COALESCE_MAX_ITEMS,
     DEFAULT_EMBED_DIMENSIONS,
     DEFAULT_EMBED_MODEL,
     DEFAULT_EMBED_PROVIDER,
     DEFAULT_CORS_ALLOWED_ORIGINS,
+    DEFAULT_DB_MAX_OVERFLOW,
+    DEFAULT_DB_POOL_PRE_PING,
+    DEFAULT_DB_POOL_RECYCLE_S,
+    DEFAULT_DB_POOL_SIZE,
+    DEFAULT_DB_POOL_TIMEOUT_S,
+    DEFAULT_DB_QUERY_CACHE_SIZE,
+    DEFAULT_DB_REPLICA_RETRY_S,
+    DEFAULT_DB_REPLICA_STICKY_S,
+    DEFAULT_DB_STATEMENT_CACHE_SIZE,
     DEFAULT_FILE_STORAGE_DIR,
+    DEFAULT_MAX_UPLOAD_BYTES,
+    DEFAULT_UPLOAD_CHUNK_BYTES,
+    DEFAULT_FILE_STORAGE_BACKEND,
+    DEFAULT_FILE_STORAGE_IO_THREADS,
+    DEFAULT_S3_KEY_PREFIX,
+    DEFAULT_S3_MULTIPART_CHUNK_BYTES,
     DEFAULT_GROBID_URL,
+    DEFAULT_INDEXING_CANCEL_POLL_S,
+    DEFAULT_INDEXING_POOL_MAX_JOBS,
+    DEFAULT_INDEXING_PROGRESS_MIN_DELTA,
+    DEFAULT_INDEXING_PROGRESS_MIN_INTERVAL_S,
+    DEFAULT_INDEXING_RUNNER,
+    DEFAULT_INDEXING_WORKER_DB_POOL_SIZE,
     DEFAULT_JWT_ALGORITHM,
     DEFAULT_JWT_SECRET_KEY,
     DEFAULT_MAX_TOP_K,
     DEFAULT_MAX_TOP_N,
+    DEFAULT_ANSWER_CACHE_ENABLED,
+    DEFAULT_ANSWER_CACHE_MAX_ENTRIES_PER_INDEX,
+    DEFAULT_ANSWER_CACHE_MAX_INDEXES,
+    DEFAULT_ANSWER_CACHE_MIN_SIMILARITY,
+    DEFAULT_RETRIEVAL_CACHE_MAX_ENTRIES,
+    DEFAULT_RETRIEVAL_CACHE_REDIS_URL,
+    DEFAULT_RETRIEVAL_CACHE_SHARED_TTL_S,
+    DEFAULT_QUERY_EMBED_LINGER_MS,
+    DEFAULT_QUERY_EMBED_MAX_CHARS,
+    DEFAULT_QUERY_EMBED_MAX_ITEMS,
     DEFAULT_QUERY_REWRITER_MAX_HISTORY_CHARS,
     DEFAULT_QUERY_REWRITER_MAX_TURN,
     DEFAULT_QUERY_REWRITER_MODEL,
@@ -30,6 +73,9 @@ from talk_to_pdf.backend.app.core.const import (
     DEFAULT_RERANKER_PROVIDER,
     DEFAULT_RERANKER_TEMPERATURE,
     DEFAULT_REPLY_MAX_CONTEXT_CHARS,
+    DEFAULT_REPLY_MAX_CONTEXT_TOKENS,
+    DEFAULT_REPLY_PROMPT_LAYOUT,
+    DEFAULT_REPLY_STREAM_HEARTBEAT_S,
     DEFAULT_REPLY_MAX_OUTPUT_TOKENS,
     DEFAULT_REPLY_MODEL,
     DEFAULT_REPLY_PROVIDER,
@@ -62,6 +108,54 @@ class Settings(BaseSettings):
         description="Async database URL used by the test suite.",
         min_length=1,
     )
+    SQLALCHEMY_READ_REPLICA_URL: str | None = Field(
+        default=None,
+        description="Async URL of a streaming read replica for retrieval/history reads (None: primary only).",
+    )
+    DB_REPLICA_RETRY_S: float = Field(
+        default=DEFAULT_DB_REPLICA_RETRY_S,
+        gt=0,
+        description="After a failed replica connect, serve reads from the primary for this long.",
+    )
+    DB_REPLICA_STICKY_S: float = Field(
+        default=DEFAULT_DB_REPLICA_STICKY_S,
+        ge=0,
+        description="Keep a user's history reads on the primary this long after they post a message.",
+    )
+    DB_POOL_SIZE: int = Field(
+        default=DEFAULT_DB_POOL_SIZE,
+        ge=1,
+        description="Persistent connections kept by each API process's pool.",
+    )
+    DB_MAX_OVERFLOW: int = Field(
+        default=DEFAULT_DB_MAX_OVERFLOW,
+        ge=0,
+        description="Extra connections a pool may open under burst (closed when returned).",
+    )
+    DB_POOL_TIMEOUT_S: float = Field(
+        default=DEFAULT_DB_POOL_TIMEOUT_S,
+        gt=0,
+        description="Seconds to wait for a free pooled connection before failing.",
+    )
+    DB_POOL_RECYCLE_S: int = Field(
+        default=DEFAULT_DB_POOL_RECYCLE_S,
+        ge=-1,
+        description="Replace pooled connections older than this (-1 disables).",
+    )
+    DB_POOL_PRE_PING: bool = Field(
+        default=DEFAULT_DB_POOL_PRE_PING,
+        description="Ping each connection on checkout (one extra round trip per checkout).",
+    )
+    DB_STATEMENT_CACHE_SIZE: int = Field(
+        default=DEFAULT_DB_STATEMENT_CACHE_SIZE,
+        ge=0,
+        description="asyncpg prepared statements cached per connection (0 behind pgbouncer in transaction mode).",
+    )
+    DB_QUERY_CACHE_SIZE: int = Field(
+        default=DEFAULT_DB_QUERY_CACHE_SIZE,
+        ge=0,
+        description="SQLAlchemy compiled-statement cache entries per engine.",
+    )
 
     # Security / auth
     JWT_SECRET_KEY: str = Field(
@@ -78,11 +172,85 @@ class Settings(BaseSettings):
         default=DEFAULT_SKIP_AUTH,
         description="Skip auth when running locally or in tests.",
     )
+    AUTH_USER_CACHE_TTL_S: float = Field(
+        default=DEFAULT_AUTH_USER_CACHE_TTL_S,
+        ge=0.0,
+        description="Seconds an authenticated user lookup is reused (0 disables the cache).",
+    )
+    AUTH_USER_CACHE_MAX_ENTRIES: int = Field(
+        default=DEFAULT_AUTH_USER_CACHE_MAX_ENTRIES,
+        ge=1,
+        description="Upper bound on cached (user, token) lookups per process.",
+    )
+    AUTH_TRUST_TOKEN_CLAIMS: bool = Field(
+        default=DEFAULT_AUTH_TRUST_TOKEN_CLAIMS,
+        description="Build the current user from signed token claims without a DB lookup "
+                    "(deactivation then takes effect only when the token expires).",
+    )
+    PASSWORD_HASH_WORKERS: int = Field(
+        default=DEFAULT_PASSWORD_HASH_WORKERS,
+        ge=1,
+        description="Threads dedicated to bcrypt hashing/verification per process.",
+    )
+    PASSWORD_HASH_MAX_PENDING: int = Field(
+        default=DEFAULT_PASSWORD_HASH_MAX_PENDING,
+        ge=1,
+        description="Running + queued bcrypt calls admitted before login/register answer 429.",
+    )
     FILE_STORAGE_DIR: str = Field(
         default=DEFAULT_FILE_STORAGE_DIR,
         min_length=1,
         description="Base directory for storing uploaded files and artifacts.",
     )
+    MAX_UPLOAD_BYTES: int = Field(
+        default=DEFAULT_MAX_UPLOAD_BYTES,
+        gt=0,
+        description="Largest PDF accepted on upload; bigger bodies are rejected with 413.",
+    )
+    UPLOAD_CHUNK_BYTES: int = Field(
+        default=DEFAULT_UPLOAD_CHUNK_BYTES,
+        gt=0,
+        description="Chunk size used when streaming an upload to storage.",
+    )
+    FILE_STORAGE_BACKEND: str = Field(
+        default=DEFAULT_FILE_STORAGE_BACKEND,
+        pattern="^(filesystem|s3)$",
+        description="Where uploads live: 'filesystem' (FILE_STORAGE_DIR) or 's3' (any S3-compatible store).",
+    )
+    FILE_STORAGE_IO_THREADS: int = Field(
+        default=DEFAULT_FILE_STORAGE_IO_THREADS,
+        ge=1,
+        description="Worker threads available to blocking file-storage I/O per process.",
+    )
+    S3_BUCKET: str | None = Field(
+        default=None,
+        description="Bucket for uploads when FILE_STORAGE_BACKEND=s3.",
+    )
+    S3_ENDPOINT_URL: str | None = Field(
+        default=None,
+        description="Custom S3 endpoint (e.g. http://minio:9000); None for AWS.",
+    )
+    S3_REGION: str | None = Field(
+        default=None,
+        description="S3 region name.",
+    )
+    S3_ACCESS_KEY_ID: str | None = Field(
+        default=None,
+        description="S3 access key (falls back to the standard AWS credential chain).",
+    )
+    S3_SECRET_ACCESS_KEY: str | None = Field(
+        default=None,
+        description="S3 secret key (falls back to the standard AWS credential chain).",
+    )
+    S3_KEY_PREFIX: str = Field(
+        default=DEFAULT_S3_KEY_PREFIX,
+        description="Prefix prepended to every object key, e.g. 'uploads/'.",
+    )
+    S3_MULTIPART_CHUNK_BYTES: int = Field(
+        default=DEFAULT_S3_MULTIPART_CHUNK_BYTES,
+        ge=5 * 1024 * 1024,
+        description="Part size for multipart uploads (S3 minimum is 5 MiB).",
+    )
     CORS_ALLOWED_ORIGINS: list[str] = Field(
         default=DEFAULT_CORS_ALLOWED_ORIGINS,
         description="Allowed browser origins for the React frontend and local previews.",
@@ -108,7 +276,50 @@ class Settings(BaseSettings):
     EMBED_BATCH_SIZE: int = Field(
         default=DEFAULT_EMBED_BATCH_SIZE,
         ge=1,
-        description="Batch size for embedding requests.",
+        description="Inputs per embedding request when EMBED_BATCH_MAX_TOKENS is None.",
+    )
+    EMBED_BATCH_MAX_TOKENS: int | None = Field(
+        default=DEFAULT_EMBED_BATCH_MAX_TOKENS,
+        ge=1,
+        description="Token budget per indexing embedding request (None = fixed EMBED_BATCH_SIZE batches).",
+    )
+    EMBED_BATCH_MAX_ITEMS: int = Field(
+        default=DEFAULT_EMBED_BATCH_MAX_ITEMS,
+        ge=1,
+        description="Input cap per token-budgeted embedding request.",
+    )
+    EMBED_COALESCE_LINGER_MS: float = Field(
+        default=DEFAULT_EMBED_COALESCE_LINGER_MS,
+        ge=0.0,
+        description="How long pooled indexing jobs wait to merge embedding batches with the same signature.",
+    )
+    EMBED_COALESCE_MAX_ITEMS: int = Field(
+        default=DEFAULT_EMBED_COALESCE_MAX_ITEMS,
+        ge=1,
+        description="Input cap of a coalesced embedding request.",
+    )
+    EMBED_COALESCE_MAX_CHARS: int = Field(
+        default=DEFAULT_EMBED_COALESCE_MAX_CHARS,
+        ge=1,
+        description=(
+            "Character cap of a coalesced embedding request. Pooled indexing also caps merged requests "
+            "at EMBED_BATCH_MAX_TOKENS tokens, since characters do not bound tokens."
+        ),
+    )
+    QUERY_EMBED_LINGER_MS: float = Field(
+        default=DEFAULT_QUERY_EMBED_LINGER_MS,
+        ge=0.0,
+        description="Window in which concurrent chat turns' query embeddings are sent as one request (0 disables).",
+    )
+    QUERY_EMBED_MAX_ITEMS: int = Field(
+        default=DEFAULT_QUERY_EMBED_MAX_ITEMS,
+        ge=1,
+        description="Input cap of a micro-batched query embedding request.",
+    )
+    QUERY_EMBED_MAX_CHARS: int = Field(
+        default=DEFAULT_QUERY_EMBED_MAX_CHARS,
+        ge=1,
+        description="Character cap of a micro-batched query embedding request.",
     )
     EMBED_DIMENSIONS: int | None = Field(
         default=DEFAULT_EMBED_DIMENSIONS,
@@ -131,6 +342,48 @@ class Settings(BaseSettings):
         ge=0,
         description="Overlap characters injected between adjacent chunks.",
     )
+    CHUNKER_PARALLEL_WORKERS: int = Field(
+        default=DEFAULT_CHUNKER_PARALLEL_WORKERS,
+        ge=0,
+        description="Processes used to chunk divs in parallel inside an indexing job (0/1 = sequential).",
+    )
+    CHUNKER_PARALLEL_MIN_BLOCKS: int = Field(
+        default=DEFAULT_CHUNKER_PARALLEL_MIN_BLOCKS,
+        ge=0,
+        description="Documents with fewer blocks are chunked sequentially (process start-up dominates).",
+    )
+
+    # Indexing worker
+    INDEXING_PROGRESS_MIN_INTERVAL_S: float = Field(
+        default=DEFAULT_INDEXING_PROGRESS_MIN_INTERVAL_S,
+        ge=0.0,
+        description="Minimum seconds between embedding progress writes.",
+    )
+    INDEXING_PROGRESS_MIN_DELTA: int = Field(
+        default=DEFAULT_INDEXING_PROGRESS_MIN_DELTA,
+        ge=1,
+        description="Progress points that force a write even inside the interval.",
+    )
+    INDEXING_WORKER_DB_POOL_SIZE: int = Field(
+        default=DEFAULT_INDEXING_WORKER_DB_POOL_SIZE,
+        ge=1,
+        description="DB pool size per indexing job (no overflow).",
+    )
+    INDEXING_RUNNER: str = Field(
+        default=DEFAULT_INDEXING_RUNNER,
+        pattern="^(spawn|pool)$",
+        description="'spawn': one process per job; 'pool': one long-lived process running jobs concurrently.",
+    )
+    INDEXING_POOL_MAX_JOBS: int = Field(
+        default=DEFAULT_INDEXING_POOL_MAX_JOBS,
+        ge=1,
+        description="Concurrent jobs in the 'pool' indexing runner.",
+    )
+    INDEXING_CANCEL_POLL_S: float = Field(
+        default=DEFAULT_INDEXING_CANCEL_POLL_S,
+        gt=0.0,
+        description="Fallback poll interval for cancel requests (NOTIFY usually delivers first).",
+    )
 
     # Retrieval guardrails
     MAX_TOP_K: int = Field(
@@ -143,6 +396,20 @@ class Settings(BaseSettings):
         ge=1,
         description="Upper bound for reranked results returned to clients.",
     )
+    RETRIEVAL_CACHE_MAX_ENTRIES: int = Field(
+        default=DEFAULT_RETRIEVAL_CACHE_MAX_ENTRIES,
+        ge=0,
+        description="Merged retrieval results kept per API process for READY indexes (0 disables the cache).",
+    )
+    RETRIEVAL_CACHE_REDIS_URL: str | None = Field(
+        default=DEFAULT_RETRIEVAL_CACHE_REDIS_URL,
+        description="Optional Redis URL for a retrieval cache shared by API processes (needs the 'redis' extra).",
+    )
+    RETRIEVAL_CACHE_SHARED_TTL_S: int = Field(
+        default=DEFAULT_RETRIEVAL_CACHE_SHARED_TTL_S,
+        ge=1,
+        description="Lifetime of shared retrieval cache entries (they never go stale; this bounds storage).",
+    )
 
     # Reply generation
     REPLY_PROVIDER: str = Field(
@@ -168,7 +435,47 @@ class Settings(BaseSettings):
     REPLY_MAX_CONTEXT_CHARS: int = Field(
         default=DEFAULT_REPLY_MAX_CONTEXT_CHARS,
         ge=1,
-        description="Maximum context characters passed into reply prompts.",
+        description="Hard safety clip on the context text in reply prompts (packing normally stays well below).",
+    )
+    REPLY_MAX_CONTEXT_TOKENS: int = Field(
+        default=DEFAULT_REPLY_MAX_CONTEXT_TOKENS,
+        ge=1,
+        description="Token budget for retrieved sources in reply prompts (reply model's tokenizer).",
+    )
+    REPLY_PROMPT_LAYOUT: str = Field(
+        default=DEFAULT_REPLY_PROMPT_LAYOUT,
+        pattern="^(context_first|stable_prefix)$",
+        description=(
+            "'context_first' (default): context before history. 'stable_prefix': system, earlier turns, "
+            "context, question, with the history window start aligned to QUERY_REWRITER_MAX_TURN so provider "
+            "prompt caching reuses the prefix; the reply prompt then carries N to 2*N-1 history turns "
+            "(N = QUERY_REWRITER_MAX_TURN) instead of N."
+        ),
+    )
+    REPLY_STREAM_HEARTBEAT_S: float = Field(
+        default=DEFAULT_REPLY_STREAM_HEARTBEAT_S,
+        gt=0.0,
+        description="Idle seconds before a heartbeat frame is sent on SSE/NDJSON reply streams.",
+    )
+    ANSWER_CACHE_ENABLED: bool = Field(
+        default=DEFAULT_ANSWER_CACHE_ENABLED,
+        description="Replay cached answers for near-identical questions that retrieve the same context after the same chat history (per index).",
+    )
+    ANSWER_CACHE_MIN_SIMILARITY: float = Field(
+        default=DEFAULT_ANSWER_CACHE_MIN_SIMILARITY,
+        ge=0.0,
+        le=1.0,
+        description="Minimum cosine similarity between question embeddings for an answer cache hit.",
+    )
+    ANSWER_CACHE_MAX_INDEXES: int = Field(
+        default=DEFAULT_ANSWER_CACHE_MAX_INDEXES,
+        ge=1,
+        description="Indexes with cached answers kept per API process (least recently used are dropped).",
+    )
+    ANSWER_CACHE_MAX_ENTRIES_PER_INDEX: int = Field(
+        default=DEFAULT_ANSWER_CACHE_MAX_ENTRIES_PER_INDEX,
+        ge=1,
+        description="Cached answers kept per index.",
     )
 
     # Query rewriting
@@ -1,20 +1,23 @@
 from functools import lru_cache
-from pathlib import Path
 from typing import AsyncIterator, Annotated, Callable
 
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from talk_to_pdf.backend.app.application.indexing.interfaces import IndexingRunner
+from talk_to_pdf.backend.app.application.indexing.interfaces import IndexingRunner, IndexStatusFeed
 from talk_to_pdf.backend.app.core.config import settings
 from talk_to_pdf.backend.app.domain.files.interfaces import FileStorage
 from talk_to_pdf.backend.app.domain.common.value_objects import EmbedConfig, ReplyGenerationConfig, QueryRewriteConfig, \
     RerankerConfig
-from talk_to_pdf.backend.app.infrastructure.db.session import SessionLocal
+from talk_to_pdf.backend.app.infrastructure.db.engine import raw_asyncpg_dsn
+from talk_to_pdf.backend.app.infrastructure.db.read_routing import ReadSessionRouter
+from talk_to_pdf.backend.app.infrastructure.db.session import SessionLocal, ReplicaSessionLocal
 from talk_to_pdf.backend.app.infrastructure.db.uow import SqlAlchemyUnitOfWork
 from talk_to_pdf.backend.app.domain.common.uow import UnitOfWork
-from talk_to_pdf.backend.app.infrastructure.files.filesystem_storage import FilesystemFileStorage
+from talk_to_pdf.backend.app.infrastructure.files.factory import build_file_storage
+from talk_to_pdf.backend.app.infrastructure.indexing.runner_pool import SharedProcessIndexingRunner
 from talk_to_pdf.backend.app.infrastructure.indexing.runner_spawn import SpawnProcessIndexingRunner
+from talk_to_pdf.backend.app.infrastructure.indexing.status_feed import PgIndexStatusFeed
 
 
 async def get_session()->AsyncIterator[AsyncSession]:
@@ -36,11 +39,43 @@ def get_uow_factory(
         return SqlAlchemyUnitOfWork(session)
     return _factory
 
+@lru_cache
+def get_read_session_router() -> ReadSessionRouter:
+    return ReadSessionRouter(
+        primary=SessionLocal,
+        replica=ReplicaSessionLocal,
+        retry_after_s=settings.DB_REPLICA_RETRY_S,
+        sticky_s=settings.DB_REPLICA_STICKY_S,
+    )
+
+
+async def get_read_session(
+    router: Annotated[ReadSessionRouter, Depends(get_read_session_router)],
+) -> AsyncIterator[AsyncSession]:
+    async with router.session() as session:
+        yield session
+
+
+def get_read_uow_factory(
+    session: Annotated[AsyncSession, Depends(get_read_session)]
+) -> Callable[[], UnitOfWork]:
+    """UoW factory for read-only use cases (replica when available). Never write through it."""
+    def _factory() -> UnitOfWork:
+        return SqlAlchemyUnitOfWork(session)
+    return _factory
+
 @lru_cache
 def get_indexing_runner()->IndexingRunner:
+    if settings.INDEXING_RUNNER == "pool":
+        return SharedProcessIndexingRunner(max_jobs=settings.INDEXING_POOL_MAX_JOBS)
     return SpawnProcessIndexingRunner()
 
 
+@lru_cache
+def get_index_status_feed() -> IndexStatusFeed:
+    return PgIndexStatusFeed(raw_asyncpg_dsn())
+
+
 def get_embed_config()->EmbedConfig:
     return EmbedConfig(
         provider=settings.EMBED_PROVIDER,
@@ -56,6 +91,7 @@ def get_reply_generation_config()->ReplyGenerationConfig:
         temperature=settings.REPLY_TEMPERATURE,
         max_output_tokens=settings.REPLY_MAX_OUTPUT_TOKENS,
         max_context_chars=settings.REPLY_MAX_CONTEXT_CHARS,
+        prompt_layout=settings.REPLY_PROMPT_LAYOUT,
     )
 
 def get_reranker_config()->RerankerConfig:
@@ -81,6 +117,4 @@ def get_file_storage() -> FileStorage:
     Singleton file storage instance.
     Swap implementation here (FS / S3 / MinIO) without touching use cases.
     """
-    base_dir = Path(settings.FILE_STORAGE_DIR)
-    base_dir.mkdir(parents=True, exist_ok=True)
-    return FilesystemFileStorage(base_dir)
+    return build_file_storage(settings)
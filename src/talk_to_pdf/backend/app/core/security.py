@@ -1,20 +1,55 @@
 # app/core/security.py
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta, datetime, timezone
-from typing import Union, Any
+from typing import Callable, TypeVar, Union, Any
 from jose import jwt, JWTError
 from passlib.context import CryptContext
 
 from talk_to_pdf.backend.app.core.config import settings
+from talk_to_pdf.backend.app.domain.users import AuthBusyError
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+T = TypeVar("T")
+
 
 class BcryptPasswordHasher:
-    def hash(self, raw_password: str) -> str:
-        return pwd_context.hash(raw_password)
+    """
+    bcrypt burns 100-300 ms of CPU per call, so it runs on a small dedicated
+    thread pool (the bcrypt backend releases the GIL) instead of the event loop.
+
+    At most `max_pending` calls may be running or queued. A slot is held until
+    the hash really finishes (even if the caller went away), and calls beyond
+    the limit fail fast with AuthBusyError instead of piling up behind the pool.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_workers: int = settings.PASSWORD_HASH_WORKERS,
+        max_pending: int = settings.PASSWORD_HASH_MAX_PENDING,
+    ) -> None:
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bcrypt")
+        self._slots = threading.BoundedSemaphore(max_pending)
+
+    async def hash(self, raw_password: str) -> str:
+        return await self._run(pwd_context.hash, raw_password)
+
+    async def verify(self, raw_password: str, hashed_password: str) -> bool:
+        return await self._run(pwd_context.verify, raw_password, hashed_password)
 
-    def verify(self, raw_password: str, hashed_password: str) -> bool:
-        return pwd_context.verify(raw_password, hashed_password)
+    async def _run(self, fn: Callable[..., T], *args: Any) -> T:
+        if not self._slots.acquire(blocking=False):
+            raise AuthBusyError()
+        try:
+            future = self._executor.submit(fn, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return await asyncio.wrap_future(future)
 
 
 ACCESS_TOKEN_EXPIRE_MINUTES = 60  # tweak if you want
@@ -23,9 +58,10 @@ ACCESS_TOKEN_EXPIRE_MINUTES = 60  # tweak if you want
 def create_access_token(
     subject: Union[str, int],
     expires_delta: timedelta | None = None,
+    claims: dict[str, Any] | None = None,
 ) -> str:
     """
-    Create a signed JWT access token with a `sub` claim.
+    Create a signed JWT access token with a `sub` claim (plus any extra `claims`).
     """
     if expires_delta is None:
         expires_delta = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
@@ -33,7 +69,7 @@ def create_access_token(
     now = datetime.now(timezone.utc)
     expire = now + expires_delta
 
-    to_encode: dict[str, Any] = {"sub": str(subject), "iat": now, "exp": expire}
+    to_encode: dict[str, Any] = {**(claims or {}), "sub": str(subject), "iat": now, "exp": expire}
     encoded_jwt = jwt.encode(
         to_encode,
         settings.JWT_SECRET_KEY,
@@ -27,7 +27,7 @@ class Chunk:
     index_id: UUID
     chunk_index: int
     text: str
-    text_norm: str
+    text_norm: str | None
     meta: dict[str, Any] | None
     created_at: datetime
 
@@ -127,6 +127,9 @@ class ReplyGenerationConfig:
     temperature: float = 0.2
     max_output_tokens: int | None = None
     max_context_chars: int = 20_000  # safety clip
+    # "context_first": system, context, history (question is the last history turn)
+    # "stable_prefix": system, earlier turns, context, question (provider prompt-cache friendly)
+    prompt_layout: str = "context_first"
 
     def to_dict(self) -> dict:
         return {
@@ -135,6 +138,7 @@ class ReplyGenerationConfig:
             "temperature": float(self.temperature),
             "max_output_tokens": int(self.max_output_tokens) if self.max_output_tokens is not None else None,
             "max_context_chars": int(self.max_context_chars),
+            "prompt_layout": self.prompt_layout,
         }
 
     @classmethod
@@ -145,6 +149,7 @@ class ReplyGenerationConfig:
             "temperature",
             "max_output_tokens",
             "max_context_chars",
+            "prompt_layout",
         }
         unknown = set(d.keys()) - allowed
         if unknown:
@@ -155,7 +160,8 @@ class ReplyGenerationConfig:
             model=str(d["model"]),
             temperature=float(d.get("temperature", 0.0)),
             max_output_tokens=int(d.get("max_output_tokens")) if d.get("max_output_tokens") is not None else None,
-            max_context_chars=int(d.get("max_context_chars", 20_000))
+            max_context_chars=int(d.get("max_context_chars", 20_000)),
+            prompt_layout=str(d.get("prompt_layout", "context_first")),
         )
 
     def canonical_json(self) -> str:
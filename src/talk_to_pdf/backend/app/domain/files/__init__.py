@@ -1,4 +1,5 @@
 from talk_to_pdf.backend.app.domain.files.entities import StoredFileInfo
+from talk_to_pdf.backend.app.domain.files.errors import FailedToSaveFile, FileTooLarge
 
-__all__=['StoredFileInfo']
+__all__=['StoredFileInfo', 'FailedToSaveFile', 'FileTooLarge']
 
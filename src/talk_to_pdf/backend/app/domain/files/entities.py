@@ -7,4 +7,5 @@ class StoredFileInfo:
     stored_filename: str
     storage_path: str
     size_bytes: int
-    content_type: str
\ No newline at end of file
+    content_type: str
+    sha256: str | None = None
\ No newline at end of file
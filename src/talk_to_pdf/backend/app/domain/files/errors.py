@@ -1,3 +1,9 @@
 class FailedToSaveFile(Exception):
     def __init__(self,reason:str=None):
-        super().__init__(reason)
\ No newline at end of file
+        super().__init__(reason)
+
+
+class FileTooLarge(Exception):
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        super().__init__(f"File exceeds the {max_bytes} byte upload limit")
\ No newline at end of file
@@ -1,20 +1,24 @@
-from pathlib import Path
-from typing import Protocol, runtime_checkable
+from typing import AsyncIterable, AsyncIterator, Protocol, runtime_checkable
 from uuid import UUID
 from talk_to_pdf.backend.app.domain.files import StoredFileInfo
 
 @runtime_checkable
 class FileStorage(Protocol):
-    _base_dir:Path
     async def save(
         self,
             *,
         owner_id: UUID,
         project_id: UUID,
         filename: str,
-        content: bytes,
+        content: AsyncIterable[bytes],
         content_type: str,
+        max_bytes: int | None = None,
     ) -> StoredFileInfo:
+        """
+        Consume `content` chunk by chunk (never buffering the whole file), filling
+        in size_bytes and sha256. Raises FileTooLarge as soon as more than
+        `max_bytes` arrive, leaving nothing behind.
+        """
         ...
 
     async def read_bytes(self, *, storage_path: str) -> bytes:
@@ -23,5 +27,16 @@ class FileStorage(Protocol):
         """
         ...
 
+    async def read_range(self, *, storage_path: str, start: int, length: int | None = None) -> bytes:
+        """
+        Read `length` bytes from offset `start` (to the end when length is None).
+        Short reads past EOF return what is there, like file.read().
+        """
+        ...
+
+    def iter_bytes(self, *, storage_path: str, chunk_size: int = 1024 * 1024) -> AsyncIterator[bytes]:
+        """Stream the stored file in chunks without loading it whole."""
+        ...
+
     async def delete(self, *,storage_path: str) -> None:
-        ...
\ No newline at end of file
+        ...
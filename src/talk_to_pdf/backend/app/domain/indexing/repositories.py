@@ -79,6 +79,12 @@ class ChunkRepository(Protocol):
     async def list_chunk_ids(self, *, index_id: UUID) -> list[UUID]: ...
     async def delete_by_index(self, *, index_id: UUID) -> None: ...
     async def get_many_by_ids_for_index(self, *, index_id: UUID, ids: list[UUID]) -> list[Chunk]:...
+    async def get_texts_by_index_and_ids(self, *, ids_by_index: dict[UUID, list[UUID]]) -> dict[UUID, str]:
+        """
+        Batched (id -> text) lookup for chunks spread over several indexes.
+        Used to hydrate citations without loading full chunk rows.
+        """
+        ...
 
 
 class ChunkEmbeddingRepository(Protocol):
@@ -19,6 +19,7 @@ class ProjectDocument:
     size_bytes: int
     id: UUID = field(default_factory=uuid4)
     uploaded_at: datetime = field(default_factory=utcnow)
+    sha256: str | None = None
 
 
 @dataclass
@@ -20,6 +20,8 @@ class ChatMessage:
     created_at: datetime = field(default_factory=utcnow)
     citations: ChatMessageCitations | None = None
     metrics: ReplyMetrics | None = None
+    # assistant reply cut short because the client disconnected mid-stream
+    truncated: bool = False
 
 
 @dataclass(frozen=True, slots=True)
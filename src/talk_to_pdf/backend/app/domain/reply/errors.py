@@ -1,3 +1,8 @@
 class ChatNotFoundOrForbidden(Exception):
     def __init__(self) -> None:
-        super().__init__(f"Index not found")
\ No newline at end of file
+        super().__init__(f"Index not found")
+
+
+class InvalidMessageCursor(Exception):
+    def __init__(self, reason: str = "Invalid message cursor") -> None:
+        super().__init__(reason)
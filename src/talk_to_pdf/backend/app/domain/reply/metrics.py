@@ -45,10 +45,15 @@ class ReplyMetrics:
     - Completion tokens
     - Total tokens
     - Latency for each processing stage
+    - Prompt tokens served from the provider's prompt cache
+    - Whether the answer was replayed from the semantic answer cache
     """
     prompt_tokens: TokenMetrics
     completion_tokens: int = 0
+    cached_prompt_tokens: int | None = None  # provider-reported, None when unknown
     latency: LatencyMetrics = field(default_factory=LatencyMetrics)
+    answer_cache_hit: bool = False
+    answer_cache_similarity: float | None = None  # cosine to the cached question, on a hit
 
     @property
     def total_tokens(self) -> int:
@@ -66,6 +71,7 @@ class ReplyMetrics:
                     "context": self.prompt_tokens.context,
                     "question": self.prompt_tokens.question,
                     "total": self.prompt_tokens.total,
+                    "cached": self.cached_prompt_tokens,
                 },
                 "completion": self.completion_tokens,
                 "total": self.total_tokens,
@@ -76,6 +82,10 @@ class ReplyMetrics:
                 "reply_generation": self.latency.reply_generation,
                 "total": self.latency.total,
             },
+            "answer_cache": {
+                "hit": self.answer_cache_hit,
+                "similarity": self.answer_cache_similarity,
+            },
         }
 
     @classmethod
@@ -88,6 +98,7 @@ class ReplyMetrics:
         tokens_data = data.get("tokens", {}) if isinstance(data.get("tokens"), dict) else {}
         prompt_data = tokens_data.get("prompt", {}) if isinstance(tokens_data.get("prompt"), dict) else {}
         latency_data = data.get("latency", {}) if isinstance(data.get("latency"), dict) else {}
+        cache_data = data.get("answer_cache", {}) if isinstance(data.get("answer_cache"), dict) else {}
 
         return cls(
             prompt_tokens=TokenMetrics(
@@ -98,9 +109,12 @@ class ReplyMetrics:
                 question=prompt_data.get("question", 0),
             ),
             completion_tokens=tokens_data.get("completion", 0),
+            cached_prompt_tokens=prompt_data.get("cached"),
             latency=LatencyMetrics(
                 query_rewriting=latency_data.get("query_rewriting"),
                 retrieval=latency_data.get("retrieval"),
                 reply_generation=latency_data.get("reply_generation"),
             ),
+            answer_cache_hit=bool(cache_data.get("hit", False)),
+            answer_cache_similarity=cache_data.get("similarity"),
         )
@@ -4,7 +4,9 @@ from datetime import datetime
 from typing import Iterable, Protocol
 from uuid import UUID
 
+from talk_to_pdf.backend.app.domain.common.value_objects import ChatTurn
 from talk_to_pdf.backend.app.domain.reply import Chat, ChatMessage
+from talk_to_pdf.backend.app.domain.reply.value_objects import MessageCursor
 
 
 class ChatRepository(Protocol):
@@ -55,6 +57,32 @@ class ChatMessageRepository(Protocol):
         """
         ...
 
+    async def list_page_by_owner_and_chat(
+        self,
+        *,
+        owner_id: UUID,
+        chat_id: UUID,
+        limit: int = 50,
+        before: MessageCursor | None = None,
+        after: MessageCursor | None = None,
+    ) -> list[ChatMessage]:
+        """
+        Keyset page on (created_at, id), ordered oldest -> newest.
+        - only `after`: the oldest `limit` messages newer than the cursor
+        - otherwise: the newest `limit` messages older than `before` (if given)
+        """
+        ...
+
+    async def list_recent_turns(self, *, chat_id: UUID, limit: int, align: int = 1) -> list[ChatTurn]:
+        """
+        Last `limit` (role, content) pairs, oldest -> newest.
+        With `align` > 1 the window starts at a multiple of `align` (counted from the
+        chat's first message), so it holds `limit` to `limit + align - 1` turns and
+        its older part stays identical for `align` consecutive turns.
+        No ownership check: callers validate the chat in the same unit of work.
+        """
+        ...
+
     async def delete_by_owner_and_chat(self, *, owner_id: UUID, chat_id: UUID) -> int:
         """
         Returns number of deleted messages.
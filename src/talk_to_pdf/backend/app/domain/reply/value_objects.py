@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from datetime import datetime
 from typing import Any
 from uuid import UUID
 
@@ -49,3 +50,13 @@ class GenerateReplyInput:
     context: str  # already built/condensed context string
     history: list[ChatTurn]
     system_prompt: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class MessageCursor:
+    """
+    Keyset position inside a chat's message stream.
+    (created_at, id) is unique and matches the ordering used for pagination.
+    """
+    created_at: datetime
+    id: UUID
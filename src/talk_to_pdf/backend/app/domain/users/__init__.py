@@ -3,10 +3,11 @@ from talk_to_pdf.backend.app.domain.users.erorrs import (
     RegistrationError,
     InvalidCredentialsError,
     InactiveUserError, \
-    UserNotFoundError
+    UserNotFoundError,
+    AuthBusyError,
 )
 
 from talk_to_pdf.backend.app.domain.users.value_objects import UserEmail
 
-__all__ = ['UserEmail','User','RegistrationError','InvalidCredentialsError','InactiveUserError','UserNotFoundError']
+__all__ = ['UserEmail','User','RegistrationError','InvalidCredentialsError','InactiveUserError','UserNotFoundError','AuthBusyError']
 
@@ -13,4 +13,9 @@ class InactiveUserError(Exception):
 
 
 class UserNotFoundError(Exception):
-    pass
\ No newline at end of file
+    pass
+
+
+class AuthBusyError(Exception):
+    """Raised when password hashing capacity is saturated; the client should retry shortly."""
+    pass
@@ -3,13 +3,14 @@ import logging
 from fastapi import FastAPI,Request, status
 from fastapi.responses import JSONResponse
 
-from talk_to_pdf.backend.app.domain.files.errors import FailedToSaveFile
+from talk_to_pdf.backend.app.domain.files.errors import FailedToSaveFile, FileTooLarge
 from talk_to_pdf.backend.app.domain.indexing.errors import FailedToStartIndexing, IndexNotFound, NoIndexesForProject
+from talk_to_pdf.backend.app.domain.reply.errors import InvalidMessageCursor
 from talk_to_pdf.backend.app.domain.projects.errors import ProjectNotFound, FailedToCreateProject
 from talk_to_pdf.backend.app.domain.retrieval.errors import InvalidQuery, IndexNotReady, IndexNotFoundOrForbidden, \
     InvalidRetrieval
 from talk_to_pdf.backend.app.domain.users import InvalidCredentialsError, InactiveUserError, UserNotFoundError, \
-    RegistrationError
+    RegistrationError, AuthBusyError
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +43,14 @@ def register_exception_handlers(app: FastAPI) -> None:
             content={"detail": str(exc) or "Registration failed"},
         )
 
+    @app.exception_handler(AuthBusyError)
+    async def auth_busy(_: Request, __: AuthBusyError):
+        return JSONResponse(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            content={"detail": "Too many sign-in attempts right now, retry shortly"},
+            headers={"Retry-After": "1"},
+        )
+
     @app.exception_handler(ProjectNotFound)
     async def project_not_found(_: Request, exc: ProjectNotFound):
         return JSONResponse(
@@ -56,6 +65,13 @@ def register_exception_handlers(app: FastAPI) -> None:
             content={"detail": str(exc) or "Failed to save file"},
         )
 
+    @app.exception_handler(FileTooLarge)
+    async def file_too_large(_: Request, exc: FileTooLarge):
+        return JSONResponse(
+            status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+            content={"detail": str(exc)},
+        )
+
     @app.exception_handler(FailedToCreateProject)
     async def failed_to_create_project(_: Request, exc: FailedToCreateProject):
         return JSONResponse(
@@ -112,6 +128,13 @@ def register_exception_handlers(app: FastAPI) -> None:
             content={"detail": str(exc)},
         )
 
+    @app.exception_handler(InvalidMessageCursor)
+    async def invalid_message_cursor(_: Request, exc: InvalidMessageCursor):
+        return JSONResponse(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            content={"detail": str(exc)},
+        )
+
     @app.exception_handler(Exception)
     async def unhandled_exception(_: Request, exc: Exception):
         logger.exception("Unhandled exception", exc_info=exc)
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Callable, Sequence
+
+from talk_to_pdf.backend.app.application.common.interfaces import AsyncEmbedder, EmbedderFactory
+from talk_to_pdf.backend.app.domain.common.value_objects import EmbedConfig
+from talk_to_pdf.backend.app.infrastructure.common.token_counter import encode_text
+
+
+def count_input_tokens(texts: Sequence[str], *, model: str) -> int:
+    # same counting as the indexing batch planner (special-token text is plain text)
+    return sum(len(encode_text(t, model=model)) for t in texts)
+
+
+@dataclass(slots=True)
+class _Pending:
+    texts: list[str]
+    tokens: int
+    future: asyncio.Future
+
+
+@dataclass(slots=True)
+class CoalescerStats:
+    calls: int = 0
+    requests: int = 0
+    texts: int = 0
+
+    def snapshot(self) -> dict[str, int]:
+        return {"calls": self.calls, "requests": self.requests, "texts": self.texts}
+
+
+class CoalescingEmbedder:
+    """
+    Merges concurrent aembed_documents calls into shared provider requests.
+
+    The first call opens a `linger_s` window; calls arriving inside it ride the
+    same request until `max_items` inputs, `max_chars` characters or, when
+    `count_tokens` is given, `max_tokens` tokens would be exceeded. Characters
+    are no bound on tokens (CJK or math can run well over one token per
+    character), so requests that may be large should set the token budget.
+    A call that already fills a request goes straight through.
+
+    The request runs in its own task, so a cancelled caller never fails the
+    others; a provider error is raised to every caller of that request.
+    """
+
+    def __init__(
+            self,
+            inner: AsyncEmbedder,
+            *,
+            linger_s: float,
+            max_items: int,
+            max_chars: int,
+            max_tokens: int | None = None,
+            count_tokens: Callable[[Sequence[str]], int] | None = None,
+    ) -> None:
+        self._inner = inner
+        self._linger_s = linger_s
+        self._max_items = max_items
+        self._max_chars = max_chars
+        self._max_tokens = max_tokens if count_tokens is not None else None
+        self._count_tokens = count_tokens
+        self._pending: list[_Pending] = []
+        self._pending_items = 0
+        self._pending_chars = 0
+        self._pending_tokens = 0
+        self._timer: asyncio.TimerHandle | None = None
+        self._inflight: set[asyncio.Task] = set()
+        self.stats = CoalescerStats()
+
+    async def aembed_documents(self, texts: Sequence[str]) -> list[list[float]]:
+        texts = list(texts)
+        if not texts:
+            return []
+        self.stats.calls += 1
+        chars = sum(len(t) for t in texts)
+        tokens = 0
+        if self._max_tokens is not None and self._count_tokens is not None:
+            # tiktoken on a large batch is CPU-bound: keep it off the event loop
+            tokens = await asyncio.to_thread(self._count_tokens, texts)
+
+        if (
+            len(texts) >= self._max_items
+            or chars >= self._max_chars
+            or (self._max_tokens is not None and tokens >= self._max_tokens)
+        ):
+            self.stats.requests += 1
+            self.stats.texts += len(texts)
+            return await self._inner.aembed_documents(texts)
+
+        if self._pending and (
+            self._pending_items + len(texts) > self._max_items
+            or self._pending_chars + chars > self._max_chars
+            or (self._max_tokens is not None and self._pending_tokens + tokens > self._max_tokens)
+        ):
+            self._flush()
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        self._pending.append(_Pending(texts=texts, tokens=tokens, future=future))
+        self._pending_items += len(texts)
+        self._pending_chars += chars
+        self._pending_tokens += tokens
+
+        if self._pending_items >= self._max_items:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._linger_s, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        self._pending_items = 0
+        self._pending_chars = 0
+        self._pending_tokens = 0
+        batch = [p for p in batch if not p.future.done()]  # drop callers that gave up
+        if not batch:
+            return
+        task = asyncio.create_task(self._send(batch))
+        self._inflight.add(task)
+        task.add_done_callback(self._inflight.discard)
+
+    async def _send(self, batch: list[_Pending]) -> None:
+        texts = [t for p in batch for t in p.texts]
+        self.stats.requests += 1
+        self.stats.texts += len(texts)
+        try:
+            vectors = await self._inner.aembed_documents(texts)
+            if len(vectors) != len(texts):
+                raise RuntimeError(f"embedder returned {len(vectors)} vectors for {len(texts)} texts")
+        except asyncio.CancelledError:
+            for p in batch:
+                p.future.cancel()
+            raise
+        except Exception as e:
+            for p in batch:
+                if not p.future.done():
+                    p.future.set_exception(e)
+            return
+
+        offset = 0
+        for p in batch:
+            n = len(p.texts)
+            if not p.future.done():
+                p.future.set_result(vectors[offset: offset + n])
+            offset += n
+
+
+@dataclass(slots=True)
+class CoalescingEmbedderFactory:
+    """
+    One CoalescingEmbedder (and so one underlying client) per embed signature,
+    so every caller in the process with the same EmbedConfig shares its batches.
+    `max_tokens` budgets merged requests with the embed model's tokenizer.
+    """
+
+    inner: EmbedderFactory
+    linger_s: float
+    max_items: int
+    max_chars: int
+    max_tokens: int | None = None
+    _embedders: dict[str, CoalescingEmbedder] = field(default_factory=dict)
+
+    def create(self, cfg: EmbedConfig) -> CoalescingEmbedder:
+        key = cfg.signature()
+        embedder = self._embedders.get(key)
+        if embedder is None:
+            embedder = CoalescingEmbedder(
+                self.inner.create(cfg),
+                linger_s=self.linger_s,
+                max_items=self.max_items,
+                max_chars=self.max_chars,
+                max_tokens=self.max_tokens,
+                count_tokens=partial(count_input_tokens, model=cfg.model) if self.max_tokens is not None else None,
+            )
+            self._embedders[key] = embedder
+        return embedder
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        return {key: e.stats.snapshot() for key, e in self._embedders.items()}
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+import httpx
 from langchain_openai import OpenAIEmbeddings
 
 from talk_to_pdf.backend.app.application.common.interfaces import AsyncEmbedder
@@ -12,11 +13,14 @@ from talk_to_pdf.backend.app.infrastructure.common.embedders.langchain_openai_em
 @dataclass(frozen=True, slots=True)
 class OpenAIEmbedderFactory:
     api_key: str
+    # shared keep-alive pool; None lets every created embedder open its own client
+    http_async_client: httpx.AsyncClient | None = None
 
     def create(self, cfg: EmbedConfig) -> AsyncEmbedder:
         embeddings = OpenAIEmbeddings(
             model=cfg.model,
             dimensions=cfg.dimensions,
             api_key=self.api_key,
+            http_async_client=self.http_async_client,
         )
         return LangChainEmbedder(embeddings)
@@ -41,6 +41,23 @@ def count_tokens(text: str, model: str = "gpt-4") -> int:
     return len(encoding.encode(text))
 
 
+def encode_text(text: str, model: str = "gpt-4") -> list[int]:
+    """Token ids for arbitrary text; special-token strings (e.g. from a PDF) count as plain text."""
+    if not text:
+        return []
+    return _get_encoding(model).encode(text, disallowed_special=())
+
+
+def truncate_to_tokens(text: str, max_tokens: int, model: str = "gpt-4") -> str:
+    """Longest prefix of `text` (on a token boundary) that fits in `max_tokens`."""
+    if max_tokens <= 0:
+        return ""
+    tokens = encode_text(text, model=model)
+    if len(tokens) <= max_tokens:
+        return text
+    return _get_encoding(model).decode(tokens[:max_tokens])
+
+
 def _stringify_content(content: Any) -> str:
     """
     LangChain message.content can be:
@@ -84,6 +101,55 @@ def _stringify_additional_kwargs(message: BaseMessage) -> str:
         return str(ak)
 
 
+# Heuristic overhead for chat-style formatting.
+# (These constants are not universal; keep them as best-effort guardrails.)
+TOKENS_PER_MESSAGE = 3
+TOKENS_PER_NAME = 1
+REPLY_PRIMING = 3
+
+
+def _message_tokens(encoding: tiktoken.Encoding, content_text: str, has_name: bool, ak_text: str) -> int:
+    num_tokens = TOKENS_PER_MESSAGE
+
+    # Count content tokens (handles str or block-list content)
+    if content_text:
+        num_tokens += len(encoding.encode(content_text))
+
+    # Count "name" tokens if present
+    if has_name:
+        num_tokens += TOKENS_PER_NAME
+
+    # Include tool/function payloads if present
+    if ak_text:
+        num_tokens += len(encoding.encode(ak_text))
+
+    return num_tokens
+
+
+@lru_cache(maxsize=4096)
+def _cached_message_tokens(model: str, content_text: str, has_name: bool, ak_text: str) -> int:
+    return _message_tokens(_get_encoding(model), content_text, has_name, ak_text)
+
+
+def count_message_tokens_memoized(messages: Sequence[BaseMessage], model: str = "gpt-4") -> int:
+    """
+    Same result as count_message_tokens, but memoizes per-message counts.
+    Use for messages that repeat across requests (system prompt, chat history).
+    """
+    if not messages:
+        return 0
+
+    num_tokens = 0
+    for message in messages:
+        num_tokens += _cached_message_tokens(
+            model,
+            _stringify_content(getattr(message, "content", None)),
+            bool(getattr(message, "name", None)),
+            _stringify_additional_kwargs(message),
+        )
+    return num_tokens + REPLY_PRIMING
+
+
 def count_message_tokens(messages: Sequence[BaseMessage], model: str = "gpt-4") -> int:
     """
     Count tokens in a sequence of LangChain messages.
@@ -105,33 +171,17 @@ def count_message_tokens(messages: Sequence[BaseMessage], model: str = "gpt-4")
 
     encoding = _get_encoding(model)
 
-    # Heuristic overhead for chat-style formatting.
-    # (These constants are not universal; keep them as best-effort guardrails.)
-    tokens_per_message = 3
-    tokens_per_name = 1
-    reply_priming = 3
-
     num_tokens = 0
 
     for message in messages:
-        num_tokens += tokens_per_message
-
-        # Count content tokens (handles str or block-list content)
-        content_text = _stringify_content(getattr(message, "content", None))
-        if content_text:
-            num_tokens += len(encoding.encode(content_text))
-
-        # Count "name" tokens if present
-        name = getattr(message, "name", None)
-        if name:
-            num_tokens += tokens_per_name
-
-        # Include tool/function payloads if present
-        ak_text = _stringify_additional_kwargs(message)
-        if ak_text:
-            num_tokens += len(encoding.encode(ak_text))
+        num_tokens += _message_tokens(
+            encoding,
+            _stringify_content(getattr(message, "content", None)),
+            bool(getattr(message, "name", None)),
+            _stringify_additional_kwargs(message),
+        )
 
     # Add priming tokens for assistant reply
-    num_tokens += reply_priming
+    num_tokens += REPLY_PRIMING
 
     return num_tokens
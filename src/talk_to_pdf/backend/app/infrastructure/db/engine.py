@@ -1,13 +1,44 @@
-from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 from talk_to_pdf.backend.app.core.config import settings
+from talk_to_pdf.backend.app.infrastructure.db.pool_metrics import PoolMetrics
 
 ASYNC_DATABASE_URI = settings.SQLALCHEMY_DATABASE_URL
 
-engine = create_async_engine(
-    ASYNC_DATABASE_URI,
-    echo=False,
-    pool_pre_ping=True,
-    future=True,
+
+def build_engine(
+    url: str = ASYNC_DATABASE_URI,
+    *,
+    pool_size: int = settings.DB_POOL_SIZE,
+    max_overflow: int = settings.DB_MAX_OVERFLOW,
+) -> AsyncEngine:
+    """
+    One pooled asyncpg engine per process. Pre-ping is opt-in: recycling old
+    connections covers server-side idle timeouts without a round trip per checkout.
+    """
+    return create_async_engine(
+        url,
+        echo=False,
+        future=True,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=settings.DB_POOL_TIMEOUT_S,
+        pool_recycle=settings.DB_POOL_RECYCLE_S,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+        connect_args={"prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE},
+    )
+
+
+engine = build_engine()
+replica_engine = (
+    build_engine(settings.SQLALCHEMY_READ_REPLICA_URL) if settings.SQLALCHEMY_READ_REPLICA_URL else None
 )
+pool_metrics = PoolMetrics(engine, pool_size=settings.DB_POOL_SIZE, max_overflow=settings.DB_MAX_OVERFLOW)
+
+
+def raw_asyncpg_dsn(url: str = ASYNC_DATABASE_URI) -> str:
+    """Plain libpq DSN for asyncpg connections kept outside the pool (LISTEN)."""
+    return make_url(url).set(drivername="postgresql").render_as_string(hide_password=False)
 
 # sync_engine = engine.sync_engine
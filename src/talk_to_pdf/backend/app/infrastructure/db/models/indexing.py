@@ -73,11 +73,12 @@ class ChunkModel(Base):
     # NEW: normalized text used for better retrieval (de-hyphenate, newline cleanup, etc.)
     text_norm: Mapped[str | None] = mapped_column(Text, nullable=True)
 
-    # NEW: full-text search vector (generated, always in sync)
+    # NEW: full-text search vector (generated, always in sync); deferred: only FTS reads it, in SQL
     tsv: Mapped[str] = mapped_column(
         TSVECTOR(),
         Computed("to_tsvector('english', coalesce(text_norm, text))", persisted=True),
         nullable=False,
+        deferred=True,
     )
 
     meta: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
@@ -73,4 +73,5 @@ class ProjectDocumentModel(Base):
     storage_path: Mapped[str] = mapped_column(String(1024), nullable=False, unique=True)
     content_type: Mapped[str] = mapped_column(String(128), nullable=False)
     size_bytes: Mapped[int] = mapped_column(Integer, nullable=False)
+    sha256: Mapped[str | None] = mapped_column(String(64), nullable=True)
     uploaded_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 from uuid import uuid4
 from sqlalchemy import Enum as SAEnum
-from sqlalchemy import DateTime, ForeignKey, String, Index, Text, UUID
+from sqlalchemy import Boolean, DateTime, ForeignKey, String, Index, Text, UUID, false
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import Optional
@@ -121,15 +121,23 @@ class ChatMessageModel(Base):
         nullable=True,
     )
 
+    truncated: Mapped[bool] = mapped_column(
+        Boolean,
+        nullable=False,
+        default=False,
+        server_default=false(),
+    )
+
     chat: Mapped["ChatModel"] = relationship(
         "ChatModel",
         back_populates="messages",
     )
 
 
-# Critical for fast pagination
+# Critical for fast (keyset) pagination on (created_at, id)
 Index(
-    "ix_chat_messages_chat_created",
+    "ix_chat_messages_chat_created_id",
     ChatMessageModel.chat_id,
     ChatMessageModel.created_at,
+    ChatMessageModel.id,
 )
\ No newline at end of file
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+class PoolMetrics:
+    """
+    Counters and a live snapshot of one engine's connection pool, for sizing
+    DB_POOL_SIZE/DB_MAX_OVERFLOW against the Postgres max_connections budget
+    (every API process and indexing worker holds its own pool).
+    """
+
+    def __init__(self, engine: AsyncEngine, *, pool_size: int, max_overflow: int) -> None:
+        self._engine = engine
+        self._max_connections = pool_size + max_overflow
+        self.connects = 0
+        self.checkouts = 0
+        self.invalidations = 0
+        self.peak_checked_out = 0
+
+        target = engine.sync_engine
+        event.listen(target, "connect", self._on_connect)
+        event.listen(target, "checkout", self._on_checkout)
+        event.listen(target, "invalidate", self._on_invalidate)
+
+    def _on_connect(self, *_: Any) -> None:
+        self.connects += 1
+
+    def _on_checkout(self, *_: Any) -> None:
+        self.checkouts += 1
+        # NullPool/StaticPool have no checkedout(); only the counter applies there
+        checkedout = getattr(self._engine.pool, "checkedout", None)
+        if callable(checkedout):
+            self.peak_checked_out = max(self.peak_checked_out, checkedout())
+
+    def _on_invalidate(self, *_: Any) -> None:
+        self.invalidations += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        pool = self._engine.pool
+        snap: dict[str, Any] = {
+            "max_connections": self._max_connections,
+            "connects": self.connects,
+            "checkouts": self.checkouts,
+            "invalidations": self.invalidations,
+            "peak_checked_out": self.peak_checked_out,
+        }
+        # QueuePool exposes these; NullPool/StaticPool (tests) do not
+        for name in ("size", "checkedin", "checkedout", "overflow"):
+            fn = getattr(pool, name, None)
+            if callable(fn):
+                snap[name] = fn()
+        return snap
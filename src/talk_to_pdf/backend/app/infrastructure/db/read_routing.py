@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, Hashable
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+logger = logging.getLogger(__name__)
+
+_MAX_PINS = 10_000
+
+
+class ReadSessionRouter:
+    """
+    Sessions for read-only use cases: on the read replica when one is configured
+    and reachable, otherwise on the primary.
+
+    - A replica that fails to connect is skipped for `retry_after_s`, so reads
+      don't pay a connect timeout on every request while it is down.
+    - pin_primary(key) keeps reads for `key` (e.g. a user who just posted a
+      message) on the primary for `sticky_s`, covering replication lag for
+      read-your-writes. Pins are per process.
+    """
+
+    def __init__(
+        self,
+        *,
+        primary: async_sessionmaker[AsyncSession],
+        replica: async_sessionmaker[AsyncSession] | None,
+        retry_after_s: float,
+        sticky_s: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._primary = primary
+        self._replica = replica
+        self._retry_after_s = retry_after_s
+        self._sticky_s = sticky_s
+        self._clock = clock
+        self._replica_down_until = 0.0
+        self._pins: dict[Hashable, float] = {}
+
+    def pin_primary(self, key: Hashable) -> None:
+        if self._replica is None or self._sticky_s <= 0:
+            return
+        now = self._clock()
+        if len(self._pins) >= _MAX_PINS:
+            self._pins = {k: until for k, until in self._pins.items() if until > now}
+        self._pins[key] = now + self._sticky_s
+
+    def _use_primary(self, key: Hashable | None) -> bool:
+        if self._replica is None or self._clock() < self._replica_down_until:
+            return True
+        if key is None:
+            return False
+        until = self._pins.get(key)
+        if until is None:
+            return False
+        if until <= self._clock():
+            del self._pins[key]
+            return False
+        return True
+
+    @asynccontextmanager
+    async def session(self, *, key: Hashable | None = None) -> AsyncIterator[AsyncSession]:
+        replica = self._replica
+        if replica is not None and not self._use_primary(key):
+            replica_session = replica()
+            try:
+                # connect now, so an unreachable replica falls back instead of failing the read
+                await replica_session.connection()
+            except Exception:
+                logger.warning(
+                    "Read replica unavailable; using primary for %.0fs", self._retry_after_s, exc_info=True
+                )
+                self._replica_down_until = self._clock() + self._retry_after_s
+                await replica_session.close()
+            else:
+                async with replica_session:
+                    yield replica_session
+                return
+
+        async with self._primary() as session:
+            yield session
@@ -1,6 +1,6 @@
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from talk_to_pdf.backend.app.infrastructure.db.engine import engine
+from talk_to_pdf.backend.app.infrastructure.db.engine import engine, replica_engine
 
 # Async session factory
 SessionLocal = async_sessionmaker(
@@ -8,4 +8,12 @@ SessionLocal = async_sessionmaker(
     class_=AsyncSession,
     autoflush=False,
     expire_on_commit=False,
-)
\ No newline at end of file
+)
+
+# Read-replica session factory (None when no replica is configured)
+ReplicaSessionLocal = async_sessionmaker(
+    bind=replica_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+) if replica_engine is not None else None
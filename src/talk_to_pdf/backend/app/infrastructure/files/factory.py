@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import anyio
+
+from talk_to_pdf.backend.app.core.config import Settings
+from talk_to_pdf.backend.app.domain.files.interfaces import FileStorage
+from talk_to_pdf.backend.app.infrastructure.files.filesystem_storage import FilesystemFileStorage
+
+
+def build_file_storage(settings: Settings) -> FileStorage:
+    """Pick the FileStorage backend from settings (shared by the API and the indexing worker)."""
+    limiter = anyio.CapacityLimiter(settings.FILE_STORAGE_IO_THREADS)
+
+    if settings.FILE_STORAGE_BACKEND == "s3":
+        if not settings.S3_BUCKET:
+            raise ValueError("S3_BUCKET is required when FILE_STORAGE_BACKEND=s3")
+        import boto3
+        from botocore.config import Config
+
+        from talk_to_pdf.backend.app.infrastructure.files.s3_storage import S3FileStorage
+
+        client = boto3.client(
+            "s3",
+            endpoint_url=settings.S3_ENDPOINT_URL or None,
+            region_name=settings.S3_REGION or None,
+            aws_access_key_id=settings.S3_ACCESS_KEY_ID or None,
+            aws_secret_access_key=settings.S3_SECRET_ACCESS_KEY or None,
+            # one pooled connection per storage thread
+            config=Config(max_pool_connections=settings.FILE_STORAGE_IO_THREADS),
+        )
+        return S3FileStorage(
+            client=client,
+            bucket=settings.S3_BUCKET,
+            key_prefix=settings.S3_KEY_PREFIX,
+            multipart_chunk_bytes=settings.S3_MULTIPART_CHUNK_BYTES,
+            limiter=limiter,
+        )
+
+    base_dir = Path(settings.FILE_STORAGE_DIR)
+    base_dir.mkdir(parents=True, exist_ok=True)
+    return FilesystemFileStorage(base_dir, limiter=limiter)
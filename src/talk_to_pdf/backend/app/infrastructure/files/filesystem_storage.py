@@ -1,15 +1,69 @@
 from __future__ import annotations
 
+import hashlib
 import os
 from pathlib import Path
+from typing import AsyncIterable, AsyncIterator, BinaryIO, Callable, TypeVar
 from uuid import UUID, uuid4
 
+import anyio
+
+from talk_to_pdf.backend.app.domain.files.errors import FileTooLarge
 from talk_to_pdf.backend.app.domain.files.interfaces import StoredFileInfo
 
+T = TypeVar("T")
+
+
+def _write_chunk(f: BinaryIO, digest: hashlib._Hash, chunk: bytes) -> None:
+    f.write(chunk)
+    digest.update(chunk)
+
+
+def _discard(f: BinaryIO, part_path: Path) -> None:
+    f.close()
+    part_path.unlink(missing_ok=True)
+
+
+def _open_for_read(path: Path) -> BinaryIO:
+    return open(path, "rb")
+
+
+def _read_range(path: Path, start: int, length: int | None) -> bytes:
+    with open(path, "rb") as f:
+        f.seek(start)
+        return f.read() if length is None else f.read(length)
+
+
+def _remove(path: Path) -> None:
+    if path.exists():
+        path.unlink()
+        full_dir = path.parent
+        if not any(full_dir.iterdir()):
+            full_dir.rmdir()
+
 
 class FilesystemFileStorage:
-    def __init__(self, base_dir: Path) -> None:
+    """
+    FileStorage on a local (or shared) directory.
+
+    Every blocking call runs on a worker thread, capped by `limiter` so a burst
+    of uploads/reads cannot take every thread anyio has.
+    """
+
+    def __init__(self, base_dir: Path, *, limiter: anyio.CapacityLimiter | None = None) -> None:
         self._base_dir = base_dir
+        self._limiter = limiter
+
+    async def _run(self, fn: Callable[..., T], *args: object) -> T:
+        return await anyio.to_thread.run_sync(fn, *args, limiter=self._limiter)
+
+    def _resolve(self, storage_path: str) -> Path:
+        full_path = (self._base_dir / storage_path).resolve()
+
+        # Safety: prevent path traversal
+        if not str(full_path).startswith(str(self._base_dir.resolve())):
+            raise ValueError("Invalid storage path")
+        return full_path
 
     async def save(
         self,
@@ -17,11 +71,12 @@ class FilesystemFileStorage:
         owner_id: UUID,
         project_id: UUID,
         filename: str,
-        content: bytes,
+        content: AsyncIterable[bytes],
         content_type: str,
+        max_bytes: int | None = None,
     ) -> StoredFileInfo:
         project_dir = self._base_dir / str(owner_id) / str(project_id)
-        project_dir.mkdir(parents=True, exist_ok=True)
+        await self._run(lambda: project_dir.mkdir(parents=True, exist_ok=True))
 
         # derive safe extension
         ext = Path(filename).suffix.lower()
@@ -30,11 +85,26 @@ class FilesystemFileStorage:
 
         stored_filename = f"{uuid4()}{ext}"
         full_path = project_dir / stored_filename
+        part_path = full_path.with_name(stored_filename + ".part")
 
-        with open(full_path, "wb") as f:
-            f.write(content)
+        # write to a .part file and rename at the end, so a failed or oversized
+        # upload never leaves a half-written PDF under its final name
+        digest = hashlib.sha256()
+        size = 0
+        f = await self._run(open, part_path, "wb")
+        try:
+            async for chunk in content:
+                size += len(chunk)
+                if max_bytes is not None and size > max_bytes:
+                    raise FileTooLarge(max_bytes)
+                await self._run(_write_chunk, f, digest, chunk)
+            await self._run(f.close)
+            await self._run(os.replace, part_path, full_path)
+        except BaseException:
+            with anyio.CancelScope(shield=True):
+                await self._run(_discard, f, part_path)
+            raise
 
-        size = full_path.stat().st_size
         rel_path = os.path.relpath(full_path, self._base_dir)
 
         return StoredFileInfo(
@@ -43,20 +113,23 @@ class FilesystemFileStorage:
             storage_path=rel_path,
             size_bytes=size,
             content_type=content_type,
+            sha256=digest.hexdigest(),
         )
 
     async def read_bytes(self, *, storage_path: str) -> bytes:
-        full_path = (self._base_dir / storage_path).resolve()
-
-        # Safety: prevent path traversal
-        if not str(full_path).startswith(str(self._base_dir.resolve())):
-            raise ValueError("Invalid storage path")
+        return await self._run(self._resolve(storage_path).read_bytes)
 
-        return full_path.read_bytes()
+    async def read_range(self, *, storage_path: str, start: int, length: int | None = None) -> bytes:
+        return await self._run(_read_range, self._resolve(storage_path), start, length)
 
+    async def iter_bytes(self, *, storage_path: str, chunk_size: int = 1024 * 1024) -> AsyncIterator[bytes]:
+        f = await self._run(_open_for_read, self._resolve(storage_path))
+        try:
+            while chunk := await self._run(f.read, chunk_size):
+                yield chunk
+        finally:
+            with anyio.CancelScope(shield=True):
+                await self._run(f.close)
 
     async def delete(self, *,storage_path: str) -> None:
-        full_path = self._base_dir / storage_path
-        if full_path.exists():
-            full_path.unlink()
-            full_path.parent.rmdir()
+        await self._run(_remove, self._resolve(storage_path))
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import hashlib
+from typing import Any, AsyncIterable, AsyncIterator, Callable, TypeVar
+from uuid import UUID, uuid4
+
+import anyio
+
+from talk_to_pdf.backend.app.domain.files.errors import FileTooLarge
+from talk_to_pdf.backend.app.domain.files.interfaces import StoredFileInfo
+
+T = TypeVar("T")
+
+MIN_MULTIPART_CHUNK_BYTES = 5 * 1024 * 1024  # S3 minimum for every part but the last
+
+
+def _is_invalid_range(exc: Exception) -> bool:
+    response = getattr(exc, "response", None) or {}
+    return response.get("Error", {}).get("Code") == "InvalidRange"
+
+
+class S3FileStorage:
+    """
+    FileStorage on an S3-compatible bucket (AWS S3, MinIO, ...), so API nodes and
+    indexing workers share uploads without a shared volume.
+
+    Drives a (thread-safe) boto3 S3 client on worker threads (capped by `limiter`).
+    Uploads go through multipart in `multipart_chunk_bytes` parts, so at most
+    one part is buffered; files smaller than one part are a single PUT.
+    storage_path is the object key relative to `key_prefix`.
+    """
+
+    def __init__(
+        self,
+        *,
+        client: Any,
+        bucket: str,
+        key_prefix: str = "",
+        multipart_chunk_bytes: int = 8 * 1024 * 1024,
+        limiter: anyio.CapacityLimiter | None = None,
+    ) -> None:
+        if multipart_chunk_bytes < MIN_MULTIPART_CHUNK_BYTES:
+            raise ValueError(f"multipart_chunk_bytes must be >= {MIN_MULTIPART_CHUNK_BYTES}")
+        self._bucket = bucket
+        self._key_prefix = key_prefix
+        self._part_size = multipart_chunk_bytes
+        self._client = client
+        self._limiter = limiter
+
+    async def _run(self, fn: Callable[..., T], *args: object, **kwargs: object) -> T:
+        return await anyio.to_thread.run_sync(lambda: fn(*args, **kwargs), limiter=self._limiter)
+
+    def _key(self, storage_path: str) -> str:
+        if storage_path.startswith("/") or ".." in storage_path.split("/"):
+            raise ValueError("Invalid storage path")
+        return self._key_prefix + storage_path
+
+    async def save(
+        self,
+        *,
+        owner_id: UUID,
+        project_id: UUID,
+        filename: str,
+        content: AsyncIterable[bytes],
+        content_type: str,
+        max_bytes: int | None = None,
+    ) -> StoredFileInfo:
+        stored_filename = f"{uuid4()}.pdf"
+        storage_path = f"{owner_id}/{project_id}/{stored_filename}"
+        key = self._key(storage_path)
+
+        digest = hashlib.sha256()
+        size = 0
+        buffer = bytearray()
+        upload_id: str | None = None
+        parts: list[dict[str, Any]] = []
+
+        async def flush_part() -> None:
+            nonlocal upload_id
+            if upload_id is None:
+                created = await self._run(
+                    self._client.create_multipart_upload,
+                    Bucket=self._bucket, Key=key, ContentType=content_type,
+                )
+                upload_id = created["UploadId"]
+            part_number = len(parts) + 1
+            body = bytes(buffer)
+            buffer.clear()
+            uploaded = await self._run(
+                self._client.upload_part,
+                Bucket=self._bucket, Key=key, UploadId=upload_id, PartNumber=part_number, Body=body,
+            )
+            parts.append({"ETag": uploaded["ETag"], "PartNumber": part_number})
+
+        try:
+            async for chunk in content:
+                size += len(chunk)
+                if max_bytes is not None and size > max_bytes:
+                    raise FileTooLarge(max_bytes)
+                digest.update(chunk)
+                buffer += chunk
+                if len(buffer) >= self._part_size:
+                    await flush_part()
+
+            if upload_id is None:
+                await self._run(
+                    self._client.put_object,
+                    Bucket=self._bucket, Key=key, Body=bytes(buffer), ContentType=content_type,
+                )
+            else:
+                if buffer:
+                    await flush_part()
+                await self._run(
+                    self._client.complete_multipart_upload,
+                    Bucket=self._bucket, Key=key, UploadId=upload_id, MultipartUpload={"Parts": parts},
+                )
+        except BaseException:
+            if upload_id is not None:
+                with anyio.CancelScope(shield=True):
+                    try:
+                        await self._run(
+                            self._client.abort_multipart_upload,
+                            Bucket=self._bucket, Key=key, UploadId=upload_id,
+                        )
+                    except Exception:
+                        pass
+            raise
+
+        return StoredFileInfo(
+            original_filename=filename,
+            stored_filename=stored_filename,
+            storage_path=storage_path,
+            size_bytes=size,
+            content_type=content_type,
+            sha256=digest.hexdigest(),
+        )
+
+    async def read_bytes(self, *, storage_path: str) -> bytes:
+        return await self._get(self._key(storage_path))
+
+    async def read_range(self, *, storage_path: str, start: int, length: int | None = None) -> bytes:
+        if length is not None and length <= 0:
+            return b""
+        end = "" if length is None else str(start + length - 1)
+        try:
+            return await self._get(self._key(storage_path), Range=f"bytes={start}-{end}")
+        except Exception as e:
+            if _is_invalid_range(e):  # start past EOF: behave like file.read()
+                return b""
+            raise
+
+    async def iter_bytes(self, *, storage_path: str, chunk_size: int = 1024 * 1024) -> AsyncIterator[bytes]:
+        obj = await self._run(self._client.get_object, Bucket=self._bucket, Key=self._key(storage_path))
+        body = obj["Body"]
+        try:
+            while chunk := await self._run(body.read, chunk_size):
+                yield chunk
+        finally:
+            with anyio.CancelScope(shield=True):
+                await self._run(body.close)
+
+    async def delete(self, *, storage_path: str) -> None:
+        await self._run(self._client.delete_object, Bucket=self._bucket, Key=self._key(storage_path))
+
+    async def _get(self, key: str, **kwargs: Any) -> bytes:
+        def get() -> bytes:
+            body = self._client.get_object(Bucket=self._bucket, Key=key, **kwargs)["Body"]
+            try:
+                return body.read()
+            finally:
+                body.close()
+
+        return await self._run(get)
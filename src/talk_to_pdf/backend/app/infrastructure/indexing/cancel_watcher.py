@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from contextlib import asynccontextmanager, suppress
+from typing import Any, AsyncIterator, Awaitable, Callable
+from uuid import UUID
+
+from talk_to_pdf.backend.app.application.indexing.indexing_progress import CancelFlag
+from talk_to_pdf.backend.app.infrastructure.indexing.status_feed import INDEX_STATUS_CHANNEL
+
+logger = logging.getLogger(__name__)
+
+
+class IndexCancelWatcher:
+    """
+    Keeps a CancelFlag for one index current without touching the DB per batch.
+
+    request_cancel publishes on INDEX_STATUS_CHANNEL, so with a `dsn` the flag
+    flips as soon as the NOTIFY arrives. A slow poll of the authoritative check
+    covers a notification sent before LISTEN started or a dropped listener.
+    """
+
+    def __init__(
+        self,
+        *,
+        poll_interval_s: float,
+        dsn: str | None = None,
+        connect: Callable[[str], Awaitable[Any]] | None = None,
+    ) -> None:
+        self._poll_interval_s = poll_interval_s
+        self._dsn = dsn
+        self._connect = connect
+
+    @asynccontextmanager
+    async def watch(
+        self,
+        *,
+        index_id: UUID,
+        is_cancel_requested: Callable[[], Awaitable[bool]],
+    ) -> AsyncIterator[CancelFlag]:
+        flag = CancelFlag()
+        conn = await self._listen(index_id=index_id, flag=flag)
+        poller = asyncio.create_task(self._poll(flag, is_cancel_requested))
+        try:
+            yield flag
+        finally:
+            poller.cancel()
+            with suppress(asyncio.CancelledError):
+                await poller
+            if conn is not None:
+                with suppress(Exception):
+                    await conn.close()
+
+    async def _listen(self, *, index_id: UUID, flag: CancelFlag) -> Any | None:
+        if self._dsn is None:
+            return None
+
+        target = str(index_id)
+
+        def on_notify(_conn: Any, _pid: int, _channel: str, payload: str) -> None:
+            try:
+                data = json.loads(payload)
+            except ValueError:
+                return
+            if data.get("index_id") == target and data.get("cancel_requested"):
+                flag.set()
+
+        connect = self._connect
+        if connect is None:
+            import asyncpg
+
+            connect = asyncpg.connect
+        try:
+            conn = await connect(self._dsn)
+            await conn.add_listener(INDEX_STATUS_CHANNEL, on_notify)
+        except Exception:
+            logger.warning("Cancel LISTEN unavailable for index %s; polling only", index_id, exc_info=True)
+            return None
+        return conn
+
+    async def _poll(self, flag: CancelFlag, is_cancel_requested: Callable[[], Awaitable[bool]]) -> None:
+        while not flag.is_set():
+            await asyncio.sleep(self._poll_interval_s)
+            try:
+                if await is_cancel_requested():
+                    flag.set()
+            except Exception:
+                logger.warning("Cancel poll failed; retrying", exc_info=True)
@@ -1,15 +1,368 @@
 from __future__ import annotations
 
 import re
-from collections import Counter
+from collections import Counter, deque
 from dataclasses import dataclass
-from typing import Any, Iterable, Literal
+from typing import Any, Literal
 
 from talk_to_pdf.backend.app.domain.indexing.value_objects import Block, ChunkDraft
 from talk_to_pdf.backend.app.infrastructure.indexing.text_normalizer import normalize_block_text_by_kind
 
 FlushReason = Literal["size", "section", "div_end", "end"]
 
+_SEP = "\n\n"
+_SEP_LEN = len(_SEP)
+_SENT_SPLIT = re.compile(r"(?<=[.!?])\s+|\n{2,}")  # sentence-ish boundaries
+
+
+# -------------------------
+# Block helpers
+# -------------------------
+def _block_div_index(b: Block) -> int | None:
+    v = (b.meta or {}).get("div_index")
+    return v if isinstance(v, int) else None
+
+
+def _kind(b: Block) -> str:
+    return (b.meta or {}).get("kind", "unknown")
+
+
+def _is_overlap(b: Block) -> bool:
+    return (b.meta or {}).get("synthetic_kind") == "overlap_block"
+
+
+def _render_block(b: Block) -> str:
+    meta = b.meta or {}
+    kind = meta.get("kind")
+    text = (b.text or "").strip()
+    if not text:
+        return ""
+
+    if kind == "section_head":
+        return f"## {text}"
+    if kind == "equation":
+        label = meta.get("equation_label")
+        prefix = f"({label}) " if label else ""
+        return f"{prefix}{text}"
+    if kind == "list_item":
+        return f"- {text}"
+    if kind == "figure_caption":
+        return f"Figure: {text}"
+    if kind == "table":
+        return f"Table: {text}"
+
+    return text
+
+
+def _join_texts(texts: Any) -> str:
+    return _SEP.join(texts).strip()
+
+
+def _current_head_text(buf_blocks: Any) -> str | None:
+    for b in reversed(buf_blocks):
+        head = (b.meta or {}).get("head")
+        if isinstance(head, str) and head.strip():
+            return head
+    return None
+
+
+# -------------------------
+# Sentence-aware splitter
+# -------------------------
+def _hard_cut(spans: list[tuple[int, int]], start: int, end: int, max_len: int) -> None:
+    i = start
+    while i < end:
+        j = min(i + max_len, end)
+        spans.append((i, j))
+        i = j
+
+
+def _sentence_spans(t: str) -> list[tuple[int, int]]:
+    """Stripped, non-empty pieces of `t` between _SENT_SPLIT boundaries, as (start, end)."""
+    out: list[tuple[int, int]] = []
+    pos = 0
+    bounds = [(m.start(), m.end()) for m in _SENT_SPLIT.finditer(t)]
+    bounds.append((len(t), len(t)))
+    for sep_start, sep_end in bounds:
+        piece = t[pos:sep_start]
+        stripped = piece.strip()
+        if stripped:
+            start = pos + (len(piece) - len(piece.lstrip()))
+            out.append((start, start + len(stripped)))
+        pos = sep_end
+    return out
+
+
+def _split_text_sentence_aware(text: str, max_len: int) -> list[tuple[int, int]]:
+    """
+    Return spans (start,end) that partition text into pieces <= max_len.
+    Tries sentence boundaries first; finally hard cut.
+    """
+    t = text.strip()
+    if len(t) <= max_len:
+        return [(0, len(t))]
+
+    spans: list[tuple[int, int]] = []
+    cur_start = 0
+    cur_len = 0
+
+    for p_start, p_end in _sentence_spans(t):
+        # current buffer empty and this sentence alone is too long: hard cut it
+        if cur_len == 0 and (p_end - cur_start) > max_len:
+            _hard_cut(spans, cur_start, p_end, max_len)
+            cur_start = p_end
+            continue
+
+        candidate_len = p_end - cur_start
+        if candidate_len > max_len and cur_len > 0:
+            if p_start > cur_start:
+                spans.append((cur_start, p_start))
+            cur_start = p_start
+            cur_len = p_end - cur_start
+        else:
+            cur_len = candidate_len
+
+    # tail (hard cut if still too big)
+    if cur_start < len(t):
+        if len(t) - cur_start <= max_len:
+            spans.append((cur_start, len(t)))
+        else:
+            _hard_cut(spans, cur_start, len(t), max_len)
+
+    return spans
+
+
+# -------------------------
+# Chunk assembly
+# -------------------------
+class _ChunkAssembler:
+    """
+    Per-call buffer state for DefaultBlockChunker.chunk.
+
+    Rendered texts are computed once per block and `buf_len` is kept as a running
+    total (rendered texts carry no outer whitespace, so the joined length is the
+    sum of parts plus separators), which keeps assembly linear in the input.
+    """
+
+    __slots__ = (
+        "max_chars",
+        "overlap_budget",
+        "chunks",
+        "buf_blocks",
+        "buf_texts",
+        "buf_texts_norms",
+        "buf_len",
+        "chunk_idx",
+        "current_div",
+    )
+
+    def __init__(self, *, max_chars: int, overlap_budget: int) -> None:
+        self.max_chars = max_chars
+        self.overlap_budget = overlap_budget
+        self.chunks: list[ChunkDraft] = []
+        self.buf_blocks: deque[Block] = deque()
+        self.buf_texts: deque[str] = deque()
+        self.buf_texts_norms: deque[str] = deque()
+        self.buf_len = 0
+        self.chunk_idx = 0
+        self.current_div: int | None = None
+
+    def _reset(self, *, texts_norms: bool = True) -> None:
+        self.buf_blocks = deque()
+        self.buf_texts = deque()
+        if texts_norms:
+            self.buf_texts_norms = deque()
+        self.buf_len = 0
+
+    def _cand_len(self, rendered_next: str) -> int:
+        sep = _SEP_LEN if self.buf_texts else 0
+        return self.buf_len + sep + len(rendered_next)
+
+    def add(self, block: Block, rendered: str) -> None:
+        b_div = _block_div_index(block)
+
+        if self.current_div is None:
+            self.current_div = b_div
+        elif b_div is not None and b_div != self.current_div:
+            self.flush("div_end")
+            self.current_div = b_div
+
+        if not rendered:
+            return
+
+        # section_head hard boundary
+        if _kind(block) == "section_head":
+            self.flush("section")
+            self.buf_blocks = deque([block])
+            self.buf_texts = deque([rendered])
+            self.buf_texts_norms = deque([normalize_block_text_by_kind(rendered, kind="section_head")])
+            self.buf_len = len(rendered)
+            return
+
+        # Still over max_chars here means a non-splittable kind (huge table/equation): own chunk.
+        if len(rendered) > self.max_chars:
+            self._emit_oversize(block, rendered, b_div)
+            return
+
+        # Ensure buffer + this block fits, dropping overlap if necessary
+        self._ensure_fit_next(rendered)
+
+        # If still would exceed and we have content, flush size, carry overlap, re-ensure
+        if self.buf_blocks and self._cand_len(rendered) > self.max_chars:
+            self.flush("size")
+            self._ensure_fit_next(rendered)
+
+        self.buf_len = self._cand_len(rendered)
+        self.buf_texts.append(rendered)
+        self.buf_blocks.append(block)
+
+    def _emit_oversize(self, block: Block, rendered: str, b_div: int | None) -> None:
+        self.flush("size" if self.buf_blocks else "end")
+
+        div_index = self.current_div if self.current_div is not None else (b_div or 0)
+        text = rendered.strip()
+        meta = {
+            "chunk_index": self.chunk_idx,
+            "chunk_char_len": len(text),
+            "div_index": div_index,
+            "dominant_head": (block.meta or {}).get("head"),
+            "block_counts": dict(Counter([_kind(block)])),
+            "oversize_single_block": True,
+            "max_chars": self.max_chars,
+        }
+        self.chunks.append(
+            ChunkDraft(
+                chunk_index=self.chunk_idx,
+                blocks=[block],
+                text=text,
+                text_norm=normalize_block_text_by_kind(rendered, kind="non-splittable"),
+                meta=meta,
+            )
+        )
+        self.chunk_idx += 1
+        # historical behaviour: norms carried by the flush above are kept
+        self._reset(texts_norms=False)
+
+    def _ensure_fit_next(self, rendered_next: str) -> None:
+        if self._cand_len(rendered_next) <= self.max_chars:
+            return
+
+        # Drop overlap blocks from the start first
+        buf_blocks = self.buf_blocks
+        while buf_blocks and self._cand_len(rendered_next) > self.max_chars:
+            if not _is_overlap(buf_blocks[0]):
+                break
+            buf_blocks.popleft()
+            dropped = self.buf_texts.popleft()
+            self.buf_texts_norms.popleft()
+            self.buf_len -= len(dropped) + (_SEP_LEN if self.buf_texts else 0)
+
+        # If still too big, DO NOT discard. Flush instead.
+        if buf_blocks and self._cand_len(rendered_next) > self.max_chars:
+            self.flush("size")
+
+    def flush(self, reason: FlushReason) -> None:
+        buf_blocks = self.buf_blocks
+        if not buf_blocks:
+            return
+
+        # drop header-only chunks
+        if all((b.meta or {}).get("kind") == "section_head" for b in buf_blocks):
+            self._reset()
+            return
+
+        div_index = self.current_div if self.current_div is not None else (_block_div_index(buf_blocks[0]) or 0)
+        text = _join_texts(self.buf_texts)
+        if not text:
+            self._reset()
+            return
+
+        self.chunks.append(
+            ChunkDraft(
+                chunk_index=self.chunk_idx,
+                blocks=list(buf_blocks),
+                text=text,
+                text_norm=_join_texts(self.buf_texts_norms),
+                meta=self._chunk_meta(text, div_index),
+            )
+        )
+        self.chunk_idx += 1
+
+        if reason == "size" and self.overlap_budget > 0 and self._carry_overlap_suffix(div_index):
+            return
+        self._reset()
+
+    def _chunk_meta(self, text: str, div_index: int) -> dict[str, Any]:
+        # exclude synthetic overlap blocks from stats; split blocks are real content
+        heads: list[str] = []
+        kinds: list[str] = []
+        has_overlap = False
+        for b in self.buf_blocks:
+            if _is_overlap(b):
+                has_overlap = True
+                continue
+            if not b.meta:
+                continue
+            head = b.meta.get("head")
+            if isinstance(head, str) and head:
+                heads.append(head)
+            kinds.append(b.meta.get("kind", "unknown"))
+
+        meta: dict[str, Any] = {
+            "chunk_index": self.chunk_idx,
+            "chunk_char_len": len(text),
+            "div_index": div_index,
+            "dominant_head": heads[-1] if heads else None,
+        }
+        if kinds:
+            meta["block_counts"] = dict(Counter(kinds))
+
+        if has_overlap:
+            meta["has_overlap_prefix"] = True
+            meta["overlap_chars_budget"] = self.overlap_budget
+
+        return meta
+
+    def _carry_overlap_suffix(self, div_index: int) -> bool:
+        """Seed the buffer with the longest real-content suffix that fits overlap_budget."""
+        head_text = _current_head_text(self.buf_blocks)
+
+        # zip() truncates to the norms, which only track heads/overlap (kept as-is)
+        chosen: list[tuple[Block, str, str]] = []
+        total = 0
+        triples = list(zip(self.buf_blocks, self.buf_texts, self.buf_texts_norms))
+        for b, t, tn in reversed(triples):
+            meta = b.meta or {}
+            if meta.get("synthetic_kind") == "overlap_block" or meta.get("kind") == "section_head":
+                continue
+            if not t.strip():
+                continue
+            nxt = total + (_SEP_LEN if chosen else 0) + len(t)
+            if nxt > self.overlap_budget:
+                break
+            chosen.append((b, t, tn))
+            total = nxt
+
+        if not chosen:
+            return False
+
+        chosen.reverse()
+        self.buf_blocks = deque(_copy_as_overlap_block(b, div_index, head_text) for b, _, _ in chosen)
+        self.buf_texts = deque(t for _, t, _ in chosen)
+        self.buf_texts_norms = deque(tn for _, _, tn in chosen)
+        self.buf_len = total
+        return True
+
+
+def _copy_as_overlap_block(b: Block, div_index: int, head_text: str | None) -> Block:
+    m = dict(b.meta or {})
+    m["div_index"] = div_index
+    if head_text is not None:
+        m["head"] = head_text
+    m["synthetic"] = True
+    m["synthetic_kind"] = "overlap_block"
+    return Block(text=b.text, text_norm=normalize_block_text_by_kind(b.text, kind="overlap_block"), meta=m)
+
 
 @dataclass(frozen=True, slots=True)
 class DefaultBlockChunker:
@@ -21,9 +374,11 @@ class DefaultBlockChunker:
       - block-based overlap (suffix blocks), not raw char slicing
       - sentence-aware splitting for oversize paragraph-ish blocks
 
-    Key change vs your current implementation:
-      - Oversize "paragraph/reference/unknown" blocks are split into multiple synthetic blocks
-        BEFORE chunking, so chunk_char_len respects max_chars.
+    Oversize "paragraph/reference/unknown" blocks are split into multiple synthetic blocks
+    BEFORE chunking, so chunk_char_len respects max_chars.
+
+    Runs in time linear in the total text: each block is rendered once and buffer
+    lengths are tracked incrementally (see benchmarks/block_chunker_throughput.py).
     """
 
     max_chars: int = 1200
@@ -33,438 +388,53 @@ class DefaultBlockChunker:
     SPLITTABLE_KINDS: tuple[str, ...] = ("paragraph", "reference", "footnote", "unknown")
 
     def chunk(self, *, blocks: list[Block]) -> list[ChunkDraft]:
-        prepared = [b for b in blocks if b.text and b.text.strip()]
-        if not prepared:
-            return []
-
         overlap_budget = max(0, min(self.overlap_chars, max(0, self.max_chars // 3)))
-
-        def _block_div_index(b: Block) -> int | None:
-            m = b.meta or {}
-            v = m.get("div_index")
-            return v if isinstance(v, int) else None
-
-        def _kind(b: Block) -> str:
-            return (b.meta or {}).get("kind", "unknown")
-
-        def _is_section_head(b: Block) -> bool:
-            return _kind(b) == "section_head"
-
-        def _render_block(b: Block) -> str:
-            meta = b.meta or {}
-            kind = meta.get("kind")
+        assembler = _ChunkAssembler(max_chars=self.max_chars, overlap_budget=overlap_budget)
+        for block, rendered in self._prepare(blocks):
+            assembler.add(block, rendered)
+        assembler.flush("end")
+        return assembler.chunks
+
+    def _prepare(self, blocks: list[Block]) -> list[tuple[Block, str]]:
+        """
+        Drop empty blocks, render each block once, and split oversize splittable blocks
+        into synthetic sub-blocks (preserving div_index/head/targets, adding char_start/char_end).
+        """
+        out: list[tuple[Block, str]] = []
+
+        for b in blocks:
             text = (b.text or "").strip()
             if not text:
-                return ""
-
-            if kind == "section_head":
-                return f"## {text}"
-            if kind == "equation":
-                label = meta.get("equation_label")
-                prefix = f"({label}) " if label else ""
-                return f"{prefix}{text}"
-            if kind == "list_item":
-                return f"- {text}"
-            if kind == "figure_caption":
-                return f"Figure: {text}"
-            if kind == "table":
-                return f"Table: {text}"
-
-            return text
-
-        def _join_texts(texts: list[str]) -> str:
-            return "\n\n".join(texts).strip()
-
-        def _current_head_text(buf_blocks: list[Block]) -> str | None:
-            for b in reversed(buf_blocks):
-                m = b.meta or {}
-                head = m.get("head")
-                if isinstance(head, str) and head.strip():
-                    return head
-            return None
-
-        # -------------------------
-        # Sentence-aware splitters
-        # -------------------------
-        _SENT_SPLIT = re.compile(r"(?<=[.!?])\s+|\n{2,}")  # sentence-ish boundaries
-
-        def _split_text_sentence_aware(text: str, max_len: int) -> list[tuple[int, int]]:
-            """
-            Return spans (start,end) that partition text into pieces <= max_len.
-            Tries sentence boundaries first; falls back to whitespace; finally hard cut.
-            """
-            t = text.strip()
-            if len(t) <= max_len:
-                return [(0, len(t))]
-
-            # Build "chunks" by appending sentences until we reach max_len
-            parts = _SENT_SPLIT.split(t)
-            spans: list[tuple[int, int]] = []
-
-            # To map back to indices, we walk through the original string.
-            # We'll rebuild with a cursor search (safe enough for our use).
-            cursor = 0
-            cur_start = 0
-            cur_len = 0
-
-            def emit(end_pos: int) -> None:
-                nonlocal cur_start, cur_len
-                if end_pos > cur_start:
-                    spans.append((cur_start, end_pos))
-                cur_start = end_pos
-                cur_len = 0
-
-            for p in parts:
-                p = p.strip()
-                if not p:
-                    continue
-
-                # Find p in t starting from cursor
-                idx = t.find(p, cursor)
-                if idx == -1:
-                    # fallback: if we somehow can't find, treat as hard cut piece
-                    idx = cursor
-
-                p_start = idx
-                p_end = idx + len(p)
-                cursor = p_end
-
-                # If current buffer empty and this sentence alone > max, hard-split it
-                if cur_len == 0 and (p_end - cur_start) > max_len:
-                    # hard cut the long sentence
-                    long_seg = t[cur_start:p_end]
-                    i = 0
-                    while i < len(long_seg):
-                        j = min(i + max_len, len(long_seg))
-                        spans.append((cur_start + i, cur_start + j))
-                        i = j
-                    cur_start = p_end
-                    cur_len = 0
-                    continue
-
-                # Would adding this sentence exceed max?
-                candidate_len = (p_end - cur_start)
-                if candidate_len > max_len and cur_len > 0:
-                    emit(p_start)
-                    # start new with this sentence
-                    # (now it should fit unless it's a huge single sentence handled above)
-                    cur_len = (p_end - cur_start)
-                else:
-                    cur_len = candidate_len
-
-            # emit tail
-            if cur_start < len(t):
-                # if tail still too big, hard split
-                tail = t[cur_start:]
-                if len(tail) <= max_len:
-                    spans.append((cur_start, len(t)))
-                else:
-                    i = 0
-                    while i < len(tail):
-                        j = min(i + max_len, len(tail))
-                        spans.append((cur_start + i, cur_start + j))
-                        i = j
-
-            return spans
-
-        def _split_oversize_blocks(blocks_in: list[Block]) -> list[Block]:
-            """
-            Preprocess: split oversize splittable blocks into multiple synthetic blocks,
-            preserving div_index/head/targets/etc and adding char_start/char_end markers.
-            """
-            out: list[Block] = []
-
-            for b in blocks_in:
-                text = (b.text or "").strip()
-                if not text:
-                    continue
-
-                k = _kind(b)
-                rendered = _render_block(b)
-
-                # Use rendered length to decide oversize for chunking purposes
-                if len(rendered) <= self.max_chars:
-                    out.append(b)
-                    continue
-
-                # Don't split section heads; and only split "paragraph-ish" kinds by default
-                if k not in self.SPLITTABLE_KINDS:
-                    # keep as-is (will become oversize chunk later)
-                    out.append(b)
-                    continue
-
-                # Split using ORIGINAL text (not rendered) to keep clean content
-                spans = _split_text_sentence_aware(text, self.max_chars)
-
-                # Create synthetic sub-blocks
-                base_meta = dict(b.meta or {})
-                base_meta["synthetic"] = True
-                base_meta["synthetic_kind"] = "split_block"
-                base_meta["split_kind"] = k
-                base_meta["split_count"] = len(spans)
-
-                for si, (s, e) in enumerate(spans):
-                    sub_meta = dict(base_meta)
-                    sub_meta["split_index"] = si
-                    sub_meta["char_start"] = s
-                    sub_meta["char_end"] = e
-                    sub_text = text[s:e].strip()
-                    out.append(Block(text=sub_text, text_norm=normalize_block_text_by_kind(sub_text,kind="split_block"), meta=sub_meta))
-
-            return out
-
-        prepared = _split_oversize_blocks(prepared)
-
-        # -------------------------
-        # Chunk assembly
-        # -------------------------
-        chunks: list[ChunkDraft] = []
-
-        buf_blocks: list[Block] = []
-        buf_texts: list[str] = []
-        buf_texts_norms: list[str] = []
-        buf_len: int = 0
-        chunk_idx: int = 0
-        current_div: int | None = None
-
-        def _chunk_meta(blocks_in_chunk: list[Block], idx: int, text: str, div_index: int) -> dict[str, Any]:
-            # exclude synthetic overlap blocks from stats; BUT keep split blocks as "real content"
-            # (they are synthetic=True, but they are actual content, so treat them as real)
-            # We'll only exclude overlap synthetic blocks.
-            def is_overlap(b: Block) -> bool:
-                return (b.meta or {}).get("synthetic_kind") == "overlap_block"
-
-            real_blocks = [b for b in blocks_in_chunk if not is_overlap(b)]
-
-            heads = [
-                b.meta.get("head")
-                for b in real_blocks
-                if b.meta and isinstance(b.meta.get("head"), str) and b.meta.get("head")
-            ]
-            kinds = [b.meta.get("kind", "unknown") for b in real_blocks if b.meta]
-
-            meta: dict[str, Any] = {
-                "chunk_index": idx,
-                "chunk_char_len": len(text),
-                "div_index": div_index,
-                "dominant_head": heads[-1] if heads else None,
-            }
-            if kinds:
-                meta["block_counts"] = dict(Counter(kinds))
-
-            if any((b.meta or {}).get("synthetic_kind") == "overlap_block" for b in blocks_in_chunk):
-                meta["has_overlap_prefix"] = True
-                meta["overlap_chars_budget"] = overlap_budget
-
-            return meta
-
-        def _copy_as_overlap_block(b: Block, div_index: int, head_text: str | None) -> Block:
-            m = dict(b.meta or {})
-            m["div_index"] = div_index
-            if head_text is not None:
-                m["head"] = head_text
-            m["synthetic"] = True
-            m["synthetic_kind"] = "overlap_block"
-            return Block(text=b.text, text_norm=normalize_block_text_by_kind(b.text,kind="overlap_block"), meta=m)
-
-        def _carry_overlap_suffix(
-            *,
-            div_index: int,
-            head_text: str | None,
-            prev_blocks: list[Block],
-            prev_texts: list[str],
-            prev_texts_norms: list[str],
-        ) -> tuple[list[Block], list[str], list[str], int]:
-            if overlap_budget <= 0:
-                return [], [], [], 0
-
-            # Prefer overlapping "real content" (exclude overlap blocks; allow split blocks)
-            pairs: list[tuple[Block, str,str]] = []
-            for b, t, tn in zip(prev_blocks, prev_texts, prev_texts_norms):
-                if (b.meta or {}).get("synthetic_kind") == "overlap_block":
-                    continue
-                if (b.meta or {}).get("kind") == "section_head":
-                    continue
-                if t.strip():
-                    pairs.append((b, t,tn))
-
-            chosen: list[tuple[Block, str,str]] = []
-            total = 0
-            for b, t,tn in reversed(pairs):
-                sep = 2 if chosen else 0
-                nxt = total + sep + len(t)
-                if nxt > overlap_budget:
-                    break
-                chosen.append((b, t,tn))
-                total = nxt
-            chosen.reverse()
-
-            if not chosen:
-                return [], [],[], 0
-
-            ov_blocks: list[Block] = []
-            ov_texts: list[str] = []
-            ov_texts_norms: list[str] = []
-            for b, t,tn in chosen:
-                ov_blocks.append(_copy_as_overlap_block(b, div_index, head_text))
-                ov_texts.append(t)
-                ov_texts_norms.append(tn)
-            return ov_blocks, ov_texts, ov_texts_norms, total
-
-        def _recompute_buf_len() -> int:
-            return len(_join_texts(buf_texts))
-
-        def _ensure_fit_next(rendered_next: str) -> None:
-            nonlocal buf_blocks, buf_texts, buf_texts_norms, buf_len
-
-            def cand_len() -> int:
-                sep = 2 if buf_texts else 0
-                return buf_len + sep + len(rendered_next)
-
-            if cand_len() <= self.max_chars:
-                return
-
-            # Drop overlap blocks from the start first
-            while buf_blocks and cand_len() > self.max_chars:
-                if (buf_blocks[0].meta or {}).get("synthetic_kind") != "overlap_block":
-                    break
-                buf_blocks.pop(0)
-                buf_texts.pop(0)
-                buf_texts_norms.pop(0)
-                buf_len = _recompute_buf_len()
-
-            # If still too big, DO NOT discard. Flush instead.
-            if buf_blocks and cand_len() > self.max_chars:
-                flush("size")
-
-        def flush(reason: FlushReason) -> None:
-            nonlocal buf_blocks, buf_texts,buf_texts_norms, buf_len, chunk_idx
-
-            if not buf_blocks:
-                return
-
-            # drop header-only chunks
-            real_blocks = [b for b in buf_blocks if (b.meta or {}).get("kind") != "section_head"]
-            if not real_blocks:
-                buf_blocks = []
-                buf_texts = []
-                buf_texts_norms = []
-                buf_len = 0
-                return
-
-            div_index = current_div if current_div is not None else (_block_div_index(buf_blocks[0]) or 0)
-            text = _join_texts(buf_texts)
-            text_norms = _join_texts(buf_texts_norms)
-            if not text:
-                buf_blocks = []
-                buf_texts = []
-                buf_texts_norms = []
-                buf_len = 0
-                return
-
-            meta = _chunk_meta(buf_blocks, chunk_idx, text, div_index)
-            chunks.append(
-                ChunkDraft(
-                    chunk_index=chunk_idx,
-                    blocks=list(buf_blocks),
-                    text=text,
-                    text_norm=text_norms,
-                    meta=meta,
-                )
-            )
-            chunk_idx += 1
-
-            if reason == "size" and overlap_budget > 0:
-                head_text = _current_head_text(buf_blocks)
-                ov_blocks, ov_texts, ov_texts_norms, ov_len = _carry_overlap_suffix(
-                    div_index=div_index,
-                    head_text=head_text,
-                    prev_blocks=buf_blocks,
-                    prev_texts=buf_texts,
-                    prev_texts_norms=buf_texts_norms,
-                )
-                if ov_blocks:
-                    buf_blocks = ov_blocks
-                    buf_texts = ov_texts
-                    buf_texts_norms = ov_texts_norms
-                    buf_len = ov_len
-                    return
-
-            buf_blocks = []
-            buf_texts = []
-            buf_texts_norms = []
-            buf_len = 0
-
-        # Main loop: enforce div boundaries + section boundaries + size splits
-        for block in prepared:
-            b_div = _block_div_index(block)
-
-            if current_div is None:
-                current_div = b_div
-            elif b_div is not None and current_div is not None and b_div != current_div:
-                flush("div_end")
-                current_div = b_div
-
-            rendered = _render_block(block)
-            if not rendered:
                 continue
 
-            # section_head hard boundary
-            if _is_section_head(block):
-                flush("section")
-                buf_blocks = [block]
-                buf_texts = [rendered]
-                buf_texts_norms = [normalize_block_text_by_kind(rendered,kind='section_head')]
-                buf_len = len(rendered)
+            # Use rendered length to decide oversize for chunking purposes
+            rendered = _render_block(b)
+            k = _kind(b)
+            if len(rendered) <= self.max_chars or k not in self.SPLITTABLE_KINDS:
+                # unsplittable oversize blocks become their own chunk later
+                out.append((b, rendered))
                 continue
 
-            # If rendered still exceeds max_chars here, it means it's a non-splittable kind
-            # (e.g., huge table/equation). Emit it as its own chunk.
-            if len(rendered) > self.max_chars:
-                flush("size" if buf_blocks else "end")
-
-                div_index = current_div if current_div is not None else (b_div or 0)
-                text = rendered.strip()
-                text_norms = normalize_block_text_by_kind(rendered,kind="non-splittable")
-                meta = {
-                    "chunk_index": chunk_idx,
-                    "chunk_char_len": len(text),
-                    "div_index": div_index,
-                    "dominant_head": (block.meta or {}).get("head"),
-                    "block_counts": dict(Counter([_kind(block)])),
-                    "oversize_single_block": True,
-                    "max_chars": self.max_chars,
-                }
-                chunks.append(
-                    ChunkDraft(
-                        chunk_index=chunk_idx,
-                        blocks=[block],
-                        text=text,
-                        text_norm=text_norms,
-                        meta=meta,
-                    )
+            # Split using ORIGINAL text (not rendered) to keep clean content
+            spans = _split_text_sentence_aware(text, self.max_chars)
+
+            base_meta = dict(b.meta or {})
+            base_meta["synthetic"] = True
+            base_meta["synthetic_kind"] = "split_block"
+            base_meta["split_kind"] = k
+            base_meta["split_count"] = len(spans)
+
+            for si, (s, e) in enumerate(spans):
+                sub_meta = dict(base_meta)
+                sub_meta["split_index"] = si
+                sub_meta["char_start"] = s
+                sub_meta["char_end"] = e
+                sub_text = text[s:e].strip()
+                sub = Block(
+                    text=sub_text,
+                    text_norm=normalize_block_text_by_kind(sub_text, kind="split_block"),
+                    meta=sub_meta,
                 )
-                chunk_idx += 1
-                buf_blocks = []
-                buf_texts = []
-                buf_len = 0
-                continue
-
-            # Ensure buffer + this block fits, dropping overlap if necessary
-            _ensure_fit_next(rendered)
-
-            # If still would exceed and we have content, flush size, carry overlap, re-ensure
-            sep = 2 if buf_texts else 0
-            candidate_len = buf_len + sep + len(rendered)
-            if buf_blocks and candidate_len > self.max_chars:
-                flush("size")
-                _ensure_fit_next(rendered)
-
-            # Append
-            sep = 2 if buf_texts else 0
-            buf_texts.append(rendered)
-            buf_blocks.append(block)
-            buf_len += sep + len(rendered)
+                out.append((sub, _render_block(sub)))
 
-        flush("end")
-        return chunks
+        return out
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from multiprocessing import get_context
+from typing import Callable
+
+from talk_to_pdf.backend.app.domain.indexing.value_objects import Block, ChunkDraft
+from talk_to_pdf.backend.app.infrastructure.indexing.chunkers.block_chunker import DefaultBlockChunker
+
+
+def partition_by_div(blocks: list[Block]) -> list[list[Block]]:
+    """
+    Split blocks at the points where DefaultBlockChunker flushes on a div change.
+
+    Mirrors its bookkeeping: empty blocks are ignored, blocks without an int
+    div_index stay with the current run, and the first int div_index of a run
+    adopts it without a boundary.
+    """
+    parts: list[list[Block]] = []
+    current: list[Block] = []
+    current_div: int | None = None
+    for b in blocks:
+        if not (b.text and b.text.strip()):
+            continue
+        v = (b.meta or {}).get("div_index")
+        b_div = v if isinstance(v, int) else None
+        if current_div is None:
+            current_div = b_div
+        elif b_div is not None and b_div != current_div:
+            parts.append(current)
+            current = []
+            current_div = b_div
+        current.append(b)
+    if current:
+        parts.append(current)
+    return parts
+
+
+def _group_contiguous(parts: list[list[Block]], groups: int) -> list[list[list[Block]]]:
+    # contiguous runs of roughly equal block counts: few large IPC messages, order kept
+    total = sum(len(p) for p in parts)
+    target = max(1, -(-total // max(1, groups)))
+    out: list[list[list[Block]]] = []
+    cur: list[list[Block]] = []
+    size = 0
+    for p in parts:
+        cur.append(p)
+        size += len(p)
+        if size >= target:
+            out.append(cur)
+            cur, size = [], 0
+    if cur:
+        out.append(cur)
+    return out
+
+
+def _chunk_group(chunker: DefaultBlockChunker, group: list[list[Block]]) -> list[list[ChunkDraft]]:
+    # module-level so it pickles into pool workers
+    return [chunker.chunk(blocks=part) for part in group]
+
+
+def _spawn_pool(max_workers: int) -> Executor:
+    # spawn, like the indexing runner: forking a process with live threads/event loop is unsafe
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=get_context("spawn"))
+
+
+@dataclass(frozen=True, slots=True)
+class ParallelBlockChunker:
+    """
+    Chunk independent divs across a process pool, then renumber in document order.
+
+    A div change is a hard flush in DefaultBlockChunker (no overlap is carried
+    across it), so chunking each div run separately and renumbering chunk_index
+    gives the same drafts as one sequential pass. Small documents skip the pool.
+    The pool only lives for one chunk() call; indexing runs one job per spawned
+    process, so there is nothing longer-lived to attach it to.
+    """
+
+    inner: DefaultBlockChunker
+    max_workers: int
+    min_blocks: int
+    executor_factory: Callable[[int], Executor] = _spawn_pool
+
+    def chunk(self, *, blocks: list[Block]) -> list[ChunkDraft]:
+        parts = partition_by_div(blocks)
+        if self.max_workers <= 1 or len(parts) < 2 or len(blocks) < self.min_blocks:
+            return self.inner.chunk(blocks=blocks)
+
+        groups = _group_contiguous(parts, self.max_workers * 4)
+        workers = min(self.max_workers, len(groups))
+        with self.executor_factory(workers) as pool:
+            results = list(pool.map(_chunk_group, [self.inner] * len(groups), groups))
+
+        out: list[ChunkDraft] = []
+        for group_result in results:
+            for part_chunks in group_result:
+                for c in part_chunks:
+                    idx = len(out)
+                    meta = dict(c.meta or {})
+                    meta["chunk_index"] = idx
+                    out.append(replace(c, chunk_index=idx, meta=meta))
+        return out
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+from talk_to_pdf.backend.app.infrastructure.common import token_counter
+
+
+@dataclass(frozen=True, slots=True)
+class EmbedBatchPlan:
+    """How a document's chunk texts are grouped into embedding requests."""
+
+    batches: list[list[str]]
+    strategy: str  # "tokens" | "count"
+    max_items: int
+    max_tokens: int | None = None
+    total_tokens: int | None = None
+    largest_batch_tokens: int | None = None
+
+    def summary(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            "strategy": self.strategy,
+            "batches": len(self.batches),
+            "max_items": self.max_items,
+        }
+        if self.strategy == "tokens":
+            out["max_tokens"] = self.max_tokens
+            out["total_tokens"] = self.total_tokens
+            out["largest_batch_tokens"] = self.largest_batch_tokens
+        return out
+
+
+def count_batches(texts: list[str], *, batch_size: int) -> EmbedBatchPlan:
+    if batch_size <= 0:
+        batch_size = 64
+    batches = [texts[i: i + batch_size] for i in range(0, len(texts), batch_size)]
+    return EmbedBatchPlan(batches=batches, strategy="count", max_items=batch_size)
+
+
+def token_budget_batches(
+    texts: list[str],
+    *,
+    model: str,
+    max_tokens: int,
+    max_items: int,
+) -> EmbedBatchPlan:
+    """
+    Greedily pack texts, in order, into requests of at most `max_tokens` tokens
+    and `max_items` inputs. A single text over the budget goes out alone (the
+    provider truncates or rejects it either way; chunks are far below that).
+    CPU-bound on large documents: call it off the event loop.
+    """
+    encoding = token_counter._get_encoding(model)
+    # chunk text may contain "<|endoftext|>" and friends; count them as plain text
+    sizes = [len(encoding.encode(t, disallowed_special=())) for t in texts]
+
+    batches: list[list[str]] = []
+    current: list[str] = []
+    current_tokens = 0
+    largest = 0
+    for text, n in zip(texts, sizes):
+        if current and (current_tokens + n > max_tokens or len(current) >= max_items):
+            batches.append(current)
+            largest = max(largest, current_tokens)
+            current, current_tokens = [], 0
+        current.append(text)
+        current_tokens += n
+    if current:
+        batches.append(current)
+        largest = max(largest, current_tokens)
+
+    return EmbedBatchPlan(
+        batches=batches,
+        strategy="tokens",
+        max_items=max_items,
+        max_tokens=max_tokens,
+        total_tokens=sum(sizes),
+        largest_batch_tokens=largest,
+    )
@@ -49,17 +49,40 @@ def create_document_index_model(*,
         meta=None,
     )
 
-def _serialize_block(block: Block) -> dict[str, Any]:
-    return {
-        "text": block.text,
-        "meta": block.meta or {},
-    }
+_COMPACT_BLOCK_KEYS = ("kind", "head", "xml_id", "targets", "synthetic_kind")
+
+
+def _compact_block(block: Block, span: tuple[int, int] | None) -> dict[str, Any]:
+    out: dict[str, Any] = {}
+    if span is not None:
+        out["start"], out["end"] = span
+    meta = block.meta or {}
+    for key in _COMPACT_BLOCK_KEYS:
+        value = meta.get(key)
+        if value not in (None, "", []):
+            out[key] = value
+    return out
 
 
 def _chunk_meta_with_blocks(chunk: ChunkDraft) -> dict[str, Any] | None:
+    """
+    Chunk meta plus a compact description of its blocks: [start, end) offsets of
+    each block's text in `chunk.text`, kind, head, ids and synthetic kind. The
+    block text itself is not repeated; slice `chunk.text` to get it back.
+    """
     meta = dict(chunk.meta or {})
     if chunk.blocks:
-        meta["blocks"] = [_serialize_block(b) for b in chunk.blocks]
+        blocks: list[dict[str, Any]] = []
+        cursor = 0
+        for b in chunk.blocks:
+            text = (b.text or "").strip()
+            start = chunk.text.find(text, cursor) if text else -1
+            if start < 0:
+                blocks.append(_compact_block(b, None))  # rendered differently; keep the labels only
+                continue
+            cursor = start + len(text)
+            blocks.append(_compact_block(b, (start, cursor)))
+        meta["blocks"] = blocks
     return meta or None
 
 
@@ -133,6 +156,18 @@ def rows_to_chunk_matches(rows: Iterable[object],source:MatchSource) -> list[Chu
         for row in rows
     ]
 
+def chunk_row_to_domain(row: Any, *, index_id: UUID) -> Chunk:
+    """Map a retrieval-time row (id, chunk_index, text, meta, created_at) to a Chunk without text_norm."""
+    return Chunk(
+        id=row.id,
+        index_id=index_id,
+        chunk_index=row.chunk_index,
+        text=row.text,
+        text_norm=None,
+        meta=row.meta,
+        created_at=row.created_at,
+    )
+
 def chunk_model_to_domain(m:ChunkModel)->Chunk:
     return Chunk(
         id=m.id,
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 from uuid import UUID
 
-from sqlalchemy import delete, desc, select, update, exists, func
+from sqlalchemy import delete, desc, select, update, exists, func, tuple_, cast, Text, Update, lambda_stmt
+from sqlalchemy.sql import StatementLambdaElement
 from sqlalchemy.dialects.postgresql import insert
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -14,12 +15,126 @@ from talk_to_pdf.backend.app.domain.indexing.value_objects import ChunkDraft, Ch
 from talk_to_pdf.backend.app.domain.common.value_objects import Vector, Chunk, EmbedConfig
 from talk_to_pdf.backend.app.domain.retrieval.value_objects import ChunkMatch
 from talk_to_pdf.backend.app.infrastructure.db.models import ProjectModel
+from talk_to_pdf.backend.app.infrastructure.indexing.status_feed import INDEX_STATUS_CHANNEL
 from talk_to_pdf.backend.app.infrastructure.indexing.mappers import index_model_to_domain, create_document_index_model, \
-    create_chunk_models, embedding_drafts_to_insert_rows, rows_to_chunk_matches, chunk_model_to_domain
+    create_chunk_models, embedding_drafts_to_insert_rows, rows_to_chunk_matches, chunk_row_to_domain
 from talk_to_pdf.backend.app.infrastructure.db.models.indexing import ChunkModel, DocumentIndexModel, \
     ChunkEmbeddingModel
 
 
+# keeps the NOTIFY payload well under Postgres' 8000-byte limit
+_NOTIFY_TEXT_MAX_CHARS = 1000
+
+
+def _similarity_search_stmt(
+    *,
+    metric: VectorMetric,
+    vec: list[float],
+    index_id: UUID,
+    embed_signature: str,
+    top_k: int,
+) -> StatementLambdaElement:
+    """
+    Top-k vector search as lambda statements: one compiled SQL string per metric,
+    with the vector, index, signature and limit bound as parameters.
+    """
+    if metric == VectorMetric.COSINE:
+        stmt = lambda_stmt(
+            lambda: select(
+                ChunkEmbeddingModel.chunk_id,
+                ChunkEmbeddingModel.chunk_index,
+                (1.0 - ChunkEmbeddingModel.embedding.cosine_distance(vec)).label("score"),
+            ).order_by(ChunkEmbeddingModel.embedding.cosine_distance(vec).asc())
+        )
+    elif metric == VectorMetric.L2:
+        stmt = lambda_stmt(
+            lambda: select(
+                ChunkEmbeddingModel.chunk_id,
+                ChunkEmbeddingModel.chunk_index,
+                (-ChunkEmbeddingModel.embedding.l2_distance(vec)).label("score"),
+            ).order_by(ChunkEmbeddingModel.embedding.l2_distance(vec).asc())
+        )
+    elif metric == VectorMetric.INNER_PRODUCT:
+        # pgvector's <#> is the negative inner product, so ASC is best-first
+        stmt = lambda_stmt(
+            lambda: select(
+                ChunkEmbeddingModel.chunk_id,
+                ChunkEmbeddingModel.chunk_index,
+                (-ChunkEmbeddingModel.embedding.max_inner_product(vec)).label("score"),
+            ).order_by(ChunkEmbeddingModel.embedding.max_inner_product(vec).asc())
+        )
+    else:
+        raise ValueError(f"Unsupported metric: {metric}")
+
+    stmt += lambda s: s.where(
+        ChunkEmbeddingModel.index_id == index_id,
+        ChunkEmbeddingModel.embed_signature == embed_signature,
+    ).limit(top_k)
+    return stmt
+
+
+def _chunks_by_ids_stmt(*, index_id: UUID, ids: list[UUID]):
+    return select(
+        ChunkModel.id,
+        ChunkModel.chunk_index,
+        ChunkModel.text,
+        ChunkModel.meta,
+        ChunkModel.created_at,
+    ).where(
+        ChunkModel.index_id == index_id,
+        ChunkModel.id.in_(ids),
+    )
+
+
+def _status_notify_from(src):
+    """
+    SELECT pg_notify(INDEX_STATUS_CHANNEL, ...) for each document_indexes row in `src`
+    (the table itself or a RETURNING CTE with the same columns).
+    """
+    payload = func.json_build_object(
+        "index_id", src.c.id,
+        "project_id", src.c.project_id,
+        "document_id", src.c.document_id,
+        "owner_id", ProjectModel.owner_id,
+        "status", src.c.status,
+        "progress", src.c.progress,
+        "message", func.left(src.c.message, _NOTIFY_TEXT_MAX_CHARS),
+        "error", func.left(src.c.error, _NOTIFY_TEXT_MAX_CHARS),
+        "cancel_requested", src.c.cancel_requested,
+        "updated_at", src.c.updated_at,
+    )
+    return (
+        select(func.pg_notify(INDEX_STATUS_CHANNEL, cast(payload, Text)))
+        .select_from(src.join(ProjectModel, ProjectModel.id == src.c.project_id))
+    )
+
+
+def _with_status_notify(stmt: Update):
+    """
+    Wrap an UPDATE on document_indexes so the same round trip publishes the new
+    status on INDEX_STATUS_CHANNEL. Postgres delivers it only if the transaction
+    commits, so listeners never see a rolled-back state.
+    """
+    upd = stmt.returning(
+        DocumentIndexModel.id,
+        DocumentIndexModel.project_id,
+        DocumentIndexModel.document_id,
+        DocumentIndexModel.status,
+        DocumentIndexModel.progress,
+        DocumentIndexModel.message,
+        DocumentIndexModel.error,
+        DocumentIndexModel.cancel_requested,
+        DocumentIndexModel.updated_at,
+    ).cte("upd")
+    return _status_notify_from(upd)
+
+
+def _index_status_notify(index_id: UUID):
+    """Publish the current status of one index (e.g. right after it is inserted)."""
+    src = DocumentIndexModel.__table__
+    return _status_notify_from(src).where(src.c.id == index_id)
+
+
 class SqlAlchemyDocumentIndexRepository:
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
@@ -42,6 +157,8 @@ class SqlAlchemyDocumentIndexRepository:
         )
         self._session.add(m)
         await self._session.flush()  # ensures m.id is available before commit
+        # subscribers see the new PENDING index once the transaction commits
+        await self._session.execute(_index_status_notify(m.id))
         return index_model_to_domain(m)
 
     async def get_latest_by_project(self, *, project_id: UUID) -> DocumentIndex | None:
@@ -137,8 +254,9 @@ class SqlAlchemyDocumentIndexRepository:
         return index_model_to_domain(model) if model else None
 
     async def get_by_owner_project_and_id(self, *, owner_id: UUID, project_id:UUID,index_id: UUID) -> DocumentIndex | None:
-        stmt = (
-            select(DocumentIndexModel)
+        # hot path (every retrieval): lambda_stmt skips rebuilding and re-keying the statement
+        stmt = lambda_stmt(
+            lambda: select(DocumentIndexModel)
             .join(ProjectModel, ProjectModel.id == DocumentIndexModel.project_id)
             .where(
                 DocumentIndexModel.id == index_id,
@@ -170,7 +288,7 @@ class SqlAlchemyDocumentIndexRepository:
                 meta=meta,
             )
         )
-        await self._session.execute(stmt)
+        await self._session.execute(_with_status_notify(stmt))
 
     async def request_cancel(self, *, index_id: UUID) -> None:
         stmt = (
@@ -178,7 +296,7 @@ class SqlAlchemyDocumentIndexRepository:
             .where(DocumentIndexModel.id == index_id)
             .values(cancel_requested=True)
         )
-        await self._session.execute(stmt)
+        await self._session.execute(_with_status_notify(stmt))
 
     async def is_cancel_requested(self, *, index_id: UUID) -> bool:
         stmt = select(DocumentIndexModel.cancel_requested).where(DocumentIndexModel.id == index_id)
@@ -248,12 +366,26 @@ class SqlAlchemyChunkRepository:
         await self._session.execute(stmt)
 
     async def get_many_by_ids_for_index(self, *, index_id: UUID, ids: list[UUID]) -> list[Chunk]:
-        stmt = select(ChunkModel).where(
-            ChunkModel.index_id == index_id,
-            ChunkModel.id.in_(ids),
+        """
+        Context load: only the columns retrieval uses (no tsv, no text_norm).
+        """
+        stmt = _chunks_by_ids_stmt(index_id=index_id, ids=ids)
+        rows = (await self._session.execute(stmt)).all()
+        return [chunk_row_to_domain(row, index_id=index_id) for row in rows]
+
+    async def get_texts_by_index_and_ids(self, *, ids_by_index: dict[UUID, list[UUID]]) -> dict[UUID, str]:
+        """
+        Single round trip for all (index_id, chunk_id) pairs; selects only id + text.
+        """
+        pairs = [(index_id, cid) for index_id, ids in ids_by_index.items() for cid in ids]
+        if not pairs:
+            return {}
+
+        stmt = select(ChunkModel.id, ChunkModel.text).where(
+            tuple_(ChunkModel.index_id, ChunkModel.id).in_(pairs)
         )
-        rows = (await self._session.execute(stmt)).scalars().all()
-        return [chunk_model_to_domain(m) for m in rows]
+        rows = (await self._session.execute(stmt)).all()
+        return {row.id: row.text for row in rows}
 
 class SqlAlchemyChunkVectorRepository:
     def __init__(self, session: AsyncSession) -> None:
@@ -357,45 +489,13 @@ class SqlAlchemyChunkVectorRepository:
         if top_k <= 0:
             return []
 
-        # pgvector comparator operators differ by metric:
-        # - cosine distance: embedding.cosine_distance(vec)
-        # - l2 distance: embedding.l2_distance(vec)
-        # - inner product: embedding.max_inner_product(vec)  (naming varies by pgvector sqlalchemy version)
-        #
-        # We'll implement in a way that is compatible with common pgvector.sqlalchemy comparators:
-        vec = list(query.values)
-
-        emb_col = ChunkEmbeddingModel.embedding
-
-        if metric == VectorMetric.COSINE:
-            distance_expr = emb_col.cosine_distance(vec)
-            order_expr = distance_expr.asc()
-            score_expr = (1.0 - distance_expr).label("score")  # cosine similarity
-        elif metric == VectorMetric.L2:
-            distance_expr = emb_col.l2_distance(vec)
-            order_expr = distance_expr.asc()
-            score_expr = (-distance_expr).label("score")  # or transform to 1/(1+d)
-        elif metric == VectorMetric.INNER_PRODUCT:
-            # pgvector's inner product operator is distance-like in many bindings;
-            # keep your -distance approach if you're ordering ASC.
-            distance_expr = emb_col.max_inner_product(vec)
-            order_expr = distance_expr.asc()
-            score_expr = (-distance_expr).label("score")
-        else:
-            raise ValueError(f"Unsupported metric: {metric}")
-
-        stmt = (
-            select(
-                ChunkEmbeddingModel.chunk_id,
-                ChunkEmbeddingModel.chunk_index,
-                score_expr,
-            )
-            .where(ChunkEmbeddingModel.index_id == index_id)
-            .where(ChunkEmbeddingModel.embed_signature == embed_signature)
-            .order_by(order_expr)
-            .limit(top_k)
+        stmt = _similarity_search_stmt(
+            metric=metric,
+            vec=list(query.values),
+            index_id=index_id,
+            embed_signature=embed_signature,
+            top_k=top_k,
         )
-
         rows = (await self._session.execute(stmt)).all()
         return rows_to_chunk_matches(rows, source=MatchSource.VECTOR)
 
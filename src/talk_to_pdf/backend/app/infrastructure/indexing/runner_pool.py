@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import queue
+from multiprocessing import get_context, parent_process
+from typing import Any, Callable
+from uuid import UUID
+
+import anyio
+
+from talk_to_pdf.backend.app.infrastructure.indexing.worker_factory import build_worker
+
+logger = logging.getLogger(__name__)
+
+_mp = get_context("spawn")
+_STOP = None  # sentinel on the job queue
+_PARENT_CHECK_S = 1.0
+
+
+def _pool_entry(jobs: Any, max_jobs: int) -> None:
+    asyncio.run(_serve(jobs, max_jobs))
+
+
+def _next_job(jobs: Any) -> str | None:
+    # poll so the worker notices when the API process goes away
+    while True:
+        try:
+            return jobs.get(timeout=_PARENT_CHECK_S)
+        except queue.Empty:
+            parent = parent_process()
+            if parent is not None and not parent.is_alive():
+                return _STOP
+
+
+def _forget(running: dict[UUID, asyncio.Task], index_id: UUID) -> Callable[[asyncio.Task], None]:
+    def done(_task: asyncio.Task) -> None:
+        running.pop(index_id, None)
+
+    return done
+
+
+async def _serve(jobs: Any, max_jobs: int) -> None:
+    # one worker for all jobs: they share the DB pool and the coalescing embedder
+    worker = build_worker(concurrent_jobs=max_jobs)
+    slots = asyncio.Semaphore(max_jobs)
+    running: dict[UUID, asyncio.Task] = {}
+
+    async def run_one(index_id: UUID) -> None:
+        async with slots:
+            try:
+                await worker.run(index_id=index_id)
+            except Exception:
+                logger.exception("Indexing job %s crashed", index_id)
+
+    while True:
+        item = await anyio.to_thread.run_sync(_next_job, jobs)
+        if item is _STOP:
+            break
+        index_id = UUID(item)
+        if index_id in running:
+            continue
+        task = asyncio.create_task(run_one(index_id))
+        running[index_id] = task
+        task.add_done_callback(_forget(running, index_id))
+
+    if running:
+        await asyncio.gather(*running.values(), return_exceptions=True)
+
+
+class SharedProcessIndexingRunner:
+    """
+    Runs up to `max_jobs` indexing jobs concurrently in one long-lived spawned
+    process, so concurrent documents share a DB pool, one HTTP client and the
+    embedding coalescer (batches from different jobs with the same embed
+    signature go out together). The process starts on first enqueue and is
+    restarted if it died.
+    """
+
+    def __init__(self, *, max_jobs: int) -> None:
+        self._max_jobs = max_jobs
+        self._proc: Any | None = None
+        self._jobs: Any | None = None
+        self._lock = anyio.Lock()
+
+    async def enqueue(self, *, index_id: UUID) -> None:
+        async with self._lock:
+            jobs = self._jobs
+            if jobs is None or self._proc is None or not self._proc.is_alive():
+                jobs = _mp.Queue()
+                self._jobs = jobs
+                self._proc = _mp.Process(target=_pool_entry, args=(jobs, self._max_jobs), daemon=False)
+                self._proc.start()
+            jobs.put(str(index_id))
+
+    async def stop(self, *, index_id: UUID) -> None:
+        # jobs share the process; cancellation is cooperative via cancel_requested
+        return None
+
+    async def aclose(self) -> None:
+        """Stop taking jobs; running ones finish first (like spawned job processes do)."""
+        async with self._lock:
+            jobs, self._proc, self._jobs = self._jobs, None, None
+        if jobs is not None:
+            jobs.put(_STOP)
@@ -7,23 +7,26 @@ from uuid import UUID
 import anyio
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from talk_to_pdf.backend.app.application.indexing.interfaces import BlockChunker, BlockExtractor, PdfToXmlConverter
+from talk_to_pdf.backend.app.application.indexing.interfaces import BlockChunker, BlockExtractor, PdfToXmlConverter, \
+    CancelWatcher
 from talk_to_pdf.backend.app.application.common.interfaces import EmbedderFactory
-from talk_to_pdf.backend.app.application.indexing.indexing_progress import report
+from talk_to_pdf.backend.app.application.indexing.indexing_progress import report, ProgressThrottle
+from talk_to_pdf.backend.app.core.const import DEFAULT_INDEXING_CANCEL_POLL_S, DEFAULT_INDEXING_PROGRESS_MIN_DELTA, \
+    DEFAULT_INDEXING_PROGRESS_MIN_INTERVAL_S, DEFAULT_EMBED_BATCH_MAX_ITEMS
 from talk_to_pdf.backend.app.domain.common.uow import UnitOfWork
 from talk_to_pdf.backend.app.domain.files.interfaces import FileStorage
 from talk_to_pdf.backend.app.domain.indexing.enums import IndexStatus, IndexStep, STEP_PROGRESS
 from talk_to_pdf.backend.app.domain.indexing.value_objects import Block, ChunkDraft
 from talk_to_pdf.backend.app.domain.common.value_objects import Vector, EmbedConfig
+from talk_to_pdf.backend.app.infrastructure.indexing.cancel_watcher import IndexCancelWatcher
+from talk_to_pdf.backend.app.infrastructure.indexing.embed_batching import (
+    EmbedBatchPlan,
+    count_batches,
+    token_budget_batches,
+)
 from talk_to_pdf.backend.app.infrastructure.indexing.mappers import create_chunk_embedding_drafts
 
 
-def _batched(items: list[Any], batch_size: int) -> list[list[Any]]:
-    if batch_size <= 0:
-        batch_size = 64
-    return [items[i: i + batch_size] for i in range(0, len(items), batch_size)]
-
-
 @dataclass(frozen=True, slots=True)
 class WorkerDeps:
     pdf_to_xml_converter: PdfToXmlConverter
@@ -33,6 +36,12 @@ class WorkerDeps:
     file_storage: FileStorage
     session_factory: Callable[[], AsyncContextManager[AsyncSession]]
     uow_factory: Callable[[AsyncSession], UnitOfWork]
+    cancel_watcher: CancelWatcher | None = None
+    progress_min_interval_s: float = DEFAULT_INDEXING_PROGRESS_MIN_INTERVAL_S
+    progress_min_delta: int = DEFAULT_INDEXING_PROGRESS_MIN_DELTA
+    # None: fixed-count batches of embed_cfg.batch_size
+    embed_batch_max_tokens: int | None = None
+    embed_batch_max_items: int = DEFAULT_EMBED_BATCH_MAX_ITEMS
 
 
 UowFn = Callable[[UnitOfWork], Awaitable[Any]]
@@ -41,6 +50,9 @@ UowFn = Callable[[UnitOfWork], Awaitable[Any]]
 class IndexingWorkerService:
     def __init__(self, deps: WorkerDeps) -> None:
         self.deps = deps
+        self._cancel_watcher = deps.cancel_watcher or IndexCancelWatcher(
+            poll_interval_s=DEFAULT_INDEXING_CANCEL_POLL_S
+        )
 
     async def _with_uow(self, fn: UowFn) -> Any:
         async with self.deps.session_factory() as session:
@@ -113,48 +125,78 @@ class IndexingWorkerService:
 
         return await self._with_uow(_persist)
 
-    async def embed_chunks(self,index_id: UUID, chunks: list[ChunkDraft],embed_cfg:EmbedConfig) -> list[Vector] | None:
+    async def plan_embed_batches(self, chunks: list[ChunkDraft], embed_cfg: EmbedConfig) -> EmbedBatchPlan:
+        texts = [c.text for c in chunks]
+        max_tokens = self.deps.embed_batch_max_tokens
+        if max_tokens is None:
+            return count_batches(texts, batch_size=embed_cfg.batch_size)
+        return await anyio.to_thread.run_sync(
+            lambda: token_budget_batches(
+                texts,
+                model=embed_cfg.model,
+                max_tokens=max_tokens,
+                max_items=self.deps.embed_batch_max_items,
+            )
+        )
+
+    async def embed_chunks(
+            self,
+            index_id: UUID,
+            chunks: list[ChunkDraft],
+            embed_cfg: EmbedConfig,
+            plan: EmbedBatchPlan | None = None,
+    ) -> list[Vector] | None:
         embedder = self.deps.embedder_factory.create(embed_cfg)
-        texts= [c.text for c in chunks]
         vectors: list[Vector] = []
+        throttle = ProgressThrottle(
+            min_interval_s=self.deps.progress_min_interval_s,
+            min_delta=self.deps.progress_min_delta,
+        )
+
+        async def _is_cancel_requested() -> bool:
+            return await self._with_uow(lambda uow: uow.index_repo.is_cancel_requested(index_id=index_id))
+
         try:
-            batches = list(_batched(texts, embed_cfg.batch_size))
-            total = len(texts)
+            if plan is None:
+                plan = await self.plan_embed_batches(chunks, embed_cfg)
+            batches = plan.batches
+            total = len(chunks)
             done = 0
             start_p = STEP_PROGRESS[IndexStep.EMBEDDING]
             end_p = STEP_PROGRESS[IndexStep.STORING]
-            for bi, batch in enumerate(batches):
-                # 6a) DB: cancel check + progress update (short transaction)
-                async def _progress(uow: UnitOfWork) -> bool:
-                    if await uow.index_repo.is_cancel_requested(index_id=index_id):
-                        await self._cancel(uow=uow, index_id=index_id)
-                        return False
-
+            async with self._cancel_watcher.watch(
+                    index_id=index_id, is_cancel_requested=_is_cancel_requested
+            ) as cancelled:
+                for bi, batch in enumerate(batches):
+                    # 6a) Cancel check: in-memory flag, no DB round trip per batch
+                    if cancelled.is_set():
+                        await self._with_uow(lambda uow: self._cancel(uow=uow, index_id=index_id))
+                        return None
+
+                    # 6b) Progress: short transaction only when the throttle lets it through
                     pct = start_p + int((done / max(1, total)) * (end_p - start_p))
-                    await report(
-                        uow=uow,
-                        index_id=index_id,
-                        status=IndexStatus.RUNNING,
-                        step=IndexStep.EMBEDDING,
-                        progress=pct,
-                        message=f"Embedding batch {bi + 1}/{len(batches)}",
-                        meta={
-                            "embedder": embed_cfg.model,
-                            "batch_size": embed_cfg.batch_size,
-                            "done": done,
-                            "total": total,
-                        },
-                    )
-                    return True
-
-                should_continue = await self._with_uow(_progress)
-                if not should_continue:
-                    return None
-
-                # 6b) Network: embed outside any DB session
-                raw = await embedder.aembed_documents(batch)
-                vectors.extend(Vector.from_list(v) for v in raw)
-                done += len(batch)
+                    if throttle.should_write(pct):
+                        await self._with_uow(
+                            lambda uow: report(
+                                uow=uow,
+                                index_id=index_id,
+                                status=IndexStatus.RUNNING,
+                                step=IndexStep.EMBEDDING,
+                                progress=pct,
+                                message=f"Embedding batch {bi + 1}/{len(batches)}",
+                                meta={
+                                    "embedder": embed_cfg.model,
+                                    "batching": plan.strategy,
+                                    "done": done,
+                                    "total": total,
+                                },
+                            )
+                        )
+
+                    # 6c) Network: embed outside any DB session
+                    raw = await embedder.aembed_documents(batch)
+                    vectors.extend(Vector.from_list(v) for v in raw)
+                    done += len(batch)
             return vectors
         except Exception as e:
             await self._with_uow(
@@ -169,6 +211,7 @@ class IndexingWorkerService:
             chunks: list[ChunkDraft],
             embeds: list[Vector],
             embed_cfg: EmbedConfig,
+            batching: dict[str, Any] | None = None,
     ) -> None:
         """
         Persist embeddings for chunks of this index.
@@ -217,6 +260,7 @@ class IndexingWorkerService:
                     "chunks": len(chunks),
                     "embedder": embed_cfg.model,
                     "embed_signature": embed_signature,
+                    **({"embed_batching": batching} if batching else {}),
                 },
             )
 
@@ -284,9 +328,20 @@ class IndexingWorkerService:
             return
         if not chunks:
             return
-        # 7) Embed (batched)
-        embeds = await self.embed_chunks(index_id=index_id, chunks=chunks,embed_cfg=embed_cfg)
+        # 7) Embed (token-budgeted batches unless configured by count)
+        try:
+            plan = await self.plan_embed_batches(chunks, embed_cfg)
+        except Exception as e:
+            await self._with_uow(lambda uow: self.mark_failed(uow=uow, index_id=index_id, error=str(e)))
+            return
+        embeds = await self.embed_chunks(index_id=index_id, chunks=chunks, embed_cfg=embed_cfg, plan=plan)
         if embeds is None:
             return
 
-        await self.store_embeds(index_id=index_id, chunks=chunks, embeds=embeds, embed_cfg=embed_cfg)
+        await self.store_embeds(
+            index_id=index_id,
+            chunks=chunks,
+            embeds=embeds,
+            embed_cfg=embed_cfg,
+            batching=plan.summary(),
+        )
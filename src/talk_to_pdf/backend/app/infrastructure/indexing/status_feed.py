@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable
+from uuid import UUID
+
+from talk_to_pdf.backend.app.application.common.progress import ProgressEvent
+
+logger = logging.getLogger(__name__)
+
+INDEX_STATUS_CHANNEL = "index_status"
+INDEX_STATUS_EVENT = "index_status"
+
+_CLOSED = None  # sentinel: ends a subscriber's stream
+
+
+def _offer(queue: asyncio.Queue, item: Any) -> None:
+    # slow consumer: drop the oldest update, the newest status is what matters
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(item)
+
+
+class PgIndexStatusFeed:
+    """
+    Fans `index_status` NOTIFYs out to in-process subscribers, filtered by owner.
+
+    One dedicated asyncpg LISTEN connection per API process, outside the
+    SQLAlchemy pool, opened on the first subscribe. If that connection drops,
+    every open stream ends so clients reconnect (and re-sync) on their own.
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        *,
+        queue_size: int = 64,
+        connect: Callable[[str], Awaitable[Any]] | None = None,
+    ) -> None:
+        self._dsn = dsn
+        self._queue_size = queue_size
+        self._connect = connect
+        self._conn: Any | None = None
+        self._lock = asyncio.Lock()
+        self._subscribers: dict[UUID, set[asyncio.Queue]] = {}
+
+    @asynccontextmanager
+    async def subscribe(self, *, owner_id: UUID) -> AsyncIterator[AsyncIterator[ProgressEvent]]:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self._queue_size)
+        async with self._lock:
+            await self._ensure_listening()
+            self._subscribers.setdefault(owner_id, set()).add(queue)
+        try:
+            yield self._drain(queue)
+        finally:
+            queues = self._subscribers.get(owner_id)
+            if queues is not None:
+                queues.discard(queue)
+                if not queues:
+                    del self._subscribers[owner_id]
+
+    async def aclose(self) -> None:
+        async with self._lock:
+            conn, self._conn = self._conn, None
+            self._end_all_streams()
+            if conn is not None and not conn.is_closed():
+                await conn.close()
+
+    async def _ensure_listening(self) -> None:
+        if self._conn is not None and not self._conn.is_closed():
+            return
+        connect = self._connect
+        if connect is None:
+            import asyncpg
+
+            connect = asyncpg.connect
+        conn = await connect(self._dsn)
+        conn.add_termination_listener(self._on_terminated)
+        await conn.add_listener(INDEX_STATUS_CHANNEL, self._on_notify)
+        self._conn = conn
+
+    async def _drain(self, queue: asyncio.Queue) -> AsyncIterator[ProgressEvent]:
+        while True:
+            item = await queue.get()
+            if item is _CLOSED:
+                return
+            yield item
+
+    def _on_notify(self, _conn: Any, _pid: int, _channel: str, payload: str) -> None:
+        try:
+            data = json.loads(payload)
+            owner_id = UUID(data.pop("owner_id"))
+        except (ValueError, KeyError, TypeError, AttributeError):
+            logger.warning("Ignoring malformed %s notification", INDEX_STATUS_CHANNEL)
+            return
+
+        queues = self._subscribers.get(owner_id)
+        if not queues:
+            return
+        event = ProgressEvent(name=INDEX_STATUS_EVENT, payload=data)
+        for queue in queues:
+            _offer(queue, event)
+
+    def _on_terminated(self, conn: Any) -> None:
+        if conn is self._conn:
+            logger.warning("%s listener connection lost", INDEX_STATUS_CHANNEL)
+            self._conn = None
+            self._end_all_streams()
+
+    def _end_all_streams(self) -> None:
+        for queues in self._subscribers.values():
+            for queue in queues:
+                _offer(queue, _CLOSED)
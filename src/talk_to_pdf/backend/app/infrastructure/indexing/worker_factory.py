@@ -1,26 +1,82 @@
 from __future__ import annotations
 
-from pathlib import Path
+import httpx
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from talk_to_pdf.backend.app.application.common.interfaces import EmbedderFactory
 
 from talk_to_pdf.backend.app.core.config import settings
+from talk_to_pdf.backend.app.infrastructure.common.embedders.coalescing import CoalescingEmbedderFactory
 from talk_to_pdf.backend.app.infrastructure.common.embedders.factory_openai_langchain import OpenAIEmbedderFactory
-from talk_to_pdf.backend.app.infrastructure.db.session import SessionLocal
+from talk_to_pdf.backend.app.infrastructure.db.engine import build_engine, raw_asyncpg_dsn
 from talk_to_pdf.backend.app.infrastructure.db.uow import SqlAlchemyUnitOfWork
-from talk_to_pdf.backend.app.infrastructure.files.filesystem_storage import FilesystemFileStorage
+from talk_to_pdf.backend.app.infrastructure.files.factory import build_file_storage
+from talk_to_pdf.backend.app.infrastructure.indexing.cancel_watcher import IndexCancelWatcher
+from talk_to_pdf.backend.app.application.indexing.interfaces import BlockChunker
 from talk_to_pdf.backend.app.infrastructure.indexing.chunkers.block_chunker import DefaultBlockChunker
+from talk_to_pdf.backend.app.infrastructure.indexing.chunkers.parallel_chunker import ParallelBlockChunker
 from talk_to_pdf.backend.app.infrastructure.indexing.extractors.grobid_pdf_to_xml import GrobidPdfToXmlConverter
 from talk_to_pdf.backend.app.infrastructure.indexing.extractors.grobid_tei_block_extractor import GrobidTeiBlockExtractor
 from talk_to_pdf.backend.app.infrastructure.indexing.service import IndexingWorkerService, WorkerDeps
 
 
-def build_worker() -> IndexingWorkerService:
+def _worker_session_factory(concurrent_jobs: int) -> async_sessionmaker[AsyncSession]:
+    # a small fixed pool per job instead of the API-sized one
+    worker_engine = build_engine(pool_size=settings.INDEXING_WORKER_DB_POOL_SIZE * concurrent_jobs, max_overflow=0)
+    return async_sessionmaker(
+        bind=worker_engine,
+        class_=AsyncSession,
+        autoflush=False,
+        expire_on_commit=False,
+    )
+
+
+def _block_chunker() -> BlockChunker:
+    chunker = DefaultBlockChunker(max_chars=settings.CHUNKER_MAX_CHARS, overlap_chars=settings.CHUNKER_OVERLAP)
+    if settings.CHUNKER_PARALLEL_WORKERS <= 1:
+        return chunker
+    return ParallelBlockChunker(
+        inner=chunker,
+        max_workers=settings.CHUNKER_PARALLEL_WORKERS,
+        min_blocks=settings.CHUNKER_PARALLEL_MIN_BLOCKS,
+    )
+
+
+def _embedder_factory(concurrent_jobs: int) -> EmbedderFactory:
+    if concurrent_jobs <= 1:
+        return OpenAIEmbedderFactory(api_key=settings.OPENAI_API_KEY)
+    # jobs in this process share one keep-alive pool and coalesce their batches
+    client = httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=concurrent_jobs * 2, max_keepalive_connections=concurrent_jobs * 2),
+        timeout=httpx.Timeout(60.0, connect=10.0),
+    )
+    return CoalescingEmbedderFactory(
+        inner=OpenAIEmbedderFactory(api_key=settings.OPENAI_API_KEY, http_async_client=client),
+        linger_s=settings.EMBED_COALESCE_LINGER_MS / 1000,
+        max_items=settings.EMBED_COALESCE_MAX_ITEMS,
+        max_chars=settings.EMBED_COALESCE_MAX_CHARS,
+        # merged batches stay within the per-request token budget each job planned for
+        max_tokens=settings.EMBED_BATCH_MAX_TOKENS,
+    )
+
+
+def build_worker(*, concurrent_jobs: int = 1) -> IndexingWorkerService:
+    """`concurrent_jobs` > 1 builds one worker shared by that many jobs (SharedProcessIndexingRunner)."""
     deps = WorkerDeps(
         pdf_to_xml_converter=GrobidPdfToXmlConverter(base_url=settings.GROBID_URL),
         block_extractor=GrobidTeiBlockExtractor(),
-        block_chunker=DefaultBlockChunker(max_chars=settings.CHUNKER_MAX_CHARS,overlap_chars=settings.CHUNKER_OVERLAP),
-        embedder_factory=OpenAIEmbedderFactory(api_key=settings.OPENAI_API_KEY),
-        session_factory=SessionLocal,
+        block_chunker=_block_chunker(),
+        embedder_factory=_embedder_factory(concurrent_jobs),
+        session_factory=_worker_session_factory(concurrent_jobs),
         uow_factory=SqlAlchemyUnitOfWork,
-        file_storage=FilesystemFileStorage(base_dir=Path(settings.FILE_STORAGE_DIR)),
+        file_storage=build_file_storage(settings),
+        cancel_watcher=IndexCancelWatcher(
+            poll_interval_s=settings.INDEXING_CANCEL_POLL_S,
+            dsn=raw_asyncpg_dsn(),
+        ),
+        progress_min_interval_s=settings.INDEXING_PROGRESS_MIN_INTERVAL_S,
+        progress_min_delta=settings.INDEXING_PROGRESS_MIN_DELTA,
+        embed_batch_max_tokens=settings.EMBED_BATCH_MAX_TOKENS,
+        embed_batch_max_items=settings.EMBED_BATCH_MAX_ITEMS,
     )
     return IndexingWorkerService(deps)
@@ -12,6 +12,7 @@ def project_document_model_to_domain(m: ProjectDocumentModel) -> ProjectDocument
         content_type=m.content_type,
         size_bytes=m.size_bytes,
         uploaded_at=m.uploaded_at,
+        sha256=m.sha256,
     )
 
 
@@ -35,6 +36,7 @@ def project_document_domain_to_model(d: ProjectDocument) -> ProjectDocumentModel
         content_type=d.content_type,
         size_bytes=d.size_bytes,
         uploaded_at=d.uploaded_at,
+        sha256=d.sha256,
     )
 
 
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import itertools
+import math
+from collections import OrderedDict
+from dataclasses import dataclass
+from uuid import UUID
+
+from talk_to_pdf.backend.app.application.reply.interfaces import CachedAnswer
+
+
+@dataclass(frozen=True, slots=True)
+class _Entry:
+    scope: str
+    chunk_ids: tuple[UUID, ...]
+    unit_vector: tuple[float, ...]
+    answer: str
+
+
+def _unit(vector: list[float]) -> tuple[float, ...] | None:
+    norm = math.sqrt(sum(x * x for x in vector))
+    if norm == 0.0:
+        return None
+    return tuple(x / norm for x in vector)
+
+
+class InMemorySemanticAnswerCache:
+    """
+    Per-process semantic answer cache: up to `max_entries_per_index` answers for
+    each of the `max_indexes` most recently used indexes (both LRU).
+
+    Candidates are first narrowed to the same scope (embed signature + reply
+    model) and the same retrieved chunk ids, so the cosine scan only runs over
+    answers generated from identical context.
+    """
+
+    def __init__(self, *, min_similarity: float, max_indexes: int, max_entries_per_index: int) -> None:
+        self._min_similarity = min_similarity
+        self._max_indexes = max_indexes
+        self._max_entries_per_index = max_entries_per_index
+        self._by_index: OrderedDict[UUID, OrderedDict[int, _Entry]] = OrderedDict()
+        self._ids = itertools.count()
+
+    async def lookup(
+            self,
+            *,
+            index_id: UUID,
+            scope: str,
+            query_vector: list[float],
+            chunk_ids: tuple[UUID, ...],
+    ) -> CachedAnswer | None:
+        found = self._best(index_id, scope, query_vector, chunk_ids)
+        if found is None:
+            return None
+        entry_id, entry, similarity = found
+        entries = self._by_index[index_id]
+        entries.move_to_end(entry_id)
+        self._by_index.move_to_end(index_id)
+        return CachedAnswer(answer=entry.answer, similarity=similarity)
+
+    async def store(
+            self,
+            *,
+            index_id: UUID,
+            scope: str,
+            query_vector: list[float],
+            chunk_ids: tuple[UUID, ...],
+            answer: str,
+    ) -> None:
+        unit = _unit(query_vector)
+        if unit is None or not answer:
+            return
+        if self._best(index_id, scope, query_vector, chunk_ids) is not None:
+            return  # an equivalent answer is already cached
+
+        entries = self._by_index.get(index_id)
+        if entries is None:
+            entries = OrderedDict()
+            self._by_index[index_id] = entries
+        self._by_index.move_to_end(index_id)
+        entries[next(self._ids)] = _Entry(scope=scope, chunk_ids=chunk_ids, unit_vector=unit, answer=answer)
+
+        while len(entries) > self._max_entries_per_index:
+            entries.popitem(last=False)
+        while len(self._by_index) > self._max_indexes:
+            self._by_index.popitem(last=False)
+
+    def _best(
+            self,
+            index_id: UUID,
+            scope: str,
+            query_vector: list[float],
+            chunk_ids: tuple[UUID, ...],
+    ) -> tuple[int, _Entry, float] | None:
+        entries = self._by_index.get(index_id)
+        if not entries or not chunk_ids:
+            return None
+        unit = _unit(query_vector)
+        if unit is None:
+            return None
+
+        best: tuple[int, _Entry, float] | None = None
+        for entry_id, entry in entries.items():
+            if entry.scope != scope or entry.chunk_ids != chunk_ids or len(entry.unit_vector) != len(unit):
+                continue
+            similarity = sum(a * b for a, b in zip(entry.unit_vector, unit))
+            if similarity >= self._min_similarity and (best is None or similarity > best[2]):
+                best = (entry_id, entry, similarity)
+        return best
@@ -82,6 +82,7 @@ def message_domain_to_model(msg: ChatMessage) -> ChatMessageModel:
         created_at=msg.created_at,
         citations=citations_dict,
         metrics=metrics_dict,
+        truncated=msg.truncated,
     )
 
 
@@ -125,4 +126,5 @@ def message_model_to_domain(m: ChatMessageModel) -> ChatMessage:
         created_at=m.created_at,
         citations=citations,
         metrics=metrics,
+        truncated=bool(m.truncated),
     )
@@ -14,5 +14,7 @@ class OpenAILlmReplyGeneratorFactory:
             model=cfg.model,
             temperature=cfg.temperature,
             api_key=self.api_key,
+            # final chunk carries token usage (stream_options.include_usage)
+            stream_usage=True,
         )
         return OpenAIReplyGenerator(llm=llm, cfg=cfg)
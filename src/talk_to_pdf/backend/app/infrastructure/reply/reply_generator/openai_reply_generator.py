@@ -1,16 +1,21 @@
 # app/infrastructure/llm/openai_answer_generator.py
 from __future__ import annotations
 
+import asyncio
+from contextlib import aclosing
 from dataclasses import dataclass
-from typing import AsyncIterator, Sequence
+from typing import AsyncGenerator, Sequence, cast
 
 from langchain_openai import ChatOpenAI
-from langchain_core.messages import SystemMessage, HumanMessage, AIMessage, BaseMessage
+from langchain_core.messages import SystemMessage, HumanMessage, AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.messages.ai import UsageMetadata
 
+from talk_to_pdf.backend.app.application.reply.interfaces import PromptTokenBreakdown, StreamMetrics
 from talk_to_pdf.backend.app.domain.common.value_objects import ReplyGenerationConfig, ChatTurn
 from talk_to_pdf.backend.app.domain.common.enums import ChatRole
 from talk_to_pdf.backend.app.domain.reply.value_objects import GenerateReplyInput
-from talk_to_pdf.backend.app.infrastructure.common.token_counter import count_tokens, count_message_tokens
+from talk_to_pdf.backend.app.infrastructure.common.token_counter import count_tokens, count_message_tokens, \
+    count_message_tokens_memoized
 
 DEFAULT_SYSTEM = ( "You are a helpful assistant.\n"
                    "Answer using the provided context when relevant.\n"
@@ -26,23 +31,110 @@ CONTEXT_PREAMBLE = ( "Use the following context as your primary source.\n"
 
 
 
+@dataclass(frozen=True, slots=True)
+class PromptParts:
+    """Prompt messages grouped by component, kept for token accounting after the stream."""
+    system: list[BaseMessage]
+    context: list[BaseMessage]
+    history: list[BaseMessage]
+    question: list[BaseMessage]
+    # context_first sends the question as the last history turn; stable_prefix sends it on its own
+    question_in_history: bool = True
 
 
-@dataclass
-class PromptTokenBreakdown:
-    """Breakdown of tokens in the prompt."""
-    system: int
-    context: int
-    history: int
-    question: int
+def count_prompt_breakdown(parts: PromptParts, *, model: str, prompt_tokens: int | None) -> PromptTokenBreakdown:
+    """
+    CPU-bound (tiktoken); run off the event loop.
 
+    System and history repeat across turns, so their counts are memoized. When the
+    provider reported the prompt total, the context share is the remainder and the
+    (large) context text is never tokenized.
+    """
+    system_tokens = count_message_tokens_memoized(parts.system, model=model)
+    history_tokens = count_message_tokens_memoized(parts.history, model=model) if parts.history else 0
+    question_tokens = count_message_tokens(parts.question, model=model)
 
-@dataclass
-class StreamMetrics:
-    """Metrics collected during streaming."""
-    prompt_breakdown: PromptTokenBreakdown
-    completion_tokens: int = 0
+    if not parts.context:
+        context_tokens = 0
+    elif prompt_tokens is not None:
+        sent_question = 0 if parts.question_in_history else question_tokens
+        context_tokens = max(0, prompt_tokens - system_tokens - history_tokens - sent_question)
+    else:
+        context_tokens = count_message_tokens(parts.context, model=model)
+
+    return PromptTokenBreakdown(
+        system=system_tokens,
+        context=context_tokens,
+        history=history_tokens,
+        question=question_tokens,
+    )
+
+
+class OpenAIReplyStream:
+    """
+    One streamed answer. Metrics live on this per-call handle (not on the shared
+    generator) and are filled from the provider's final `usage` chunk.
+    """
+
+    def __init__(
+        self,
+        *,
+        llm: ChatOpenAI,
+        msgs: list[BaseMessage],
+        parts: PromptParts,
+        model: str,
+    ) -> None:
+        self._llm = llm
+        self._msgs = msgs
+        self._parts = parts
+        self._model = model
+        self._metrics: StreamMetrics | None = None
+
+    @property
+    def metrics(self) -> StreamMetrics | None:
+        return self._metrics
+
+    def _collect_metrics(self, answer: str, usage: UsageMetadata | None) -> StreamMetrics:
+        cached_tokens: int | None = None
+        if usage:
+            completion_tokens = int(usage.get("output_tokens") or 0)
+            prompt_tokens = int(usage["input_tokens"]) if usage.get("input_tokens") is not None else None
+            details = usage.get("input_token_details") or {}
+            if details.get("cache_read") is not None:
+                cached_tokens = int(details["cache_read"])
+        else:
+            # provider sent no usage: count the full answer once
+            completion_tokens = count_tokens(answer, model=self._model)
+            prompt_tokens = None
+
+        return StreamMetrics(
+            prompt_breakdown=count_prompt_breakdown(self._parts, model=self._model, prompt_tokens=prompt_tokens),
+            completion_tokens=completion_tokens,
+            prompt_tokens=prompt_tokens,
+            cached_prompt_tokens=cached_tokens,
+        )
 
+    async def __aiter__(self) -> AsyncGenerator[str, None]:
+        parts: list[str] = []
+        usage: UsageMetadata | None = None
+
+        # LangChain streaming yields AIMessageChunk objects; with stream_usage the
+        # last one carries usage_metadata (stream_options.include_usage)
+        # aclosing: if our consumer stops early, close the HTTP stream to the provider now
+        # astream is an async generator, though LangChain annotates it as an AsyncIterator
+        stream_gen = cast(AsyncGenerator[AIMessageChunk, None], self._llm.astream(self._msgs))
+        async with aclosing(stream_gen) as stream:
+            async for chunk in stream:
+                if getattr(chunk, "usage_metadata", None):
+                    usage = chunk.usage_metadata
+                # chunk.content can be "" sometimes
+                txt = getattr(chunk, "content", "") or ""
+                if txt:
+                    parts.append(txt)
+                    yield txt
+
+        # token accounting happens once, after the last byte, on a worker thread
+        self._metrics = await asyncio.to_thread(self._collect_metrics, "".join(parts), usage)
 
 
 class OpenAIReplyGenerator:
@@ -50,7 +142,6 @@ class OpenAIReplyGenerator:
         self._llm = llm
         self._cfg = cfg
         self.llm_model = llm.model_name
-        self._last_metrics: StreamMetrics | None = None
 
     def _clip(self, text: str) -> str:
         t = (text or "").strip().replace("\u0000", "")
@@ -72,7 +163,11 @@ class OpenAIReplyGenerator:
                 msgs.append(AIMessage(content=content))
         return msgs
 
-    def _build_messages(self, inp: GenerateReplyInput) -> tuple[list[BaseMessage], PromptTokenBreakdown]:
+    def _build_messages(self, inp: GenerateReplyInput) -> tuple[list[BaseMessage], PromptParts]:
+        """Assemble the prompt. No tokenization here: this runs before the first byte."""
+        if self._cfg.prompt_layout == "stable_prefix":
+            return self._build_stable_prefix_messages(inp)
+
         system = inp.system_prompt or DEFAULT_SYSTEM
         context = self._clip(inp.context)
 
@@ -80,59 +175,60 @@ class OpenAIReplyGenerator:
         system_msg = SystemMessage(content=system)
         msgs: list[BaseMessage] = [system_msg]
 
-        # Count system tokens
-        system_tokens = count_message_tokens([system_msg], model=self.llm_model)
-
         # Add context if present
-        context_tokens = 0
+        context_msgs: list[BaseMessage] = []
         if context:
-            context_msg = SystemMessage(content=CONTEXT_PREAMBLE + context)
-            msgs.append(context_msg)
-            context_tokens = count_message_tokens([context_msg], model=self.llm_model)
+            context_msgs.append(SystemMessage(content=CONTEXT_PREAMBLE + context))
+            msgs.extend(context_msgs)
 
         # Add history
         history_msgs = self._map_turns(inp.history)
         msgs.extend(history_msgs)
-        history_tokens = count_message_tokens(history_msgs, model=self.llm_model) if history_msgs else 0
 
-        # Add user question
+        # User question (tracked for metrics)
         question_msg = HumanMessage(content=inp.query.strip())
-        question_tokens = count_message_tokens([question_msg], model=self.llm_model)
 
-        breakdown = PromptTokenBreakdown(
-            system=system_tokens,
-            context=context_tokens,
-            history=history_tokens,
-            question=question_tokens,
+        parts = PromptParts(
+            system=[system_msg],
+            context=context_msgs,
+            history=history_msgs,
+            question=[question_msg],
         )
 
-        return msgs, breakdown
+        return msgs, parts
 
-    async def stream_answer(self, inp: GenerateReplyInput) -> AsyncIterator[str]:
-        msgs, breakdown = self._build_messages(inp)
+    def _build_stable_prefix_messages(self, inp: GenerateReplyInput) -> tuple[list[BaseMessage], PromptParts]:
+        """
+        Most to least stable: system, earlier turns, this turn's context, the question.
 
-        # Initialize metrics
-        completion_tokens = 0
+        System prompt and rendered earlier turns are byte-identical from one turn to
+        the next (as long as the history window start doesn't move, see
+        list_recent_turns(align=...)), so the provider's automatic prompt caching
+        can reuse that prefix.
+        """
+        system_msg = SystemMessage(content=inp.system_prompt or DEFAULT_SYSTEM)
+        question = inp.query.strip()
 
-        # LangChain streaming yields AIMessageChunk objects
-        async for chunk in self._llm.astream(msgs):
-            # chunk.content can be "" sometimes
-            txt = getattr(chunk, "content", "") or ""
-            if txt:
-                # Count completion tokens (approximate per chunk)
-                completion_tokens += count_tokens(txt, model=self.llm_model)
-                yield txt
+        history = list(inp.history)
+        # the reply flow passes the just-saved question as the last turn; it goes last, after the context
+        if history and history[-1].role == ChatRole.USER and (history[-1].content or "").strip() == question:
+            history.pop()
+        history_msgs = self._map_turns(history)
 
-        # Store metrics for later retrieval
-        self._last_metrics = StreamMetrics(
-            prompt_breakdown=breakdown,
-            completion_tokens=completion_tokens,
+        context = self._clip(inp.context)
+        context_msgs: list[BaseMessage] = [SystemMessage(content=CONTEXT_PREAMBLE + context)] if context else []
+        question_msg = HumanMessage(content=question)
+
+        msgs: list[BaseMessage] = [system_msg, *history_msgs, *context_msgs, question_msg]
+        parts = PromptParts(
+            system=[system_msg],
+            context=context_msgs,
+            history=history_msgs,
+            question=[question_msg],
+            question_in_history=False,
         )
+        return msgs, parts
 
-    def get_last_metrics(self) -> StreamMetrics | None:
-        """Get metrics from the last stream_answer call."""
-        return self._last_metrics
-
-    def clear_metrics(self) -> None:
-        """Clear stored metrics."""
-        self._last_metrics = None
+    def stream_answer(self, inp: GenerateReplyInput) -> OpenAIReplyStream:
+        msgs, parts = self._build_messages(inp)
+        return OpenAIReplyStream(llm=self._llm, msgs=msgs, parts=parts, model=self.llm_model)
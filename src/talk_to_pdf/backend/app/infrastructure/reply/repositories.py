@@ -3,10 +3,12 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Iterable
 from uuid import UUID
-from sqlalchemy import delete, desc, select, update
+from sqlalchemy import delete, desc, func, select, update, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from talk_to_pdf.backend.app.domain.common.value_objects import ChatTurn
 from talk_to_pdf.backend.app.domain.reply import Chat, ChatMessage
+from talk_to_pdf.backend.app.domain.reply.value_objects import MessageCursor
 from talk_to_pdf.backend.app.infrastructure.db.models import ProjectModel,ChatModel, ChatMessageModel
 from talk_to_pdf.backend.app.infrastructure.reply.mappers import chat_domain_to_model, chat_model_to_domain, \
     message_domain_to_model, message_model_to_domain
@@ -132,6 +134,73 @@ class SqlAlchemyChatMessageRepository:
         rows = list(reversed(rows))
         return [message_model_to_domain(r) for r in rows]
 
+    async def list_page_by_owner_and_chat(
+            self,
+            *,
+            owner_id: UUID,
+            chat_id: UUID,
+            limit: int = 50,
+            before: MessageCursor | None = None,
+            after: MessageCursor | None = None,
+    ) -> list[ChatMessage]:
+        """
+        Keyset pagination on (created_at, id), served by ix_chat_messages_chat_created_id.
+        Returns messages ordered oldest -> newest.
+        """
+        key = tuple_(ChatMessageModel.created_at, ChatMessageModel.id)
+        stmt = (
+            select(ChatMessageModel)
+            .join(ChatModel, ChatModel.id == ChatMessageModel.chat_id)
+            .join(ProjectModel, ProjectModel.id == ChatModel.project_id)
+            .where(ChatMessageModel.chat_id == chat_id)
+            .where(ProjectModel.owner_id == owner_id)
+        )
+        if before is not None:
+            stmt = stmt.where(key < tuple_(before.created_at, before.id))
+        if after is not None:
+            stmt = stmt.where(key > tuple_(after.created_at, after.id))
+
+        forward = after is not None and before is None
+        if forward:
+            stmt = stmt.order_by(ChatMessageModel.created_at.asc(), ChatMessageModel.id.asc())
+        else:
+            stmt = stmt.order_by(ChatMessageModel.created_at.desc(), ChatMessageModel.id.desc())
+        stmt = stmt.limit(int(limit))
+
+        rows = list((await self._session.execute(stmt)).scalars().all())
+        if not forward:
+            rows.reverse()
+        return [message_model_to_domain(r) for r in rows]
+
+    async def list_recent_turns(self, *, chat_id: UUID, limit: int, align: int = 1) -> list[ChatTurn]:
+        """
+        Slim history for prompting: only role + content, no citations/metrics JSON.
+        Both queries are bounded by ix_chat_messages_chat_created_id.
+        """
+        limit, align = int(limit), max(1, int(align))
+        if limit <= 0:
+            return []
+        window = limit
+        if align > 1:
+            # index-only count, so the aligned start is known before reading any content
+            total = int(
+                await self._session.scalar(
+                    select(func.count()).select_from(ChatMessageModel).where(ChatMessageModel.chat_id == chat_id)
+                )
+                or 0
+            )
+            window = total - max(0, (total - limit) // align * align)
+            if window <= 0:
+                return []
+        stmt = (
+            select(ChatMessageModel.role, ChatMessageModel.content)
+            .where(ChatMessageModel.chat_id == chat_id)
+            .order_by(ChatMessageModel.created_at.desc(), ChatMessageModel.id.desc())
+            .limit(window)
+        )
+        rows = (await self._session.execute(stmt)).all()
+        return [ChatTurn(role=r.role, content=r.content) for r in reversed(rows)]
+
     async def delete_by_owner_and_chat(self, *, owner_id: UUID, chat_id: UUID) -> int:
         """
         Returns number of deleted messages.
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Protocol
+from uuid import UUID
+
+from talk_to_pdf.backend.app.application.retrieval.value_objects import MergeResult, RetrievalCacheKey, \
+    RetrievalCacheStatus
+from talk_to_pdf.backend.app.domain.common.enums import MatchSource
+from talk_to_pdf.backend.app.domain.retrieval.value_objects import ChunkMatch
+
+logger = logging.getLogger(__name__)
+
+
+class SharedRetrievalCacheBackend(Protocol):
+    async def get(self, key: str) -> bytes | None: ...
+
+    async def set(self, key: str, value: bytes, *, ttl_s: int) -> None: ...
+
+
+def dump_merge_result(result: MergeResult) -> bytes:
+    payload = {
+        "matches": [
+            [
+                str(m.chunk_id),
+                m.chunk_index,
+                m.score,
+                m.source.value,
+                sorted(m.matched_by) if m.matched_by is not None else None,
+            ]
+            for m in result.matches
+        ],
+        "score_by_id": {str(k): v for k, v in result.score_by_id.items()},
+        "matched_by": {str(k): v for k, v in result.matched_by.items()},
+        "total_candidates": result.total_candidates,
+        "unique_candidates": result.unique_candidates,
+    }
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+
+def load_merge_result(raw: bytes) -> MergeResult:
+    payload: dict[str, Any] = json.loads(raw)
+    return MergeResult(
+        matches=[
+            ChunkMatch(
+                chunk_id=UUID(cid),
+                chunk_index=idx,
+                score=score,
+                source=MatchSource(source),
+                matched_by=set(matched_by) if matched_by is not None else None,
+            )
+            for cid, idx, score, source, matched_by in payload["matches"]
+        ],
+        score_by_id={UUID(k): v for k, v in payload["score_by_id"].items()},
+        matched_by={UUID(k): v for k, v in payload["matched_by"].items()},
+        total_candidates=payload["total_candidates"],
+        unique_candidates=payload["unique_candidates"],
+    )
+
+
+class RedisRetrievalCacheBackend:
+    """Shared entries in Redis (any `redis.asyncio` client), so API workers reuse each other's results."""
+
+    def __init__(self, client: Any, *, prefix: str = "ttp:retrieval:") -> None:
+        self._client = client
+        self._prefix = prefix
+
+    async def get(self, key: str) -> bytes | None:
+        return await self._client.get(self._prefix + key)
+
+    async def set(self, key: str, value: bytes, *, ttl_s: int) -> None:
+        await self._client.set(self._prefix + key, value, ex=ttl_s)
+
+
+class LruRetrievalCache:
+    """
+    Per-process LRU of merged retrieval results, optionally backed by a shared store.
+
+    A READY index never changes, so entries need no invalidation: reindexing
+    creates a new index id. The shared TTL only bounds storage.
+
+    Singleflight: while a key is being computed, identical requests wait for
+    that computation instead of repeating it. If the computing request is
+    cancelled, one of the waiters takes over; an error is raised to all of them.
+    Shared-store failures are logged and treated as misses.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int,
+        shared: SharedRetrievalCacheBackend | None = None,
+        shared_ttl_s: int = 86_400,
+    ) -> None:
+        self._max_entries = max_entries
+        self._shared = shared
+        self._shared_ttl_s = shared_ttl_s
+        self._entries: OrderedDict[str, MergeResult] = OrderedDict()
+        self._inflight: dict[str, asyncio.Future] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get_or_compute(
+        self,
+        key: RetrievalCacheKey,
+        compute: Callable[[], Awaitable[MergeResult]],
+    ) -> tuple[MergeResult, RetrievalCacheStatus]:
+        digest = key.digest()
+        while True:
+            cached = self._entries.get(digest)
+            if cached is not None:
+                self._entries.move_to_end(digest)
+                return cached, RetrievalCacheStatus.HIT
+
+            leader = self._inflight.get(digest)
+            if leader is None:
+                break
+            try:
+                return await asyncio.shield(leader), RetrievalCacheStatus.JOINED
+            except asyncio.CancelledError:
+                task = asyncio.current_task()
+                if leader.cancelled() and not (task is not None and task.cancelling()):
+                    continue  # the computing request went away; take over
+                raise
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        # nobody may be waiting: don't let an unread exception get logged
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._inflight[digest] = future
+        try:
+            result, status = await self._load(digest, compute)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result, status
+        finally:
+            del self._inflight[digest]
+
+    async def _load(
+        self,
+        digest: str,
+        compute: Callable[[], Awaitable[MergeResult]],
+    ) -> tuple[MergeResult, RetrievalCacheStatus]:
+        if self._shared is not None:
+            try:
+                raw = await self._shared.get(digest)
+            except Exception:
+                logger.warning("Shared retrieval cache read failed", exc_info=True)
+                raw = None
+            if raw is not None:
+                result = load_merge_result(raw)
+                self._put(digest, result)
+                return result, RetrievalCacheStatus.SHARED
+
+        result = await compute()
+        self._put(digest, result)
+        if self._shared is not None:
+            try:
+                await self._shared.set(digest, dump_merge_result(result), ttl_s=self._shared_ttl_s)
+            except Exception:
+                logger.warning("Shared retrieval cache write failed", exc_info=True)
+        return result, RetrievalCacheStatus.MISS
+
+    def _put(self, digest: str, result: MergeResult) -> None:
+        self._entries[digest] = result
+        self._entries.move_to_end(digest)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
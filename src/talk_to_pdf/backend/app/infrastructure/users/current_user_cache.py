@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Callable
+from uuid import UUID
+
+from talk_to_pdf.backend.app.application.users import CurrentUserDTO
+
+
+class TTLCurrentUserCache:
+    """
+    Bounded, per-process LRU of CurrentUserDTO keyed by (user_id, token iat).
+
+    Entries live for `ttl_s`, so a change made by another process is picked up
+    within that window; changes made here should call invalidate().
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_s: float,
+        max_entries: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttl_s = ttl_s
+        self._max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[tuple[UUID, int], tuple[float, CurrentUserDTO]] = OrderedDict()
+
+    def get(self, user_id: UUID, issued_at: int) -> CurrentUserDTO | None:
+        key = (user_id, issued_at)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, user = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return user
+
+    def put(self, user_id: UUID, issued_at: int, user: CurrentUserDTO) -> None:
+        if self._ttl_s <= 0:
+            return
+        key = (user_id, issued_at)
+        self._entries[key] = (self._clock() + self._ttl_s, user)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: UUID) -> None:
+        for key in [k for k in self._entries if k[0] == user_id]:
+            del self._entries[key]
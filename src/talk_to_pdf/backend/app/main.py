@@ -2,10 +2,14 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from talk_to_pdf.backend.app.api.v1.reply.deps import get_query_embed_http_client
 from talk_to_pdf.backend.app.api.v1.router import api_router
 from talk_to_pdf.backend.app.core.config import settings
+from talk_to_pdf.backend.app.core.deps import get_index_status_feed, get_indexing_runner
 from talk_to_pdf.backend.app.exception_handlers import register_exception_handlers
+from talk_to_pdf.backend.app.infrastructure.db.engine import engine, pool_metrics, replica_engine
 from talk_to_pdf.backend.app.infrastructure.db.init_db import init_db
+from talk_to_pdf.backend.app.infrastructure.indexing.runner_pool import SharedProcessIndexingRunner
 
 
 def create_app():
@@ -13,6 +17,15 @@ def create_app():
     async def lifespan(app: FastAPI):
         await init_db()
         yield
+        await get_index_status_feed().aclose()
+        runner = get_indexing_runner()
+        if isinstance(runner, SharedProcessIndexingRunner):
+            await runner.aclose()
+        if get_query_embed_http_client.cache_info().currsize:
+            await get_query_embed_http_client().aclose()
+        await engine.dispose()
+        if replica_engine is not None:
+            await replica_engine.dispose()
 
     app = FastAPI(lifespan=lifespan)
     if settings.CORS_ALLOWED_ORIGINS:
@@ -28,6 +41,10 @@ def create_app():
     def health():
         return {"status": "ok"}
 
+    @app.get("/health/db-pool")
+    def db_pool_health():
+        return pool_metrics.snapshot()
+
     register_exception_handlers(app)
     return app
 
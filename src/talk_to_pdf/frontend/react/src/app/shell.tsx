@@ -6,13 +6,14 @@ import {
   useOutletContext,
   useParams,
 } from 'react-router-dom'
-import { useCallback, useEffect, useMemo, useState } from 'react'
+import { useCallback, useEffect, useMemo, useRef, useState } from 'react'
 
 import { isApiError } from '@/api/client'
 import { useApiClient, useAuth } from '@/app/auth'
 import { AppSidebar } from '@/components/layout/AppSidebar'
 import { Button } from '@/components/ui/Button'
 import { Spinner } from '@/components/ui/Spinner'
+import { resolveLiveWsUrl } from '@/lib/env'
 import { formatDateTime } from '@/lib/format'
 import type { Chat } from '@/types/chat'
 import type { IndexingStatus } from '@/types/indexing'
@@ -54,6 +55,13 @@ function isIndexReady(status: string | undefined | null) {
   return normalized === 'ready' || normalized === 'completed'
 }
 
+const LIVE_RECONNECT_MS = 5000
+
+interface LiveIndexStatusMessage {
+  type: 'index_status'
+  data: Partial<IndexingStatus> & { index_id: string; project_id: string }
+}
+
 function isIndexTerminal(status: string | undefined | null) {
   const normalized = (status ?? '').toLowerCase()
   return ['ready', 'completed', 'failed', 'error', 'cancelled', 'canceled'].includes(normalized)
@@ -65,7 +73,7 @@ export function useAppShell() {
 
 export function AppLayout() {
   const api = useApiClient()
-  const { logout, user } = useAuth()
+  const { logout, token, user } = useAuth()
   const location = useLocation()
   const navigate = useNavigate()
   const params = useParams()
@@ -85,6 +93,8 @@ export function AppLayout() {
   const [latestIndexStatus, setLatestIndexStatus] = useState<IndexingStatus | null>(null)
   const [indexStatusLoading, setIndexStatusLoading] = useState(false)
   const [indexStatusError, setIndexStatusError] = useState<string | null>(null)
+  const [liveConnected, setLiveConnected] = useState(false)
+  const latestIndexIdRef = useRef<string | null>(null)
 
   const refreshProjects = useCallback(async () => {
     setProjectsLoading(true)
@@ -190,7 +200,65 @@ export function AppLayout() {
   }, [refreshChats, refreshIndexStatus, refreshProject])
 
   useEffect(() => {
-    if (!activeProjectId || !latestIndexStatus || isIndexTerminal(latestIndexStatus.status)) {
+    latestIndexIdRef.current = latestIndexStatus?.index_id ?? null
+  }, [latestIndexStatus])
+
+  useEffect(() => {
+    if (!activeProjectId) {
+      return
+    }
+
+    let socket: WebSocket | null = null
+    let retryTimer: number | undefined
+    let disposed = false
+
+    const connect = () => {
+      const params: Record<string, string> = { project_id: activeProjectId }
+      if (token) {
+        params.token = token
+      }
+      socket = new WebSocket(resolveLiveWsUrl(params))
+
+      socket.onopen = () => {
+        setLiveConnected(true)
+        // catch up on anything that changed while we were not listening
+        void refreshIndexStatus({ silent: true })
+      }
+      socket.onmessage = (event) => {
+        const message = JSON.parse(event.data as string) as LiveIndexStatusMessage
+        if (message.type !== 'index_status') {
+          return
+        }
+        if (message.data.index_id !== latestIndexIdRef.current) {
+          // a new index for this project: fetch the full record once
+          void refreshIndexStatus({ silent: true })
+          return
+        }
+        setLatestIndexStatus((current) =>
+          current && current.index_id === message.data.index_id ? { ...current, ...message.data } : current,
+        )
+      }
+      socket.onclose = () => {
+        setLiveConnected(false)
+        if (!disposed) {
+          retryTimer = window.setTimeout(connect, LIVE_RECONNECT_MS)
+        }
+      }
+    }
+
+    connect()
+
+    return () => {
+      disposed = true
+      window.clearTimeout(retryTimer)
+      socket?.close()
+      setLiveConnected(false)
+    }
+  }, [activeProjectId, refreshIndexStatus, token])
+
+  useEffect(() => {
+    // polling is only the fallback while the live channel is down
+    if (liveConnected || !activeProjectId || !latestIndexStatus || isIndexTerminal(latestIndexStatus.status)) {
       return
     }
 
@@ -201,7 +269,7 @@ export function AppLayout() {
     return () => {
       window.clearInterval(timer)
     }
-  }, [activeProjectId, latestIndexStatus, refreshIndexStatus])
+  }, [activeProjectId, latestIndexStatus, liveConnected, refreshIndexStatus])
 
   const handleCreateChat = useCallback(
     async (title: string) => {
@@ -13,3 +13,20 @@ export function resolveApiUrl(path: string) {
 export function resolveHealthUrl() {
   return new URL('/health', resolveBaseUrl(API_BASE_URL)).toString()
 }
+
+export function resolveLiveWsUrl(params: Record<string, string>) {
+  const configured = (import.meta.env.VITE_WS_URL as string | undefined)?.trim()
+  const url = configured
+    ? new URL(configured, window.location.origin)
+    : new URL('live/ws', resolveBaseUrl(API_BASE_URL))
+
+  if (url.protocol === 'http:') {
+    url.protocol = 'ws:'
+  } else if (url.protocol === 'https:') {
+    url.protocol = 'wss:'
+  }
+  for (const [key, value] of Object.entries(params)) {
+    url.searchParams.set(key, value)
+  }
+  return url.toString()
+}
@@ -65,10 +65,14 @@ export interface ChatMessage {
   created_at: string
   citations?: MessageCitations | null
   metrics?: ReplyMetrics | null
+  truncated?: boolean
 }
 
 export interface ListMessagesResponse {
   items: ChatMessage[]
+  has_more?: boolean
+  before_cursor?: string | null
+  after_cursor?: string | null
 }
 
 export interface CreateChatRequest {
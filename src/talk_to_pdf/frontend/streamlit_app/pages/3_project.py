@@ -94,6 +94,11 @@ def _status_badge(status: str) -> str:
     return "⚙️"
 
 
+def _is_terminal(status: Optional[Dict[str, Any]]) -> bool:
+    s = str((status or {}).get("status") or "").lower()
+    return s in {"ready", "completed", "failed", "error", "cancelled", "canceled"}
+
+
 def _safe_float(x, default: float = 0.0) -> float:
     try:
         return float(x)
@@ -139,39 +144,49 @@ def _sidebar_navigation() -> None:
 # -----------------------------
 # Sidebar: Indexing Status
 # -----------------------------
-def _sidebar_indexing(latest_status, latest_err, pending_doc_id) -> None:
-    st.sidebar.markdown("### Indexing")
-
-    if latest_err:
-        st.sidebar.error(latest_err)
-
-    if latest_status:
-        status = str(latest_status.get("status") or "unknown")
-        progress = _safe_int(latest_status.get("progress"), 0)
-        message = latest_status.get("message")
-        error = latest_status.get("error")
-        cancel_requested = bool(latest_status.get("cancel_requested") or False)
+def _render_index_status(box, status_json: Dict[str, Any]) -> None:
+    with box.container():
+        status = str(status_json.get("status") or "unknown")
+        progress = _safe_int(status_json.get("progress"), 0)
+        message = status_json.get("message")
+        error = status_json.get("error")
+        cancel_requested = bool(status_json.get("cancel_requested") or False)
 
-        st.sidebar.markdown(f"**{_status_badge(status)} {status}**")
-        st.sidebar.progress(max(0, min(100, progress)) / 100.0)
+        st.markdown(f"**{_status_badge(status)} {status}**")
+        st.progress(max(0, min(100, progress)) / 100.0)
 
         if cancel_requested:
-            st.sidebar.caption("Cancel requested.")
+            st.caption("Cancel requested.")
 
         if message:
-            st.sidebar.info(message)
+            st.info(message)
         if error:
-            st.sidebar.error(error)
+            st.error(error)
+
+
+def _sidebar_indexing(latest_status, latest_err, pending_doc_id):
+    """Renders the indexing block; returns the status placeholder for live updates."""
+    st.sidebar.markdown("### Indexing")
+
+    if latest_err:
+        st.sidebar.error(latest_err)
+
+    status_box = None
+    if latest_status:
+        status_box = st.sidebar.empty()
+        _render_index_status(status_box, latest_status)
 
         c1, c2 = st.sidebar.columns([1, 1], gap="small")
         with c1:
             if st.button("Refresh", use_container_width=True, key="idx_refresh"):
+                st.session_state.pop("index_status", None)
                 st.rerun()
 
         with c2:
             if st.button("Cancel", use_container_width=True, key="idx_cancel"):
                 try:
                     api.cancel_indexing(token, index_id=str(latest_status["index_id"]))
+                    st.session_state.pop("index_status", None)
                     st.sidebar.warning("Cancel requested.")
                     st.rerun()
                 except ApiError as e:
@@ -193,6 +208,7 @@ def _sidebar_indexing(latest_status, latest_err, pending_doc_id) -> None:
                     st.sidebar.error(str(e))
 
     st.sidebar.divider()
+    return status_box
 
 
 # -----------------------------
@@ -288,7 +304,7 @@ def _sidebar_chat_settings() -> None:
 
 
 # -----------------------------
-# Indexing (auto-start + polling) - in sidebar
+# Indexing (auto-start + live updates over /live/ws) - in sidebar
 # -----------------------------
 auto_start = bool(st.session_state.get("auto_start_indexing"))
 pending_doc_id = st.session_state.get("pending_index_document_id")
@@ -318,7 +334,11 @@ if auto_start:
     st.session_state["auto_start_indexing"] = False
 
 idx = st.session_state.get("current_index_id") or (latest_status or {}).get("index_id")
-if idx:
+cached_status = st.session_state.get("index_status")
+if idx and cached_status is not None and _is_terminal(cached_status) and str(cached_status.get("index_id")) == str(idx):
+    # a finished index no longer changes: skip the status request on every rerun
+    latest_status = cached_status
+elif idx:
     try:
         latest_status = api.get_index_status(token, index_id=str(idx))
     except ApiError as e:
@@ -335,6 +355,9 @@ else:
         else:
             latest_err = msg
 
+if latest_status:
+    st.session_state["index_status"] = latest_status
+
 index_ready = False
 if latest_status:
     s = str(latest_status.get("status") or "").lower()
@@ -342,7 +365,7 @@ if latest_status:
 
 # Sidebar render order
 _sidebar_navigation()
-_sidebar_indexing(latest_status, latest_err, pending_doc_id)
+index_status_box = _sidebar_indexing(latest_status, latest_err, pending_doc_id)
 _sidebar_chats(index_ready)
 
 selected_chat_id = st.session_state.get("selected_chat_id")
@@ -365,6 +388,31 @@ selected_chat_id = st.session_state.get("selected_chat_id")
 
 if not index_ready:
     st.info("Indexing is required before chatting.")
+    if latest_status and index_status_box is not None and not _is_terminal(latest_status):
+        # follow the running index over the push channel instead of polling GET /indexing/...
+        synced = False
+        try:
+            for event in api.watch_index_status(token, project_id=str(project_id)):
+                if event is None:
+                    if synced:
+                        # idle: redraw so Streamlit can act on widget clicks meanwhile
+                        _render_index_status(index_status_box, latest_status)
+                        continue
+                    # subscribed: re-sync once in case the status changed before the socket opened
+                    event = api.get_index_status(token, index_id=str(latest_status["index_id"]))
+                    synced = True
+                if str(event.get("index_id")) != str(latest_status.get("index_id")):
+                    continue
+                latest_status = {**latest_status, **event}
+                st.session_state["index_status"] = latest_status
+                _render_index_status(index_status_box, latest_status)
+                if _is_terminal(latest_status):
+                    break
+        except ApiError as e:
+            # live channel down: fall back to a slow refresh until it is back
+            st.caption(f"Live updates unavailable ({e}); refreshing every 5 s.")
+            time.sleep(5)
+        st.rerun()
     st.stop()
 
 if not selected_chat_id:
@@ -412,6 +460,8 @@ for msg in messages:
                     total_latency = _safe_float(latency.get("total"), 0.0)
                     label_bits.append(f"{total_tokens:,} tok")
                     label_bits.append(f"{total_latency:.2f}s")
+                    if (metrics_data.get("answer_cache") or {}).get("hit"):
+                        label_bits.append("cached answer")
 
                 if has_citations:
                     label_bits.append(f"{len(citations_data.get('chunks', []))} sources")
@@ -433,6 +483,8 @@ for msg in messages:
                             st.caption(f"Context: {prompt.get('context', 0):,}")
                             st.caption(f"Question: {prompt.get('question', 0):,}")
                             st.caption(f"Prompt total: {prompt.get('total', 0):,}")
+                            if prompt.get("cached") is not None:
+                                st.caption(f"Prompt cached: {prompt['cached']:,}")
                         with c2:
                             st.caption(f"Completion: {tokens.get('completion', 0):,}")
                             st.caption(f"Total: {tokens.get('total', 0):,}")
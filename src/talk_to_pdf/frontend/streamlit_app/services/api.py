@@ -1,10 +1,14 @@
 # talk_to_pdf/frontend/streamlit_app/services/api.py
 from __future__ import annotations
 
-from typing import Any, Dict, Optional, List
+import json
+from typing import Any, Dict, Iterator, Optional, List
 from uuid import UUID
 
 import httpx
+from websockets.exceptions import ConnectionClosed, WebSocketException
+from websockets.frames import CloseCode
+from websockets.sync.client import connect as ws_connect
 
 
 class ApiError(RuntimeError):
@@ -62,6 +66,8 @@ class Api:
 
     def __init__(self, base_url: str, timeout: float = 30.0):
         # base_url should already include "/api/v1"
+        self._ws_base_url = "ws" + base_url.rstrip("/").removeprefix("http")
+        self._timeout = timeout
         self._client = httpx.Client(
             base_url=base_url.rstrip("/"),
             timeout=timeout,
@@ -262,6 +268,42 @@ class Api:
         resp.raise_for_status()
         return None
 
+    def watch_index_status(
+            self,
+            access_token: Optional[str],
+            *,
+            project_id: str | UUID,
+            idle_timeout_s: float = 5.0,
+    ) -> Iterator[Optional[Dict[str, Any]]]:
+        """
+        WS /live/ws?project_id=... (push channel for index status changes)
+
+        Yields each status payload as it arrives, and None after `idle_timeout_s`
+        without one so the caller can refresh its UI. Ends when the server closes.
+        """
+        try:
+            with ws_connect(
+                f"{self._ws_base_url}/live/ws?project_id={project_id}",
+                additional_headers=self._auth_headers(access_token) or None,
+                open_timeout=self._timeout,
+            ) as ws:
+                while True:
+                    try:
+                        raw = ws.recv(timeout=idle_timeout_s)
+                    except TimeoutError:
+                        yield None
+                        continue
+                    msg = json.loads(raw)
+                    if msg.get("type") == "index_status":
+                        yield msg.get("data") or {}
+        except ConnectionClosed as e:
+            # 1012: the server's listener restarted; the caller re-syncs and reconnects
+            if e.rcvd is not None and e.rcvd.code in (CloseCode.NORMAL_CLOSURE, CloseCode.SERVICE_RESTART):
+                return
+            raise ApiError(f"Live updates closed: {e}") from e
+        except (WebSocketException, OSError) as e:
+            raise ApiError(f"Live updates failed: {e.__class__.__name__}: {e}") from e
+
     def query_project_stream(
             self,
             access_token: Optional[str],
@@ -16,7 +16,8 @@ from talk_to_pdf.backend.app.infrastructure.db.models import (
     ChunkModel,
     DocumentIndexModel,
 )
-from talk_to_pdf.backend.app.infrastructure.indexing.repositories import SqlAlchemyChunkVectorRepository
+from talk_to_pdf.backend.app.infrastructure.indexing.repositories import SqlAlchemyChunkVectorRepository, \
+    SqlAlchemyChunkRepository
 
 pytestmark = pytest.mark.asyncio
 
@@ -358,3 +359,36 @@ async def test_cascade_delete_index_removes_chunk_embeddings(session, repo: SqlA
     # embeddings should be gone
     stmt = select(func.count()).select_from(ChunkEmbeddingModel).where(ChunkEmbeddingModel.index_id == index_id)
     assert int((await session.execute(stmt)).scalar_one()) == 0
+
+
+async def test_get_texts_by_index_and_ids_scopes_pairs_in_one_query(session) -> None:
+    index_a = await _seed_index(session)
+    index_b = await _seed_index(session)
+    chunks_a = await _seed_chunks(session, index_id=index_a, n=2)
+    chunks_b = await _seed_chunks(session, index_id=index_b, n=1)
+
+    chunk_repo = SqlAlchemyChunkRepository(session)
+    texts = await chunk_repo.get_texts_by_index_and_ids(
+        ids_by_index={
+            index_a: [chunks_a[0].id, chunks_b[0].id],  # chunk from index_b must not leak through index_a
+            index_b: [chunks_b[0].id],
+        }
+    )
+
+    assert texts == {chunks_a[0].id: "chunk-0", chunks_b[0].id: "chunk-0"}
+    assert await chunk_repo.get_texts_by_index_and_ids(ids_by_index={}) == {}
+
+
+async def test_get_many_by_ids_for_index_loads_context_columns_only(session) -> None:
+    index_a = await _seed_index(session)
+    index_b = await _seed_index(session)
+    chunks_a = await _seed_chunks(session, index_id=index_a, n=2)
+    chunks_b = await _seed_chunks(session, index_id=index_b, n=1)
+
+    chunk_repo = SqlAlchemyChunkRepository(session)
+    got = await chunk_repo.get_many_by_ids_for_index(index_id=index_a, ids=[chunks_a[1].id, chunks_b[0].id])
+
+    assert [(c.id, c.index_id, c.chunk_index, c.text) for c in got] == [
+        (chunks_a[1].id, index_a, 1, "chunk-1")
+    ]
+    assert got[0].text_norm is None
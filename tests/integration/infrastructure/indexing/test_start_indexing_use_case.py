@@ -15,6 +15,7 @@ from talk_to_pdf.backend.app.domain.common.value_objects import EmbedConfig
 from talk_to_pdf.backend.app.domain.indexing.errors import FailedToStartIndexing
 from talk_to_pdf.backend.app.infrastructure.db.models import DocumentIndexModel
 from talk_to_pdf.backend.app.infrastructure.files.filesystem_storage import FilesystemFileStorage
+from tests.unit.fakes.project_storage import byte_stream
 
 pytestmark = pytest.mark.asyncio
 
@@ -53,7 +54,7 @@ async def _create_project(uow, tmp_path: Path, pdf_bytes: bytes):
         CreateProjectInputDTO(
             owner_id=owner_id,
             name="StartIndexing UC Test",
-            file_bytes=pdf_bytes,
+            content=byte_stream(pdf_bytes),
             filename="sample.pdf",
             content_type="application/pdf",
         )
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import AsyncIterable, Optional
 from uuid import UUID, uuid4
 
 import pytest
@@ -13,6 +13,7 @@ from talk_to_pdf.backend.app.domain.files.interfaces import StoredFileInfo
 from talk_to_pdf.backend.app.domain.files.errors import FailedToSaveFile
 from talk_to_pdf.backend.app.domain.projects.errors import FailedToCreateProject
 from talk_to_pdf.backend.app.infrastructure.db.models.project import ProjectModel, ProjectDocumentModel
+from tests.unit.fakes.project_storage import byte_stream
 
 
 pytestmark = pytest.mark.asyncio
@@ -35,23 +36,27 @@ class SpyFileStorage:
         owner_id: UUID,
         project_id: UUID,
         filename: str,
-        content: bytes,
+        content: AsyncIterable[bytes],
         content_type: str,
+        max_bytes: int | None = None,
     ) -> StoredFileInfo:
         self.save_called = True
+        size = 0
+        async for chunk in content:
+            size += len(chunk)
         # deterministic path for assertions
         self.stored = StoredFileInfo(
             original_filename=filename,
             stored_filename="stored.pdf",
             storage_path=f"{owner_id}/{project_id}/stored.pdf",
-            size_bytes=len(content),
+            size_bytes=size,
             content_type=content_type,
         )
         return self.stored
 
-    async def delete(self, path: str) -> None:
+    async def delete(self, *, storage_path: str) -> None:
         self.delete_called = True
-        self.deleted_path = path
+        self.deleted_path = storage_path
 
 
 class FailingSaveFileStorage(SpyFileStorage):
@@ -80,10 +85,11 @@ async def test_create_project_success_persists_project_and_document(uow, session
     use_case = CreateProjectUseCase(uow=uow, file_storage=file_storage)
 
     owner_id = uuid4()
+    pdf_bytes = b"%PDF-1.4 fake pdf bytes"
     dto = CreateProjectInputDTO(
         owner_id=owner_id,
         name="My Project",
-        file_bytes=b"%PDF-1.4 fake pdf bytes",
+        content=byte_stream(pdf_bytes),
         filename="my.pdf",
         content_type="application/pdf",
     )
@@ -95,7 +101,7 @@ async def test_create_project_success_persists_project_and_document(uow, session
     assert out.name == "My Project"
     assert out.primary_document.original_filename == "my.pdf"
     assert out.primary_document.content_type == "application/pdf"
-    assert out.primary_document.size_bytes == len(dto.file_bytes)
+    assert out.primary_document.size_bytes == len(pdf_bytes)
 
     # file storage was used
     assert file_storage.save_called is True
@@ -120,7 +126,7 @@ async def test_create_project_raises_failed_to_save_file_and_does_not_touch_db(u
     dto = CreateProjectInputDTO(
         owner_id=uuid4(),
         name="Will Fail",
-        file_bytes=b"whatever",
+        content=byte_stream(b"whatever"),
         filename="x.pdf",
         content_type="application/pdf",
     )
@@ -149,7 +155,7 @@ async def test_create_project_db_failure_deletes_saved_file_and_raises(uow, sess
     dto = CreateProjectInputDTO(
         owner_id=uuid4(),
         name="DB Fails",
-        file_bytes=b"pdfbytes",
+        content=byte_stream(b"pdfbytes"),
         filename="y.pdf",
         content_type="application/pdf",
     )
@@ -20,6 +20,7 @@ from talk_to_pdf.backend.app.domain.reply.errors import ChatNotFoundOrForbidden
 
 from talk_to_pdf.backend.app.infrastructure.db.models import ChatModel, ChatMessageModel
 from talk_to_pdf.backend.app.infrastructure.files.filesystem_storage import FilesystemFileStorage
+from tests.unit.fakes.project_storage import byte_stream
 
 pytestmark = pytest.mark.asyncio
 
@@ -32,7 +33,7 @@ async def _seed_project(*, uow, tmp_path: Path, pdf_bytes: bytes):
         CreateProjectInputDTO(
             owner_id=owner_id,
             name="CreateChatMessage UC Test",
-            file_bytes=pdf_bytes,
+            content=byte_stream(pdf_bytes),
             filename="sample.pdf",
             content_type="application/pdf",
         )
@@ -15,6 +15,7 @@ from talk_to_pdf.backend.app.domain.projects.errors import ProjectNotFound
 
 from talk_to_pdf.backend.app.infrastructure.db.models import ChatModel
 from talk_to_pdf.backend.app.infrastructure.files.filesystem_storage import FilesystemFileStorage
+from tests.unit.fakes.project_storage import byte_stream
 
 pytestmark = pytest.mark.asyncio
 
@@ -27,7 +28,7 @@ async def _seed_project(*, uow, tmp_path: Path, pdf_bytes: bytes):
         CreateProjectInputDTO(
             owner_id=owner_id,
             name="CreateChat UC Test",
-            file_bytes=pdf_bytes,
+            content=byte_stream(pdf_bytes),
             filename="sample.pdf",
             content_type="application/pdf",
         )
@@ -11,6 +11,7 @@ from talk_to_pdf.backend.app.domain.projects.entities import Project, ProjectDoc
 from talk_to_pdf.backend.app.domain.projects.value_objects import ProjectName
 from talk_to_pdf.backend.app.domain.reply import Chat, ChatMessage
 from talk_to_pdf.backend.app.domain.common.enums import ChatRole
+from talk_to_pdf.backend.app.domain.reply.value_objects import MessageCursor
 
 from talk_to_pdf.backend.app.infrastructure.db.models import ProjectModel
 from talk_to_pdf.backend.app.infrastructure.db.models.reply import ChatModel, ChatMessageModel
@@ -317,6 +318,89 @@ async def test_list_recent_by_owner_and_chat_before_filters_correctly(session):
     assert [m.content for m in recent] == ["m2", "m3"]
 
 
+async def test_list_page_by_owner_and_chat_keyset_breaks_created_at_ties_by_id(session):
+    owner = uuid4()
+    project_id = await make_saved_project_id(session, owner_id=owner)
+
+    chat_repo = SqlAlchemyChatRepository(session)
+    msg_repo = SqlAlchemyChatMessageRepository(session)
+
+    chat = make_chat(owner_id=owner, project_id=project_id, title="Keyset", created_at=_dt(0), updated_at=_dt(0))
+    await chat_repo.add(chat)
+
+    # three messages share a timestamp; (created_at, id) must still page without gaps/dupes
+    msgs = [make_msg(chat_id=chat.id, role=ChatRole.USER, content=f"m{i}", created_at=_dt(1)) for i in range(3)]
+    msgs.append(make_msg(chat_id=chat.id, role=ChatRole.USER, content="m3", created_at=_dt(2)))
+    await msg_repo.add_many(msgs)
+    ordered = sorted(msgs, key=lambda m: (m.created_at, m.id))
+
+    newest = await msg_repo.list_page_by_owner_and_chat(owner_id=owner, chat_id=chat.id, limit=2)
+    assert [m.id for m in newest] == [m.id for m in ordered[2:]]
+
+    older = await msg_repo.list_page_by_owner_and_chat(
+        owner_id=owner,
+        chat_id=chat.id,
+        limit=2,
+        before=MessageCursor(created_at=newest[0].created_at, id=newest[0].id),
+    )
+    assert [m.id for m in older] == [m.id for m in ordered[:2]]
+
+    newer = await msg_repo.list_page_by_owner_and_chat(
+        owner_id=owner,
+        chat_id=chat.id,
+        limit=2,
+        after=MessageCursor(created_at=ordered[0].created_at, id=ordered[0].id),
+    )
+    assert [m.id for m in newer] == [m.id for m in ordered[1:3]]
+
+
+async def test_list_recent_turns_returns_role_and_content_window(session):
+    owner = uuid4()
+    project_id = await make_saved_project_id(session, owner_id=owner)
+
+    chat_repo = SqlAlchemyChatRepository(session)
+    msg_repo = SqlAlchemyChatMessageRepository(session)
+
+    chat = make_chat(owner_id=owner, project_id=project_id, title="Turns", created_at=_dt(0), updated_at=_dt(0))
+    await chat_repo.add(chat)
+    await msg_repo.add_many(
+        [
+            make_msg(chat_id=chat.id, role=ChatRole.USER, content="m1", created_at=_dt(1)),
+            make_msg(chat_id=chat.id, role=ChatRole.ASSISTANT, content="m2", created_at=_dt(2)),
+            make_msg(chat_id=chat.id, role=ChatRole.USER, content="m3", created_at=_dt(3)),
+        ]
+    )
+
+    turns = await msg_repo.list_recent_turns(chat_id=chat.id, limit=2)
+    assert [(t.role, t.content) for t in turns] == [(ChatRole.ASSISTANT, "m2"), (ChatRole.USER, "m3")]
+
+
+async def test_list_recent_turns_aligned_window_start(session):
+    owner = uuid4()
+    project_id = await make_saved_project_id(session, owner_id=owner)
+
+    chat_repo = SqlAlchemyChatRepository(session)
+    msg_repo = SqlAlchemyChatMessageRepository(session)
+
+    chat = make_chat(owner_id=owner, project_id=project_id, title="Aligned", created_at=_dt(0), updated_at=_dt(0))
+    await chat_repo.add(chat)
+    await msg_repo.add_many(
+        [
+            make_msg(
+                chat_id=chat.id,
+                role=ChatRole.USER if i % 2 else ChatRole.ASSISTANT,
+                content=f"m{i}",
+                created_at=_dt(i),
+            )
+            for i in range(1, 6)
+        ]
+    )
+
+    # 5 messages, limit 2, align 2: start at message index 2 -> m3..m5
+    turns = await msg_repo.list_recent_turns(chat_id=chat.id, limit=2, align=2)
+    assert [t.content for t in turns] == ["m3", "m4", "m5"]
+
+
 async def test_list_recent_by_owner_and_chat_wrong_owner_returns_empty(session):
     owner_a = uuid4()
     owner_b = uuid4()
@@ -36,6 +36,7 @@ from talk_to_pdf.backend.app.infrastructure.db.models import (
 )
 from talk_to_pdf.backend.app.infrastructure.indexing.service import IndexingWorkerService, WorkerDeps
 from tests.unit.fakes.indexing_worker_deps import FakePdfToXmlConverter, FakeBlockExtractor, FakeBlockChunker
+from tests.unit.fakes.project_storage import byte_stream
 
 pytestmark = pytest.mark.asyncio
 
@@ -135,7 +136,7 @@ async def _seed_ready_index_with_chunks_and_embeds(
         CreateProjectInputDTO(
             owner_id=owner_id,
             name="BuildIndexContext Seed",
-            file_bytes=pdf_bytes,
+            content=byte_stream(pdf_bytes),
             filename="sample.pdf",
             content_type="application/pdf",
         )
@@ -285,7 +286,7 @@ async def test_build_index_context_index_not_ready_raises(session, uow, uow_fact
         CreateProjectInputDTO(
             owner_id=owner_id,
             name="NotReady seed",
-            file_bytes=pdf_bytes,
+            content=byte_stream(pdf_bytes),
             filename="sample.pdf",
             content_type="application/pdf",
         )
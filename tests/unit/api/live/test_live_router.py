@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import json
+from uuid import uuid4
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from talk_to_pdf.backend.app.api.v1.live import router as live_router
+from talk_to_pdf.backend.app.api.v1.live.deps import get_ws_user
+from talk_to_pdf.backend.app.api.v1.users.deps import DEV_USER
+from talk_to_pdf.backend.app.core.config import settings
+from talk_to_pdf.backend.app.core.deps import get_index_status_feed
+from talk_to_pdf.backend.app.infrastructure.indexing.status_feed import INDEX_STATUS_CHANNEL, PgIndexStatusFeed
+from tests.unit.infrastructure.indexing.test_status_feed import FakeListenConnection
+
+
+def _app(feed: PgIndexStatusFeed, *, authenticated: bool = True) -> FastAPI:
+    app = FastAPI()
+    app.include_router(live_router.router, prefix="/api/v1")
+    app.dependency_overrides[get_index_status_feed] = lambda: feed
+    if authenticated:
+        app.dependency_overrides[get_ws_user] = lambda: DEV_USER
+    return app
+
+
+def _feed_with(conn: FakeListenConnection) -> PgIndexStatusFeed:
+    async def connect(dsn):
+        return conn
+
+    return PgIndexStatusFeed("postgresql://x", connect=connect)
+
+
+def test_pushes_status_updates_for_the_requested_project():
+    conn = FakeListenConnection()
+    project_id = uuid4()
+    client = TestClient(_app(_feed_with(conn)))
+
+    with client.websocket_connect(f"/api/v1/live/ws?project_id={project_id}") as ws:
+        notify = conn.listeners[INDEX_STATUS_CHANNEL]
+        for pid, progress in ((uuid4(), 10), (project_id, 55)):
+            payload = {"owner_id": str(DEV_USER.id), "project_id": str(pid), "progress": progress}
+            ws.portal.call(notify, conn, 1, INDEX_STATUS_CHANNEL, json.dumps(payload))
+
+        msg = ws.receive_json()
+
+    assert msg == {"type": "index_status", "data": {"project_id": str(project_id), "progress": 55}}
+
+
+def test_rejects_missing_token(monkeypatch):
+    monkeypatch.setattr(settings, "SKIP_AUTH", False)
+    client = TestClient(_app(_feed_with(FakeListenConnection()), authenticated=False))
+
+    with pytest.raises(WebSocketDisconnect) as exc:
+        with client.websocket_connect("/api/v1/live/ws"):
+            pass
+    assert exc.value.code == 1008
+
+
+def test_asks_client_to_reconnect_when_listener_drops():
+    conn = FakeListenConnection()
+    client = TestClient(_app(_feed_with(conn)))
+
+    with client.websocket_connect("/api/v1/live/ws") as ws:
+        ws.portal.call(conn.terminate)
+        with pytest.raises(WebSocketDisconnect) as exc:
+            ws.receive_json()
+
+    assert exc.value.code == 1012
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import pytest
+
+from talk_to_pdf.backend.app.api.v1.reply import deps
+from talk_to_pdf.backend.app.domain.common.value_objects import EmbedConfig
+from talk_to_pdf.backend.app.infrastructure.common.embedders.coalescing import CoalescingEmbedderFactory
+from talk_to_pdf.backend.app.infrastructure.common.embedders.factory_openai_langchain import OpenAIEmbedderFactory
+
+
+@pytest.fixture
+def embedding_factory(monkeypatch):
+    monkeypatch.setattr(deps.settings, "OPENAI_API_KEY", "sk-test")
+    deps.get_open_ai_embedding_factory.cache_clear()
+    yield deps.get_open_ai_embedding_factory
+    deps.get_open_ai_embedding_factory.cache_clear()
+
+
+def test_query_embedder_is_shared_and_micro_batched(embedding_factory, monkeypatch):
+    monkeypatch.setattr(deps.settings, "QUERY_EMBED_LINGER_MS", 5.0)
+    cfg = EmbedConfig(provider="openai", model="text-embedding-3-small", batch_size=16, dimensions=None)
+
+    factory = embedding_factory()
+
+    assert isinstance(factory, CoalescingEmbedderFactory)
+    assert factory.linger_s == pytest.approx(0.005)
+    # every request's BuildIndexContextUseCase gets the same embedder for a signature
+    assert embedding_factory().create(cfg) is factory.create(cfg)
+
+
+def test_zero_linger_keeps_the_plain_factory(embedding_factory, monkeypatch):
+    monkeypatch.setattr(deps.settings, "QUERY_EMBED_LINGER_MS", 0.0)
+
+    assert isinstance(embedding_factory(), OpenAIEmbedderFactory)
+
+
+def test_query_embed_client_has_bounded_pool(embedding_factory, monkeypatch):
+    monkeypatch.setattr(deps.settings, "QUERY_EMBED_LINGER_MS", 5.0)
+    deps.get_query_embed_http_client.cache_clear()
+
+    embedding_factory()
+    client = deps.get_query_embed_http_client()
+
+    assert deps.get_query_embed_http_client.cache_info().currsize == 1
+    assert client.timeout.connect == 10.0
+    deps.get_query_embed_http_client.cache_clear()
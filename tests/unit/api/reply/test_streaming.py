@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+
+from talk_to_pdf.backend.app.api.v1.reply.streaming import (
+    HEARTBEAT,
+    encode_ndjson,
+    encode_sse,
+    error_event,
+    stop_on_disconnect,
+    with_heartbeats,
+)
+from talk_to_pdf.backend.app.application.common.progress import ProgressEvent
+from talk_to_pdf.backend.app.domain.reply.errors import ChatNotFoundOrForbidden
+
+
+@pytest.mark.asyncio
+async def test_heartbeats_fill_idle_gaps():
+    async def slow():
+        yield ProgressEvent(name="a", payload={})
+        await asyncio.sleep(0.05)
+        yield ProgressEvent(name="b", payload={})
+
+    names = [e.name async for e in with_heartbeats(slow(), interval_s=0.01)]
+
+    assert names[0] == "a" and names[-1] == "b"
+    assert HEARTBEAT.name in names[1:-1]
+
+
+@pytest.mark.asyncio
+async def test_closing_heartbeat_stream_cancels_source():
+    cancelled = asyncio.Event()
+
+    async def endless():
+        try:
+            yield ProgressEvent(name="token", payload={"text": "x"})
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    gen = with_heartbeats(endless(), interval_s=5)
+    assert (await gen.__anext__()).name == "token"
+    await gen.aclose()
+
+    assert cancelled.is_set()
+
+
+@pytest.mark.asyncio
+async def test_stop_on_disconnect_closes_source():
+    closed = False
+
+    async def source():
+        nonlocal closed
+        try:
+            for i in range(10):
+                yield ProgressEvent(name="token", payload={"text": str(i)})
+        finally:
+            closed = True
+
+    seen = 0
+
+    async def is_disconnected() -> bool:
+        return seen >= 2
+
+    async for _ in stop_on_disconnect(source(), is_disconnected):
+        seen += 1
+
+    assert seen == 2
+    assert closed
+
+
+def test_encoders():
+    ev = ProgressEvent(name="token", payload={"text": "hi"})
+
+    assert encode_sse(ev) == 'event: token\ndata: {"text": "hi"}\n\n'
+    assert encode_sse(HEARTBEAT).startswith(":")
+    assert json.loads(encode_ndjson(ev)) == {"event": "token", "data": {"text": "hi"}}
+
+
+def test_error_event_hides_unexpected_errors():
+    assert error_event(ChatNotFoundOrForbidden()).payload["type"] == "ChatNotFoundOrForbidden"
+    assert error_event(RuntimeError("db password")).payload["detail"] == "Internal server error"
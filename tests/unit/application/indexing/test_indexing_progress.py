@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from talk_to_pdf.backend.app.application.indexing.indexing_progress import ProgressThrottle
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_throttle_writes_first_then_on_interval_or_delta():
+    clock = FakeClock()
+    throttle = ProgressThrottle(min_interval_s=2.0, min_delta=5, clock=clock)
+
+    assert throttle.should_write(60) is True
+    assert throttle.should_write(61) is False  # too soon, too small
+    assert throttle.should_write(64) is False
+
+    assert throttle.should_write(65) is True  # moved by min_delta
+    clock.now = 1.0
+    assert throttle.should_write(66) is False
+
+    clock.now = 3.5
+    assert throttle.should_write(66) is True  # interval elapsed
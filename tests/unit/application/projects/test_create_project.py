@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import hashlib
+from uuid import uuid4
+
+import pytest
+
+from talk_to_pdf.backend.app.application.projects.dto import CreateProjectInputDTO
+from talk_to_pdf.backend.app.application.projects.use_cases.create_project import CreateProjectUseCase
+from talk_to_pdf.backend.app.domain.files import FileTooLarge
+from tests.unit.fakes.project_storage import FakeFileStorage, byte_stream
+
+pytestmark = pytest.mark.asyncio
+
+
+def _dto(data: bytes) -> CreateProjectInputDTO:
+    return CreateProjectInputDTO(
+        owner_id=uuid4(),
+        name="Streamed",
+        content=byte_stream(data),
+        filename="doc.pdf",
+        content_type="application/pdf",
+    )
+
+
+async def test_records_size_and_sha256_of_streamed_upload(uow):
+    storage = FakeFileStorage()
+    data = b"%PDF-1.4 streamed body"
+
+    out = await CreateProjectUseCase(uow, storage, max_upload_bytes=1024).execute(_dto(data))
+
+    saved = await uow.project_repo.get_by_id(project_id=out.id)
+    assert out.primary_document.size_bytes == len(data)
+    assert saved.primary_document.sha256 == hashlib.sha256(data).hexdigest()
+
+
+async def test_oversized_upload_is_not_wrapped(uow):
+    storage = FakeFileStorage()
+
+    with pytest.raises(FileTooLarge):
+        await CreateProjectUseCase(uow, storage, max_upload_bytes=8).execute(_dto(b"x" * 9))
+
+    assert storage.count() == 0
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from uuid import uuid4
+
+import pytest
+
+from talk_to_pdf.backend.app.application.common.dto import ContextChunkDTO
+from talk_to_pdf.backend.app.application.reply.context_packer import pack_context
+from talk_to_pdf.backend.app.infrastructure.common import token_counter
+from tests.unit.fakes.encoding import CharEncoding
+
+
+@pytest.fixture(autouse=True)
+def char_tokens(monkeypatch):
+    monkeypatch.setattr(token_counter, "_get_encoding", lambda model: CharEncoding())
+
+
+def _chunk(index: int, text: str, *, score: float = 1.0, overlap: bool = False) -> ContextChunkDTO:
+    meta = {"chunk_index": index, "has_overlap_prefix": True} if overlap else {"chunk_index": index}
+    return ContextChunkDTO(chunk_id=uuid4(), chunk_index=index, text=text, score=score, meta=meta, citation=None)
+
+
+def test_neighbours_merge_and_drop_duplicate_overlap():
+    a = _chunk(4, "Intro.\n\nShared tail block.")
+    b = _chunk(5, "Shared tail block.\n\nNew content.", overlap=True)
+
+    packed = pack_context([b, a], model="m", max_tokens=10_000)
+
+    assert packed.text == "[1] Intro.\n\nShared tail block.\n\nNew content."
+    assert packed.overlap_chars_removed == len("Shared tail block.\n\n")
+    assert packed.chunk_ids == [a.chunk_id, b.chunk_id]
+    assert packed.tokens == len(packed.text)
+
+
+def test_overlap_kept_when_source_chunk_is_not_packed():
+    b = _chunk(5, "Shared tail block.\n\nNew content.", overlap=True)
+    other = _chunk(9, "Elsewhere.")
+
+    packed = pack_context([b, other], model="m", max_tokens=10_000)
+
+    assert packed.text == "[1] Shared tail block.\n\nNew content.\n\n[2] Elsewhere."
+    assert packed.overlap_chars_removed == 0
+
+
+def test_overlap_detected_from_compact_block_meta():
+    a = _chunk(4, "Intro.\n\nShared tail block.")
+    b = _chunk(5, "Shared tail block.\n\nNew content.")
+    b.meta["blocks"] = [
+        {"start": 0, "end": 18, "kind": "paragraph", "synthetic_kind": "overlap_block"},
+        {"start": 20, "end": 32, "kind": "paragraph"},
+    ]
+
+    packed = pack_context([a, b], model="m", max_tokens=10_000)
+
+    assert packed.text == "[1] Intro.\n\nShared tail block.\n\nNew content."
+
+
+def test_budget_is_exact_and_filled_by_score_density():
+    top = _chunk(1, "x" * 40, score=0.9)
+    dense = _chunk(10, "y" * 10, score=0.5)
+    sparse = _chunk(20, "z" * 40, score=0.6)
+
+    packed = pack_context([top, sparse, dense], model="m", max_tokens=70)
+
+    assert packed.chunk_ids == [top.chunk_id, dense.chunk_id]
+    assert packed.dropped == 1
+    assert packed.tokens <= 70
+
+
+def test_oversize_top_chunk_is_truncated_to_budget():
+    packed = pack_context([_chunk(0, "w" * 500)], model="m", max_tokens=50)
+
+    assert packed.tokens == 50
+    assert packed.text.startswith("[1] www")
+
+
+def test_empty_context():
+    packed = pack_context([], model="m", max_tokens=100)
+
+    assert packed.text == ""
+    assert packed.chunk_ids == []
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+
+from talk_to_pdf.backend.app.application.reply.dto import GetChatMessagesInputDTO
+from talk_to_pdf.backend.app.application.reply.use_cases.get_chat_messages import GetChatMessagesUseCase
+from talk_to_pdf.backend.app.domain.common.enums import ChatRole, VectorMetric
+from talk_to_pdf.backend.app.domain.reply import Chat, ChatMessage
+from talk_to_pdf.backend.app.domain.reply.errors import ChatNotFoundOrForbidden
+from talk_to_pdf.backend.app.domain.reply.value_objects import ChatMessageCitations, CitedChunk, MessageCursor
+
+pytestmark = pytest.mark.asyncio
+
+
+def _dt(minutes: int) -> datetime:
+    return datetime(2025, 1, 1, tzinfo=timezone.utc) + timedelta(minutes=minutes)
+
+
+def _citations(index_id, chunk_ids) -> ChatMessageCitations:
+    return ChatMessageCitations(
+        index_id=index_id,
+        embed_signature="sig",
+        metric=VectorMetric.COSINE,
+        chunks=[CitedChunk(chunk_id=cid, score=0.5, citation={}, matched_by=[0]) for cid in chunk_ids],
+        top_k=5,
+        rerank_signature=None,
+        prompt_version="0.1.0",
+        model="m",
+        rewritten_query="rq",
+        rewritten_queries=["rq", "rq2"],
+    )
+
+
+async def _seed_chat(uow) -> Chat:
+    chat = Chat(owner_id=uuid4(), project_id=uuid4(), title="c")
+    await uow.chat_repo.add(chat)
+    return chat
+
+
+async def test_hydrates_all_citations_with_one_lookup(uow):
+    chat = await _seed_chat(uow)
+    index_a, index_b = uuid4(), uuid4()
+    a1, a2, b1 = uuid4(), uuid4(), uuid4()
+    uow.chunk_repo.texts = {(index_a, a1): "A1", (index_a, a2): "A2", (index_b, b1): "B1"}
+
+    await uow.chat_message_repo.add_many(
+        [
+            ChatMessage(chat_id=chat.id, role=ChatRole.USER, content="q1", created_at=_dt(1)),
+            ChatMessage(chat_id=chat.id, role=ChatRole.ASSISTANT, content="a1", created_at=_dt(2),
+                        citations=_citations(index_a, [a1, a2])),
+            ChatMessage(chat_id=chat.id, role=ChatRole.USER, content="q2", created_at=_dt(3)),
+            ChatMessage(chat_id=chat.id, role=ChatRole.ASSISTANT, content="a2", created_at=_dt(4),
+                        citations=_citations(index_b, [b1])),
+        ]
+    )
+
+    out = await GetChatMessagesUseCase(lambda: uow).execute(
+        GetChatMessagesInputDTO(owner_id=chat.owner_id, chat_id=chat.id)
+    )
+
+    assert uow.chunk_repo.text_lookups == 1
+    assert out.has_more is False
+    out = out.items
+    assert [m.content for m in out] == ["q1", "a1", "q2", "a2"]
+    assert [c["content"] for c in out[1].citations["chunks"]] == ["A1", "A2"]
+    assert [c["content"] for c in out[3].citations["chunks"]] == ["B1"]
+    # the rest of the citation payload is preserved
+    assert out[1].citations["chunks"][0]["matched_by"] == [0]
+    assert out[1].citations["rewritten_query"] == "rq"
+    assert out[1].citations["rewritten_queries"] == ["rq", "rq2"]
+
+
+async def test_skips_lookup_when_no_citations(uow):
+    chat = await _seed_chat(uow)
+    await uow.chat_message_repo.add(
+        ChatMessage(chat_id=chat.id, role=ChatRole.USER, content="q", created_at=_dt(1))
+    )
+
+    out = await GetChatMessagesUseCase(lambda: uow).execute(
+        GetChatMessagesInputDTO(owner_id=chat.owner_id, chat_id=chat.id)
+    )
+
+    assert [m.content for m in out.items] == ["q"]
+    assert uow.chunk_repo.text_lookups == 0
+
+
+async def test_wrong_owner_raises(uow):
+    chat = await _seed_chat(uow)
+
+    with pytest.raises(ChatNotFoundOrForbidden):
+        await GetChatMessagesUseCase(lambda: uow).execute(
+            GetChatMessagesInputDTO(owner_id=uuid4(), chat_id=chat.id)
+        )
+
+
+async def _seed_messages(uow, chat, n):
+    msgs = [
+        ChatMessage(chat_id=chat.id, role=ChatRole.USER, content=f"m{i}", created_at=_dt(i))
+        for i in range(n)
+    ]
+    await uow.chat_message_repo.add_many(msgs)
+    return msgs
+
+
+async def test_pages_backwards_with_before_cursor(uow):
+    chat = await _seed_chat(uow)
+    msgs = await _seed_messages(uow, chat, 5)
+    uc = GetChatMessagesUseCase(lambda: uow)
+
+    page = await uc.execute(GetChatMessagesInputDTO(owner_id=chat.owner_id, chat_id=chat.id, limit=2))
+    assert [m.content for m in page.items] == ["m3", "m4"]
+    assert page.has_more is True
+
+    oldest = msgs[3]
+    page = await uc.execute(
+        GetChatMessagesInputDTO(
+            owner_id=chat.owner_id,
+            chat_id=chat.id,
+            limit=2,
+            before=MessageCursor(created_at=oldest.created_at, id=oldest.id),
+        )
+    )
+    assert [m.content for m in page.items] == ["m1", "m2"]
+    assert page.has_more is True
+
+
+async def test_pages_forwards_with_after_cursor(uow):
+    chat = await _seed_chat(uow)
+    msgs = await _seed_messages(uow, chat, 5)
+
+    page = await GetChatMessagesUseCase(lambda: uow).execute(
+        GetChatMessagesInputDTO(
+            owner_id=chat.owner_id,
+            chat_id=chat.id,
+            limit=2,
+            after=MessageCursor(created_at=msgs[2].created_at, id=msgs[2].id),
+        )
+    )
+    assert [m.content for m in page.items] == ["m3", "m4"]
+    assert page.has_more is False
+
+
+async def test_citation_stubs_skip_text_lookup(uow):
+    chat = await _seed_chat(uow)
+    index_id, chunk_id = uuid4(), uuid4()
+    uow.chunk_repo.texts = {(index_id, chunk_id): "T"}
+    await uow.chat_message_repo.add(
+        ChatMessage(chat_id=chat.id, role=ChatRole.ASSISTANT, content="a", created_at=_dt(1),
+                    citations=_citations(index_id, [chunk_id]))
+    )
+
+    page = await GetChatMessagesUseCase(lambda: uow).execute(
+        GetChatMessagesInputDTO(owner_id=chat.owner_id, chat_id=chat.id, include_citation_content=False)
+    )
+
+    assert uow.chunk_repo.text_lookups == 0
+    chunk = page.items[0].citations["chunks"][0]
+    assert "content" not in chunk
+    assert chunk["chunk_id"] == str(chunk_id)
@@ -0,0 +1,301 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+
+from talk_to_pdf.backend.app.application.common.dto import ContextChunkDTO
+from talk_to_pdf.backend.app.application.reply.dto import ReplyInputDTO
+from talk_to_pdf.backend.app.application.reply.use_cases.create_message import CreateChatMessageUseCase
+from talk_to_pdf.backend.app.application.reply.use_cases.stream_reply import StreamReplyUseCase
+from talk_to_pdf.backend.app.domain.common.enums import ChatRole
+from talk_to_pdf.backend.app.domain.common.value_objects import EmbedConfig
+from talk_to_pdf.backend.app.domain.indexing.entities import DocumentIndex
+from talk_to_pdf.backend.app.domain.indexing.enums import IndexStatus
+from talk_to_pdf.backend.app.domain.reply import Chat, ChatMessage
+from talk_to_pdf.backend.app.domain.reply.errors import ChatNotFoundOrForbidden
+from talk_to_pdf.backend.app.infrastructure.common import token_counter
+from talk_to_pdf.backend.app.infrastructure.reply.answer_cache import InMemorySemanticAnswerCache
+from tests.unit.fakes.encoding import CharEncoding
+from tests.unit.fakes.reply_pipeline import FakeContextBuilder, FakeReplyGenerator
+
+pytestmark = pytest.mark.asyncio
+
+
+def _dt(minutes: int) -> datetime:
+    return datetime(2025, 1, 1, tzinfo=timezone.utc) + timedelta(minutes=minutes)
+
+
+async def _seed(uow) -> Chat:
+    chat = Chat(owner_id=uuid4(), project_id=uuid4(), title="c")
+    await uow.chat_repo.add(chat)
+    idx = DocumentIndex(
+        project_id=chat.project_id,
+        document_id=uuid4(),
+        storage_path="p",
+        chunker_version="v",
+        embed_config=EmbedConfig(provider="openai", model="m", batch_size=10, dimensions=None),
+        status=IndexStatus.READY,
+        progress=100,
+    )
+    uow.index_repo._by_id[idx.id] = idx
+    return chat
+
+
+def _use_case(uow, ctx_builder, generator, *, history_max_turns=6) -> StreamReplyUseCase:
+    return StreamReplyUseCase(
+        uow_factory=lambda: uow,
+        ctx_builder_uc=ctx_builder,
+        create_msg_uc=CreateChatMessageUseCase(lambda: uow),
+        reply_generator=generator,
+        history_max_turns=history_max_turns,
+    )
+
+
+def _input(chat: Chat, query: str = "new question") -> ReplyInputDTO:
+    return ReplyInputDTO(
+        chat_id=chat.id,
+        project_id=chat.project_id,
+        owner_id=chat.owner_id,
+        query=query,
+        top_k=5,
+        top_n=3,
+        rerank_timeout_s=0.1,
+    )
+
+
+async def test_history_is_slim_window_including_new_user_message(uow):
+    chat = await _seed(uow)
+    await uow.chat_message_repo.add_many(
+        [
+            ChatMessage(chat_id=chat.id, role=ChatRole.USER if i % 2 == 0 else ChatRole.ASSISTANT,
+                        content=f"m{i}", created_at=_dt(i))
+            for i in range(5)
+        ]
+    )
+    ctx_builder, generator = FakeContextBuilder(), FakeReplyGenerator()
+
+    out = [c async for c in _use_case(uow, ctx_builder, generator, history_max_turns=3).execute(_input(chat))]
+
+    assert out == ["Hello", " world"]
+    assert uow.chat_message_repo.turn_lookups == 1
+    history = generator.calls[0].history
+    assert [t.content for t in history] == ["m3", "m4", "new question"]
+    assert ctx_builder.calls[0].message_history == history
+
+    stored = [m.content for m in uow.chat_message_repo._messages]
+    assert stored[-2:] == ["new question", "Hello world"]
+
+
+async def test_chat_from_other_project_is_rejected_before_writing(uow):
+    chat = await _seed(uow)
+    other = Chat(owner_id=chat.owner_id, project_id=uuid4(), title="other")
+    await uow.chat_repo.add(other)
+    dto = ReplyInputDTO(
+        chat_id=other.id,
+        project_id=chat.project_id,
+        owner_id=chat.owner_id,
+        query="q",
+        top_k=5,
+        top_n=3,
+        rerank_timeout_s=0.1,
+    )
+
+    with pytest.raises(ChatNotFoundOrForbidden):
+        [c async for c in _use_case(uow, FakeContextBuilder(), FakeReplyGenerator()).execute(dto)]
+
+    assert uow.chat_message_repo._messages == []
+
+
+async def test_event_stream_reports_progress_tokens_and_message_id(uow):
+    chat = await _seed(uow)
+
+    events = [e async for e in _use_case(uow, FakeContextBuilder(), FakeReplyGenerator()).execute_events(_input(chat))]
+
+    assert [e.name for e in events] == ["rewrite_done", "retrieval_done", "token", "token", "done"]
+    assert events[0].payload["queries"] == ["new question"]
+    assert events[1].payload["citations"]["chunks"] == []
+    assistant = uow.chat_message_repo._messages[-1]
+    assert events[-1].payload["message_id"] == str(assistant.id)
+    assert events[-1].payload["metrics"]["tokens"]["completion"] == 2
+
+
+async def test_disconnect_mid_answer_closes_stream_and_saves_truncated_partial(uow):
+    chat = await _seed(uow)
+    generator = FakeReplyGenerator(["Hel", "lo", " there"])
+    events = _use_case(uow, FakeContextBuilder(), generator).execute_events(_input(chat))
+
+    async for event in events:
+        if event.name == "token":
+            break
+    await events.aclose()
+
+    assert generator.streams[0].closed_early
+    assistant = uow.chat_message_repo._messages[-1]
+    assert assistant.role == ChatRole.ASSISTANT
+    assert assistant.content == "Hel"
+    assert assistant.truncated is True
+
+
+async def test_cancel_during_retrieval_cancels_context_builder(uow):
+    chat = await _seed(uow)
+    started, cancelled = asyncio.Event(), asyncio.Event()
+
+    class BlockingContextBuilder:
+        async def execute(self, dto, *, progress=None):
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+    async def consume():
+        async for _ in _use_case(uow, BlockingContextBuilder(), FakeReplyGenerator()).execute_events(_input(chat)):
+            pass
+
+    task = asyncio.create_task(consume())
+    await started.wait()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert cancelled.is_set()
+    # only the user message was written
+    assert [m.role for m in uow.chat_message_repo._messages] == [ChatRole.USER]
+
+
+class _ContextWithChunks(FakeContextBuilder):
+    def __init__(self) -> None:
+        super().__init__()
+        self.chunk_ids = [uuid4(), uuid4()]
+
+    async def execute(self, dto, *, progress=None):
+        ctx = await super().execute(dto, progress=progress)
+        chunks = [
+            ContextChunkDTO(chunk_id=cid, chunk_index=i, text=f"t{i}", score=1.0, meta=None, citation=None)
+            for i, cid in enumerate(self.chunk_ids)
+        ]
+        return replace(ctx, chunks=chunks)
+
+
+class _QuestionEmbedder:
+    def create(self, cfg):
+        return self
+
+    async def aembed_documents(self, texts):
+        # "same question" variants embed identically, anything else is orthogonal
+        return [[1.0, 0.0] if "same" in t else [0.0, 1.0] for t in texts]
+
+
+async def test_answer_cache_replays_answer_without_calling_generator(uow, monkeypatch):
+    monkeypatch.setattr(token_counter, "_get_encoding", lambda model: CharEncoding())
+    chat = await _seed(uow)
+    ctx_builder, generator = _ContextWithChunks(), FakeReplyGenerator()
+    uc = StreamReplyUseCase(
+        uow_factory=lambda: uow,
+        ctx_builder_uc=ctx_builder,
+        create_msg_uc=CreateChatMessageUseCase(lambda: uow),
+        reply_generator=generator,
+        answer_cache=InMemorySemanticAnswerCache(min_similarity=0.95, max_indexes=4, max_entries_per_index=4),
+        embedder_factory=_QuestionEmbedder(),
+    )
+
+    # a fresh chat in the same project: same context, same (empty) earlier history
+    other = Chat(owner_id=chat.owner_id, project_id=chat.project_id, title="other")
+    await uow.chat_repo.add(other)
+
+    first = [e async for e in uc.execute_events(_input(chat, "the same question"))]
+    second = [e async for e in uc.execute_events(_input(other, "the same  question?"))]
+    third = [e async for e in uc.execute_events(_input(chat, "a different one"))]
+
+    assert len(generator.calls) == 2  # first and third
+    assert "".join(e.payload["text"] for e in second if e.name == "token") == "Hello world"
+    assert first[-1].payload["metrics"]["answer_cache"]["hit"] is False
+    assert second[-1].payload["metrics"]["answer_cache"]["hit"] is True
+    assert second[-1].payload["metrics"]["tokens"]["completion"] == 0
+    assert third[-1].payload["metrics"]["answer_cache"]["hit"] is False
+    assert uow.chat_message_repo._messages[3].content == "Hello world"
+
+
+async def test_answer_cache_is_scoped_to_the_earlier_turns(uow, monkeypatch):
+    monkeypatch.setattr(token_counter, "_get_encoding", lambda model: CharEncoding())
+    chat = await _seed(uow)
+    generator = FakeReplyGenerator()
+    uc = StreamReplyUseCase(
+        uow_factory=lambda: uow,
+        ctx_builder_uc=_ContextWithChunks(),
+        create_msg_uc=CreateChatMessageUseCase(lambda: uow),
+        reply_generator=generator,
+        answer_cache=InMemorySemanticAnswerCache(min_similarity=0.95, max_indexes=4, max_entries_per_index=4),
+        embedder_factory=_QuestionEmbedder(),
+    )
+
+    _ = [e async for e in uc.execute_events(_input(chat, "the same question"))]
+    # same question and context, but the prompt now carries the first exchange
+    again = [e async for e in uc.execute_events(_input(chat, "the same question"))]
+
+    assert len(generator.calls) == 2
+    assert again[-1].payload["metrics"]["answer_cache"]["hit"] is False
+    assert [t.content for t in generator.calls[1].history] == ["the same question", "Hello world", "the same question"]
+
+
+async def test_aligned_history_window_moves_in_steps_and_rewriter_keeps_fixed_window(uow):
+    chat = await _seed(uow)
+    await uow.chat_message_repo.add_many(
+        [
+            ChatMessage(chat_id=chat.id, role=ChatRole.USER if i % 2 == 0 else ChatRole.ASSISTANT,
+                        content=f"m{i}", created_at=_dt(i))
+            for i in range(7)
+        ]
+    )
+    ctx_builder, generator = FakeContextBuilder(), FakeReplyGenerator()
+    uc = StreamReplyUseCase(
+        uow_factory=lambda: uow,
+        ctx_builder_uc=ctx_builder,
+        create_msg_uc=CreateChatMessageUseCase(lambda: uow),
+        reply_generator=generator,
+        history_max_turns=3,
+        history_align_turns=3,
+    )
+
+    _ = [c async for c in uc.execute(_input(chat))]
+
+    # 8 messages: the window starts at message 3 (a multiple of 3) and keeps 5 turns
+    assert [t.content for t in generator.calls[0].history] == ["m3", "m4", "m5", "m6", "new question"]
+    assert [t.content for t in ctx_builder.calls[0].message_history] == ["m5", "m6", "new question"]
+
+
+async def test_assistant_message_cites_only_packed_chunks(uow, monkeypatch):
+    monkeypatch.setattr(token_counter, "_get_encoding", lambda model: CharEncoding())
+    chat = await _seed(uow)
+    kept, dropped = uuid4(), uuid4()
+
+    class OversizedSecondChunk(FakeContextBuilder):
+        async def execute(self, dto, *, progress=None):
+            ctx = await super().execute(dto, progress=progress)
+            chunks = [
+                ContextChunkDTO(chunk_id=kept, chunk_index=0, text="short", score=1.0, meta=None, citation=None),
+                ContextChunkDTO(chunk_id=dropped, chunk_index=5, text="x" * 50, score=0.9, meta=None, citation=None),
+            ]
+            return replace(ctx, chunks=chunks)
+
+    generator = FakeReplyGenerator()
+    uc = StreamReplyUseCase(
+        uow_factory=lambda: uow,
+        ctx_builder_uc=OversizedSecondChunk(),
+        create_msg_uc=CreateChatMessageUseCase(lambda: uow),
+        reply_generator=generator,
+        context_max_tokens=20,
+    )
+
+    events = [e async for e in uc.execute_events(_input(chat))]
+
+    # retrieval still reports both; the prompt and the saved citations carry only the packed one
+    assert len(events[1].payload["citations"]["chunks"]) == 2
+    assert "x" * 50 not in generator.calls[0].context
+    assistant = uow.chat_message_repo._messages[-1]
+    assert [c.chunk_id for c in assistant.citations.chunks] == [kept]
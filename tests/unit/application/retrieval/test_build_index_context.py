@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+from uuid import uuid4
+
+import pytest
+
+from talk_to_pdf.backend.app.application.common.dto import SearchInputDTO
+from talk_to_pdf.backend.app.application.retrieval.use_cases.build_index_context import BuildIndexContextUseCase
+from talk_to_pdf.backend.app.application.retrieval.value_objects import MergeResult, MultiQueryRewriteResult
+from talk_to_pdf.backend.app.domain.common.value_objects import EmbedConfig
+from talk_to_pdf.backend.app.domain.indexing.enums import IndexStatus
+from talk_to_pdf.backend.app.domain.retrieval.errors import IndexNotFoundOrForbidden, IndexNotReady
+from talk_to_pdf.backend.app.infrastructure.retrieval.cache import LruRetrievalCache
+from tests.unit.fakes.uow import FakeUnitOfWork
+
+pytestmark = pytest.mark.asyncio
+
+
+class _ReachedRewrite(Exception):
+    pass
+
+
+class StopAtRewrite:
+    """Query rewriter that ends the use case right after the index check."""
+
+    async def rewrite_queries_with_metrics(self, *, query, history):
+        raise _ReachedRewrite
+
+
+async def _seed_index(uow: FakeUnitOfWork, *, project_id, status: IndexStatus):
+    idx = await uow.index_repo.create_pending(
+        project_id=project_id,
+        document_id=uuid4(),
+        storage_path="p.pdf",
+        chunker_version="v1",
+        embed_config=EmbedConfig(provider="openai", model="m", batch_size=8, dimensions=None),
+    )
+    if status != IndexStatus.PENDING:
+        await uow.index_repo.update_progress(index_id=idx.id, status=status, progress=100)
+    return idx.id
+
+
+def _use_case(primary: FakeUnitOfWork, replica: FakeUnitOfWork) -> BuildIndexContextUseCase:
+    return BuildIndexContextUseCase(
+        lambda: primary,
+        read_uow_factory=lambda: replica,
+        embedder_factory=None,
+        query_rewriter=StopAtRewrite(),
+        retrieval_merger=None,
+        max_top_k=10,
+        max_top_n=5,
+    )
+
+
+def _dto(project_id, index_id) -> SearchInputDTO:
+    return SearchInputDTO(
+        owner_id=uuid4(),
+        project_id=project_id,
+        index_id=index_id,
+        query="q",
+        message_history=[],
+        top_n=3,
+        top_k=5,
+        rerank_timeout_s=0.0,
+    )
+
+
+async def test_ready_on_replica_never_touches_primary():
+    primary, replica = FakeUnitOfWork(), FakeUnitOfWork()
+    project_id = uuid4()
+    index_id = await _seed_index(replica, project_id=project_id, status=IndexStatus.READY)
+
+    with pytest.raises(_ReachedRewrite):
+        await _use_case(primary, replica).execute(_dto(project_id, index_id))
+
+    assert replica.index_repo.owner_lookups == 1
+    assert primary.index_repo.owner_lookups == 0
+
+
+async def test_lagging_replica_falls_back_to_primary():
+    primary, replica = FakeUnitOfWork(), FakeUnitOfWork()
+    project_id = uuid4()
+    index_id = await _seed_index(primary, project_id=project_id, status=IndexStatus.READY)
+    # replica has not replayed the index yet
+
+    with pytest.raises(_ReachedRewrite):
+        await _use_case(primary, replica).execute(_dto(project_id, index_id))
+
+    assert primary.index_repo.owner_lookups == 1
+
+
+async def test_missing_everywhere_still_raises():
+    primary, replica = FakeUnitOfWork(), FakeUnitOfWork()
+
+    with pytest.raises(IndexNotFoundOrForbidden):
+        await _use_case(primary, replica).execute(_dto(uuid4(), uuid4()))
+
+    assert primary.index_repo.owner_lookups == 1
+
+
+async def test_not_ready_on_primary_raises():
+    primary, replica = FakeUnitOfWork(), FakeUnitOfWork()
+    project_id = uuid4()
+    index_id = await _seed_index(primary, project_id=project_id, status=IndexStatus.PENDING)
+
+    with pytest.raises(IndexNotReady):
+        await _use_case(primary, replica).execute(_dto(project_id, index_id))
+
+
+class _Rewriter:
+    async def rewrite_queries_with_metrics(self, *, query, history):
+        return MultiQueryRewriteResult(queries=[query], prompt_tokens=1, completion_tokens=1)
+
+
+class _CountingEmbedderFactory:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def create(self, cfg):
+        return self
+
+    async def aembed_documents(self, texts):
+        self.calls += 1
+        return [[1.0, 0.0] for _ in texts]
+
+
+class _ChunkSearch:
+    def __init__(self) -> None:
+        self.searches = 0
+
+    async def similarity_search(self, **kwargs):
+        self.searches += 1
+        return []
+
+    async def fts_search(self, **kwargs):
+        return []
+
+
+class _EmptyMerger:
+    w_vec = 0.65
+    w_fts = 0.35
+
+    async def merge(self, **kwargs):
+        return MergeResult(matches=[], score_by_id={}, matched_by={}, total_candidates=0, unique_candidates=0)
+
+
+async def test_retrieval_cache_skips_embedding_and_search_on_repeat():
+    uow = FakeUnitOfWork()
+    uow.chunk_search_repo = _ChunkSearch()
+    project_id = uuid4()
+    index_id = await _seed_index(uow, project_id=project_id, status=IndexStatus.READY)
+    embedder = _CountingEmbedderFactory()
+    uc = BuildIndexContextUseCase(
+        lambda: uow,
+        embedder_factory=embedder,
+        query_rewriter=_Rewriter(),
+        retrieval_merger=_EmptyMerger(),
+        retrieval_cache=LruRetrievalCache(max_entries=8),
+        max_top_k=10,
+        max_top_n=5,
+    )
+
+    await uc.execute(_dto(project_id, index_id))
+    await uc.execute(_dto(project_id, index_id))
+
+    assert embedder.calls == 1
+    assert uow.chunk_search_repo.searches == 1
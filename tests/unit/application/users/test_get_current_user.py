@@ -0,0 +1,60 @@
+import pytest
+
+from talk_to_pdf.backend.app.application.users.use_cases.get_current_user import GetCurrentUserUseCase
+from talk_to_pdf.backend.app.domain.users import User
+from talk_to_pdf.backend.app.domain.users.value_objects import UserEmail
+from talk_to_pdf.backend.app.infrastructure.users.current_user_cache import TTLCurrentUserCache
+
+pytestmark = pytest.mark.asyncio
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+async def _seed(uow) -> User:
+    user = User(email=UserEmail("a@example.com"), name="A", hashed_password="x", is_active=True)
+    await uow.user_repo.add(user)
+    return user
+
+
+async def test_cached_lookup_skips_the_db_for_the_same_token(uow):
+    user = await _seed(uow)
+    uc = GetCurrentUserUseCase(uow, TTLCurrentUserCache(ttl_s=30, max_entries=10))
+
+    first = await uc.execute(user.id, issued_at=100)
+    second = await uc.execute(user.id, issued_at=100)
+    await uc.execute(user.id, issued_at=200)  # new token, fresh lookup
+
+    assert first == second
+    assert second.email == "a@example.com"
+    assert uow.user_repo.id_lookups == 2
+
+
+async def test_expired_and_invalidated_entries_hit_the_db(uow):
+    user = await _seed(uow)
+    clock = FakeClock()
+    cache = TTLCurrentUserCache(ttl_s=30, max_entries=10, clock=clock)
+    uc = GetCurrentUserUseCase(uow, cache)
+
+    await uc.execute(user.id, issued_at=1)
+    clock.now = 31
+    await uc.execute(user.id, issued_at=1)
+    cache.invalidate(user.id)
+    await uc.execute(user.id, issued_at=1)
+
+    assert uow.user_repo.id_lookups == 3
+
+
+async def test_without_issued_at_always_reads_the_db(uow):
+    user = await _seed(uow)
+    uc = GetCurrentUserUseCase(uow, TTLCurrentUserCache(ttl_s=30, max_entries=10))
+
+    await uc.execute(user.id)
+    await uc.execute(user.id)
+
+    assert uow.user_repo.id_lookups == 2
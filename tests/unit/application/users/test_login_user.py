@@ -15,10 +15,10 @@ class PlaintextTestHasher:
     Fast + deterministic for unit tests.
     You still test DB/UoW/repository integration; you’re not paying bcrypt cost.
     """
-    def hash(self, raw_password: str) -> str:
+    async def hash(self, raw_password: str) -> str:
         return raw_password
 
-    def verify(self, raw_password: str, hashed_password: str) -> bool:
+    async def verify(self, raw_password: str, hashed_password: str) -> bool:
         return raw_password == hashed_password
 
 
@@ -43,7 +43,7 @@ async def test_login_success_returns_output_dto(uow):
         uow=uow,
         email="amin@example.com",
         name="Amin",
-        hashed_password=password_hasher.hash("secret123"),
+        hashed_password=await password_hasher.hash("secret123"),
         is_active=True,
     )
 
@@ -72,7 +72,7 @@ async def test_login_wrong_password_raises_invalid_credentials(uow):
         uow=uow,
         email="wrongpass@example.com",
         name="Amin",
-        hashed_password=password_hasher.hash("correct"),
+        hashed_password=await password_hasher.hash("correct"),
         is_active=True,
     )
 
@@ -89,7 +89,7 @@ async def test_login_inactive_user_raises_inactive_user_error(uow):
         uow=uow,
         email="inactive@example.com",
         name="Amin",
-        hashed_password=password_hasher.hash("secret"),
+        hashed_password=await password_hasher.hash("secret"),
         is_active=False,
     )
 
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+
+from talk_to_pdf.backend.app.core import security
+from talk_to_pdf.backend.app.core.security import BcryptPasswordHasher
+from talk_to_pdf.backend.app.domain.users import AuthBusyError
+
+pytestmark = pytest.mark.asyncio
+
+
+class BlockingContext:
+    """Stands in for passlib: hash() blocks its worker thread until released."""
+
+    def __init__(self) -> None:
+        self.release = threading.Event()
+
+    def hash(self, raw: str) -> str:
+        self.release.wait(timeout=5)
+        return f"h::{raw}"
+
+    def verify(self, raw: str, hashed: str) -> bool:
+        return hashed == f"h::{raw}"
+
+
+@pytest.fixture
+def ctx(monkeypatch) -> BlockingContext:
+    ctx = BlockingContext()
+    monkeypatch.setattr(security, "pwd_context", ctx)
+    return ctx
+
+
+async def test_hashing_runs_off_the_event_loop(ctx):
+    hasher = BcryptPasswordHasher(max_workers=1, max_pending=2)
+
+    pending = asyncio.ensure_future(hasher.hash("pw"))
+    await asyncio.sleep(0.01)  # the loop keeps running while the worker blocks
+    assert not pending.done()
+
+    ctx.release.set()
+    assert await pending == "h::pw"
+    assert await hasher.verify("pw", "h::pw") is True
+
+
+async def test_rejects_beyond_pending_limit_until_work_finishes(ctx):
+    hasher = BcryptPasswordHasher(max_workers=1, max_pending=1)
+
+    first = asyncio.ensure_future(hasher.hash("a"))
+    await asyncio.sleep(0)
+    with pytest.raises(AuthBusyError):
+        await hasher.hash("b")
+
+    # a caller giving up does not free the slot while bcrypt is still running
+    first.cancel()
+    with pytest.raises(AuthBusyError):
+        await hasher.verify("a", "h::a")
+
+    ctx.release.set()
+    for _ in range(100):
+        try:
+            assert await hasher.verify("a", "h::a") is True
+            break
+        except AuthBusyError:
+            await asyncio.sleep(0.01)
+    else:
+        pytest.fail("slot was never released")
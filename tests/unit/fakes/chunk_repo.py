@@ -8,6 +8,9 @@ from talk_to_pdf.backend.app.domain.indexing.value_objects import ChunkDraft
 class FakeChunkRepository:
     def __init__(self) -> None:
         self._by_index: dict[UUID, list[ChunkDraft]] = {}
+        # (index_id, chunk_id) -> text, seeded directly by tests
+        self.texts: dict[tuple[UUID, UUID], str] = {}
+        self.text_lookups = 0
 
     async def bulk_create(self, *, index_id: UUID, chunks: list[ChunkDraft]) -> None:
         self._by_index[index_id] = list(chunks)
@@ -17,3 +20,12 @@ class FakeChunkRepository:
 
     async def delete_by_index(self, *, index_id: UUID) -> None:
         self._by_index.pop(index_id, None)
+
+    async def get_texts_by_index_and_ids(self, *, ids_by_index: dict[UUID, list[UUID]]) -> dict[UUID, str]:
+        self.text_lookups += 1
+        return {
+            cid: self.texts[(index_id, cid)]
+            for index_id, ids in ids_by_index.items()
+            for cid in ids
+            if (index_id, cid) in self.texts
+        }
@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+
+class CharEncoding:
+    """One token per character; stands in for tiktoken (which downloads encodings)."""
+
+    def encode(self, text: str, disallowed_special=()) -> list[str]:
+        return list(text)
+
+    def decode(self, tokens: list[str]) -> str:
+        return "".join(tokens)
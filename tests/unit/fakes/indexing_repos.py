@@ -15,6 +15,9 @@ class FakeDocumentIndexRepository:
     def __init__(self) -> None:
         self._by_id: dict[UUID, DocumentIndex] = {}
         self._cancel_requests: set[UUID] = set()
+        self.progress_updates: list[dict] = []
+        self.cancel_checks = 0
+        self.owner_lookups = 0
 
     async def create_pending(
         self,
@@ -54,6 +57,23 @@ class FakeDocumentIndexRepository:
         ]
         return max(candidates, key=lambda i: i.updated_at) if candidates else None
 
+    async def get_latest_ready_by_project_and_owner(
+        self, *, project_id: UUID, owner_id: UUID
+    ) -> Optional[DocumentIndex]:
+        # ownership is not modelled in this fake
+        candidates = [
+            i for i in self._by_id.values() if i.project_id == project_id and i.status == IndexStatus.READY
+        ]
+        return max(candidates, key=lambda i: i.updated_at) if candidates else None
+
+    async def get_by_owner_project_and_id(
+        self, *, owner_id: UUID, project_id: UUID, index_id: UUID
+    ) -> Optional[DocumentIndex]:
+        # ownership is not modelled in this fake
+        self.owner_lookups += 1
+        idx = self._by_id.get(index_id)
+        return idx if idx and idx.project_id == project_id else None
+
     async def get_by_id(self, *, index_id: UUID) -> Optional[DocumentIndex]:
         idx = self._by_id.get(index_id)
         if not idx:
@@ -77,6 +97,9 @@ class FakeDocumentIndexRepository:
         error: str | None = None,
         meta: dict | None = None,
     ) -> None:
+        self.progress_updates.append(
+            {"status": status, "progress": progress, "message": message, "error": error, "meta": meta}
+        )
         idx = self._by_id[index_id]
         self._by_id[index_id] = DocumentIndex(
             project_id=idx.project_id,
@@ -97,6 +120,7 @@ class FakeDocumentIndexRepository:
         self._cancel_requests.add(index_id)
 
     async def is_cancel_requested(self, *, index_id: UUID) -> bool:
+        self.cancel_checks += 1
         return index_id in self._cancel_requests
 
     async def delete_index_artifacts(self, *, index_id: UUID) -> None:
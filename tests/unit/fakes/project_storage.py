@@ -1,11 +1,18 @@
 from __future__ import annotations
 
+import hashlib
 from pathlib import Path
 from uuid import UUID
-from typing import Dict
+from typing import AsyncIterable, AsyncIterator, Dict
 from dataclasses import dataclass
 
-from talk_to_pdf.backend.app.domain.files import StoredFileInfo
+from talk_to_pdf.backend.app.domain.files import FileTooLarge, StoredFileInfo
+
+
+async def byte_stream(data: bytes, chunk_size: int = 4) -> AsyncIterator[bytes]:
+    """Feed `data` to FileStorage.save the way an upload arrives: in chunks."""
+    for i in range(0, len(data), chunk_size):
+        yield data[i:i + chunk_size]
 
 
 class FakeFileStorage:
@@ -14,7 +21,7 @@ class FakeFileStorage:
     """
 
     def __init__(self, base_dir: Path | None = None) -> None:
-        # base_dir exists only to satisfy the Protocol shape
+        # base_dir is unused; kept so call sites can mirror FilesystemFileStorage
         self._base_dir = base_dir or Path("/fake")
 
         # storage_path -> bytes
@@ -29,19 +36,27 @@ class FakeFileStorage:
         owner_id: UUID,
         project_id: UUID,
         filename: str,
-        content: bytes,
+        content: AsyncIterable[bytes],
         content_type: str,
+        max_bytes: int | None = None,
     ) -> StoredFileInfo:
+        data = b""
+        async for chunk in content:
+            data += chunk
+            if max_bytes is not None and len(data) > max_bytes:
+                raise FileTooLarge(max_bytes)
+
         # deterministic & realistic relative path
         storage_path = f"{owner_id}/{project_id}/{filename}"
         info = StoredFileInfo(
             original_filename=filename,
             stored_filename=filename,
             storage_path=storage_path,
-            size_bytes=len(content),
+            size_bytes=len(data),
             content_type=content_type,
+            sha256=hashlib.sha256(data).hexdigest(),
         )
-        self._files[storage_path] = content
+        self._files[storage_path] = data
         self._meta[storage_path] = info
 
         return info
@@ -52,6 +67,15 @@ class FakeFileStorage:
         except KeyError:
             raise FileNotFoundError(storage_path)
 
+    async def read_range(self, *, storage_path: str, start: int, length: int | None = None) -> bytes:
+        data = await self.read_bytes(storage_path=storage_path)
+        return data[start:] if length is None else data[start:start + length]
+
+    async def iter_bytes(self, *, storage_path: str, chunk_size: int = 1024 * 1024) -> AsyncIterator[bytes]:
+        data = await self.read_bytes(storage_path=storage_path)
+        for i in range(0, len(data), chunk_size):
+            yield data[i:i + chunk_size]
+
     async def delete(self, *, storage_path: str) -> None:
         self._files.pop(storage_path, None)
         self._meta.pop(storage_path, None)
@@ -0,0 +1,61 @@
+# tests/unit/fakes/reply_pipeline.py
+from __future__ import annotations
+
+from typing import AsyncIterator
+
+from talk_to_pdf.backend.app.application.common.dto import SearchInputDTO, ContextPackDTO
+from talk_to_pdf.backend.app.application.common.progress import ProgressEvent, ProgressSink
+from talk_to_pdf.backend.app.application.reply.interfaces import PromptTokenBreakdown, StreamMetrics
+from talk_to_pdf.backend.app.domain.common.enums import VectorMetric
+from talk_to_pdf.backend.app.domain.reply.value_objects import GenerateReplyInput
+
+
+class FakeContextBuilder:
+    def __init__(self) -> None:
+        self.calls: list[SearchInputDTO] = []
+
+    async def execute(self, dto: SearchInputDTO, *, progress: ProgressSink | None = None) -> ContextPackDTO:
+        self.calls.append(dto)
+        if progress is not None:
+            await progress.emit(ProgressEvent(name="multi_rewrite_done", payload={"queries": [dto.query]}))
+        return ContextPackDTO(
+            index_id=dto.index_id,
+            project_id=dto.project_id,
+            query=dto.query,
+            embed_signature="sig",
+            metric=VectorMetric.COSINE,
+            chunks=[],
+        )
+
+
+class FakeReplyStream:
+    def __init__(self, chunks: list[str]) -> None:
+        self._chunks = chunks
+        self.metrics: StreamMetrics | None = None
+        self.closed_early = False
+
+    async def __aiter__(self) -> AsyncIterator[str]:
+        try:
+            for c in self._chunks:
+                yield c
+        except GeneratorExit:
+            self.closed_early = True
+            raise
+        self.metrics = StreamMetrics(
+            prompt_breakdown=PromptTokenBreakdown(system=1, context=2, history=3, question=4),
+            completion_tokens=len(self._chunks),
+        )
+
+
+class FakeReplyGenerator:
+    llm_model = "fake-llm"
+
+    def __init__(self, chunks: list[str] | None = None) -> None:
+        self.chunks = chunks if chunks is not None else ["Hello", " world"]
+        self.calls: list[GenerateReplyInput] = []
+        self.streams: list[FakeReplyStream] = []
+
+    def stream_answer(self, inp: GenerateReplyInput) -> FakeReplyStream:
+        self.calls.append(inp)
+        self.streams.append(FakeReplyStream(self.chunks))
+        return self.streams[-1]
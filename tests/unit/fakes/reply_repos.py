@@ -0,0 +1,104 @@
+# tests/unit/fakes/reply_repos.py
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Iterable
+from uuid import UUID
+
+from talk_to_pdf.backend.app.domain.common.value_objects import ChatTurn
+from talk_to_pdf.backend.app.domain.reply import Chat, ChatMessage
+from talk_to_pdf.backend.app.domain.reply.value_objects import MessageCursor
+
+
+class FakeChatRepository:
+    def __init__(self) -> None:
+        self._by_id: dict[UUID, Chat] = {}
+
+    async def add(self, chat: Chat) -> None:
+        self._by_id[chat.id] = chat
+
+    async def get_by_owner_and_id(self, *, owner_id: UUID, chat_id: UUID) -> Chat | None:
+        chat = self._by_id.get(chat_id)
+        return chat if chat and chat.owner_id == owner_id else None
+
+    async def list_by_owner_and_project(
+        self,
+        *,
+        owner_id: UUID,
+        project_id: UUID,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> list[Chat]:
+        chats = [c for c in self._by_id.values() if c.owner_id == owner_id and c.project_id == project_id]
+        chats.sort(key=lambda c: c.updated_at, reverse=True)
+        return chats[offset: offset + limit]
+
+    async def delete_by_owner_and_id(self, *, owner_id: UUID, chat_id: UUID) -> bool:
+        chat = self._by_id.get(chat_id)
+        if not chat or chat.owner_id != owner_id:
+            return False
+        del self._by_id[chat_id]
+        return True
+
+
+class FakeChatMessageRepository:
+    def __init__(self, chat_repo: FakeChatRepository) -> None:
+        self._chat_repo = chat_repo
+        self._messages: list[ChatMessage] = []
+        self.turn_lookups = 0
+
+    async def add(self, message: ChatMessage) -> None:
+        self._messages.append(message)
+
+    async def add_many(self, messages: Iterable[ChatMessage]) -> None:
+        self._messages.extend(messages)
+
+    def _owned(self, *, owner_id: UUID, chat_id: UUID) -> list[ChatMessage]:
+        chat = self._chat_repo._by_id.get(chat_id)
+        if not chat or chat.owner_id != owner_id:
+            return []
+        return sorted((m for m in self._messages if m.chat_id == chat_id), key=lambda m: (m.created_at, m.id))
+
+    async def list_recent_by_owner_and_chat(
+        self,
+        *,
+        owner_id: UUID,
+        chat_id: UUID,
+        limit: int = 20,
+        before: datetime | None = None,
+    ) -> list[ChatMessage]:
+        msgs = self._owned(owner_id=owner_id, chat_id=chat_id)
+        if before is not None:
+            msgs = [m for m in msgs if m.created_at < before]
+        return msgs[-limit:] if limit else []
+
+    async def list_page_by_owner_and_chat(
+        self,
+        *,
+        owner_id: UUID,
+        chat_id: UUID,
+        limit: int = 50,
+        before: MessageCursor | None = None,
+        after: MessageCursor | None = None,
+    ) -> list[ChatMessage]:
+        msgs = self._owned(owner_id=owner_id, chat_id=chat_id)
+        if before is not None:
+            msgs = [m for m in msgs if (m.created_at, m.id) < (before.created_at, before.id)]
+        if after is not None:
+            msgs = [m for m in msgs if (m.created_at, m.id) > (after.created_at, after.id)]
+        if after is not None and before is None:
+            return msgs[:limit]
+        return msgs[-limit:] if limit else []
+
+    async def list_recent_turns(self, *, chat_id: UUID, limit: int, align: int = 1) -> list[ChatTurn]:
+        self.turn_lookups += 1
+        msgs = sorted((m for m in self._messages if m.chat_id == chat_id), key=lambda m: (m.created_at, m.id))
+        if not limit:
+            return []
+        start = max(0, (len(msgs) - limit) // max(1, align) * max(1, align))
+        return [ChatTurn(role=m.role, content=m.content) for m in msgs[start:]]
+
+    async def delete_by_owner_and_chat(self, *, owner_id: UUID, chat_id: UUID) -> int:
+        owned = self._owned(owner_id=owner_id, chat_id=chat_id)
+        self._messages = [m for m in self._messages if m not in owned]
+        return len(owned)
@@ -3,6 +3,7 @@ from __future__ import annotations
 from tests.unit.fakes.chunk_repo import FakeChunkRepository
 from tests.unit.fakes.indexing_repos import  FakeDocumentIndexRepository
 from tests.unit.fakes.project_repo import FakeProjectRepository
+from tests.unit.fakes.reply_repos import FakeChatRepository, FakeChatMessageRepository
 from tests.unit.fakes.user_repo import FakeUserRepository
 
 
@@ -14,6 +15,8 @@ class FakeUnitOfWork:
         self.project_repo = FakeProjectRepository()
         self.index_repo = FakeDocumentIndexRepository()
         self.chunk_repo = FakeChunkRepository()
+        self.chat_repo = FakeChatRepository()
+        self.chat_message_repo = FakeChatMessageRepository(self.chat_repo)
 
         self.committed = False
         self.rolled_back = False
@@ -12,11 +12,13 @@ class FakeUserRepository(UserRepository):
     def __init__(self) -> None:
         self._by_id: dict[UUID, User] = {}
         self._by_email: dict[str, User] = {}
+        self.id_lookups = 0
 
     async def get_by_email(self, email: str) -> Optional[User]:
         return self._by_email.get(email.lower())
 
     async def get_by_id(self, user_id: UUID) -> Optional[User]:
+        self.id_lookups += 1
         return self._by_id.get(user_id)
 
     async def add(self, user: User) -> User:
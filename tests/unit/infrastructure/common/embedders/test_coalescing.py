@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from talk_to_pdf.backend.app.domain.common.value_objects import EmbedConfig
+from talk_to_pdf.backend.app.infrastructure.common import token_counter
+from talk_to_pdf.backend.app.infrastructure.common.embedders.coalescing import (
+    CoalescingEmbedder,
+    CoalescingEmbedderFactory,
+    count_input_tokens,
+)
+from tests.unit.fakes.encoding import CharEncoding
+
+pytestmark = pytest.mark.asyncio
+
+
+class RecordingEmbedder:
+    def __init__(self, *, fail: Exception | None = None, delay_s: float = 0.0) -> None:
+        self.calls: list[list[str]] = []
+        self._fail = fail
+        self._delay_s = delay_s
+
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        self.calls.append(list(texts))
+        if self._delay_s:
+            await asyncio.sleep(self._delay_s)
+        if self._fail:
+            raise self._fail
+        return [[float(len(t))] for t in texts]
+
+
+class DenseEncoding(CharEncoding):
+    def encode(self, text: str, disallowed_special=()) -> list[str]:
+        return [c for c in text for _ in range(2)]
+
+
+class RecordingFactory:
+    def __init__(self) -> None:
+        self.created: list[EmbedConfig] = []
+
+    def create(self, cfg: EmbedConfig) -> RecordingEmbedder:
+        self.created.append(cfg)
+        return RecordingEmbedder()
+
+
+def _embedder(inner, **kw) -> CoalescingEmbedder:
+    opts = {"linger_s": 0.01, "max_items": 100, "max_chars": 10_000} | kw
+    return CoalescingEmbedder(inner, **opts)
+
+
+async def test_concurrent_calls_share_one_request_and_get_their_own_vectors():
+    inner = RecordingEmbedder()
+    emb = _embedder(inner)
+
+    a, b, c = await asyncio.gather(
+        emb.aembed_documents(["a"]),
+        emb.aembed_documents(["bb", "ccc"]),
+        emb.aembed_documents(["dddd"]),
+    )
+
+    assert inner.calls == [["a", "bb", "ccc", "dddd"]]
+    assert (a, b, c) == ([[1.0]], [[2.0], [3.0]], [[4.0]])
+    assert emb.stats.snapshot() == {"calls": 3, "requests": 1, "texts": 4}
+
+
+async def test_limits_split_requests_and_full_batches_skip_the_window():
+    inner = RecordingEmbedder()
+    emb = _embedder(inner, max_items=3)
+
+    await asyncio.gather(
+        emb.aembed_documents(["1", "2"]),
+        emb.aembed_documents(["3", "4"]),  # would exceed 3 items: previous batch goes first
+        emb.aembed_documents(["x", "y", "z"]),  # already full
+    )
+
+    assert sorted(inner.calls) == sorted([["1", "2"], ["3", "4"], ["x", "y", "z"]])
+
+
+async def test_provider_error_reaches_every_caller():
+    emb = _embedder(RecordingEmbedder(fail=RuntimeError("rate limited")))
+
+    results = await asyncio.gather(
+        emb.aembed_documents(["a"]), emb.aembed_documents(["b"]), return_exceptions=True
+    )
+
+    assert [str(r) for r in results] == ["rate limited", "rate limited"]
+
+
+async def test_cancelled_caller_does_not_fail_the_others():
+    inner = RecordingEmbedder(delay_s=0.02)
+    emb = _embedder(inner)
+
+    doomed = asyncio.create_task(emb.aembed_documents(["a"]))
+    kept = asyncio.create_task(emb.aembed_documents(["bb"]))
+    await asyncio.sleep(0.015)  # request in flight
+    doomed.cancel()
+
+    assert await kept == [[2.0]]
+    assert doomed.cancelled()
+
+
+async def test_factory_shares_one_embedder_per_signature():
+    inner = RecordingFactory()
+    factory = CoalescingEmbedderFactory(inner=inner, linger_s=0.01, max_items=10, max_chars=1000)
+    cfg = EmbedConfig(provider="openai", model="m", batch_size=16, dimensions=3)
+    other = EmbedConfig(provider="openai", model="m2", batch_size=16, dimensions=3)
+
+    assert factory.create(cfg) is factory.create(cfg)
+    assert factory.create(other) is not factory.create(cfg)
+    assert len(inner.created) == 2
+
+
+async def test_token_budget_splits_merged_requests():
+    inner = RecordingEmbedder()
+    # each character counts as one token: the character cap alone would merge all three
+    emb = _embedder(inner, max_tokens=6, count_tokens=lambda texts: sum(len(t) for t in texts))
+
+    await asyncio.gather(
+        emb.aembed_documents(["aaa"]),
+        emb.aembed_documents(["bbb"]),
+        emb.aembed_documents(["ccc"]),  # would exceed 6 tokens: the first two go first
+        emb.aembed_documents(["dddddd"]),  # already at the budget
+    )
+
+    assert sorted(inner.calls) == sorted([["aaa", "bbb"], ["ccc"], ["dddddd"]])
+
+
+async def test_factory_budgets_tokens_with_the_embed_models_tokenizer(monkeypatch):
+    # token-dense text (e.g. CJK): two tokens per character
+    monkeypatch.setattr(token_counter, "_get_encoding", lambda model: DenseEncoding())
+    inner = RecordingFactory()
+    factory = CoalescingEmbedderFactory(inner=inner, linger_s=0.01, max_items=100, max_chars=10_000, max_tokens=10)
+    emb = factory.create(EmbedConfig(provider="openai", model="m", batch_size=16, dimensions=3))
+
+    assert count_input_tokens(["漢字かな"], model="m") == 8
+    await asyncio.gather(emb.aembed_documents(["漢字かな"]), emb.aembed_documents(["文章"]))
+
+    # 6 characters fit the character cap, but 12 tokens exceed the 10-token budget
+    assert emb._inner.calls == [["漢字かな"], ["文章"]]
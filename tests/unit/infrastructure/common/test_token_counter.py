@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import pytest
+from langchain_core.messages import HumanMessage, SystemMessage
+
+from talk_to_pdf.backend.app.infrastructure.common import token_counter
+
+
+class CharEncoding:
+    """One token per character; stands in for tiktoken (which downloads encodings)."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def encode(self, text: str) -> list[str]:
+        self.calls += 1
+        return list(text)
+
+
+@pytest.fixture
+def encoding(monkeypatch) -> CharEncoding:
+    enc = CharEncoding()
+    monkeypatch.setattr(token_counter, "_get_encoding", lambda model: enc)
+    token_counter._cached_message_tokens.cache_clear()
+    yield enc
+    token_counter._cached_message_tokens.cache_clear()
+
+
+def test_memoized_count_matches_plain_count(encoding):
+    msgs = [SystemMessage(content="sys"), HumanMessage(content="hello", name="bob")]
+
+    assert token_counter.count_message_tokens_memoized(msgs, model="m") == token_counter.count_message_tokens(
+        msgs, model="m"
+    )
+
+
+def test_memoized_count_reuses_previous_messages(encoding):
+    history = [HumanMessage(content="q1"), HumanMessage(content="q2")]
+    token_counter.count_message_tokens_memoized(history, model="m")
+    calls = encoding.calls
+
+    token_counter.count_message_tokens_memoized(history + [HumanMessage(content="q3")], model="m")
+
+    assert encoding.calls == calls + 1
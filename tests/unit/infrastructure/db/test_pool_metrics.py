@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
+
+from talk_to_pdf.backend.app.infrastructure.db.pool_metrics import PoolMetrics
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_counts_checkouts_and_reports_pool_state(tmp_path):
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'db.sqlite'}",
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=2,
+        max_overflow=1,
+    )
+    metrics = PoolMetrics(engine, pool_size=2, max_overflow=1)
+    try:
+        async with engine.connect() as a, engine.connect() as b:
+            await a.execute(text("select 1"))
+            await b.execute(text("select 1"))
+            assert metrics.snapshot()["checkedout"] == 2
+
+        async with engine.connect() as c:
+            await c.execute(text("select 1"))
+
+        snap = metrics.snapshot()
+        assert snap["max_connections"] == 3
+        assert snap["checkouts"] == 3
+        assert snap["connects"] == 2  # the third checkout reused a pooled connection
+        assert snap["peak_checked_out"] == 2
+        assert snap["checkedout"] == 0
+        assert snap["size"] == 2
+    finally:
+        await engine.dispose()
+
+
+async def test_checkout_listener_tolerates_pools_without_checkedout(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'db.sqlite'}", poolclass=NullPool)
+    metrics = PoolMetrics(engine, pool_size=1, max_overflow=0)
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text("select 1"))
+
+        snap = metrics.snapshot()
+        assert snap["checkouts"] == 1
+        assert snap["peak_checked_out"] == 0
+        assert "checkedout" not in snap
+    finally:
+        await engine.dispose()
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import pytest
+
+from talk_to_pdf.backend.app.infrastructure.db.read_routing import ReadSessionRouter
+
+pytestmark = pytest.mark.asyncio
+
+
+class FakeSession:
+    def __init__(self, name: str, *, fail_connect: bool = False) -> None:
+        self.name = name
+        self.fail_connect = fail_connect
+        self.closed = False
+
+    async def connection(self):
+        if self.fail_connect:
+            raise OSError("connection refused")
+
+    async def close(self) -> None:
+        self.closed = True
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+
+class FakeSessionMaker:
+    def __init__(self, name: str, *, fail_connect: bool = False) -> None:
+        self.name = name
+        self.fail_connect = fail_connect
+        self.opened: list[FakeSession] = []
+
+    def __call__(self) -> FakeSession:
+        session = FakeSession(self.name, fail_connect=self.fail_connect)
+        self.opened.append(session)
+        return session
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _router(replica, clock, *, sticky_s=5.0):
+    return ReadSessionRouter(
+        primary=FakeSessionMaker("primary"),
+        replica=replica,
+        retry_after_s=30.0,
+        sticky_s=sticky_s,
+        clock=clock,
+    )
+
+
+async def _name(router, key=None) -> str:
+    async with router.session(key=key) as session:
+        return session.name
+
+
+async def test_reads_go_to_replica_and_primary_without_one():
+    clock = Clock()
+    assert await _name(_router(FakeSessionMaker("replica"), clock)) == "replica"
+    assert await _name(_router(None, clock)) == "primary"
+
+
+async def test_unreachable_replica_falls_back_and_is_skipped_until_retry():
+    clock = Clock()
+    replica = FakeSessionMaker("replica", fail_connect=True)
+    router = _router(replica, clock)
+
+    assert await _name(router) == "primary"
+    assert replica.opened[0].closed
+
+    replica.fail_connect = False
+    clock.now += 10
+    assert await _name(router) == "primary"
+    assert len(replica.opened) == 1  # not retried inside the window
+
+    clock.now += 30
+    assert await _name(router) == "replica"
+
+
+async def test_pinned_key_reads_primary_until_sticky_window_ends():
+    clock = Clock()
+    router = _router(FakeSessionMaker("replica"), clock)
+
+    router.pin_primary("user-1")
+    assert await _name(router, key="user-1") == "primary"
+    assert await _name(router, key="user-2") == "replica"
+
+    clock.now += 6
+    assert await _name(router, key="user-1") == "replica"
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import hashlib
+from uuid import uuid4
+
+import pytest
+
+from talk_to_pdf.backend.app.domain.files import FileTooLarge
+from talk_to_pdf.backend.app.infrastructure.files.filesystem_storage import FilesystemFileStorage
+from tests.unit.fakes.project_storage import byte_stream
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_save_streams_chunks_and_hashes(tmp_path):
+    storage = FilesystemFileStorage(tmp_path)
+    data = b"%PDF-1.4 " + bytes(range(256)) * 10
+
+    info = await storage.save(
+        owner_id=uuid4(),
+        project_id=uuid4(),
+        filename="doc.PDF",
+        content=byte_stream(data, chunk_size=100),
+        content_type="application/pdf",
+        max_bytes=len(data),
+    )
+
+    assert info.size_bytes == len(data)
+    assert info.sha256 == hashlib.sha256(data).hexdigest()
+    assert info.stored_filename.endswith(".pdf")
+    assert await storage.read_bytes(storage_path=info.storage_path) == data
+    assert not list(tmp_path.rglob("*.part"))
+
+
+async def test_save_over_limit_raises_and_leaves_nothing(tmp_path):
+    storage = FilesystemFileStorage(tmp_path)
+    consumed = []
+
+    async def stream():
+        for chunk in (b"a" * 8, b"b" * 8, b"c" * 8):
+            consumed.append(chunk)
+            yield chunk
+
+    with pytest.raises(FileTooLarge):
+        await storage.save(
+            owner_id=uuid4(),
+            project_id=uuid4(),
+            filename="big.pdf",
+            content=stream(),
+            content_type="application/pdf",
+            max_bytes=10,
+        )
+
+    # stops at the chunk that crossed the limit
+    assert len(consumed) == 2
+    assert [p for p in tmp_path.rglob("*") if p.is_file()] == []
+
+
+async def test_ranged_and_streaming_reads(tmp_path):
+    storage = FilesystemFileStorage(tmp_path)
+    data = bytes(range(200))
+    info = await storage.save(
+        owner_id=uuid4(),
+        project_id=uuid4(),
+        filename="doc.pdf",
+        content=byte_stream(data, chunk_size=64),
+        content_type="application/pdf",
+    )
+
+    assert await storage.read_range(storage_path=info.storage_path, start=10, length=5) == data[10:15]
+    assert await storage.read_range(storage_path=info.storage_path, start=190) == data[190:]
+    assert await storage.read_range(storage_path=info.storage_path, start=500, length=5) == b""
+
+    chunks = [c async for c in storage.iter_bytes(storage_path=info.storage_path, chunk_size=64)]
+    assert [len(c) for c in chunks] == [64, 64, 64, 8]
+    assert b"".join(chunks) == data
+
+    with pytest.raises(ValueError):
+        await storage.read_bytes(storage_path="../outside.pdf")
+
+    await storage.delete(storage_path=info.storage_path)
+    assert [p for p in tmp_path.rglob("*") if p.is_file()] == []
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import hashlib
+import io
+from uuid import uuid4
+
+import pytest
+
+from talk_to_pdf.backend.app.domain.files import FileTooLarge
+from talk_to_pdf.backend.app.infrastructure.files.s3_storage import MIN_MULTIPART_CHUNK_BYTES, S3FileStorage
+from tests.unit.fakes.project_storage import byte_stream
+
+pytestmark = pytest.mark.asyncio
+
+PART = MIN_MULTIPART_CHUNK_BYTES
+BUCKET = "test-bucket"
+
+
+class FakeClientError(Exception):
+    def __init__(self, code: str) -> None:
+        super().__init__(code)
+        self.response = {"Error": {"Code": code}}
+
+
+class InMemoryS3Client:
+    """The slice of the boto3 S3 client that S3FileStorage uses."""
+
+    def __init__(self) -> None:
+        self.objects: dict[tuple[str, str], bytes] = {}
+        self.uploads: dict[str, list[bytes]] = {}
+        self.aborted: list[str] = []
+
+    def put_object(self, *, Bucket, Key, Body, ContentType):
+        self.objects[(Bucket, Key)] = Body
+
+    def create_multipart_upload(self, *, Bucket, Key, ContentType):
+        upload_id = f"u{len(self.uploads)}"
+        self.uploads[upload_id] = []
+        return {"UploadId": upload_id}
+
+    def upload_part(self, *, Bucket, Key, UploadId, PartNumber, Body):
+        self.uploads[UploadId].append(Body)
+        return {"ETag": f"etag-{PartNumber}"}
+
+    def complete_multipart_upload(self, *, Bucket, Key, UploadId, MultipartUpload):
+        assert [p["PartNumber"] for p in MultipartUpload["Parts"]] == list(range(1, len(self.uploads[UploadId]) + 1))
+        self.objects[(Bucket, Key)] = b"".join(self.uploads.pop(UploadId))
+
+    def abort_multipart_upload(self, *, Bucket, Key, UploadId):
+        self.uploads.pop(UploadId, None)
+        self.aborted.append(UploadId)
+
+    def get_object(self, *, Bucket, Key, Range=None):
+        data = self.objects[(Bucket, Key)]
+        if Range is not None:
+            start, _, end = Range.removeprefix("bytes=").partition("-")
+            if int(start) >= len(data):
+                raise FakeClientError("InvalidRange")
+            data = data[int(start):(int(end) + 1 if end else None)]
+        return {"Body": io.BytesIO(data)}
+
+    def delete_object(self, *, Bucket, Key):
+        self.objects.pop((Bucket, Key), None)
+
+
+def _storage(client) -> S3FileStorage:
+    return S3FileStorage(client=client, bucket=BUCKET, key_prefix="uploads/", multipart_chunk_bytes=PART)
+
+
+async def _save(storage, data: bytes, *, max_bytes=None):
+    return await storage.save(
+        owner_id=uuid4(),
+        project_id=uuid4(),
+        filename="doc.pdf",
+        content=byte_stream(data, chunk_size=1024 * 1024),
+        content_type="application/pdf",
+        max_bytes=max_bytes,
+    )
+
+
+async def test_small_file_is_a_single_put_and_reads_back():
+    client = InMemoryS3Client()
+    storage = _storage(client)
+    data = b"%PDF-1.4 small"
+
+    info = await _save(storage, data)
+
+    assert (BUCKET, "uploads/" + info.storage_path) in client.objects
+    assert client.uploads == {}
+    assert info.sha256 == hashlib.sha256(data).hexdigest()
+    assert await storage.read_bytes(storage_path=info.storage_path) == data
+    assert await storage.read_range(storage_path=info.storage_path, start=2, length=3) == data[2:5]
+    assert await storage.read_range(storage_path=info.storage_path, start=100) == b""
+
+    await storage.delete(storage_path=info.storage_path)
+    assert client.objects == {}
+
+
+async def test_large_file_goes_multipart_and_streams_back():
+    client = InMemoryS3Client()
+    storage = _storage(client)
+    data = bytes(range(256)) * (PART * 2 // 256 + 10)
+
+    info = await _save(storage, data)
+
+    assert info.size_bytes == len(data)
+    assert client.objects[(BUCKET, "uploads/" + info.storage_path)] == data
+    chunks = [c async for c in storage.iter_bytes(storage_path=info.storage_path, chunk_size=PART)]
+    assert [len(c) for c in chunks[:-1]] == [PART, PART]
+    assert b"".join(chunks) == data
+
+
+async def test_oversized_multipart_upload_is_aborted():
+    client = InMemoryS3Client()
+    storage = _storage(client)
+
+    with pytest.raises(FileTooLarge):
+        await _save(storage, b"x" * (PART + 2 * 1024 * 1024), max_bytes=PART + 1024 * 1024)
+
+    assert client.aborted == ["u0"]
+    assert client.objects == {}
+
+
+async def test_round_trip_against_moto():
+    moto = pytest.importorskip("moto")
+    boto3 = pytest.importorskip("boto3")
+
+    with moto.mock_aws():
+        client = boto3.client("s3", region_name="us-east-1")
+        client.create_bucket(Bucket=BUCKET)
+        storage = _storage(client)
+        data = b"z" * (PART + 123)
+
+        info = await _save(storage, data)
+
+        assert await storage.read_bytes(storage_path=info.storage_path) == data
+        assert await storage.read_range(storage_path=info.storage_path, start=PART, length=10) == b"z" * 10
+        assert await storage.read_range(storage_path=info.storage_path, start=len(data) + 5) == b""
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from talk_to_pdf.backend.app.domain.indexing.value_objects import Block
+from talk_to_pdf.backend.app.infrastructure.indexing.chunkers.block_chunker import (
+    DefaultBlockChunker,
+    _split_text_sentence_aware,
+)
+
+
+def _block(text: str, kind: str, div_index: int = 0, head: str | None = "Intro") -> Block:
+    return Block(text=text, text_norm=text, meta={"kind": kind, "div_index": div_index, "head": head})
+
+
+def test_sentence_split_spans_start_on_sentences_and_respect_max_len():
+    text = "One two three.  Four five six!\n\nSeven eight nine? Ten eleven twelve."
+
+    spans = _split_text_sentence_aware(text, 32)
+
+    assert all(e - s <= 32 for s, e in spans)
+    assert [text[s:e].strip().split()[0] for s, e in spans] == ["One", "Seven", "Ten"]
+    assert spans[0][0] == 0 and spans[-1][1] == len(text)
+    assert all(a[1] == b[0] for a, b in zip(spans, spans[1:]))
+
+
+def test_sentence_split_hard_cuts_a_single_long_sentence():
+    text = "x" * 25
+
+    assert _split_text_sentence_aware(text, 10) == [(0, 10), (10, 20), (20, 25)]
+
+
+def test_chunks_respect_max_chars_and_renumber():
+    blocks = [_block("Intro", "section_head")] + [
+        _block(f"Sentence number {i} is here. And another one follows it.", "paragraph") for i in range(20)
+    ]
+
+    chunks = DefaultBlockChunker(max_chars=150, overlap_chars=0).chunk(blocks=blocks)
+
+    assert [c.chunk_index for c in chunks] == list(range(len(chunks)))
+    assert all(c.meta["chunk_char_len"] <= 150 for c in chunks)
+    assert chunks[0].text.startswith("## Intro\n\nSentence number 0")
+    # every paragraph lands in exactly one chunk
+    assert sum(c.meta["block_counts"].get("paragraph", 0) for c in chunks) == 20
+
+
+def test_oversize_unsplittable_block_is_its_own_chunk():
+    blocks = [
+        _block("short para.", "paragraph"),
+        _block("1 2 3 " * 30, "table"),
+        _block("after table.", "paragraph"),
+    ]
+
+    chunks = DefaultBlockChunker(max_chars=60).chunk(blocks=blocks)
+
+    assert [c.text[:6] for c in chunks] == ["short ", "Table:", "after "]
+    assert chunks[1].meta["oversize_single_block"] is True
+    assert chunks[1].meta["max_chars"] == 60
+
+
+def test_div_change_flushes_and_drops_header_only_chunks():
+    blocks = [
+        _block("Empty", "section_head", div_index=0, head="Empty"),
+        _block("Body", "section_head", div_index=1, head="Body"),
+        _block("Body text.", "paragraph", div_index=1, head="Body"),
+    ]
+
+    chunks = DefaultBlockChunker().chunk(blocks=blocks)
+
+    assert len(chunks) == 1
+    assert chunks[0].text == "## Body\n\nBody text."
+    assert chunks[0].meta["div_index"] == 1
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from uuid import uuid4
+
+import pytest
+
+from talk_to_pdf.backend.app.infrastructure.indexing.cancel_watcher import IndexCancelWatcher
+from tests.unit.infrastructure.indexing.test_status_feed import FakeListenConnection
+
+pytestmark = pytest.mark.asyncio
+
+
+async def _never() -> bool:
+    return False
+
+
+async def test_notify_for_this_index_sets_flag():
+    conn = FakeListenConnection()
+    index_id = uuid4()
+
+    async def connect(dsn):
+        return conn
+
+    watcher = IndexCancelWatcher(poll_interval_s=60, dsn="postgresql://x", connect=connect)
+    async with watcher.watch(index_id=index_id, is_cancel_requested=_never) as cancelled:
+        conn.notify({"index_id": str(uuid4()), "cancel_requested": True})
+        conn.notify({"index_id": str(index_id), "cancel_requested": False, "progress": 70})
+        assert not cancelled.is_set()
+
+        conn.notify({"index_id": str(index_id), "cancel_requested": True})
+        assert cancelled.is_set()
+
+    assert conn.closed
+
+
+async def test_poll_covers_missing_listener():
+    checks = 0
+
+    async def is_cancel_requested() -> bool:
+        nonlocal checks
+        checks += 1
+        return checks >= 2
+
+    async def broken_connect(dsn):
+        raise OSError("no db")
+
+    watcher = IndexCancelWatcher(poll_interval_s=0.01, dsn="postgresql://x", connect=broken_connect)
+    async with watcher.watch(index_id=uuid4(), is_cancel_requested=is_cancel_requested) as cancelled:
+        for _ in range(100):
+            if cancelled.is_set():
+                break
+            await asyncio.sleep(0.01)
+
+    assert cancelled.is_set()
+    assert checks == 2
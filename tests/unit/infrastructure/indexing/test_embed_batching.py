@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import pytest
+
+from talk_to_pdf.backend.app.infrastructure.common import token_counter
+from talk_to_pdf.backend.app.infrastructure.indexing.embed_batching import count_batches, token_budget_batches
+
+
+class CharEncoding:
+    """One token per character; stands in for tiktoken (which downloads encodings)."""
+
+    def encode(self, text: str, disallowed_special=()) -> list[str]:
+        return list(text)
+
+
+@pytest.fixture(autouse=True)
+def encoding(monkeypatch) -> CharEncoding:
+    enc = CharEncoding()
+    monkeypatch.setattr(token_counter, "_get_encoding", lambda model: enc)
+    return enc
+
+
+def test_packs_greedily_up_to_token_budget():
+    texts = ["a" * 4, "b" * 4, "c" * 3, "d" * 9, "e"]
+
+    plan = token_budget_batches(texts, model="m", max_tokens=10, max_items=100)
+
+    assert plan.batches == [["a" * 4, "b" * 4], ["c" * 3], ["d" * 9, "e"]]
+    assert plan.summary() == {
+        "strategy": "tokens",
+        "batches": 3,
+        "max_items": 100,
+        "max_tokens": 10,
+        "total_tokens": 21,
+        "largest_batch_tokens": 10,
+    }
+
+
+def test_item_cap_and_oversize_text():
+    texts = ["x"] * 5 + ["y" * 50, "z"]
+
+    plan = token_budget_batches(texts, model="m", max_tokens=10, max_items=2)
+
+    assert plan.batches == [["x", "x"], ["x", "x"], ["x"], ["y" * 50], ["z"]]
+    # order is preserved so vectors line up with chunks
+    assert [t for b in plan.batches for t in b] == texts
+
+
+def test_count_batches_keeps_fixed_size_fallback():
+    plan = count_batches([str(i) for i in range(5)], batch_size=2)
+
+    assert plan.batches == [["0", "1"], ["2", "3"], ["4"]]
+    assert plan.summary() == {"strategy": "count", "batches": 3, "max_items": 2}
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from uuid import uuid4
+
+import pytest
+
+from talk_to_pdf.backend.app.application.indexing.indexing_progress import CancelFlag
+from talk_to_pdf.backend.app.domain.common.value_objects import EmbedConfig
+from talk_to_pdf.backend.app.domain.indexing.enums import IndexStatus
+from talk_to_pdf.backend.app.domain.indexing.value_objects import ChunkDraft
+from talk_to_pdf.backend.app.infrastructure.common import token_counter
+from talk_to_pdf.backend.app.infrastructure.indexing.service import IndexingWorkerService, WorkerDeps
+from tests.unit.fakes.indexing_worker_deps import (
+    FakeBlockChunker,
+    FakeBlockExtractor,
+    FakeEmbedder,
+    FakeEmbedderFactory,
+    FakePdfToXmlConverter,
+    FakeSession,
+    FakeSessionContext,
+)
+from tests.unit.fakes.project_storage import FakeFileStorage
+
+pytestmark = pytest.mark.asyncio
+
+
+class FakeCancelWatcher:
+    def __init__(self) -> None:
+        self.flag = CancelFlag()
+
+    @asynccontextmanager
+    async def watch(self, *, index_id, is_cancel_requested):
+        yield self.flag
+
+
+class CancellingEmbedder(FakeEmbedder):
+    def __init__(self, flag: CancelFlag, *, after: int) -> None:
+        super().__init__()
+        self._flag = flag
+        self._after = after
+
+    async def aembed_documents(self, texts):
+        if len(self.calls) + 1 >= self._after:
+            self._flag.set()
+        return await super().aembed_documents(texts)
+
+
+def _chunks(n: int) -> list[ChunkDraft]:
+    return [ChunkDraft(chunk_index=i, blocks=[], text=f"t{i}", text_norm=f"t{i}", meta={}) for i in range(n)]
+
+
+class CharEncoding:
+    def encode(self, text: str, disallowed_special=()) -> list[str]:
+        return list(text)
+
+
+def _worker(uow, embedder, watcher, **deps) -> IndexingWorkerService:
+    return IndexingWorkerService(
+        WorkerDeps(
+            pdf_to_xml_converter=FakePdfToXmlConverter(),
+            block_extractor=FakeBlockExtractor(),
+            block_chunker=FakeBlockChunker(),
+            embedder_factory=FakeEmbedderFactory(embedder),
+            file_storage=FakeFileStorage(),
+            session_factory=lambda: FakeSessionContext(FakeSession()),
+            uow_factory=lambda _s: uow,  # type: ignore[arg-type]
+            cancel_watcher=watcher,
+            progress_min_interval_s=3600,
+            progress_min_delta=5,
+            **deps,
+        )
+    )
+
+
+async def _index(uow, cfg):
+    return await uow.index_repo.create_pending(
+        project_id=uuid4(), document_id=uuid4(), storage_path="p", chunker_version="v1", embed_config=cfg
+    )
+
+
+async def test_progress_writes_are_throttled_and_cancel_checks_stay_in_memory(uow):
+    cfg = EmbedConfig(provider="openai", model="m", batch_size=1, dimensions=3)
+    idx = await _index(uow, cfg)
+    embedder = FakeEmbedder()
+    worker = _worker(uow, embedder, FakeCancelWatcher())
+
+    vectors = await worker.embed_chunks(idx.id, _chunks(100), cfg)
+
+    assert vectors is not None and len(vectors) == 100
+    assert len(embedder.calls) == 100
+    # 60 -> 85 in steps of 5 points instead of one write per batch
+    assert [u["progress"] for u in uow.index_repo.progress_updates] == [60, 65, 70, 75, 80]
+    assert uow.index_repo.cancel_checks == 0
+
+
+async def test_cancel_flag_stops_before_next_batch(uow):
+    cfg = EmbedConfig(provider="openai", model="m", batch_size=2, dimensions=3)
+    idx = await _index(uow, cfg)
+    watcher = FakeCancelWatcher()
+    embedder = CancellingEmbedder(watcher.flag, after=2)
+    worker = _worker(uow, embedder, watcher)
+
+    vectors = await worker.embed_chunks(idx.id, _chunks(10), cfg)
+
+    assert vectors is None
+    assert len(embedder.calls) == 2
+    assert uow.index_repo.progress_updates[-1]["status"] == IndexStatus.CANCELLED
+
+
+async def test_token_budget_packs_many_chunks_per_request(uow, monkeypatch):
+    monkeypatch.setattr(token_counter, "_get_encoding", lambda model: CharEncoding())
+    cfg = EmbedConfig(provider="openai", model="m", batch_size=1, dimensions=3)
+    idx = await _index(uow, cfg)
+    embedder = FakeEmbedder()
+    worker = _worker(uow, embedder, FakeCancelWatcher(), embed_batch_max_tokens=25, embed_batch_max_items=64)
+    chunks = _chunks(30)  # "t0".."t29": 2-3 tokens each
+
+    plan = await worker.plan_embed_batches(chunks, cfg)
+    vectors = await worker.embed_chunks(idx.id, chunks, cfg, plan=plan)
+
+    assert vectors is not None and len(vectors) == 30
+    assert len(embedder.calls) == len(plan.batches) < 30
+    assert [t for call in embedder.calls for t in call] == [c.text for c in chunks]
+    assert all(sum(len(t) for t in call) <= 25 for call in embedder.calls)
+    assert plan.summary()["strategy"] == "tokens"
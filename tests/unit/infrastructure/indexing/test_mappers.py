@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from uuid import uuid4
+
+from talk_to_pdf.backend.app.domain.indexing.value_objects import Block, ChunkDraft
+from talk_to_pdf.backend.app.infrastructure.indexing.chunkers.block_chunker import DefaultBlockChunker
+from talk_to_pdf.backend.app.infrastructure.indexing.mappers import create_chunk_models
+
+
+def _para(text: str, *, xml_id: str) -> Block:
+    return Block(
+        text=text,
+        text_norm=text,
+        meta={"kind": "paragraph", "div_index": 0, "head": "Method", "xml_id": xml_id, "targets": []},
+    )
+
+
+def test_chunk_meta_stores_block_offsets_not_texts():
+    blocks = [
+        Block(text="Method", text_norm="Method", meta={"kind": "section_head", "div_index": 0, "head": "Method", "xml_id": "h1"}),
+        *[_para(f"Paragraph {i} " + "words " * 6, xml_id=f"p{i}") for i in range(6)],
+    ]
+    chunks = DefaultBlockChunker(max_chars=200, overlap_chars=90).chunk(blocks=blocks)
+    models = create_chunk_models(uuid4(), chunks)
+
+    assert len(models) > 1
+    for draft, model in zip(chunks, models):
+        compact = model.meta["blocks"]
+        assert len(compact) == len(draft.blocks)
+        for b, c in zip(draft.blocks, compact):
+            assert "text" not in c and "meta" not in c
+            assert model.text[c["start"]:c["end"]] == b.text.strip()
+            assert c["kind"] == b.meta["kind"]
+            assert c["xml_id"] == b.meta["xml_id"]
+            assert "targets" not in c  # empty values are omitted
+
+
+def test_overlap_blocks_keep_their_synthetic_kind():
+    carried = Block(
+        text="Shared tail.",
+        text_norm="Shared tail.",
+        meta={"kind": "paragraph", "xml_id": "p1", "synthetic": True, "synthetic_kind": "overlap_block"},
+    )
+    draft = ChunkDraft(
+        chunk_index=1,
+        blocks=[carried, _para("Shared tail.", xml_id="p2")],
+        text="Shared tail.\n\nShared tail.",
+        text_norm="Shared tail.\n\nShared tail.",
+        meta={"chunk_index": 1, "has_overlap_prefix": True},
+    )
+
+    (model,) = create_chunk_models(uuid4(), [draft])
+
+    assert model.meta["blocks"] == [
+        {"start": 0, "end": 12, "kind": "paragraph", "xml_id": "p1", "synthetic_kind": "overlap_block"},
+        {"start": 14, "end": 26, "kind": "paragraph", "head": "Method", "xml_id": "p2"},
+    ]
+
+
+def test_block_not_found_in_chunk_text_keeps_labels_only():
+    draft = ChunkDraft(
+        chunk_index=0,
+        blocks=[Block(text="raw", text_norm="raw", meta={"kind": "unknown", "head": None})],
+        text="rendered differently",
+        text_norm="rendered differently",
+        meta={"chunk_index": 0},
+    )
+
+    (model,) = create_chunk_models(uuid4(), [draft])
+
+    assert model.meta == {"chunk_index": 0, "blocks": [{"kind": "unknown"}]}
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+
+from talk_to_pdf.backend.app.domain.indexing.value_objects import Block
+from talk_to_pdf.backend.app.infrastructure.indexing.chunkers.block_chunker import DefaultBlockChunker
+from talk_to_pdf.backend.app.infrastructure.indexing.chunkers.parallel_chunker import (
+    ParallelBlockChunker,
+    partition_by_div,
+)
+
+
+def _block(text: str, kind: str, div_index, head: str | None = None) -> Block:
+    return Block(text=text, text_norm=text, meta={"kind": kind, "div_index": div_index, "head": head})
+
+
+def _document(divs: int) -> list[Block]:
+    blocks: list[Block] = []
+    for d in range(divs):
+        blocks.append(_block(f"Section {d}", "section_head", d, f"Section {d}"))
+        for p in range(5):
+            blocks.append(_block(f"Paragraph {p} of div {d}. " * (p + 1), "paragraph", d, f"Section {d}"))
+        blocks.append(_block("x " * 100, "table", d, f"Section {d}"))
+    return blocks
+
+
+class _CountingThreadPool(ThreadPoolExecutor):
+    created: list[int] = []
+
+    def __init__(self, max_workers: int) -> None:
+        type(self).created.append(max_workers)
+        super().__init__(max_workers)
+
+
+def test_partition_mirrors_div_flush_points():
+    blocks = [
+        _block("a", "paragraph", None),
+        _block("b", "paragraph", 0),
+        _block("   ", "paragraph", 5),  # empty: ignored, no boundary
+        _block("c", "paragraph", None),
+        _block("d", "paragraph", 1),
+        _block("e", "paragraph", 0),
+    ]
+
+    parts = partition_by_div(blocks)
+
+    assert [[b.text for b in p] for p in parts] == [["a", "b", "c"], ["d"], ["e"]]
+
+
+def test_parallel_output_matches_sequential_and_is_renumbered():
+    inner = DefaultBlockChunker(max_chars=80, overlap_chars=20)
+    blocks = _document(12)
+    _CountingThreadPool.created = []
+
+    sequential = inner.chunk(blocks=blocks)
+    parallel = ParallelBlockChunker(
+        inner=inner, max_workers=3, min_blocks=0, executor_factory=_CountingThreadPool
+    ).chunk(blocks=blocks)
+
+    assert _CountingThreadPool.created == [3]
+    assert parallel == sequential
+    assert [c.meta["chunk_index"] for c in parallel] == list(range(len(parallel)))
+
+
+def test_small_documents_skip_the_pool():
+    _CountingThreadPool.created = []
+    chunker = ParallelBlockChunker(
+        inner=DefaultBlockChunker(max_chars=80),
+        max_workers=4,
+        min_blocks=1_000,
+        executor_factory=_CountingThreadPool,
+    )
+
+    chunks = chunker.chunk(blocks=_document(3))
+
+    assert chunks
+    assert _CountingThreadPool.created == []
+
+
+def test_process_pool_round_trip():
+    inner = DefaultBlockChunker(max_chars=80)
+    blocks = _document(4)
+
+    chunks = ParallelBlockChunker(inner=inner, max_workers=2, min_blocks=0).chunk(blocks=blocks)
+
+    assert chunks == inner.chunk(blocks=blocks)
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import asyncio
+import queue
+from uuid import uuid4
+
+import pytest
+
+from talk_to_pdf.backend.app.infrastructure.indexing import runner_pool
+
+pytestmark = pytest.mark.asyncio
+
+
+class FakeWorker:
+    def __init__(self) -> None:
+        self.started: list = []
+        self.active = 0
+        self.peak = 0
+
+    async def run(self, *, index_id) -> None:
+        self.started.append(index_id)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.02)
+        self.active -= 1
+        if len(self.started) == 1:
+            raise RuntimeError("one bad document")
+
+
+async def test_serve_runs_jobs_concurrently_in_one_worker(monkeypatch):
+    worker = FakeWorker()
+    built: list[int] = []
+
+    def fake_build_worker(*, concurrent_jobs: int) -> FakeWorker:
+        built.append(concurrent_jobs)
+        return worker
+
+    monkeypatch.setattr(runner_pool, "build_worker", fake_build_worker)
+    a, b, c = uuid4(), uuid4(), uuid4()
+    jobs: queue.Queue = queue.Queue()
+    for item in (str(a), str(b), str(a), str(c), runner_pool._STOP):
+        jobs.put(item)
+
+    await runner_pool._serve(jobs, 2)
+
+    assert built == [2]
+    # duplicate of a running job is ignored; a crashing job does not stop the others
+    assert sorted(map(str, worker.started)) == sorted(map(str, [a, b, c]))
+    assert worker.peak == 2
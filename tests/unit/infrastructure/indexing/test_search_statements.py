@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from talk_to_pdf.backend.app.domain.common.enums import VectorMetric
+from talk_to_pdf.backend.app.infrastructure.indexing.repositories import _chunks_by_ids_stmt, _similarity_search_stmt
+
+_DIALECT = postgresql.asyncpg.dialect()
+
+
+def _stmt(metric, vec, top_k, sig="sig"):
+    return _similarity_search_stmt(metric=metric, vec=vec, index_id=uuid4(), embed_signature=sig, top_k=top_k)
+
+
+@pytest.mark.parametrize("metric", list(VectorMetric))
+def test_one_cache_entry_per_metric_with_values_bound(metric):
+    a = _stmt(metric, [0.1, 0.2], 5)
+    b = _stmt(metric, [0.3, 0.4], 7, sig="other")
+
+    assert a._generate_cache_key().key == b._generate_cache_key().key
+    params = b.compile(dialect=_DIALECT).params
+    assert [0.3, 0.4] in params.values()
+    assert 7 in params.values()
+    assert "other" in params.values()
+
+
+def test_metrics_do_not_share_sql():
+    keys = {_stmt(m, [0.1], 3)._generate_cache_key().key for m in VectorMetric}
+    assert len(keys) == len(VectorMetric)
+
+
+def test_context_load_skips_tsv_and_text_norm():
+    sql = str(_chunks_by_ids_stmt(index_id=uuid4(), ids=[uuid4()]).compile(dialect=_DIALECT))
+
+    assert "tsv" not in sql
+    assert "text_norm" not in sql
+    assert "chunks.meta" in sql
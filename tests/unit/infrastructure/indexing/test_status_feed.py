@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from uuid import uuid4
+
+import pytest
+
+from talk_to_pdf.backend.app.infrastructure.indexing.status_feed import INDEX_STATUS_CHANNEL, PgIndexStatusFeed
+
+pytestmark = pytest.mark.asyncio
+
+
+class FakeListenConnection:
+    def __init__(self) -> None:
+        self.listeners = {}
+        self.termination_listeners = []
+        self.closed = False
+
+    async def add_listener(self, channel, callback) -> None:
+        self.listeners[channel] = callback
+
+    def add_termination_listener(self, callback) -> None:
+        self.termination_listeners.append(callback)
+
+    def is_closed(self) -> bool:
+        return self.closed
+
+    async def close(self) -> None:
+        self.closed = True
+
+    def notify(self, payload) -> None:
+        raw = payload if isinstance(payload, str) else json.dumps(payload)
+        self.listeners[INDEX_STATUS_CHANNEL](self, 1, INDEX_STATUS_CHANNEL, raw)
+
+    def terminate(self) -> None:
+        self.closed = True
+        for cb in self.termination_listeners:
+            cb(self)
+
+
+@pytest.fixture
+def conns():
+    return []
+
+
+@pytest.fixture
+def feed(conns):
+    async def connect(dsn):
+        conn = FakeListenConnection()
+        conns.append(conn)
+        return conn
+
+    return PgIndexStatusFeed("postgresql://x", queue_size=2, connect=connect)
+
+
+async def _next(events):
+    return await asyncio.wait_for(anext(events), timeout=1)
+
+
+async def test_fans_out_only_to_the_owner(feed, conns):
+    owner, other = uuid4(), uuid4()
+    async with feed.subscribe(owner_id=owner) as mine, feed.subscribe(owner_id=other):
+        conns[0].notify({"owner_id": str(other), "index_id": "a", "progress": 1})
+        conns[0].notify({"owner_id": str(owner), "index_id": "b", "progress": 2})
+
+        event = await _next(mine)
+
+    assert len(conns) == 1  # one LISTEN connection shared by all subscribers
+    assert event.name == "index_status"
+    assert event.payload == {"index_id": "b", "progress": 2}
+
+
+async def test_ignores_malformed_payloads(feed, conns):
+    owner = uuid4()
+    async with feed.subscribe(owner_id=owner) as events:
+        conns[0].notify("not json")
+        conns[0].notify({"index_id": "no-owner"})
+        conns[0].notify({"owner_id": str(owner), "progress": 5})
+
+        assert (await _next(events)).payload == {"progress": 5}
+
+
+async def test_slow_subscriber_keeps_latest_updates(feed, conns):
+    owner = uuid4()
+    async with feed.subscribe(owner_id=owner) as events:
+        for p in range(5):
+            conns[0].notify({"owner_id": str(owner), "progress": p})
+
+        assert [(await _next(events)).payload["progress"] for _ in range(2)] == [3, 4]
+
+
+async def test_lost_connection_ends_streams_and_reconnects(feed, conns):
+    owner = uuid4()
+    async with feed.subscribe(owner_id=owner) as events:
+        conns[0].terminate()
+        assert [e async for e in events] == []
+
+    async with feed.subscribe(owner_id=owner):
+        pass
+    assert len(conns) == 2
+
+    await feed.aclose()
+    assert conns[1].closed
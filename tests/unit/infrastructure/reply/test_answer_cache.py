@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from uuid import uuid4
+
+import pytest
+
+from talk_to_pdf.backend.app.infrastructure.reply.answer_cache import InMemorySemanticAnswerCache
+
+pytestmark = pytest.mark.asyncio
+
+
+def _cache(**kw) -> InMemorySemanticAnswerCache:
+    return InMemorySemanticAnswerCache(
+        min_similarity=kw.pop("min_similarity", 0.95),
+        max_indexes=kw.pop("max_indexes", 8),
+        max_entries_per_index=kw.pop("max_entries_per_index", 8),
+    )
+
+
+async def test_near_identical_question_with_same_context_hits():
+    cache, index_id, chunks = _cache(), uuid4(), (uuid4(), uuid4())
+    await cache.store(index_id=index_id, scope="s", query_vector=[1.0, 0.0], chunk_ids=chunks, answer="A")
+
+    hit = await cache.lookup(index_id=index_id, scope="s", query_vector=[0.99, 0.05], chunk_ids=chunks)
+
+    assert hit is not None
+    assert hit.answer == "A"
+    assert hit.similarity > 0.95
+
+
+async def test_misses_on_distant_question_other_context_scope_or_index():
+    cache, index_id, chunks = _cache(), uuid4(), (uuid4(), uuid4())
+    await cache.store(index_id=index_id, scope="s", query_vector=[1.0, 0.0], chunk_ids=chunks, answer="A")
+
+    assert await cache.lookup(index_id=index_id, scope="s", query_vector=[0.6, 0.8], chunk_ids=chunks) is None
+    assert await cache.lookup(index_id=index_id, scope="s", query_vector=[1.0, 0.0], chunk_ids=chunks[::-1]) is None
+    assert await cache.lookup(index_id=index_id, scope="other", query_vector=[1.0, 0.0], chunk_ids=chunks) is None
+    assert await cache.lookup(index_id=uuid4(), scope="s", query_vector=[1.0, 0.0], chunk_ids=chunks) is None
+
+
+async def test_entries_and_indexes_are_bounded():
+    cache = _cache(max_indexes=1, max_entries_per_index=1)
+    first, second = uuid4(), uuid4()
+    c1, c2 = (uuid4(),), (uuid4(),)
+    await cache.store(index_id=first, scope="s", query_vector=[1.0, 0.0], chunk_ids=c1, answer="old")
+    await cache.store(index_id=first, scope="s", query_vector=[1.0, 0.0], chunk_ids=c2, answer="new")
+
+    assert await cache.lookup(index_id=first, scope="s", query_vector=[1.0, 0.0], chunk_ids=c1) is None
+    assert (await cache.lookup(index_id=first, scope="s", query_vector=[1.0, 0.0], chunk_ids=c2)).answer == "new"
+
+    await cache.store(index_id=second, scope="s", query_vector=[1.0, 0.0], chunk_ids=c1, answer="x")
+    assert await cache.lookup(index_id=first, scope="s", query_vector=[1.0, 0.0], chunk_ids=c2) is None
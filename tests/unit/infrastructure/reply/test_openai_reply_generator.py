@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from langchain_core.messages import AIMessageChunk
+
+from talk_to_pdf.backend.app.domain.common.enums import ChatRole
+from talk_to_pdf.backend.app.domain.common.value_objects import ReplyGenerationConfig, ChatTurn
+from talk_to_pdf.backend.app.domain.reply.value_objects import GenerateReplyInput
+from talk_to_pdf.backend.app.infrastructure.reply.reply_generator import openai_reply_generator as mod
+from talk_to_pdf.backend.app.infrastructure.reply.reply_generator.openai_reply_generator import OpenAIReplyGenerator
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture(autouse=True)
+def offline_token_counts(monkeypatch):
+    # tiktoken downloads encodings on first use; keep these tests hermetic
+    monkeypatch.setattr(mod, "count_tokens", lambda text, model="gpt-4": len(text))
+    count_msgs = lambda msgs, model="gpt-4": sum(len(m.content) for m in msgs)
+    monkeypatch.setattr(mod, "count_message_tokens", count_msgs)
+    monkeypatch.setattr(mod, "count_message_tokens_memoized", count_msgs)
+
+
+class FakeStreamingLLM:
+    """Mimics ChatOpenAI.astream: text deltas, then a final usage-only chunk."""
+
+    model_name = "gpt-4o-mini"
+
+    def __init__(self, *, send_usage: bool = True) -> None:
+        self.send_usage = send_usage
+        self.closed_early = False
+
+    async def astream(self, msgs):
+        question = msgs[-1].content
+        try:
+            for part in (question, "-", "answer"):
+                await asyncio.sleep(0)
+                yield AIMessageChunk(content=part)
+        except GeneratorExit:
+            self.closed_early = True
+            raise
+        if self.send_usage:
+            n = len(question)
+            yield AIMessageChunk(
+                content="",
+                usage_metadata={"input_tokens": 1000 + n, "output_tokens": n, "total_tokens": 1000 + 2 * n},
+            )
+
+
+def _generator(llm) -> OpenAIReplyGenerator:
+    return OpenAIReplyGenerator(llm=llm, cfg=ReplyGenerationConfig(provider="openai", model="gpt-4o-mini"))
+
+
+def _inp(query: str) -> GenerateReplyInput:
+    # the reply flow passes the just-saved user message as the last history turn
+    return GenerateReplyInput(query=query, context="ctx", history=[ChatTurn(role=ChatRole.USER, content=query)])
+
+
+async def test_metrics_come_from_provider_usage():
+    stream = _generator(FakeStreamingLLM()).stream_answer(_inp("abc"))
+    assert stream.metrics is None
+
+    text = "".join([c async for c in stream])
+
+    assert text == "abc-answer"
+    assert stream.metrics.completion_tokens == 3
+    assert stream.metrics.prompt_tokens == 1003
+
+
+async def test_concurrent_streams_keep_their_own_metrics():
+    gen = _generator(FakeStreamingLLM())
+    s1, s2 = gen.stream_answer(_inp("a")), gen.stream_answer(_inp("abcdef"))
+
+    async def drain(s):
+        return "".join([c async for c in s])
+
+    await asyncio.gather(drain(s1), drain(s2))
+
+    assert s1.metrics.completion_tokens == 1
+    assert s2.metrics.completion_tokens == 6
+
+
+async def test_falls_back_to_counting_answer_once_without_usage():
+    stream = _generator(FakeStreamingLLM(send_usage=False)).stream_answer(_inp("abc"))
+
+    _ = [c async for c in stream]
+
+    assert stream.metrics.prompt_tokens is None
+    assert stream.metrics.completion_tokens == len("abc-answer")
+
+
+async def test_no_tokenization_before_first_chunk(monkeypatch):
+    def boom(*_, **__):
+        raise AssertionError("tokenized on the hot path")
+
+    for name in ("count_tokens", "count_message_tokens", "count_message_tokens_memoized"):
+        monkeypatch.setattr(mod, name, boom)
+
+    stream = _generator(FakeStreamingLLM()).stream_answer(_inp("abc"))
+    first = await stream.__aiter__().__anext__()
+
+    assert first == "abc"
+
+
+async def test_context_share_is_provider_remainder():
+    inp = _inp("abc")
+    stream = _generator(FakeStreamingLLM()).stream_answer(inp)
+
+    _ = [c async for c in stream]
+
+    b = stream.metrics.prompt_breakdown
+    assert b.history == len("abc")
+    assert b.context == 1003 - b.system - b.history
+
+
+async def test_closing_early_closes_provider_stream():
+    llm = FakeStreamingLLM()
+    chunks = aiter(_generator(llm).stream_answer(_inp("abc")))
+
+    assert await anext(chunks) == "abc"
+    await chunks.aclose()
+
+    assert llm.closed_early
+
+
+class CachingLLM(FakeStreamingLLM):
+    """Reports part of the prompt as served from the provider's prompt cache."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.prompts = []
+
+    async def astream(self, msgs):
+        self.prompts.append(msgs)
+        yield AIMessageChunk(content="ok")
+        yield AIMessageChunk(
+            content="",
+            usage_metadata={
+                "input_tokens": 2000,
+                "output_tokens": 1,
+                "total_tokens": 2001,
+                "input_token_details": {"cache_read": 1536},
+            },
+        )
+
+
+def _stable_generator(llm) -> OpenAIReplyGenerator:
+    cfg = ReplyGenerationConfig(provider="openai", model="gpt-4o-mini", prompt_layout="stable_prefix")
+    return OpenAIReplyGenerator(llm=llm, cfg=cfg)
+
+
+async def test_stable_prefix_layout_keeps_earlier_turns_as_identical_prefix():
+    llm = CachingLLM()
+    gen = _stable_generator(llm)
+    turn1 = [ChatTurn(role=ChatRole.USER, content="q1")]
+    turn2 = turn1 + [ChatTurn(role=ChatRole.ASSISTANT, content="a1"), ChatTurn(role=ChatRole.USER, content="q2")]
+
+    for query, history, context in (("q1", turn1, "ctx one"), ("q2", turn2, "ctx two")):
+        _ = [c async for c in gen.stream_answer(GenerateReplyInput(query=query, context=context, history=history))]
+
+    first, second = llm.prompts
+    assert [m.content for m in second[:3]] == [first[0].content, "q1", "a1"]
+    assert second[-2].content.endswith("ctx two")
+    assert second[-1].content == "q2"
+    assert sum(m.content == "q2" for m in second) == 1
+
+
+async def test_cached_prompt_tokens_come_from_usage_details():
+    stream = _stable_generator(CachingLLM()).stream_answer(_inp("abc"))
+
+    _ = [c async for c in stream]
+
+    assert stream.metrics.cached_prompt_tokens == 1536
+    b = stream.metrics.prompt_breakdown
+    assert b.context == 2000 - b.system - b.history - b.question
@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from talk_to_pdf.backend.app.application.retrieval.value_objects import MergeResult, RetrievalCacheKey, \
+    RetrievalCacheStatus
+from talk_to_pdf.backend.app.domain.common.enums import MatchSource
+from talk_to_pdf.backend.app.domain.retrieval.value_objects import ChunkMatch
+from talk_to_pdf.backend.app.infrastructure.retrieval.cache import LruRetrievalCache, dump_merge_result, \
+    load_merge_result
+
+pytestmark = pytest.mark.asyncio
+
+
+def _key(*queries: str, index_id=None) -> RetrievalCacheKey:
+    return RetrievalCacheKey.build(
+        index_id=index_id or uuid4(),
+        embed_signature="sig",
+        queries=list(queries or ("q",)),
+        top_k=5,
+        metric="cosine",
+        merger="0.65:0.35",
+    )
+
+
+def _result() -> MergeResult:
+    cid = uuid4()
+    return MergeResult(
+        matches=[ChunkMatch(chunk_id=cid, chunk_index=3, score=0.5, source=MatchSource.VECTOR, matched_by={0, 2})],
+        score_by_id={cid: 0.5},
+        matched_by={cid: [0, 2]},
+        total_candidates=4,
+        unique_candidates=1,
+    )
+
+
+class _Compute:
+    def __init__(self, *, gate: asyncio.Event | None = None, error: Exception | None = None) -> None:
+        self.calls = 0
+        self._gate = gate
+        self._error = error
+        self.result = _result()
+
+    async def __call__(self) -> MergeResult:
+        self.calls += 1
+        if self._gate is not None:
+            await self._gate.wait()
+        if self._error is not None:
+            raise self._error
+        return self.result
+
+
+class _DictBackend:
+    def __init__(self, *, fail: bool = False) -> None:
+        self.data: dict[str, bytes] = {}
+        self.fail = fail
+
+    async def get(self, key: str) -> bytes | None:
+        if self.fail:
+            raise ConnectionError("down")
+        return self.data.get(key)
+
+    async def set(self, key: str, value: bytes, *, ttl_s: int) -> None:
+        if self.fail:
+            raise ConnectionError("down")
+        self.data[key] = value
+
+
+async def test_key_normalizes_whitespace_but_keeps_order():
+    index_id = uuid4()
+    a = _key("what  is\nRAG?", "RAG", index_id=index_id)
+    b = _key("what is RAG?", "RAG ", index_id=index_id)
+    c = _key("RAG", "what is RAG?", index_id=index_id)
+    assert a == b and a.digest() == b.digest()
+    assert a.digest() != c.digest()
+
+
+async def test_merge_result_round_trips():
+    result = _result()
+    assert load_merge_result(dump_merge_result(result)) == result
+
+
+async def test_second_lookup_hits_without_computing():
+    cache = LruRetrievalCache(max_entries=8)
+    compute = _Compute()
+    key = _key("q")
+
+    first, s1 = await cache.get_or_compute(key, compute)
+    second, s2 = await cache.get_or_compute(key, compute)
+
+    assert (s1, s2) == (RetrievalCacheStatus.MISS, RetrievalCacheStatus.HIT)
+    assert second is first
+    assert compute.calls == 1
+
+
+async def test_lru_evicts_least_recently_used():
+    cache = LruRetrievalCache(max_entries=2)
+    compute = _Compute()
+    a, b, c = _key("a"), _key("b"), _key("c")
+    for k in (a, b):
+        await cache.get_or_compute(k, compute)
+    await cache.get_or_compute(a, compute)  # a is now most recent
+    await cache.get_or_compute(c, compute)
+
+    assert len(cache) == 2
+    _, status = await cache.get_or_compute(b, compute)
+    assert status == RetrievalCacheStatus.MISS
+    assert compute.calls == 4
+
+
+async def test_concurrent_identical_lookups_compute_once():
+    cache = LruRetrievalCache(max_entries=8)
+    gate = asyncio.Event()
+    compute = _Compute(gate=gate)
+    key = _key("same question")
+
+    tasks = [asyncio.create_task(cache.get_or_compute(key, compute)) for _ in range(20)]
+    await asyncio.sleep(0)
+    gate.set()
+    results = await asyncio.gather(*tasks)
+
+    assert compute.calls == 1
+    statuses = [s for _, s in results]
+    assert statuses.count(RetrievalCacheStatus.MISS) == 1
+    assert statuses.count(RetrievalCacheStatus.JOINED) == 19
+    assert all(r is compute.result for r, _ in results)
+
+
+async def test_error_reaches_waiters_and_is_not_cached():
+    cache = LruRetrievalCache(max_entries=8)
+    gate = asyncio.Event()
+    compute = _Compute(gate=gate, error=RuntimeError("db down"))
+    key = _key("q")
+
+    tasks = [asyncio.create_task(cache.get_or_compute(key, compute)) for _ in range(3)]
+    await asyncio.sleep(0)
+    gate.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert compute.calls == 1
+    assert len(cache) == 0
+
+
+async def test_waiter_takes_over_when_leader_is_cancelled():
+    cache = LruRetrievalCache(max_entries=8)
+    gate = asyncio.Event()
+    compute = _Compute(gate=gate)
+    key = _key("q")
+
+    leader = asyncio.create_task(cache.get_or_compute(key, compute))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(cache.get_or_compute(key, compute))
+    await asyncio.sleep(0)
+    leader.cancel()
+    await asyncio.sleep(0)
+    gate.set()
+
+    result, status = await follower
+    assert status == RetrievalCacheStatus.MISS
+    assert result is compute.result
+    assert compute.calls == 2
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+
+
+async def test_shared_backend_serves_other_processes():
+    backend = _DictBackend()
+    key = _key("q")
+    producer = LruRetrievalCache(max_entries=8, shared=backend)
+    await producer.get_or_compute(key, _Compute())
+
+    consumer = LruRetrievalCache(max_entries=8, shared=backend)
+    compute = _Compute()
+    result, status = await consumer.get_or_compute(key, compute)
+
+    assert status == RetrievalCacheStatus.SHARED
+    assert compute.calls == 0
+    assert result.unique_candidates == 1
+    _, status = await consumer.get_or_compute(key, compute)
+    assert status == RetrievalCacheStatus.HIT
+
+
+async def test_shared_backend_failure_falls_back_to_compute():
+    cache = LruRetrievalCache(max_entries=8, shared=_DictBackend(fail=True))
+    compute = _Compute()
+
+    result, status = await cache.get_or_compute(_key("q"), compute)
+
+    assert status == RetrievalCacheStatus.MISS
+    assert result is compute.result
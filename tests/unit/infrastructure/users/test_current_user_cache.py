@@ -0,0 +1,29 @@
+from uuid import uuid4
+
+from talk_to_pdf.backend.app.application.users import CurrentUserDTO
+from talk_to_pdf.backend.app.infrastructure.users.current_user_cache import TTLCurrentUserCache
+
+
+def _user() -> CurrentUserDTO:
+    return CurrentUserDTO(id=uuid4(), email="a@example.com", name="A", is_active=True)
+
+
+def test_evicts_least_recently_used_beyond_bound():
+    cache = TTLCurrentUserCache(ttl_s=30, max_entries=2)
+    a, b, c = _user(), _user(), _user()
+    cache.put(a.id, 1, a)
+    cache.put(b.id, 1, b)
+    assert cache.get(a.id, 1) is a  # a becomes most recent
+
+    cache.put(c.id, 1, c)
+
+    assert cache.get(b.id, 1) is None
+    assert cache.get(a.id, 1) is a
+    assert cache.get(c.id, 1) is c
+
+
+def test_zero_ttl_disables_caching():
+    cache = TTLCurrentUserCache(ttl_s=0, max_entries=2)
+    u = _user()
+    cache.put(u.id, 1, u)
+    assert cache.get(u.id, 1) is None